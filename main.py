@@ -9,9 +9,11 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from scrapers.pure_data_scraper import PureDataScraper
+from utils.logging_setup import setup_logging
 
 def main():
     """Main execution function for pure data collection"""
+    setup_logging()
 
     print("📊 PROPERTYGURU PURE DATA SCRAPER")
     print("=" * 60)
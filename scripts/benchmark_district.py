@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+⏱️ District Resolver Benchmark
+Compares the gazetteer trie with the old per-call dict and substring loop
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from schemas.district_gazetteer import get_gazetteer
+
+NAME_PARTS = ["The Sail @ Marina Bay", "212 Jurong East Street 21", "Seletar Hills Estate", "Parc Esta",
+              "Treasure At Tampines", "Bishan Loft", "Clementi Park", "Sunshine Residences",
+              "Upper Bukit Timah View", "Hougang Avenue 8", "One Pearl Bank", "Normanton Park"]
+STATIONS = ["Woodleigh", "Clementi", "Downtown", "Bishan", "Ang Mo Kio", "Eunos", "Botanic Gardens",
+            "Tampines West", "Jurong East", "Stevens", ""]
+
+
+def build_corpus(size: int, seed: int = 11):
+    """Generate (name, mrt_station) pairs"""
+    rng = random.Random(seed)
+    return [(rng.choice(NAME_PARTS), rng.choice(STATIONS)) for _ in range(size)]
+
+
+def legacy_extract_district(name: str, mrt_station: str):
+    """The previous implementation: dict rebuilt per call, substring test per area"""
+    area_districts = {
+        "commonwealth": "D03", "alexandra": "D03", "toa payoh": "D12",
+        "choa chu kang": "D23", "hougang": "D19", "punggol": "D19",
+        "sengkang": "D19", "bishan": "D20", "ang mo kio": "D20",
+        "orchard": "D09", "newton": "D11", "novena": "D11",
+        "marina": "D01", "raffles": "D01", "chinatown": "D02",
+        "tanjong pagar": "D02", "harbourfront": "D04", "telok blangah": "D04",
+        "buona vista": "D05", "west coast": "D05", "clementi": "D05",
+        "tanglin": "D10", "holland": "D10", "bukit timah": "D10",
+        "east coast": "D15", "marine parade": "D15", "bedok": "D16",
+        "tampines": "D18", "pasir ris": "D18", "woodlands": "D25",
+        "admiralty": "D25", "sembawang": "D27", "yishun": "D27",
+        "jurong": "D22", "boon lay": "D22", "tuas": "D22"
+    }
+
+    text_to_search = f"{name} {mrt_station}".lower()
+
+    for area, district in area_districts.items():
+        if area in text_to_search:
+            return district
+
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark district resolution")
+    parser.add_argument("--records", type=int, default=1_000_000, help="number of synthetic records")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.records)
+    gazetteer = get_gazetteer()
+
+    start = time.perf_counter()
+    legacy = [legacy_extract_district(name, station) for name, station in corpus]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    resolved = [gazetteer.resolve(name, station) for name, station in corpus]
+    gazetteer_seconds = time.perf_counter() - start
+
+    print("⏱️ DISTRICT RESOLVER BENCHMARK")
+    print("=" * 50)
+    print(f"📄 Records: {len(corpus):,}")
+    print(f"🐢 Substring loop: {legacy_seconds:8.2f} s  ({len(corpus) / legacy_seconds:,.0f} records/sec)")
+    print(f"🚀 Gazetteer trie: {gazetteer_seconds:8.2f} s  ({len(corpus) / gazetteer_seconds:,.0f} records/sec)")
+    print(f"📈 Speedup: {legacy_seconds / gazetteer_seconds:.2f}x")
+    print(f"📍 Resolved: {sum(1 for d in legacy if d):,} → {sum(1 for d in resolved if d):,}")
+    print(f"🔍 Changed where both resolved: {sum(1 for a, b in zip(legacy, resolved) if a and b and a != b):,}")
+
+
+if __name__ == "__main__":
+    main()
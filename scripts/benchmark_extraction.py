@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+⏱️ Extraction Replay Benchmark
+Replays saved result pages through every extraction path - the advanced card
+extractor, the scraper's fallback strategies, the page-text parser and the
+pure data conversion - and reports throughput, per-page latency and peak memory.
+Results can be saved as a baseline and later runs fail on regressions past a threshold
+"""
+
+import io
+import os
+import re
+import sys
+import json
+import glob
+import math
+import time
+import argparse
+import platform
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+import lxml.html
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from extractors.advanced_extractor import AdvancedPropertyExtractor
+from extractors.html_parser import HtmlPropertyParser, element_text
+from extractors.json_state_extractor import STATE_SCRIPT, find_state_json
+from schemas.pure_data_schema import PureDataSchema
+from scrapers.main_scraper import SmartPropertyScraper
+from storage.snapshot_archive import INDEX_FILE, SnapshotArchive
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures')
+LISTING_ID = re.compile(r'-(\d{8})"')
+
+# Baseline metric -> True when a higher value is better
+COMPARED_METRICS = {'cards_per_sec': True, 'p99_ms': False, 'peak_kb': False}
+
+
+class ReplayDriver:
+    """Answers the scraper's driver calls from one saved page: no browser involved"""
+
+    def __init__(self, page: Dict[str, Any]):
+        self.page = page
+        self.page_source = page['html']
+        self.current_url = page['url']
+
+    def execute_script(self, script, *args):
+        if script == STATE_SCRIPT:
+            return find_state_json(self.page_source)
+        # The bulk card snapshot script
+        return {"selector": args[0][0] if args and args[0] else None, "cards": self.page['cards']}
+
+    def find_element(self, by, value):
+        return _TextElement(self.page['body_text'])
+
+    def find_elements(self, by, value):
+        return []
+
+
+class _TextElement:
+    def __init__(self, text: str):
+        self.text = text
+
+
+def load_page(name: str, html: str, url: Optional[str] = None) -> Dict[str, Any]:
+    """Everything a live browser would hand back for one page, computed up front"""
+    parser = HtmlPropertyParser()
+    document = lxml.html.fromstring(html)
+    body = document.find('body')
+    return {
+        'name': name,
+        'url': url or "",
+        'html': html,
+        'cards': [card.to_dict() for card in parser.card_snapshots(html)],
+        'body_text': element_text(body if body is not None else document),
+    }
+
+
+def build_corpus(page_dirs: Optional[List[str]] = None, archive_dirs: Optional[List[str]] = None,
+                 copies: int = 1) -> List[Dict[str, Any]]:
+    """Saved pages from HTML directories (default: the test fixtures) and snapshot archives.
+
+    Each page is repeated `copies` times with page-specific listing ids, so
+    dedup-sensitive paths see distinct listings.
+    """
+    sources = []
+    if not page_dirs and not archive_dirs:
+        page_dirs = [FIXTURES_DIR]
+
+    for directory in page_dirs or []:
+        for path in sorted(glob.glob(os.path.join(directory, '*.html'))):
+            with open(path, 'r', encoding='utf-8') as f:
+                sources.append((os.path.basename(path), f.read(), None))
+
+    for directory in archive_dirs or []:
+        if not os.path.exists(os.path.join(directory, INDEX_FILE)):
+            raise FileNotFoundError(f"No snapshot archive in {directory}")
+        with SnapshotArchive(directory) as archive:
+            for entry, html, _ in archive.iter_pages():
+                sources.append((entry.get('url') or entry['html'], html, entry.get('url')))
+
+    corpus = []
+    for copy in range(copies):
+        for name, html, url in sources:
+            if copy:
+                html = LISTING_ID.sub(lambda m: f'-{copy:03d}{m.group(1)}"', html)
+            corpus.append(load_page(f"{name}#{copy}" if copies > 1 else name, html, url))
+    return corpus
+
+
+def _advanced_element(page, context):
+    return AdvancedPropertyExtractor(ReplayDriver(page)).extract_properties_from_page()
+
+
+def _fallback_strategies(page, context):
+    scraper = context['scraper']
+    scraper.driver = ReplayDriver(page)
+    return scraper._fallback_extraction_strategies()
+
+
+def _page_text(page, context):
+    scraper = context['scraper']
+    scraper.driver = ReplayDriver(page)
+    return scraper._extract_from_page_text()
+
+
+def _html_parser(page, context):
+    return context['html_parser'].parse(page['html'], page['url'] or None)
+
+
+def _pure_data(page, context):
+    return PureDataSchema.create_property_records(context['records'][page['name']])
+
+
+# Extraction path -> fn(page, context) returning the records it produced
+EXTRACTION_PATHS = {
+    'advanced_element': _advanced_element,
+    'fallback_strategies': _fallback_strategies,
+    'page_text': _page_text,
+    'html_parser': _html_parser,
+    'pure_data_schema': _pure_data,
+}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def run_path(name: str, corpus: List[Dict[str, Any]], context: Dict[str, Any], rounds: int = 3) -> Dict[str, Any]:
+    """Time one extraction path over the corpus; latency uses every round, memory one extra traced pass"""
+    func = EXTRACTION_PATHS[name]
+    latencies = []
+    cards = 0
+    elapsed = 0.0
+
+    # The extractors narrate every page - keep that out of the report
+    with redirect_stdout(io.StringIO()) as sink:
+        for _ in range(rounds):
+            cards = 0
+            for page in corpus:
+                start = time.perf_counter()
+                records = func(page, context)
+                latency = time.perf_counter() - start
+                latencies.append(latency)
+                elapsed += latency
+                cards += len([r for r in records if r])
+            sink.seek(0)
+            sink.truncate()
+
+        tracemalloc.start()
+        try:
+            for page in corpus:
+                func(page, context)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        'pages': len(corpus),
+        'cards': cards,
+        'seconds': elapsed / rounds,
+        'cards_per_sec': cards * rounds / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'peak_kb': peak / 1024,
+    }
+
+
+def run_benchmark(corpus: List[Dict[str, Any]], paths: Optional[List[str]] = None, rounds: int = 3) -> Dict[str, Any]:
+    """Report for every extraction path over the corpus"""
+    with redirect_stdout(io.StringIO()):
+        context = {
+            'scraper': SmartPropertyScraper(),
+            'html_parser': HtmlPropertyParser(),
+        }
+        # Conversion is timed on what the card extractor produced
+        context['records'] = {page['name']: _advanced_element(page, context) for page in corpus}
+
+    results = {name: run_path(name, corpus, context, rounds) for name in paths or EXTRACTION_PATHS}
+    return {
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'corpus_pages': len(corpus),
+        'rounds': rounds,
+        'paths': results,
+    }
+
+
+def find_regressions(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.2) -> List[str]:
+    """Metrics that got worse than the baseline by more than threshold (0.2 = 20%)"""
+    regressions = []
+    for path, base in baseline.get('paths', {}).items():
+        current = report['paths'].get(path)
+        if current is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = base.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            change = (old - new) / old if higher_is_better else (new - old) / old
+            if change > threshold:
+                regressions.append(f"{path} {metric}: {old:,.2f} -> {new:,.2f} ({change:.0%} worse)")
+    return regressions
+
+
+def save_report(report: Dict[str, Any], path: str):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+
+def print_report(report: Dict[str, Any]):
+    print(f"📄 Pages: {report['corpus_pages']:,} (x{report['rounds']} rounds)")
+    print(f"{'path':<22}{'cards/sec':>12}{'p50 ms':>10}{'p99 ms':>10}{'peak KB':>10}")
+    for name, result in report['paths'].items():
+        print(f"{name:<22}{result['cards_per_sec']:>12,.0f}{result['p50_ms']:>10.2f}"
+              f"{result['p99_ms']:>10.2f}{result['peak_kb']:>10,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark extraction paths on saved result pages")
+    parser.add_argument("--pages", action="append", help="directory of saved .html result pages (repeatable)")
+    parser.add_argument("--archive", action="append", help="snapshot archive directory (repeatable)")
+    parser.add_argument("--copies", type=int, default=20, help="copies of each page, with distinct listing ids")
+    parser.add_argument("--rounds", type=int, default=3, help="timing rounds over the corpus")
+    parser.add_argument("--path", action="append", choices=list(EXTRACTION_PATHS), help="only these paths")
+    parser.add_argument("--save-baseline", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed regression (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.pages, args.archive, args.copies)
+    if not corpus:
+        print("❌ No pages to benchmark")
+        sys.exit(2)
+
+    print("⏱️ EXTRACTION BENCHMARK")
+    print("=" * 50)
+    report = run_benchmark(corpus, args.path, args.rounds)
+    print_report(report)
+
+    if args.save_baseline:
+        save_report(report, args.save_baseline)
+        print(f"💾 Baseline saved to: {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = find_regressions(report, baseline, args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} regressions past {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"   {line}")
+            sys.exit(1)
+        print(f"✅ No regressions past {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+⏱️ Field Pattern Micro-Benchmark
+Compares the single-pass card tokenizer with the old per-field re.search calls
+"""
+
+import os
+import sys
+import time
+import argparse
+
+# Add src and tests directories to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'tests'))
+
+from extractors.patterns import scan_card_text
+from legacy_patterns import build_corpus, legacy_scan
+
+
+def time_it(func, corpus, rounds: int) -> float:
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for text in corpus:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark card field tokenizer")
+    parser.add_argument("--cards", type=int, default=20000, help="number of synthetic cards")
+    parser.add_argument("--rounds", type=int, default=5, help="timing rounds (best is reported)")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.cards)
+
+    mismatches = sum(1 for text in corpus if legacy_scan(text) != scan_card_text(text))
+
+    legacy = time_it(legacy_scan, corpus, args.rounds)
+    single_pass = time_it(scan_card_text, corpus, args.rounds)
+
+    print("⏱️ FIELD PATTERN BENCHMARK")
+    print("=" * 50)
+    print(f"📄 Cards: {len(corpus):,} (best of {args.rounds} rounds)")
+    print(f"🐢 Per-field re.search: {legacy * 1000:8.1f} ms  ({len(corpus) / legacy:,.0f} cards/sec)")
+    print(f"🚀 Single-pass scan:    {single_pass * 1000:8.1f} ms  ({len(corpus) / single_pass:,.0f} cards/sec)")
+    print(f"📈 Speedup: {legacy / single_pass:.2f}x")
+    print(f"🔍 Result mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
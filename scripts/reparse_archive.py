@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+♻️ Reparse Snapshot Archive
+Replays archived pages through the current extractors in parallel - no browser,
+no requests - and writes a fresh technical data file
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from extractors.html_parser import HtmlPropertyParser
+from extractors.json_state_extractor import JsonStateExtractor
+from storage.dedup_index import DedupIndex, DUPLICATE
+from storage.jsonl_sink import JsonlSink
+from storage.snapshot_archive import INDEX_FILE, SnapshotArchive, read_blob_at
+from utils.config_loader import load_config, resolve_data_dir
+from utils.logging_setup import setup_logging
+
+# One parser per worker process, built on first use
+_parser = None
+
+
+def _page_parser() -> HtmlPropertyParser:
+    global _parser
+    if _parser is None:
+        _parser = HtmlPropertyParser(state_extractor=JsonStateExtractor.from_config(load_config()))
+    return _parser
+
+
+def reparse_page(task) -> List[Dict[str, Any]]:
+    """Parse one archived page: (archive directory, html location, state location or None, url)"""
+    directory, html_location, state_location, url = task
+    parser = _page_parser()
+    if state_location is not None:
+        state_extractor = parser.state_extractor
+        properties = state_extractor.records(state_extractor.listings_from_text(read_blob_at(directory, state_location)))
+        if properties:
+            return properties
+    return parser.parse(read_blob_at(directory, html_location), url or None)
+
+
+def reparse_archive(directory: str, output_file: str, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Reparse every archived page into output_file (archive order, duplicate listings dropped)"""
+    if not os.path.exists(os.path.join(directory, INDEX_FILE)):
+        raise FileNotFoundError(f"No snapshot archive in {directory}")
+    stats = {'pages': 0, 'records': 0, 'duplicates': 0, 'failed_pages': 0}
+    start = time.time()
+
+    with SnapshotArchive(directory) as archive:
+        tasks = [(directory, archive.blobs[entry['html']],
+                  archive.blobs.get(entry['state']) if entry.get('state') else None, entry.get('url'))
+                 for entry in archive.pages()]
+
+    workers = workers or os.cpu_count() or 1
+    dedup_index = DedupIndex()
+
+    with JsonlSink(output_file) as sink:
+        if workers <= 1 or len(tasks) < 2:
+            results = map(_safe_reparse, tasks)
+            _write_results(results, sink, dedup_index, stats)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(_safe_reparse, tasks, chunksize=max(1, len(tasks) // (workers * 4)))
+                _write_results(results, sink, dedup_index, stats)
+
+    stats['seconds'] = time.time() - start
+    stats['pages_per_sec'] = stats['pages'] / stats['seconds'] if stats['seconds'] else 0.0
+    return stats
+
+
+def _safe_reparse(task) -> Optional[List[Dict[str, Any]]]:
+    try:
+        return reparse_page(task)
+    except Exception as e:
+        print(f"⚠️ Could not reparse {task[3]}: {e}")
+        return None
+
+
+def _write_results(results, sink, dedup_index, stats):
+    for properties in results:
+        stats['pages'] += 1
+        if properties is None:
+            stats['failed_pages'] += 1
+            continue
+        kept = []
+        for prop in properties:
+            if dedup_index.check_and_add(prop) == DUPLICATE:
+                stats['duplicates'] += 1
+            else:
+                kept.append(prop)
+        sink.write_page(kept)
+        stats['records'] += len(kept)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-extract archived pages with the current parsers")
+    parser.add_argument("archive_dir", help="snapshot archive directory (config archive.directory)")
+    parser.add_argument("output_file", nargs="?", help="output technical .jsonl file")
+    parser.add_argument("--workers", type=int, default=0, help="worker processes (0 = all CPUs)")
+    args = parser.parse_args()
+    setup_logging()
+
+    output_file = args.output_file
+    if not output_file:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = os.path.join(resolve_data_dir(), f"extraction_reparsed_{timestamp}.jsonl")
+
+    print("♻️ REPARSE SNAPSHOT ARCHIVE")
+    print("=" * 50)
+    stats = reparse_archive(args.archive_dir, output_file, args.workers)
+    print(f"✅ Reparsed {stats['pages']:,} pages into {stats['records']:,} properties "
+          f"({stats['duplicates']:,} duplicates dropped, {stats['failed_pages']} pages failed)")
+    print(f"⚡ Throughput: {stats['pages_per_sec']:,.1f} pages/sec ({stats['seconds']:.1f}s)")
+    print(f"💾 Technical data saved to: {output_file}")
+    print(f"🔄 Convert with: python src/schemas/batch_converter.py {output_file}")
+
+
+if __name__ == "__main__":
+    main()
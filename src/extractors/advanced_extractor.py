@@ -4,75 +4,108 @@
 Extracts comprehensive property details from PropertyGuru listings
 """
 
-import re
+import logging
 import json
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
+
+from extractors.card_snapshot import (
+    CardSnapshot, CARD_SELECTORS, MIN_CARD_TEXT_LENGTH, capture_card_snapshots
+)
+from extractors.selector_cache import CARDS, DEFAULT_LAYOUT, get_selector_cache
+from extractors.patterns import (
+    PATTERNS, MRT_PATTERNS, DISTRICT_PATTERNS, AGENT_NAME_PATTERNS,
+    AGENT_RATING_PATTERNS, DESCRIPTION_PATTERNS, mrt_fields, to_int
+)
+from utils.metrics import timed
+
+logger = logging.getLogger(__name__)
+
 # Advanced Property Extractor - Pure Data Only
 
 class AdvancedPropertyExtractor:
     """Advanced extractor for comprehensive PropertyGuru property data"""
     
-    def __init__(self, driver):
+    def __init__(self, driver, snapshot_mode: bool = True, layout: str = DEFAULT_LAYOUT):
         self.driver = driver
+        # Snapshot mode pulls every card in one bulk call and parses in pure Python
+        self.snapshot_mode = snapshot_mode
+        # Page layout key for the selector cache (see selector_cache.layout_key)
+        self.layout = layout
         
+    @timed('extract.advanced')
     def extract_properties_from_page(self) -> List[Dict[str, Any]]:
         """Extract all properties from current page with comprehensive details"""
-        print("🔍 Starting advanced property extraction...")
+        logger.debug("🔍 Starting advanced property extraction...")
 
-        properties = []
+        if self.snapshot_mode:
+            snapshots = capture_card_snapshots(self.driver, self.layout)
+            if snapshots:
+                return self.extract_properties_from_snapshots(snapshots, extraction_method="advanced_element")
+            if snapshots is not None:
+                # Same selectors already came back empty in the page, skip the element pass
+                logger.debug("🔄 Using fallback extraction method...")
+                return self._extract_from_page_text()
+            logger.debug("🔄 Snapshot mode unavailable, using element extraction...")
 
-        # More specific PropertyGuru selectors to avoid sub-elements
-        property_selectors = [
-            # PropertyGuru specific main property containers
-            'article[data-testid="listing-card"]',
-            'div[data-testid="listing-card"]',
-            '.listing-card',
-            '.property-card',
-            '.search-result-item',
-            # More specific to avoid sub-elements
-            'div[class*="listing"]:has(img)',
-            'div[class*="property"]:has(img)',
-            # Fallback with stricter criteria
-            'div:has(> img):has(h3)',
-            'div:has(> img):has(h2)'
-        ]
+        # More specific PropertyGuru selectors to avoid sub-elements, last page's winner first
+        selector_cache = get_selector_cache()
+        property_selectors = selector_cache.ordered(CARDS, CARD_SELECTORS, self.layout)
 
         property_elements = []
+        matched_selector = None
         for selector in property_selectors:
             try:
                 elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                 if elements:
-                    print(f"✅ Found {len(elements)} elements with selector: {selector}")
+                    logger.debug("✅ Found %s elements with selector: %s", len(elements), selector)
                     # Filter out elements that are too small (likely sub-elements)
                     filtered_elements = []
                     for elem in elements:
                         try:
-                            text_length = len(elem.text.strip())
-                            if text_length > 100:  # Property cards should have substantial text
-                                filtered_elements.append(elem)
+                            text = elem.text
+                            if len(text.strip()) > MIN_CARD_TEXT_LENGTH:  # Property cards should have substantial text
+                                filtered_elements.append((elem, text))
                         except:
                             continue
 
                     if filtered_elements:
-                        print(f"✅ Filtered to {len(filtered_elements)} substantial property elements")
+                        logger.debug("✅ Filtered to %s substantial property elements", len(filtered_elements))
                         property_elements = filtered_elements
+                        matched_selector = selector
                         break
             except:
                 continue
+        selector_cache.record(CARDS, matched_selector, self.layout)
 
         if not property_elements:
             # Fallback: extract from page structure
-            print("🔄 Using fallback extraction method...")
+            logger.debug("🔄 Using fallback extraction method...")
             return self._extract_from_page_text()
 
+        snapshots = []
+        for element, text in property_elements:
+            try:
+                snapshots.append(CardSnapshot.from_element(element, text=text))
+            except Exception as e:
+                logger.warning("⚠️ Error reading property element: %s", e)
+                snapshots.append(None)
+
+        return self.extract_properties_from_snapshots(snapshots, extraction_method="advanced_element")
+
+    def extract_properties_from_snapshots(self, snapshots: List[Optional[CardSnapshot]],
+                                          extraction_method: str = "advanced_element") -> List[Dict[str, Any]]:
+        """Parse and deduplicate card snapshots without touching the browser"""
+        properties = []
+
         # Extract each property and deduplicate
         seen_properties = set()
-        for i, element in enumerate(property_elements):
+        for i, card in enumerate(snapshots):
+            if card is None:
+                continue
             try:
-                property_data = self._extract_single_property(element, i)
+                property_data = self._extract_single_property(card, i, extraction_method)
                 if property_data and property_data.get("property_name"):
                     # Create unique key for deduplication
                     unique_key = (
@@ -85,38 +118,33 @@ class AdvancedPropertyExtractor:
                         seen_properties.add(unique_key)
                         properties.append(property_data)
                     else:
-                        print(f"🔄 Skipping duplicate: {property_data.get('property_name', 'Unknown')}")
+                        logger.debug("🔄 Skipping duplicate: %s", property_data.get('property_name', 'Unknown'))
             except Exception as e:
-                print(f"⚠️ Error extracting property {i}: {e}")
+                logger.warning("⚠️ Error extracting property %s: %s", i, e)
                 continue
 
-        print(f"✅ Extracted {len(properties)} unique properties with advanced method")
+        logger.debug("✅ Extracted %s unique properties with advanced method", len(properties))
         return properties
     
-    def _extract_single_property(self, element: WebElement, position: int) -> Dict[str, Any]:
-        """Extract comprehensive data from a single property element"""
+    def _extract_single_property(self, card: CardSnapshot, position: int,
+                                 extraction_method: str = "advanced_element") -> Dict[str, Any]:
+        """Extract comprehensive data from a single property card snapshot"""
         property_data = {}
         
         try:
             # Basic metadata
             property_data["id"] = f"property_{position}"
             property_data["position_on_page"] = position
-            property_data["extraction_method"] = "advanced_element"
+            property_data["extraction_method"] = extraction_method
 
             # Extract listing URL
-            try:
-                link_elements = element.find_elements(By.TAG_NAME, 'a')
-                for link in link_elements:
-                    href = link.get_attribute('href')
-                    if href and 'property' in href.lower():
-                        property_data["listing_url"] = href
-                        break
-            except:
-                pass
+            for href in card.links:
+                if href and 'property' in href.lower():
+                    property_data["listing_url"] = href
+                    break
 
             # Property name/title
-            name_selectors = ['h3', 'h2', '.property-title', '.listing-title', '[class*="title"]', 'a[href*="property"]']
-            property_data["property_name"] = self._extract_text(element, name_selectors)
+            property_data["property_name"] = card.title_text
 
             # Address (often same as name for PropertyGuru)
             property_data["full_address"] = property_data["property_name"]
@@ -124,36 +152,36 @@ class AdvancedPropertyExtractor:
 
             # Try to extract postal code from address
             if property_data["property_name"]:
-                postal_match = re.search(r'(\d{6})', property_data["property_name"])
+                postal_match = PATTERNS['postal_code'].search(property_data["property_name"])
                 if postal_match:
                     property_data["postal_code"] = postal_match.group(1)
             
             # Price information
-            self._extract_price_info(element, property_data)
+            self._extract_price_info(card, property_data)
             
             # Property details (beds, baths, area)
-            self._extract_property_details(element, property_data)
+            self._extract_property_details(card, property_data)
             
             # Property type and tenure
-            self._extract_property_type(element, property_data)
+            self._extract_property_type(card, property_data)
             
             # Location and MRT info
-            self._extract_location_info(element, property_data)
+            self._extract_location_info(card, property_data)
             
             # Listing information
-            self._extract_listing_info(element, property_data)
+            self._extract_listing_info(card, property_data)
             
             # Agent information
-            self._extract_agent_info(element, property_data)
+            self._extract_agent_info(card, property_data)
             
             # Images
-            self._extract_image_info(element, property_data)
+            self._extract_image_info(card, property_data)
             
             # Additional features
-            self._extract_additional_features(element, property_data)
+            self._extract_additional_features(card, property_data)
             
             # Raw data for debugging
-            property_data["raw_text"] = element.text[:500] if element.text else ""
+            property_data["raw_text"] = card.text[:500]
             
             # Basic validation - ensure we have essential data
             if not property_data.get("property_name") or not property_data.get("price"):
@@ -162,40 +190,26 @@ class AdvancedPropertyExtractor:
             return property_data
             
         except Exception as e:
-            print(f"⚠️ Error in single property extraction: {e}")
+            logger.warning("⚠️ Error in single property extraction: %s", e)
             return property_data
     
-    def _extract_text(self, element: WebElement, selectors: List[str]) -> str:
-        """Extract text using multiple selectors"""
-        for selector in selectors:
-            try:
-                sub_element = element.find_element(By.CSS_SELECTOR, selector)
-                text = sub_element.text.strip()
-                if text:
-                    return text
-            except:
-                continue
-        return ""
-    
-    def _extract_price_info(self, element: WebElement, property_data: Dict[str, Any]):
+    def _extract_price_info(self, card: CardSnapshot, property_data: Dict[str, Any]):
         """Extract price information"""
         try:
             # Look for price text
-            price_selectors = ['.price', '[class*="price"]', '.amount', '[class*="amount"]']
-            price_text = self._extract_text(element, price_selectors)
+            price_text = card.price_text
+            tokens = card.tokens
             
             if not price_text:
-                # Search in element text
-                text = element.text
-                price_match = re.search(r'S\$\s*([\d,]+(?:\.\d+)?)', text)
-                if price_match:
-                    price_text = f"S$ {price_match.group(1)}"
+                # Search in card text
+                if tokens.get('price'):
+                    price_text = f"S$ {tokens['price']}"
             
             if price_text:
                 property_data["price_formatted"] = price_text
                 
                 # Extract numeric price
-                price_numbers = re.findall(r'[\d,]+', price_text.replace('S$', ''))
+                price_numbers = PATTERNS['number_groups'].findall(price_text.replace('S$', ''))
                 if price_numbers:
                     try:
                         property_data["price"] = int(price_numbers[0].replace(',', ''))
@@ -203,57 +217,53 @@ class AdvancedPropertyExtractor:
                         pass
             
             # Extract price per sqft
-            psf_match = re.search(r'S\$\s*([\d,]+(?:\.\d+)?)\s*psf', element.text, re.IGNORECASE)
-            if psf_match:
-                property_data["price_per_sqft_formatted"] = f"S$ {psf_match.group(1)} psf"
+            psf = tokens.get('psf')
+            if psf:
+                property_data["price_per_sqft_formatted"] = f"S$ {psf} psf"
                 try:
-                    property_data["price_per_sqft"] = float(psf_match.group(1).replace(',', ''))
+                    property_data["price_per_sqft"] = float(psf.replace(',', ''))
                 except:
                     pass
                     
         except Exception as e:
-            print(f"⚠️ Price extraction error: {e}")
+            logger.warning("⚠️ Price extraction error: %s", e)
     
-    def _extract_property_details(self, element: WebElement, property_data: Dict[str, Any]):
+    def _extract_property_details(self, card: CardSnapshot, property_data: Dict[str, Any]):
         """Extract bedrooms, bathrooms, area"""
         try:
-            text = element.text
+            tokens = card.tokens
             
             # Bedrooms
-            bed_match = re.search(r'(\d+)\s*Bed', text, re.IGNORECASE)
-            if bed_match:
-                property_data["bedrooms"] = int(bed_match.group(1))
+            if tokens.get('bedrooms'):
+                property_data["bedrooms"] = int(tokens['bedrooms'])
             
             # Bathrooms  
-            bath_match = re.search(r'(\d+)\s*Bath', text, re.IGNORECASE)
-            if bath_match:
-                property_data["bathrooms"] = int(bath_match.group(1))
+            if tokens.get('bathrooms'):
+                property_data["bathrooms"] = int(tokens['bathrooms'])
             
             # Floor area
-            area_match = re.search(r'([\d,]+)\s*sqft', text, re.IGNORECASE)
-            if area_match:
-                property_data["floor_area_formatted"] = f"{area_match.group(1)} sqft"
-                try:
-                    property_data["floor_area_sqft"] = int(area_match.group(1).replace(',', ''))
-                except:
-                    pass
+            floor_area = tokens.get('floor_area')
+            if floor_area:
+                property_data["floor_area_formatted"] = f"{floor_area} sqft"
+                floor_area_sqft = to_int(floor_area)
+                if floor_area_sqft is not None:
+                    property_data["floor_area_sqft"] = floor_area_sqft
             
             # Land area (for landed properties)
-            land_match = re.search(r'([\d,]+)\s*sqft\s*\(land\)', text, re.IGNORECASE)
-            if land_match:
-                property_data["land_area_formatted"] = f"{land_match.group(1)} sqft (land)"
-                try:
-                    property_data["land_area_sqft"] = int(land_match.group(1).replace(',', ''))
-                except:
-                    pass
+            land_area = tokens.get('land_area')
+            if land_area:
+                property_data["land_area_formatted"] = f"{land_area} sqft (land)"
+                land_area_sqft = to_int(land_area)
+                if land_area_sqft is not None:
+                    property_data["land_area_sqft"] = land_area_sqft
                     
         except Exception as e:
-            print(f"⚠️ Property details extraction error: {e}")
+            logger.warning("⚠️ Property details extraction error: %s", e)
     
-    def _extract_property_type(self, element: WebElement, property_data: Dict[str, Any]):
+    def _extract_property_type(self, card: CardSnapshot, property_data: Dict[str, Any]):
         """Extract property type and tenure"""
         try:
-            text = element.text
+            text = card.text
             
             # Property types
             property_types = [
@@ -275,124 +285,78 @@ class AdvancedPropertyExtractor:
                     break
             
             # Built year
-            built_match = re.search(r'Built:\s*(\d{4})', text)
-            if built_match:
-                property_data["built_year"] = int(built_match.group(1))
+            tokens = card.tokens
+            if tokens.get('built_year'):
+                property_data["built_year"] = int(tokens['built_year'])
             
             # New project completion
-            completion_match = re.search(r'New Project:\s*(\d{4})', text)
-            if completion_match:
-                property_data["completion_year"] = int(completion_match.group(1))
+            if tokens.get('completion_year'):
+                property_data["completion_year"] = int(tokens['completion_year'])
                 
         except Exception as e:
-            print(f"⚠️ Property type extraction error: {e}")
+            logger.warning("⚠️ Property type extraction error: %s", e)
     
-    def _extract_location_info(self, element: WebElement, property_data: Dict[str, Any]):
+    def _extract_location_info(self, card: CardSnapshot, property_data: Dict[str, Any]):
         """Extract MRT and location information"""
         try:
-            text = element.text
-
-            # Multiple MRT patterns to catch different formats
-            mrt_patterns = [
-                # Standard format: "5 min (410 m) from NE11 Woodleigh MRT Station"
-                r'(\d+)\s*min\s*\(([^)]+)\)\s*from\s*([A-Z0-9]+)\s*([^MRT\n]*)\s*MRT Station',
-                # Alternative format: "5 min (410 m) from NE11 Woodleigh"
-                r'(\d+)\s*min\s*\(([^)]+)\)\s*from\s*([A-Z0-9]+)\s*([^\n]*)',
-                # Simple format: "NE11 Woodleigh MRT Station"
-                r'([A-Z0-9]+)\s*([^MRT\n]*)\s*MRT Station',
-                # Distance only: "5 min from Woodleigh MRT"
-                r'(\d+)\s*min.*?from\s*([^MRT\n]*)\s*MRT'
-            ]
-
-            for pattern in mrt_patterns:
-                mrt_match = re.search(pattern, text, re.IGNORECASE)
-                if mrt_match:
-                    groups = mrt_match.groups()
+            text = card.text
 
-                    if len(groups) >= 4:  # Full format
-                        time_dist = f"{groups[0]} min ({groups[1]})"
-                        mrt_code = groups[2]
-                        station_name = groups[3].strip()
-
-                        property_data["mrt_distance"] = time_dist
-                        property_data["mrt_line"] = mrt_code
-                        property_data["mrt_station"] = station_name
-                        property_data["nearest_mrt"] = f"{mrt_code} {station_name} MRT Station"
-                    elif len(groups) >= 2:  # Partial format
-                        if groups[0].isdigit():  # Has time
-                            property_data["mrt_distance"] = f"{groups[0]} min"
-                            property_data["mrt_station"] = groups[1].strip()
-                        else:  # Just station info
-                            property_data["mrt_line"] = groups[0]
-                            property_data["mrt_station"] = groups[1].strip()
-                            property_data["nearest_mrt"] = f"{groups[0]} {groups[1].strip()} MRT Station"
+            # Standard format comes from the tokenizer pass; other formats are tried in order
+            mrt_groups = card.tokens.get('mrt')
+            if not mrt_groups:
+                for pattern in MRT_PATTERNS[1:]:
+                    mrt_match = pattern.search(text)
+                    if mrt_match:
+                        mrt_groups = mrt_match.groups()
+                        break
 
-                    print(f"✅ Found MRT: {property_data.get('nearest_mrt', 'Partial info')}")
-                    break
+            if mrt_groups:
+                property_data.update(mrt_fields(mrt_groups))
+                logger.debug("✅ Found MRT: %s", property_data.get('nearest_mrt', 'Partial info'))
 
             # Extract district from address if possible
             address = property_data.get("property_name", "")
             # Singapore district patterns
-            district_patterns = [
-                r'D(\d{2})',  # D01, D02, etc.
-                r'District\s*(\d{1,2})',
-                # Could add more patterns based on area names
-            ]
-
-            for pattern in district_patterns:
-                district_match = re.search(pattern, text, re.IGNORECASE)
+            for pattern in DISTRICT_PATTERNS:
+                district_match = pattern.search(text)
                 if district_match:
                     property_data["district"] = f"D{district_match.group(1).zfill(2)}"
                     break
 
         except Exception as e:
-            print(f"⚠️ Location extraction error: {e}")
+            logger.warning("⚠️ Location extraction error: %s", e)
     
-    def _extract_listing_info(self, element: WebElement, property_data: Dict[str, Any]):
+    def _extract_listing_info(self, card: CardSnapshot, property_data: Dict[str, Any]):
         """Extract listing date and time information"""
         try:
-            text = element.text
-            
             # Listed date
-            date_match = re.search(r'Listed on\s*([^(]+)\s*\(([^)]+)\)', text)
-            if date_match:
-                property_data["listed_date"] = date_match.group(1).strip()
-                property_data["listed_time_ago"] = date_match.group(2).strip()
+            listed = card.tokens.get('listed')
+            if listed:
+                property_data["listed_date"] = listed[0].strip()
+                property_data["listed_time_ago"] = listed[1].strip()
                 
         except Exception as e:
-            print(f"⚠️ Listing info extraction error: {e}")
+            logger.warning("⚠️ Listing info extraction error: %s", e)
     
-    def _extract_agent_info(self, element: WebElement, property_data: Dict[str, Any]):
+    def _extract_agent_info(self, card: CardSnapshot, property_data: Dict[str, Any]):
         """Extract agent information"""
         try:
-            text = element.text
+            text = card.text
 
             # Agent name patterns
-            agent_patterns = [
-                r'Listed by\s*([^\n\d]+?)(?:\s*\d|\n|$)',  # "Listed by John Doe"
-                r'Agent:\s*([^\n\d]+?)(?:\s*\d|\n|$)',     # "Agent: John Doe"
-                r'Contact\s*([^\n\d]+?)(?:\s*\d|\n|$)',    # "Contact John Doe"
-            ]
-
-            for pattern in agent_patterns:
-                agent_match = re.search(pattern, text, re.IGNORECASE)
+            for pattern in AGENT_NAME_PATTERNS:
+                agent_match = pattern.search(text)
                 if agent_match:
                     agent_name = agent_match.group(1).strip()
                     # Clean up common suffixes
-                    agent_name = re.sub(r'\s*(Contact|Agent)$', '', agent_name, flags=re.IGNORECASE)
+                    agent_name = PATTERNS['agent_suffix'].sub('', agent_name)
                     if len(agent_name) > 2:  # Valid name
                         property_data["agent_name"] = agent_name
                         break
 
             # Agent rating - look for patterns like "4.5" or "5.0" near agent name
-            rating_patterns = [
-                r'(?:Listed by|Agent:).*?(\d+\.\d+)',
-                r'(\d+\.\d+)(?:\s*stars?|\s*rating|\s*/\s*5)',
-                r'Rating:\s*(\d+\.\d+)',
-            ]
-
-            for pattern in rating_patterns:
-                rating_match = re.search(pattern, text, re.IGNORECASE)
+            for pattern in AGENT_RATING_PATTERNS:
+                rating_match = pattern.search(text)
                 if rating_match:
                     try:
                         rating = float(rating_match.group(1))
@@ -403,13 +367,8 @@ class AdvancedPropertyExtractor:
                         continue
 
             # Agent description (property description/tagline)
-            desc_patterns = [
-                r'"([^"]+)"',  # Text in quotes
-                r'["""]([^"""]+)["""]',  # Smart quotes
-            ]
-
-            for pattern in desc_patterns:
-                desc_match = re.search(pattern, text)
+            for pattern in DESCRIPTION_PATTERNS:
+                desc_match = pattern.search(text)
                 if desc_match:
                     description = desc_match.group(1).strip()
                     if len(description) > 10:  # Substantial description
@@ -417,29 +376,28 @@ class AdvancedPropertyExtractor:
                         break
 
         except Exception as e:
-            print(f"⚠️ Agent info extraction error: {e}")
+            logger.warning("⚠️ Agent info extraction error: %s", e)
     
-    def _extract_image_info(self, element: WebElement, property_data: Dict[str, Any]):
+    def _extract_image_info(self, card: CardSnapshot, property_data: Dict[str, Any]):
         """Extract image information"""
         try:
             # Look for images
-            img_elements = element.find_elements(By.TAG_NAME, 'img')
-            if img_elements:
-                property_data["image_count"] = len(img_elements)
+            image_srcs = card.image_srcs
+            if image_srcs:
+                property_data["image_count"] = len(image_srcs)
                 # Get main image URL
-                main_img = img_elements[0]
-                src = main_img.get_attribute('src')
+                src = image_srcs[0]
                 if src and 'http' in src:
                     property_data["main_image_url"] = src
                     property_data["image_urls"] = [src]
                     
         except Exception as e:
-            print(f"⚠️ Image extraction error: {e}")
+            logger.warning("⚠️ Image extraction error: %s", e)
     
-    def _extract_additional_features(self, element: WebElement, property_data: Dict[str, Any]):
+    def _extract_additional_features(self, card: CardSnapshot, property_data: Dict[str, Any]):
         """Extract additional features and amenities"""
         try:
-            text = element.text.lower()
+            text = card.text.lower()
             
             # Check for special features
             if 'virtual tour' in text:
@@ -450,18 +408,28 @@ class AdvancedPropertyExtractor:
                 property_data["featured_listing"] = True
                 
         except Exception as e:
-            print(f"⚠️ Additional features extraction error: {e}")
+            logger.warning("⚠️ Additional features extraction error: %s", e)
     
+    @timed('extract.advanced_text')
     def _extract_from_page_text(self) -> List[Dict[str, Any]]:
         """Fallback: extract from page text when elements not found"""
-        print("🔄 Using text-based extraction fallback...")
+        logger.debug("🔄 Using text-based extraction fallback...")
         
         try:
             page_text = self.driver.find_element(By.TAG_NAME, "body").text
+        except Exception as e:
+            logger.warning("⚠️ Text extraction error: %s", e)
+            return []
+
+        return self.extract_properties_from_text(page_text)
+
+    def extract_properties_from_text(self, page_text: str) -> List[Dict[str, Any]]:
+        """Split visible page text into property blocks and parse each one"""
+        try:
             properties = []
             
             # Split by property patterns
-            property_blocks = re.split(r'S\$\s*[\d,]+', page_text)
+            property_blocks = PATTERNS['price_block_split'].split(page_text)
             
             for i, block in enumerate(property_blocks[1:], 1):  # Skip first empty block
                 if len(block.strip()) < 50:  # Too short to be a property
@@ -487,13 +455,13 @@ class AdvancedPropertyExtractor:
             return properties[:25]  # Limit to reasonable number
             
         except Exception as e:
-            print(f"⚠️ Text extraction error: {e}")
+            logger.warning("⚠️ Text extraction error: %s", e)
             return []
     
     def _extract_price_info_from_text(self, text: str, property_data: Dict[str, Any]):
         """Extract price from text block"""
         # Find price before this block
-        price_match = re.search(r'S\$\s*([\d,]+)', text)
+        price_match = PATTERNS['price_integer'].search(text)
         if price_match:
             property_data["price_formatted"] = f"S$ {price_match.group(1)}"
             try:
@@ -504,12 +472,12 @@ class AdvancedPropertyExtractor:
     def _extract_property_details_from_text(self, text: str, property_data: Dict[str, Any]):
         """Extract property details from text block"""
         # Bedrooms
-        bed_match = re.search(r'(\d+)\s*Bed', text, re.IGNORECASE)
+        bed_match = PATTERNS['bedrooms'].search(text)
         if bed_match:
             property_data["bedrooms"] = int(bed_match.group(1))
         
         # Area
-        area_match = re.search(r'([\d,]+)\s*sqft', text, re.IGNORECASE)
+        area_match = PATTERNS['floor_area'].search(text)
         if area_match:
             try:
                 property_data["floor_area_sqft"] = int(area_match.group(1).replace(',', ''))
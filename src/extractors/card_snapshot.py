@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+📸 Listing Card Snapshots
+Plain-Python copies of listing cards so field parsing never touches the browser
+"""
+
+import logging
+from typing import List, Dict, Any, Optional
+from selenium.webdriver.common.by import By
+
+from extractors.patterns import scan_card_text
+from extractors.selector_cache import CARDS, DEFAULT_LAYOUT, SelectorCache, get_selector_cache
+
+logger = logging.getLogger(__name__)
+
+# Selectors shared by the element path and the bulk snapshot script
+CARD_SELECTORS = [
+    # PropertyGuru specific main property containers
+    'article[data-testid="listing-card"]',
+    'div[data-testid="listing-card"]',
+    '.listing-card',
+    '.property-card',
+    '.search-result-item',
+    # More specific to avoid sub-elements
+    'div[class*="listing"]:has(img)',
+    'div[class*="property"]:has(img)',
+    # Fallback with stricter criteria
+    'div:has(> img):has(h3)',
+    'div:has(> img):has(h2)'
+]
+
+TITLE_SELECTORS = ['h3', 'h2', '.property-title', '.listing-title', '[class*="title"]', 'a[href*="property"]']
+PRICE_SELECTORS = ['.price', '[class*="price"]', '.amount', '[class*="amount"]']
+
+# Property cards should have substantial text
+MIN_CARD_TEXT_LENGTH = 100
+
+# Runs inside the page: picks the first card selector with substantial matches and
+# returns every card's text, links, image srcs and outerHTML in one round-trip
+CARD_SNAPSHOT_SCRIPT = """
+const selectors = arguments[0];
+const titleSelectors = arguments[1];
+const priceSelectors = arguments[2];
+const minLength = arguments[3];
+
+function firstText(card, subSelectors) {
+    for (const sel of subSelectors) {
+        try {
+            const node = card.querySelector(sel);
+            if (node) {
+                const text = (node.innerText || '').trim();
+                if (text) { return text; }
+            }
+        } catch (e) {}
+    }
+    return '';
+}
+
+for (const selector of selectors) {
+    let elements;
+    try { elements = document.querySelectorAll(selector); } catch (e) { continue; }
+    if (!elements.length) { continue; }
+    const cards = [];
+    for (const card of elements) {
+        const text = card.innerText || '';
+        if (text.trim().length <= minLength) { continue; }
+        cards.push({
+            text: text,
+            links: Array.from(card.querySelectorAll('a')).map(a => a.href || ''),
+            image_srcs: Array.from(card.querySelectorAll('img')).map(img => img.src || ''),
+            outer_html: card.outerHTML,
+            title_text: firstText(card, titleSelectors),
+            price_text: firstText(card, priceSelectors)
+        });
+    }
+    if (cards.length) { return {selector: selector, cards: cards}; }
+}
+return {selector: null, cards: []};
+"""
+
+
+class CardSnapshot:
+    """Everything the field extractors need from one listing card"""
+
+    def __init__(self, text: str = "", links: Optional[List[str]] = None,
+                 image_srcs: Optional[List[str]] = None, outer_html: str = "",
+                 title_text: str = "", price_text: str = ""):
+        self.text = text or ""
+        self.links = links or []
+        self.image_srcs = image_srcs or []
+        self.outer_html = outer_html or ""
+        self.title_text = title_text or ""
+        self.price_text = price_text or ""
+        self._tokens = None
+
+    @property
+    def tokens(self) -> Dict[str, Any]:
+        """Card fields from a single tokenizer pass, computed once per card"""
+        if self._tokens is None:
+            self._tokens = scan_card_text(self.text)
+        return self._tokens
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CardSnapshot":
+        """Build a snapshot from the dict returned by CARD_SNAPSHOT_SCRIPT"""
+        return cls(
+            text=data.get("text", ""),
+            links=data.get("links"),
+            image_srcs=data.get("image_srcs"),
+            outer_html=data.get("outer_html", ""),
+            title_text=data.get("title_text", ""),
+            price_text=data.get("price_text", "")
+        )
+
+    @classmethod
+    def from_element(cls, element, text: Optional[str] = None) -> "CardSnapshot":
+        """Build a snapshot from a live WebElement (one read per attribute)"""
+        if text is None:
+            text = element.text or ""
+
+        links = []
+        try:
+            links = [link.get_attribute('href') or "" for link in element.find_elements(By.TAG_NAME, 'a')]
+        except:
+            pass
+
+        image_srcs = []
+        try:
+            image_srcs = [img.get_attribute('src') or "" for img in element.find_elements(By.TAG_NAME, 'img')]
+        except:
+            pass
+
+        return cls(
+            text=text,
+            links=links,
+            image_srcs=image_srcs,
+            title_text=_first_sub_element_text(element, TITLE_SELECTORS),
+            price_text=_first_sub_element_text(element, PRICE_SELECTORS)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "text": self.text,
+            "links": self.links,
+            "image_srcs": self.image_srcs,
+            "outer_html": self.outer_html,
+            "title_text": self.title_text,
+            "price_text": self.price_text
+        }
+
+
+def _first_sub_element_text(element, selectors: List[str]) -> str:
+    """Return the text of the first selector that yields a non-empty sub-element"""
+    for selector in selectors:
+        try:
+            sub_element = element.find_element(By.CSS_SELECTOR, selector)
+            text = sub_element.text.strip()
+            if text:
+                return text
+        except:
+            continue
+    return ""
+
+
+def capture_card_snapshots(driver, layout: str = DEFAULT_LAYOUT,
+                           selector_cache: Optional[SelectorCache] = None) -> Optional[List[CardSnapshot]]:
+    """Snapshot every listing card on the current page in a single WebDriver call.
+
+    The selector that matched last time on this layout is tried first.
+    Returns None when the script could not run, and an empty list when no
+    selector matched substantial cards.
+    """
+    cache = selector_cache or get_selector_cache()
+    try:
+        result = driver.execute_script(
+            CARD_SNAPSHOT_SCRIPT, cache.ordered(CARDS, CARD_SELECTORS, layout),
+            TITLE_SELECTORS, PRICE_SELECTORS, MIN_CARD_TEXT_LENGTH
+        )
+    except Exception as e:
+        logger.warning("⚠️ Card snapshot script failed: %s", e)
+        return None
+
+    if not isinstance(result, dict):
+        return None
+
+    cards = [CardSnapshot.from_dict(card) for card in result.get("cards") or []]
+    cache.record(CARDS, result.get("selector") if cards else None, layout)
+    if cards:
+        logger.debug("✅ Snapshotted %s cards with selector: %s", len(cards), result.get('selector'))
+    return cards
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+🧩 Offline HTML Property Parser
+Parses saved or captured PropertyGuru result pages with lxml - no browser required
+"""
+
+import sys
+import os
+from typing import List, Dict, Any, Optional
+from urllib.parse import urljoin
+
+import lxml.html
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from extractors.advanced_extractor import AdvancedPropertyExtractor
+from extractors.card_snapshot import (
+    CardSnapshot, CARD_SELECTORS, TITLE_SELECTORS, PRICE_SELECTORS, MIN_CARD_TEXT_LENGTH
+)
+from extractors.json_state_extractor import BASE_URL, JsonStateExtractor
+from extractors.selector_cache import CARDS, get_selector_cache, layout_key
+
+
+def _class_xpath(class_name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+# lxml has no CSS engine without cssselect, so the shared selectors are mapped to XPath
+CARD_XPATHS = {
+    'article[data-testid="listing-card"]': '//article[@data-testid="listing-card"]',
+    'div[data-testid="listing-card"]': '//div[@data-testid="listing-card"]',
+    '.listing-card': f'//*[{_class_xpath("listing-card")}]',
+    '.property-card': f'//*[{_class_xpath("property-card")}]',
+    '.search-result-item': f'//*[{_class_xpath("search-result-item")}]',
+    'div[class*="listing"]:has(img)': '//div[contains(@class, "listing")][.//img]',
+    'div[class*="property"]:has(img)': '//div[contains(@class, "property")][.//img]',
+    'div:has(> img):has(h3)': '//div[img][.//h3]',
+    'div:has(> img):has(h2)': '//div[img][.//h2]',
+}
+
+SUB_ELEMENT_XPATHS = {
+    'h3': './/h3',
+    'h2': './/h2',
+    '.property-title': f'.//*[{_class_xpath("property-title")}]',
+    '.listing-title': f'.//*[{_class_xpath("listing-title")}]',
+    '[class*="title"]': './/*[contains(@class, "title")]',
+    'a[href*="property"]': './/a[contains(@href, "property")]',
+    '.price': f'.//*[{_class_xpath("price")}]',
+    '[class*="price"]': './/*[contains(@class, "price")]',
+    '.amount': f'.//*[{_class_xpath("amount")}]',
+    '[class*="amount"]': './/*[contains(@class, "amount")]',
+}
+
+# Elements rendered on their own line by the browser's innerText
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'fieldset',
+    'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table',
+    'tbody', 'thead', 'tfoot', 'tr', 'ul'
+}
+SKIPPED_TAGS = {'script', 'style', 'noscript', 'template', 'head'}
+
+
+def element_text(element) -> str:
+    """Approximate the browser's innerText for an lxml element"""
+    chunks = []
+
+    def walk(node, include_tail=True):
+        tag = node.tag if isinstance(node.tag, str) else None
+        if tag not in SKIPPED_TAGS:
+            if tag == 'br' or tag in BLOCK_TAGS:
+                chunks.append('\n')
+            if tag is not None and node.text:
+                chunks.append(node.text)
+            for child in node:
+                walk(child)
+            if tag in BLOCK_TAGS:
+                chunks.append('\n')
+        if include_tail and node.tail:
+            chunks.append(node.tail)
+
+    # The element's own tail belongs to its parent
+    walk(element, include_tail=False)
+
+    lines = []
+    for line in ''.join(chunks).split('\n'):
+        line = ' '.join(line.split())
+        if line:
+            lines.append(line)
+    return '\n'.join(lines)
+
+
+class HtmlPropertyParser:
+    """Turns raw result-page HTML into the same dicts extract_properties_from_page returns"""
+
+    def __init__(self, base_url: str = BASE_URL, state_extractor: Optional[JsonStateExtractor] = None):
+        self.base_url = base_url
+        # The extractor only needs a driver for live pages; parsing snapshots is pure Python
+        self.extractor = AdvancedPropertyExtractor(driver=None)
+        self.state_extractor = state_extractor or JsonStateExtractor(base_url=base_url)
+
+    def parse(self, html: str, base_url: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Parse a full result page, from its embedded state when it has one"""
+        if not html or not html.strip():
+            return []
+
+        properties = self.state_extractor.extract(html)
+        if properties:
+            return properties
+
+        document = lxml.html.fromstring(html)
+        snapshots = self._card_snapshots(document, base_url or self.base_url)
+        if snapshots:
+            return self.extractor.extract_properties_from_snapshots(snapshots, extraction_method="html_snapshot")
+
+        # Same fallback as the live extractor: split the visible page text
+        body = document.find('body')
+        page_text = element_text(body if body is not None else document)
+        return self.extractor.extract_properties_from_text(page_text)
+
+    def parse_file(self, path: str, base_url: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Parse a saved result page from disk"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return self.parse(f.read(), base_url)
+
+    def card_snapshots(self, html: str, base_url: Optional[str] = None) -> List[CardSnapshot]:
+        """Return the card snapshots found in a page without parsing fields"""
+        if not html or not html.strip():
+            return []
+        return self._card_snapshots(lxml.html.fromstring(html), base_url or self.base_url)
+
+    def _card_snapshots(self, document, base_url: str) -> List[CardSnapshot]:
+        selector_cache = get_selector_cache()
+        layout = layout_key(base_url)
+        for selector in selector_cache.ordered(CARDS, CARD_SELECTORS, layout):
+            elements = document.xpath(CARD_XPATHS[selector])
+            snapshots = []
+            for element in elements:
+                text = element_text(element)
+                if len(text.strip()) > MIN_CARD_TEXT_LENGTH:
+                    snapshots.append(self._snapshot(element, text, base_url))
+            if snapshots:
+                selector_cache.record(CARDS, selector, layout)
+                return snapshots
+        selector_cache.record(CARDS, None, layout)
+        return []
+
+    def _snapshot(self, element, text: str, base_url: str) -> CardSnapshot:
+        links = [urljoin(base_url, a.get('href')) if a.get('href') else "" for a in element.iter('a')]
+        image_srcs = [urljoin(base_url, img.get('src')) if img.get('src') else "" for img in element.iter('img')]
+        return CardSnapshot(
+            text=text,
+            links=links,
+            image_srcs=image_srcs,
+            outer_html=lxml.html.tostring(element, encoding='unicode', with_tail=False),
+            title_text=self._first_text(element, TITLE_SELECTORS),
+            price_text=self._first_text(element, PRICE_SELECTORS)
+        )
+
+    def _first_text(self, element, selectors: List[str]) -> str:
+        for selector in selectors:
+            matches = element.xpath(SUB_ELEMENT_XPATHS[selector])
+            if matches:
+                text = element_text(matches[0]).strip()
+                if text:
+                    return text
+        return ""
+
+
+def parse_page_html(html: str, base_url: str = BASE_URL) -> List[Dict[str, Any]]:
+    """Module-level entry point so worker processes can parse pages"""
+    return HtmlPropertyParser(base_url).parse(html)
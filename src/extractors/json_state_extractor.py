@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+🧬 JSON State Extractor
+Reads listings straight from the page's embedded Next.js state (__NEXT_DATA__)
+instead of the rendered cards: one string search, one JSON decode, one walk down
+a configured path, and a field map into the technical record
+"""
+
+import sys
+import os
+import json
+from typing import List, Dict, Any, Optional, Union
+from urllib.parse import urljoin
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from extractors.patterns import parse_mrt_text, to_int
+
+BASE_URL = "https://www.propertyguru.com.sg/"
+
+STATE_SCRIPT_MARKER = 'id="__NEXT_DATA__"'
+STATE_ASSIGNMENT_MARKER = 'window.__NEXT_DATA__'
+
+# Reads the state blob in the browser without serializing the whole page source
+STATE_SCRIPT = """
+const element = document.getElementById('__NEXT_DATA__');
+return element ? element.textContent : null;
+"""
+
+# Where the search results live in the state, and the listing object inside each result
+DEFAULT_LISTINGS_PATH = "props.pageProps.pageData.data.listingsData"
+DEFAULT_ITEM_PATH = "listingData"
+
+# Technical record field -> path (or alternative paths) inside a listing
+DEFAULT_FIELD_MAP = {
+    "listing_id": "id",
+    "listing_url": "url",
+    "property_name": ["localizedTitle", "title", "propertyName"],
+    "full_address": ["fullAddress", "address"],
+    "postal_code": "postcode",
+    "price": "price.value",
+    "price_formatted": "price.pretty",
+    "price_per_sqft": "pricePerArea.value",
+    "bedrooms": "bedrooms",
+    "bathrooms": "bathrooms",
+    "floor_area_sqft": "floorArea",
+    "property_type": ["propertyType", "property.typeText"],
+    "tenure": "tenure",
+    "built_year": "completionYear",
+    "district": "districtCode",
+    "nearest_mrt": "mrt.nearbyText",
+    "listed_date": "postedOn.text",
+    "agent_name": "agent.name",
+    "main_image_url": "media.cover.url",
+    "verified_listing": "isVerified",
+}
+
+INT_FIELDS = {"price", "bedrooms", "bathrooms", "floor_area_sqft", "land_area_sqft", "built_year", "completion_year"}
+FLOAT_FIELDS = {"price_per_sqft"}
+URL_FIELDS = {"listing_url", "main_image_url"}
+
+_DECODER = json.JSONDecoder()
+
+
+def find_state_json(html: str) -> Optional[str]:
+    """Text of the embedded state from a page source, located with plain string searches"""
+    if not html:
+        return None
+
+    start = html.find(STATE_SCRIPT_MARKER)
+    if start != -1:
+        body_start = html.find('>', start)
+        body_end = html.find('</script>', body_start)
+        if body_start != -1 and body_end != -1:
+            return html[body_start + 1:body_end]
+
+    start = html.find(STATE_ASSIGNMENT_MARKER)
+    if start != -1:
+        brace = html.find('{', start)
+        if brace != -1:
+            # raw_decode stops at the end of the object, so the rest of the page can stay attached
+            return html[brace:]
+    return None
+
+
+def decode_state(text: Optional[str]) -> Optional[Any]:
+    """Decode the first JSON value in the text, None when there is none"""
+    if not text:
+        return None
+    try:
+        value, _ = _DECODER.raw_decode(text.strip())
+        return value
+    except ValueError:
+        return None
+
+
+def get_path(data: Any, path: str) -> Any:
+    """Follow a dotted path ("a.b.0.c") through dicts and lists; None when any step is missing"""
+    if not path:
+        return data
+    for key in path.split('.'):
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+            data = data[int(key)]
+        else:
+            return None
+        if data is None:
+            return None
+    return data
+
+
+def _coerce(field: str, value: Any) -> Any:
+    if field in INT_FIELDS:
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, (int, float)):
+            return int(value)
+        return to_int(str(value))
+    if field in FLOAT_FIELDS:
+        try:
+            return float(str(value).replace(',', ''))
+        except ValueError:
+            return None
+    return value
+
+
+class JsonStateExtractor:
+    """Maps the listings in a page's embedded state to technical records"""
+
+    def __init__(self, listings_path: str = DEFAULT_LISTINGS_PATH, item_path: str = DEFAULT_ITEM_PATH,
+                 field_map: Optional[Dict[str, Union[str, List[str]]]] = None, base_url: str = BASE_URL):
+        """
+        Args:
+            listings_path: Dotted path from the state root to the list of search results
+            item_path: Dotted path from a search result to its listing object ("" for the result itself)
+            field_map: Technical record field -> path or list of alternative paths inside a listing
+            base_url: Site URL relative listing and image links are resolved against
+        """
+        self.listings_path = listings_path
+        self.item_path = item_path
+        field_map = field_map if field_map is not None else DEFAULT_FIELD_MAP
+        self.field_map = {field: [paths] if isinstance(paths, str) else list(paths)
+                          for field, paths in field_map.items()}
+        self.base_url = base_url
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> "JsonStateExtractor":
+        """Extractor from the "json_state" config section"""
+        from utils.config_loader import load_config, get_setting
+
+        if config is None:
+            config = load_config()
+        return cls(
+            listings_path=get_setting(config, 'json_state.listings_path', DEFAULT_LISTINGS_PATH),
+            item_path=get_setting(config, 'json_state.item_path', DEFAULT_ITEM_PATH),
+            field_map=get_setting(config, 'json_state.fields', None) or DEFAULT_FIELD_MAP,
+        )
+
+    def listings(self, state: Any) -> List[Dict[str, Any]]:
+        """Listing objects at the configured path of a decoded state"""
+        results = get_path(state, self.listings_path)
+        if not isinstance(results, list):
+            return []
+        listings = []
+        for result in results:
+            item = get_path(result, self.item_path)
+            if isinstance(item, dict):
+                listings.append(item)
+        return listings
+
+    def listings_from_text(self, text: Optional[str]) -> List[Dict[str, Any]]:
+        return self.listings(decode_state(text))
+
+    def listings_from_html(self, html: str) -> List[Dict[str, Any]]:
+        return self.listings_from_text(find_state_json(html))
+
+    def records(self, listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Technical records for listing objects; listings without a name or price are dropped"""
+        records = []
+        seen = set()
+        for position, item in enumerate(listings):
+            record = self._record(item, position)
+            if not record.get("property_name") or not record.get("price"):
+                continue
+            key = record.get("listing_id") or (record["property_name"], record["price"], record.get("bedrooms", 0))
+            if key in seen:
+                continue
+            seen.add(key)
+            records.append(record)
+        return records
+
+    def extract(self, html: str) -> List[Dict[str, Any]]:
+        """Records from a page source; empty when the page has no usable state"""
+        return self.records(self.listings_from_html(html))
+
+    def _record(self, item: Dict[str, Any], position: int) -> Dict[str, Any]:
+        record = {
+            "id": f"property_{position}",
+            "position_on_page": position,
+            "extraction_method": "json_state",
+        }
+        for field, paths in self.field_map.items():
+            for path in paths:
+                value = get_path(item, path)
+                if value is None or value == "":
+                    continue
+                value = _coerce(field, value)
+                if value is None:
+                    continue
+                if field in URL_FIELDS and isinstance(value, str):
+                    value = urljoin(self.base_url, value)
+                record[field] = value
+                break
+
+        if "listing_id" in record:
+            record["listing_id"] = str(record["listing_id"])
+        if record.get("property_name") and "full_address" not in record:
+            record["full_address"] = record["property_name"]
+        if "main_image_url" in record:
+            record["image_urls"] = [record["main_image_url"]]
+        if "nearest_mrt" in record:
+            # The schema reads the split fields; fields mapped directly from the state win
+            for field, value in parse_mrt_text(record["nearest_mrt"]).items():
+                record.setdefault(field, value)
+        return record
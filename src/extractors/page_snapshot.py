@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+📄 Result Page Snapshots
+Captures what a results page needs for parsing so the browser can move on immediately
+"""
+
+import logging
+import time
+from typing import List, Dict, Any, Optional, Tuple
+from selenium.webdriver.common.by import By
+
+from extractors.card_snapshot import CardSnapshot, capture_card_snapshots
+from extractors.json_state_extractor import STATE_SCRIPT, JsonStateExtractor
+from extractors.selector_cache import layout_key
+from utils.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+
+class PageSnapshot:
+    """One captured results page: embedded state listings or card snapshots, or raw text/HTML when neither matched"""
+
+    def __init__(self, page_number: int, url: str = "", cards: Optional[List[CardSnapshot]] = None,
+                 page_text: str = "", html: str = "", next_url: Optional[str] = None,
+                 state_listings: Optional[List[Dict[str, Any]]] = None,
+                 state_records: Optional[List[Dict[str, Any]]] = None):
+        self.page_number = page_number
+        self.url = url or ""
+        self.state_listings = state_listings or []
+        # Technical records mapped from state_listings at capture time (not serialised)
+        self.state_records = state_records or []
+        self.cards = cards or []
+        self.page_text = page_text or ""
+        self.html = html or ""
+        self.next_url = next_url
+        self.captured_at = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "page_number": self.page_number,
+            "url": self.url,
+            "state_listings": self.state_listings,
+            "cards": [card.to_dict() for card in self.cards],
+            "page_text": self.page_text,
+            "html": self.html,
+            "next_url": self.next_url
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PageSnapshot":
+        return cls(
+            page_number=data.get("page_number", 0),
+            url=data.get("url", ""),
+            cards=[CardSnapshot.from_dict(card) for card in data.get("cards") or []],
+            page_text=data.get("page_text", ""),
+            html=data.get("html", ""),
+            next_url=data.get("next_url"),
+            state_listings=data.get("state_listings")
+        )
+
+
+def capture_state_records(driver, state_extractor: JsonStateExtractor
+                          ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Listings from the page's embedded state and the records they map to, both empty when none map"""
+    try:
+        listings = state_extractor.listings_from_text(driver.execute_script(STATE_SCRIPT))
+        records = state_extractor.records(listings)
+    except Exception:
+        return [], []
+    return (listings, records) if records else ([], [])
+
+
+@timed('capture.page')
+def capture_page_snapshot(driver, page_number: int,
+                          state_extractor: Optional[JsonStateExtractor] = None) -> PageSnapshot:
+    """Capture the current page with as few WebDriver round-trips as possible.
+
+    With a state extractor the embedded __NEXT_DATA__ listings are tried first
+    and the DOM is not read at all when they are usable. Otherwise cards come
+    from the bulk snapshot script. If the selectors found nothing the visible
+    body text is kept for the text fallback, and if the script could not run
+    at all the page source is kept for the offline HTML parser.
+    """
+    url = ""
+    try:
+        url = driver.current_url
+    except:
+        pass
+
+    if state_extractor is not None:
+        state_listings, state_records = capture_state_records(driver, state_extractor)
+        if state_records:
+            return PageSnapshot(page_number, url, state_listings=state_listings, state_records=state_records)
+
+    cards = capture_card_snapshots(driver, layout_key(url))
+    if cards:
+        return PageSnapshot(page_number, url, cards=cards)
+
+    if cards is not None:
+        try:
+            page_text = driver.find_element(By.TAG_NAME, "body").text
+            return PageSnapshot(page_number, url, page_text=page_text)
+        except Exception as e:
+            logger.warning("⚠️ Could not read page text: %s", e)
+
+    try:
+        return PageSnapshot(page_number, url, html=driver.page_source)
+    except Exception as e:
+        logger.warning("⚠️ Could not read page source: %s", e)
+        return PageSnapshot(page_number, url)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+🧬 Field Extraction Patterns
+Precompiled regex registry shared by every extractor, plus a single-pass card tokenizer
+"""
+
+import re
+from typing import Dict, Any, Optional
+
+# Named registry of every pattern used to pull fields out of card and page text
+PATTERNS = {
+    # Prices
+    'price': re.compile(r'S\$\s*([\d,]+(?:\.\d+)?)'),
+    'price_integer': re.compile(r'S\$\s*([\d,]+)'),
+    'price_block_split': re.compile(r'S\$\s*[\d,]+'),
+    'number_groups': re.compile(r'[\d,]+'),
+    'psf': re.compile(r'S\$\s*([\d,]+(?:\.\d+)?)\s*psf', re.IGNORECASE),
+
+    # Rooms and area
+    'bedrooms': re.compile(r'(\d+)\s*Bed', re.IGNORECASE),
+    'bedrooms_strict': re.compile(r'(\d+)\s+Beds?'),
+    'bathrooms': re.compile(r'(\d+)\s*Bath', re.IGNORECASE),
+    'floor_area': re.compile(r'([\d,]+)\s*sqft', re.IGNORECASE),
+    'floor_area_strict': re.compile(r'(\d+,?\d*)\s+sqft'),
+    'land_area': re.compile(r'([\d,]+)\s*sqft\s*\(land\)', re.IGNORECASE),
+
+    # Property details
+    'built_year': re.compile(r'Built:\s*(\d{4})'),
+    'completion_year': re.compile(r'New Project:\s*(\d{4})'),
+    'postal_code': re.compile(r'(\d{6})'),
+    # A bare district code as a source states it: 'D09', 'd9' or '9'
+    'district_code': re.compile(r'D?(\d{1,2})', re.IGNORECASE),
+    'listed_date': re.compile(r'Listed on\s*([^(]+)\s*\(([^)]+)\)'),
+    'first_integer': re.compile(r'(\d+)'),
+
+    # Trailing 'MRT Station' the looser MRT patterns leave on a station name
+    'mrt_suffix': re.compile(r'\s*MRT(?:\s+Station)?\s*$', re.IGNORECASE),
+
+    # Agent
+    'agent_suffix': re.compile(r'\s*(Contact|Agent)$', re.IGNORECASE),
+
+    # Pages
+    'page_param': re.compile(r'[?&]page=(\d+)'),
+    # Search result paths: /property-for-sale (page 1) or /property-for-sale/7 (page 7)
+    'search_page_path': re.compile(r'(/property-for-(?:sale|rent))(?:/(\d+))?/?$'),
+    # Listing URLs end in the numeric listing id: .../hdb-for-sale-212-jurong-east-street-21-60013717
+    'listing_id': re.compile(r'/listing/(?:[^/?#]*-)?(\d{5,})(?:[/?#]|$)'),
+    'result_count': re.compile(r'([\d,]+)\s+Properties'),
+    'html_title': re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL),
+    'project_name': re.compile(r'^([A-Z][a-zA-Z\s&@]+(?:Residences?|Towers?|Hill|House|Nine|Waterfront|Handy|Paterson|Promont|Emerald|Shenton|Newton|Zion|Hijauan|Cairnhill|Attitude|Leonie|Wharf|Abode|Tribeca|Haus))$'),
+}
+
+# Ordered pattern lists: the first pattern that matches wins
+MRT_PATTERNS = [
+    # Standard format: "5 min (410 m) from NE11 Woodleigh MRT Station"
+    re.compile(r'(\d+)\s*min\s*\(([^)]+)\)\s*from\s*([A-Z0-9]+)\s*([^MRT\n]*)\s*MRT Station', re.IGNORECASE),
+    # Alternative format: "5 min (410 m) from NE11 Woodleigh"
+    re.compile(r'(\d+)\s*min\s*\(([^)]+)\)\s*from\s*([A-Z0-9]+)\s*([^\n]*)', re.IGNORECASE),
+    # Simple format: "NE11 Woodleigh MRT Station"
+    re.compile(r'([A-Z0-9]+)\s*([^MRT\n]*)\s*MRT Station', re.IGNORECASE),
+    # Distance only: "5 min from Woodleigh MRT"
+    re.compile(r'(\d+)\s*min.*?from\s*([^MRT\n]*)\s*MRT', re.IGNORECASE),
+]
+
+DISTRICT_PATTERNS = [
+    re.compile(r'D(\d{2})', re.IGNORECASE),  # D01, D02, etc.
+    re.compile(r'District\s*(\d{1,2})', re.IGNORECASE),
+]
+
+AGENT_NAME_PATTERNS = [
+    re.compile(r'Listed by\s*([^\n\d]+?)(?:\s*\d|\n|$)', re.IGNORECASE),  # "Listed by John Doe"
+    re.compile(r'Agent:\s*([^\n\d]+?)(?:\s*\d|\n|$)', re.IGNORECASE),     # "Agent: John Doe"
+    re.compile(r'Contact\s*([^\n\d]+?)(?:\s*\d|\n|$)', re.IGNORECASE),    # "Contact John Doe"
+]
+
+AGENT_RATING_PATTERNS = [
+    re.compile(r'(?:Listed by|Agent:).*?(\d+\.\d+)', re.IGNORECASE),
+    re.compile(r'(\d+\.\d+)(?:\s*stars?|\s*rating|\s*/\s*5)', re.IGNORECASE),
+    re.compile(r'Rating:\s*(\d+\.\d+)', re.IGNORECASE),
+]
+
+DESCRIPTION_PATTERNS = [
+    re.compile(r'"([^"]+)"'),  # Text in quotes
+    re.compile(r'["""]([^"""]+)["""]'),  # Smart quotes
+]
+
+# One alternation covering the per-card fields. Numeric fields share a single number
+# branch so each digit run is read once; the lookahead skips characters that cannot
+# start any token before the alternation is tried.
+CARD_TOKEN_RE = re.compile(r'(?=[\d,SsBNL])(?:' + '|'.join([
+    r'(?<![\d,])(?P<number>[\d,]+)\s*(?:'
+    r'(?P<mrt>(?i:min\s*\((?P<mrt_distance>[^)]+)\)\s*from\s*(?P<mrt_code>[A-Z0-9]+)\s*(?P<mrt_name>[^MRT\n]*)\s*MRT Station))'
+    r'|(?P<land>(?i:sqft\s*\(land\)))'
+    r'|(?P<sqft>(?i:sqft))'
+    r'|(?P<beds>(?i:Bed))'
+    r'|(?P<baths>(?i:Bath)))',
+    r'(?P<psf>(?i:S\$\s*(?P<psf_value>[\d,]+(?:\.\d+)?)\s*psf))',
+    r'(?P<price>S\$\s*(?P<price_value>[\d,]+(?:\.\d+)?))',
+    r'(?P<built>Built:\s*(?P<built_value>\d{4}))',
+    r'(?P<completion>New Project:\s*(?P<completion_value>\d{4}))',
+    r'(?P<listed>Listed on\s*(?P<listed_date>[^(]+)\s*\((?P<listed_ago>[^)]+)\))',
+]) + ')')
+
+CARD_TOKEN_FIELDS = ('price', 'psf', 'floor_area', 'land_area', 'bedrooms', 'bathrooms',
+                     'built_year', 'completion_year', 'listed', 'mrt')
+
+
+def scan_card_text(text: str) -> Dict[str, Any]:
+    """Pull the first occurrence of every card field in one pass over the text.
+
+    Values are the raw captured strings (tuples for listed date and MRT), matching
+    what an individual re.search per field would have returned.
+    """
+    tokens = {}
+    if not text:
+        return tokens
+
+    for match in CARD_TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        if kind in ('mrt', 'beds', 'baths'):
+            # These fields take plain digits, i.e. the run after the last comma
+            digits = match.group('number').rsplit(',', 1)[-1]
+            if not digits:
+                continue
+            if kind == 'mrt':
+                tokens.setdefault('mrt', (digits,) + match.group('mrt_distance', 'mrt_code', 'mrt_name'))
+            elif kind == 'beds':
+                tokens.setdefault('bedrooms', digits)
+            else:
+                tokens.setdefault('bathrooms', digits)
+        elif kind == 'land':
+            value = match.group('number')
+            tokens.setdefault('land_area', value)
+            # The first "... sqft" is also what a plain floor area search would see
+            tokens.setdefault('floor_area', value)
+        elif kind == 'sqft':
+            tokens.setdefault('floor_area', match.group('number'))
+        elif kind == 'psf':
+            value = match.group('psf_value')
+            tokens.setdefault('psf', value)
+            # Likewise a psf figure is the first "S$ ..." a plain price search would see
+            if match.group('psf').startswith('S$'):
+                tokens.setdefault('price', value)
+        elif kind == 'price':
+            tokens.setdefault('price', match.group('price_value'))
+        elif kind == 'built':
+            tokens.setdefault('built_year', match.group('built_value'))
+        elif kind == 'completion':
+            tokens.setdefault('completion_year', match.group('completion_value'))
+        elif kind == 'listed':
+            tokens.setdefault('listed', match.group('listed_date', 'listed_ago'))
+
+        if len(tokens) == len(CARD_TOKEN_FIELDS):
+            break
+
+    return tokens
+
+
+def mrt_fields(groups) -> Dict[str, str]:
+    """mrt_distance / mrt_line / mrt_station / nearest_mrt from the groups of an MRT_PATTERNS match"""
+    fields = {}
+    if len(groups) >= 4:  # Full format
+        station_name = PATTERNS['mrt_suffix'].sub('', groups[3].strip())
+        fields["mrt_distance"] = f"{groups[0]} min ({groups[1]})"
+        fields["mrt_line"] = groups[2]
+        fields["mrt_station"] = station_name
+        fields["nearest_mrt"] = f"{groups[2]} {station_name} MRT Station"
+    elif len(groups) >= 2:  # Partial format
+        if groups[0].isdigit():  # Has time
+            fields["mrt_distance"] = f"{groups[0]} min"
+            fields["mrt_station"] = groups[1].strip()
+        else:  # Just station info
+            fields["mrt_line"] = groups[0]
+            fields["mrt_station"] = groups[1].strip()
+            fields["nearest_mrt"] = f"{groups[0]} {groups[1].strip()} MRT Station"
+    return fields
+
+
+def parse_mrt_text(text: Optional[str]) -> Dict[str, str]:
+    """MRT fields from text like '5 min (400 m) from DT17 Downtown MRT Station' (empty when none match)"""
+    if not text:
+        return {}
+    for pattern in MRT_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return mrt_fields(match.groups())
+    return {}
+
+
+def to_int(value: Optional[str]) -> Optional[int]:
+    """Convert a captured number like '1,291' to an int"""
+    if value is None:
+        return None
+    try:
+        return int(value.replace(',', ''))
+    except ValueError:
+        return None
+
+
+def listing_id_from_url(url: Optional[str]) -> Optional[str]:
+    """PropertyGuru listing id from a listing URL, e.g. '60013717'"""
+    if not url:
+        return None
+    match = PATTERNS['listing_id'].search(url)
+    return match.group(1) if match else None
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+🎯 Selector Strategy Cache
+Remembers which selector found the cards (or the Next button) for each page
+layout, tries that one first on later pages and keeps per-selector hit rates
+across runs, so the full selector list is only walked on a miss
+"""
+
+import os
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+# Strategy names: one cached winner per strategy and layout
+CARDS = "cards"
+NEXT_BUTTON = "next_button"
+
+DEFAULT_LAYOUT = "default"
+
+
+def layout_key(url: Optional[str]) -> str:
+    """Host and path of a URL without page numbers or query - every page of a search shares one layout"""
+    if not url:
+        return DEFAULT_LAYOUT
+    parsed = urlparse(url)
+    segments = [segment for segment in parsed.path.split('/') if segment and not segment.isdigit()]
+    if not parsed.netloc and not segments:
+        return DEFAULT_LAYOUT
+    return f"{parsed.netloc}/{'/'.join(segments)}"
+
+
+class SelectorCache:
+    """Per-layout winning selectors with hit and miss counts; safe to share between threads
+
+    A selector's hits count the pages it matched on; its misses count the
+    pages where it was tried first as the cached winner and found nothing.
+    """
+
+    def __init__(self, path: Optional[str] = None, enabled: bool = True):
+        """
+        Args:
+            path: JSON file the hit rates are kept in; None keeps them for this run only
+            enabled: When False selectors are always tried in their listed order
+        """
+        self.path = path
+        self.enabled = enabled
+        # "strategy|layout" -> {"winner", "lookups", "cache_hits", "selectors": {selector: {"hits", "misses"}}}
+        self.entries = {}
+        self._changed = False
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self._load(path)
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None, base_dir: str = "") -> "SelectorCache":
+        """Cache from the "selector_cache" config section, its file relative to base_dir"""
+        from utils.config_loader import load_config, get_setting
+
+        if config is None:
+            config = load_config()
+        file_name = get_setting(config, 'selector_cache.file', 'selector_cache.json')
+        return cls(os.path.join(base_dir, file_name) if file_name else None,
+                   enabled=get_setting(config, 'selector_cache.enabled', True))
+
+    def _load(self, path: str):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != FORMAT_VERSION:
+                raise ValueError("unrecognised selector cache file")
+            self.entries = data.get('entries') or {}
+            logger.info("🎯 Selector cache loaded: %s cached strategies", len(self.entries))
+        except Exception as e:
+            logger.warning("⚠️ Could not load selector cache %s: %s", path, e)
+            self.entries = {}
+
+    def _entry(self, strategy: str, layout: str) -> Dict[str, Any]:
+        key = f"{strategy}|{layout}"
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = {"winner": None, "lookups": 0, "cache_hits": 0, "selectors": {}}
+        return entry
+
+    def ordered(self, strategy: str, selectors: List[str], layout: str = DEFAULT_LAYOUT) -> List[str]:
+        """The selectors to try, this layout's last winner first and the rest in their listed order"""
+        if not self.enabled:
+            return list(selectors)
+        with self._lock:
+            entry = self.entries.get(f"{strategy}|{layout}")
+            winner = entry.get("winner") if entry else None
+        if winner not in selectors:
+            return list(selectors)
+        return [winner] + [selector for selector in selectors if selector != winner]
+
+    def record(self, strategy: str, selector: Optional[str], layout: str = DEFAULT_LAYOUT):
+        """Note which selector matched on this page (None when none did) and make it the winner"""
+        if not self.enabled:
+            return
+        with self._lock:
+            entry = self._entry(strategy, layout)
+            winner = entry["winner"]
+            entry["lookups"] += 1
+            self._changed = True
+            if winner is not None and selector == winner:
+                entry["cache_hits"] += 1
+            elif winner is not None:
+                entry["selectors"].setdefault(winner, {"hits": 0, "misses": 0})["misses"] += 1
+            if selector is not None:
+                entry["selectors"].setdefault(selector, {"hits": 0, "misses": 0})["hits"] += 1
+                entry["winner"] = selector
+            cache_hit = winner is not None and selector == winner
+        get_metrics().incr(f"selectors.{strategy}.{'cache_hits' if cache_hit else 'cache_misses'}")
+
+    def hit_rate(self, strategy: str, layout: str = DEFAULT_LAYOUT) -> float:
+        """Share of this layout's pages where the cached winner matched straight away"""
+        with self._lock:
+            entry = self.entries.get(f"{strategy}|{layout}")
+            if not entry or not entry["lookups"]:
+                return 0.0
+            return entry["cache_hits"] / entry["lookups"]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Winner, lookups and cache hit rate per strategy and layout"""
+        with self._lock:
+            return {
+                key: {
+                    "winner": entry["winner"],
+                    "lookups": entry["lookups"],
+                    "hit_rate": entry["cache_hits"] / entry["lookups"] if entry["lookups"] else 0.0,
+                }
+                for key, entry in sorted(self.entries.items())
+            }
+
+    def save(self, path: Optional[str] = None) -> bool:
+        """Write the winners and hit counts atomically; nothing is written when no page was looked up"""
+        path = path or self.path
+        if not path or not self.enabled or not self._changed:
+            return False
+
+        with self._lock:
+            data = json.dumps({"version": FORMAT_VERSION, "entries": self.entries}, indent=2, sort_keys=True)
+            self._changed = False
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("⚠️ Could not save selector cache %s: %s", path, e)
+            return False
+        return True
+
+    def print_stats(self):
+        for key, entry in self.stats().items():
+            logger.info("🎯 %s: %s (%s of %s pages first try)",
+                        key, entry['winner'], f"{entry['hit_rate']:.0%}", entry['lookups'])
+
+
+# The cache every extractor consults; in memory until a run installs a configured one
+_selector_cache = SelectorCache()
+
+
+def get_selector_cache() -> SelectorCache:
+    return _selector_cache
+
+
+def set_selector_cache(cache: SelectorCache) -> SelectorCache:
+    """Make cache the one extractors use for the rest of the process"""
+    global _selector_cache
+    _selector_cache = cache
+    return _selector_cache
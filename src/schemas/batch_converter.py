@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+⚡ Batch Pure Data Converter
+Shards extraction files across a process pool and writes pure data records in order
+"""
+
+import logging
+import sys
+import os
+import json
+import time
+import argparse
+import itertools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from schemas.pure_data_schema import PureDataSchema
+from storage.jsonl_sink import CorruptRecordError, JsonlSink, iter_raw_records
+from utils.config_loader import resolve_data_dir
+from utils.logging_setup import setup_logging
+from utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 2000
+
+
+def convert_chunk(chunk: List[Any]) -> Tuple[List[str], int, List[int]]:
+    """Convert one shard of technical records.
+
+    Items are raw JSON lines or already-decoded dicts. Returns the serialized pure
+    records, the number skipped for insufficient data and the positions in the
+    shard of undecodable lines (e.g. a line truncated by a crash).
+    """
+    records = []
+    invalid = []
+    for position, item in enumerate(chunk):
+        if isinstance(item, str):
+            try:
+                item = json.loads(item)
+            except json.JSONDecodeError:
+                invalid.append(position)
+                continue
+        records.append(item)
+
+    output = []
+    skipped = 0
+    for pure_prop in PureDataSchema.create_property_records(records):
+        if pure_prop:
+            output.append(json.dumps(pure_prop, ensure_ascii=False, separators=(',', ':')))
+        else:
+            skipped += 1
+    return output, skipped, invalid
+
+
+def _chunks(records, size: int):
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class BatchConverter:
+    """Converts technical extraction files to pure data with a process pool"""
+
+    def __init__(self, workers: Optional[int] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_in_flight: Optional[int] = None, fsync_interval: int = 1):
+        """
+        Args:
+            workers: Worker processes; None or 0 uses every CPU, 1 converts in-process
+            batch_size: Records per shard sent to a worker
+            max_in_flight: Shards queued at once (bounds memory); defaults to 2 per worker
+            fsync_interval: fsync the output after this many shards
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = max(1, int(batch_size or DEFAULT_BATCH_SIZE))
+        self.max_in_flight = max_in_flight or self.workers * 2
+        self.fsync_interval = fsync_interval
+
+    def convert_file(self, input_file: str, output_file: str) -> Dict[str, Any]:
+        """Convert input_file into output_file, keeping the input order.
+
+        Returns conversion stats: processed, converted, skipped, invalid,
+        seconds and records_per_sec. As with iter_records, only a truncated last
+        record is tolerated; an unreadable record followed by more raises
+        CorruptRecordError.
+        """
+        stats = {'input_file': input_file, 'output_file': output_file,
+                 'processed': 0, 'converted': 0, 'skipped': 0, 'invalid': 0}
+        start = time.time()
+        last_report = start
+        # Record number of an unreadable record, corruption unless nothing follows it
+        bad_record = None
+
+        chunks = _chunks(iter_raw_records(input_file), self.batch_size)
+
+        with JsonlSink(output_file, fsync_interval=self.fsync_interval) as sink:
+            for shard, (chunk_size, (lines, skipped, invalid)) in enumerate(self._map_ordered(chunks), 1):
+                if bad_record is not None or (invalid and invalid[0] < chunk_size - 1):
+                    bad_record = bad_record or stats['processed'] + invalid[0] + 1
+                    raise CorruptRecordError(f"{input_file}: record {bad_record} is not valid JSON")
+                if invalid:
+                    bad_record = stats['processed'] + invalid[0] + 1
+                sink.write_lines(lines)
+                sink.flush(fsync=bool(self.fsync_interval) and shard % self.fsync_interval == 0)
+                stats['processed'] += chunk_size
+                stats['converted'] += len(lines)
+                stats['skipped'] += skipped
+                stats['invalid'] += len(invalid)
+
+                now = time.time()
+                if now - last_report >= 5:
+                    rate = stats['processed'] / (now - start)
+                    logger.info("   ⚡ Processed %s records (%s records/sec)", f"{stats['processed']:,}", f"{rate:,.0f}")
+                    last_report = now
+
+        if bad_record is not None:
+            logger.warning("⚠️ Skipped truncated last record %s of %s", bad_record, input_file)
+        stats['seconds'] = time.time() - start
+        stats['records_per_sec'] = stats['processed'] / stats['seconds'] if stats['seconds'] else 0.0
+        metrics = get_metrics()
+        metrics.observe('convert.file', stats['seconds'])
+        metrics.incr('records.converted', stats['converted'])
+        return stats
+
+    def _map_ordered(self, chunks):
+        """Yield (chunk_size, result) in input order with bounded work in flight"""
+        first = next(chunks, None)
+        if first is None:
+            return
+        second = next(chunks, None)
+
+        # A single shard is not worth starting a pool for
+        if self.workers <= 1 or second is None:
+            for chunk in (first, second):
+                if chunk is not None:
+                    yield len(chunk), convert_chunk(chunk)
+            for chunk in chunks:
+                yield len(chunk), convert_chunk(chunk)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            in_flight = deque()
+            for chunk in itertools.chain((first, second), chunks):
+                in_flight.append((len(chunk), executor.submit(convert_chunk, chunk)))
+                if len(in_flight) >= self.max_in_flight:
+                    chunk_size, future = in_flight.popleft()
+                    yield chunk_size, future.result()
+            while in_flight:
+                chunk_size, future = in_flight.popleft()
+                yield chunk_size, future.result()
+
+
+def print_conversion_stats(stats: Dict[str, Any]):
+    logger.info("✅ Successfully converted %s properties", f"{stats['converted']:,}")
+    logger.warning("⚠️ Skipped %s properties (insufficient data)", f"{stats['skipped']:,}")
+    if stats['invalid']:
+        logger.warning("⚠️ Ignored %s unreadable lines", f"{stats['invalid']:,}")
+    logger.info("⚡ Throughput: %s records/sec (%.1fs)", f"{stats['records_per_sec']:,.0f}", stats['seconds'])
+    logger.info("💾 Pure data saved to: %s", stats['output_file'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert extraction files to pure data in parallel")
+    parser.add_argument("input_file", help="extraction .jsonl (or legacy .json) file")
+    parser.add_argument("output_file", nargs="?", help="output .jsonl file")
+    parser.add_argument("--workers", type=int, default=0, help="worker processes (0 = all CPUs)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="records per shard")
+    args = parser.parse_args()
+    setup_logging()
+
+    output_file = args.output_file
+    if not output_file:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = os.path.join(resolve_data_dir(), f"pure_data_{timestamp}.jsonl")
+
+    print("⚡ BATCH PURE DATA CONVERSION")
+    print("=" * 50)
+    stats = BatchConverter(workers=args.workers, batch_size=args.batch_size).convert_file(args.input_file, output_file)
+    print_conversion_stats(stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+🗂️ Category Bucket Tables
+Declarative value ranges for the simple pure data categories, resolved by binary search
+"""
+
+import sys
+import os
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Any, Optional, Iterable
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.config_loader import load_config, get_setting
+
+# The tables are defined only in the config "buckets" section. Each has
+# len(labels) == len(boundaries) + 1. By default a value equal to a boundary
+# falls into the bucket above it ("value < boundary"); with upper_inclusive it
+# stays in the bucket below ("value <= boundary").
+
+# Tables PureDataSchema looks up; the config must define each of them
+TABLE_NAMES = ("price_range", "psf_range", "mrt_distance_category", "age_category", "size_category", "image_category")
+
+
+class BucketTable:
+    """Sorted boundaries plus one label per interval"""
+
+    def __init__(self, name: str, boundaries: List[float], labels: List[str], upper_inclusive: bool = False):
+        if len(labels) != len(boundaries) + 1:
+            raise ValueError(f"Bucket table '{name}' needs {len(boundaries) + 1} labels, got {len(labels)}")
+        if any(a >= b for a, b in zip(boundaries, boundaries[1:])):
+            raise ValueError(f"Bucket table '{name}' boundaries must be strictly increasing")
+
+        self.name = name
+        self.boundaries = list(boundaries)
+        self.labels = list(labels)
+        self.upper_inclusive = upper_inclusive
+        self._bisect = bisect_left if upper_inclusive else bisect_right
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> "BucketTable":
+        return cls(name, data["boundaries"], data["labels"], bool(data.get("upper_inclusive", False)))
+
+    def lookup(self, value) -> Optional[str]:
+        """Label for a single value (None passes through)"""
+        if value is None:
+            return None
+        return self.labels[self._bisect(self.boundaries, value)]
+
+    def lookup_column(self, values: Iterable) -> List[Optional[str]]:
+        """Label a whole column of values in one call"""
+        boundaries = self.boundaries
+        labels = self.labels
+        search = self._bisect
+        return [None if value is None else labels[search(boundaries, value)] for value in values]
+
+
+def load_bucket_tables(config: Optional[Dict[str, Any]] = None) -> Dict[str, BucketTable]:
+    """Build every table from the config's "buckets" section"""
+    if config is None:
+        config = load_config()
+    buckets = get_setting(config, 'buckets', {}) or {}
+    missing = [name for name in TABLE_NAMES if not buckets.get(name)]
+    if missing:
+        raise ValueError(f"Config \"buckets\" section is missing tables: {', '.join(missing)}")
+    return {name: BucketTable.from_dict(name, data) for name, data in buckets.items()}
+
+
+_TABLES = None
+
+
+def get_bucket_tables() -> Dict[str, BucketTable]:
+    """Tables loaded once per process"""
+    global _TABLES
+    if _TABLES is None:
+        _TABLES = load_bucket_tables()
+    return _TABLES
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+🗺️ District Gazetteer
+Resolves Singapore district codes (D01-D28) from names, MRT stations and postal codes
+with a single trie pass over the words of the text
+"""
+
+import re
+import sys
+import os
+from typing import Dict, Optional
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from scrapers.page_planner import DISTRICT_LABELS
+
+# Common aliases beyond the official names in the site's district filter labels
+DISTRICT_ALIASES = {
+    "D01": ["Raffles", "Marina Bay", "Cecil", "Shenton Way"],
+    "D02": ["Anson", "Outram"],
+    "D03": ["Queenstown", "Tiong Bahru", "Redhill", "Bukit Merah"],
+    "D04": ["Sentosa", "Keppel", "Mount Faber"],
+    "D05": ["Clementi", "Pasir Panjang", "Dover", "Kent Ridge"],
+    "D06": ["High Street"],
+    "D07": ["Middle Road", "Golden Mile"],
+    "D08": ["Serangoon Road", "Little India", "Jalan Besar"],
+    "D09": ["Cairnhill", "Killiney"],
+    "D10": ["Holland Village", "Farrer Road", "Ardmore", "Bukit Timah Road"],
+    "D11": ["Watten Estate", "Thomson Road"],
+    "D12": ["Whampoa", "Kallang Bahru"],
+    "D13": ["Braddell", "Woodleigh"],
+    "D14": ["Kembangan", "Sims Avenue", "Ubi"],
+    "D15": ["Katong", "Joo Chiat", "Amber Road", "Siglap", "Tanjong Rhu"],
+    "D16": ["Eastwood", "Kew Drive", "Bayshore", "Tanah Merah"],
+    "D17": ["Changi", "Loyang", "Flora Drive"],
+    "D18": ["Simei"],
+    "D19": ["Serangoon Gardens", "Serangoon North", "Kovan", "Buangkok", "Lorong Chuan"],
+    "D20": ["Braddell Hill", "Marymount"],
+    "D21": ["Ulu Pandan", "Beauty World", "King Albert Park"],
+    "D22": ["Jurong East", "Jurong West", "Pioneer", "Lakeside"],
+    "D23": ["Hillview", "Bukit Batok", "Yew Tee"],
+    "D24": ["Kranji"],
+    "D25": ["Marsiling"],
+    "D26": ["Springleaf", "Lentor", "Tagore"],
+    "D27": ["Canberra", "Khatib"],
+    "D28": ["Seletar Hills"],
+}
+
+# Official district area names (from the district filter labels) plus their aliases
+DISTRICT_AREAS = {
+    code: DISTRICT_LABELS[code].split(" / ") + DISTRICT_ALIASES[code]
+    for code in sorted(DISTRICT_LABELS)
+}
+
+# MRT/LRT stations whose names are not already area names above
+MRT_STATION_DISTRICTS = {
+    "Downtown": "D01", "Telok Ayer": "D01", "Bayfront": "D01", "Promenade": "D01",
+    "Marina South Pier": "D01", "Gardens by the Bay": "D01",
+    "Maxwell": "D02", "Outram Park": "D02",
+    "Havelock": "D03", "Labrador Park": "D04",
+    "Haw Par Villa": "D05", "One-North": "D05",
+    "Esplanade": "D06", "Fort Canning": "D06",
+    "Bras Basah": "D07", "Bencoolen": "D07", "Nicoll Highway": "D07",
+    "Boon Keng": "D08",
+    "Somerset": "D09", "Dhoby Ghaut": "D09", "Great World": "D09",
+    "Botanic Gardens": "D10", "Stevens": "D10", "Napier": "D10", "Orchard Boulevard": "D10",
+    "Sixth Avenue": "D10", "Tan Kah Kee": "D10",
+    "Caldecott": "D11",
+    "Dakota": "D14", "Aljunied": "D14", "Mattar": "D14",
+    "Mountbatten": "D15", "Stadium": "D15", "Tanjong Katong": "D15", "Katong Park": "D15",
+    "Marine Terrace": "D15",
+    "Expo": "D16", "Upper Changi": "D16", "Sungei Bedok": "D16",
+    "Bartley": "D19", "Tai Seng": "D19",
+    "Bright Hill": "D20", "Mayflower": "D20",
+    "Cashew": "D23", "Bukit Gombak": "D23",
+    "Chinese Garden": "D22", "Joo Koon": "D22", "Gul Circle": "D22",
+}
+
+WORD_RE = re.compile(r'[a-z0-9]+')
+
+# Trie node key holding the district of the phrase ending there (never a real word)
+_VALUE = ''
+
+# First two digits of a postal code -> district
+POSTAL_SECTOR_DISTRICTS = {}
+for _district, _sectors in {
+    "D01": "01 02 03 04 05 06", "D02": "07 08", "D03": "14 15 16", "D04": "09 10",
+    "D05": "11 12 13", "D06": "17", "D07": "18 19", "D08": "20 21", "D09": "22 23",
+    "D10": "24 25 26 27", "D11": "28 29 30", "D12": "31 32 33", "D13": "34 35 36 37",
+    "D14": "38 39 40 41", "D15": "42 43 44 45", "D16": "46 47 48", "D17": "49 50 81",
+    "D18": "51 52", "D19": "53 54 55 82", "D20": "56 57", "D21": "58 59",
+    "D22": "60 61 62 63 64", "D23": "65 66 67 68", "D24": "69 70 71", "D25": "72 73",
+    "D26": "77 78", "D27": "75 76", "D28": "79 80",
+}.items():
+    for _sector in _sectors.split():
+        POSTAL_SECTOR_DISTRICTS[_sector] = _district
+
+
+class PhraseTrie:
+    """Word-level trie: one pass over the text's words finds the leftmost, longest phrase.
+
+    Matching whole words gives word boundaries for free ("Tuas" never matches
+    inside "Tuasview"), and most words fail on a single dict lookup.
+    """
+
+    def __init__(self, phrases: Dict[str, str]):
+        self.root = {}
+        for phrase, value in phrases.items():
+            words = WORD_RE.findall(phrase.lower())
+            if not words:
+                continue
+            node = self.root
+            for word in words:
+                node = node.setdefault(word, {})
+            node.setdefault(_VALUE, value)
+
+    def best_match(self, text: str) -> Optional[str]:
+        root = self.root
+        words = WORD_RE.findall(text.lower())
+        for start, word in enumerate(words):
+            node = root.get(word)
+            if node is None:
+                continue
+            best = node.get(_VALUE)
+            for following in words[start + 1:]:
+                node = node.get(following)
+                if node is None:
+                    break
+                if _VALUE in node:
+                    best = node[_VALUE]
+            if best:
+                return best
+        return None
+
+
+class DistrictGazetteer:
+    """Area, MRT station and postal sector lookups for district codes"""
+
+    def __init__(self):
+        phrases = {}
+        for district, areas in DISTRICT_AREAS.items():
+            for area in areas:
+                phrases[area] = district
+        for station, district in MRT_STATION_DISTRICTS.items():
+            phrases.setdefault(station, district)
+        self.matcher = PhraseTrie(phrases)
+
+    def resolve(self, name: str = "", mrt_station: str = "", postal_code: str = "") -> Optional[str]:
+        """District for a listing: name first, then MRT station, then postal sector"""
+        for text in (name, mrt_station):
+            if text:
+                district = self.matcher.best_match(text)
+                if district:
+                    return district
+
+        if postal_code:
+            postal_code = str(postal_code).strip()
+            if len(postal_code) == 6 and postal_code.isdigit():
+                return POSTAL_SECTOR_DISTRICTS.get(postal_code[:2])
+        return None
+
+
+_GAZETTEER = None
+
+
+def get_gazetteer() -> DistrictGazetteer:
+    """Index built once per process"""
+    global _GAZETTEER
+    if _GAZETTEER is None:
+        _GAZETTEER = DistrictGazetteer()
+    return _GAZETTEER
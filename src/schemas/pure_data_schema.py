@@ -4,15 +4,40 @@
 Raw data collection without any market analysis or segmentation
 """
 
+import logging
+import sys
+import os
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import List, Dict, Any, Optional
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from extractors.patterns import PATTERNS
+from schemas.buckets import get_bucket_tables
+from schemas.district_gazetteer import get_gazetteer
+from storage.jsonl_sink import read_sample
+from utils.config_loader import resolve_data_dir
+from utils.logging_setup import setup_logging
+
+logger = logging.getLogger(__name__)
+
+MRT_LINE_NAMES = {
+    "EW": "East West Line", "NS": "North South Line", "NE": "North East Line",
+    "CC": "Circle Line", "DT": "Downtown Line", "TE": "Thomson-East Coast Line",
+    "BP": "Bukit Panjang LRT", "SK": "Sengkang LRT", "PG": "Punggol LRT"
+}
 
 class PureDataSchema:
     """Pure data collection schema - no analysis, just clean categorized data"""
     
     @staticmethod
-    def create_property_record(technical_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create clean property record with pure data only"""
+    def create_property_record(technical_data: Dict[str, Any], categorize: bool = True) -> Dict[str, Any]:
+        """Create clean property record with pure data only
+
+        With categorize=False the category fields hold the raw value to be
+        bucketed; create_property_records labels them a column at a time.
+        """
+        buckets = get_bucket_tables()
         
         # Extract basic data
         name = technical_data.get("property_name", "").strip()
@@ -61,20 +86,7 @@ class PureDataSchema:
             property_record["property_url"] = listing_url
         
         # 💰 PRICE CATEGORIES (simple ranges, no analysis)
-        if price_num < 500000:
-            property_record["price_range"] = "Under 500K"
-        elif price_num < 800000:
-            property_record["price_range"] = "500K-800K"
-        elif price_num < 1200000:
-            property_record["price_range"] = "800K-1.2M"
-        elif price_num < 2000000:
-            property_record["price_range"] = "1.2M-2M"
-        elif price_num < 3000000:
-            property_record["price_range"] = "2M-3M"
-        elif price_num < 5000000:
-            property_record["price_range"] = "3M-5M"
-        else:
-            property_record["price_range"] = "Above 5M"
+        property_record["price_range"] = buckets["price_range"].lookup(price_num) if categorize else price_num
         
         # PSF data
         if psf_num:
@@ -82,19 +94,12 @@ class PureDataSchema:
             property_record["price_per_sqft_formatted"] = psf_formatted if psf_formatted else f"S$ {psf_num:,.0f} psf"
             
             # Simple PSF ranges
-            if psf_num < 600:
-                property_record["psf_range"] = "Under 600"
-            elif psf_num < 1000:
-                property_record["psf_range"] = "600-1000"
-            elif psf_num < 1500:
-                property_record["psf_range"] = "1000-1500"
-            elif psf_num < 2000:
-                property_record["psf_range"] = "1500-2000"
-            else:
-                property_record["psf_range"] = "Above 2000"
+            property_record["psf_range"] = buckets["psf_range"].lookup(psf_num) if categorize else psf_num
         
         # 📍 LOCATION DATA
-        district = PureDataSchema._extract_district(name, mrt_station)
+        # A district the source states (e.g. the page state's districtCode) beats the gazetteer guess
+        district = (PureDataSchema._normalize_district(technical_data.get("district"))
+                    or PureDataSchema._extract_district(name, mrt_station, technical_data.get("postal_code")))
         if district:
             property_record["district_code"] = district
         
@@ -107,32 +112,20 @@ class PureDataSchema:
             walk_time = None
             if "min" in mrt_distance:
                 try:
-                    import re
-                    walk_time = int(re.search(r'(\d+)', mrt_distance).group(1))
+                    walk_time = int(PATTERNS['first_integer'].search(mrt_distance).group(1))
                     property_record["mrt_walk_minutes"] = walk_time
                     
                     # Simple time categories
-                    if walk_time <= 5:
-                        property_record["mrt_distance_category"] = "0-5 min"
-                    elif walk_time <= 10:
-                        property_record["mrt_distance_category"] = "6-10 min"
-                    elif walk_time <= 15:
-                        property_record["mrt_distance_category"] = "11-15 min"
-                    else:
-                        property_record["mrt_distance_category"] = "Above 15 min"
+                    property_record["mrt_distance_category"] = (
+                        buckets["mrt_distance_category"].lookup(walk_time) if categorize else walk_time
+                    )
                 except:
                     pass
             
             # MRT line
             if mrt_line:
                 property_record["mrt_line_code"] = mrt_line
-                line_code = mrt_line[:2]
-                line_names = {
-                    "EW": "East West Line", "NS": "North South Line", "NE": "North East Line",
-                    "CC": "Circle Line", "DT": "Downtown Line", "TE": "Thomson-East Coast Line",
-                    "BP": "Bukit Panjang LRT", "SK": "Sengkang LRT", "PG": "Punggol LRT"
-                }
-                property_record["mrt_line_name"] = line_names.get(line_code, "MRT")
+                property_record["mrt_line_name"] = MRT_LINE_NAMES.get(mrt_line[:2], "MRT")
         
         # 🏢 PROPERTY DETAILS
         if built_year:
@@ -142,30 +135,14 @@ class PureDataSchema:
             property_record["property_age_years"] = age
             
             # Simple age categories
-            if age < 5:
-                property_record["age_category"] = "0-5 years"
-            elif age < 15:
-                property_record["age_category"] = "5-15 years"
-            elif age < 30:
-                property_record["age_category"] = "15-30 years"
-            else:
-                property_record["age_category"] = "Above 30 years"
+            property_record["age_category"] = buckets["age_category"].lookup(age) if categorize else age
         
         if tenure:
             property_record["tenure"] = tenure
         
         # Size categories
         if size_sqft:
-            if size_sqft < 500:
-                property_record["size_category"] = "Under 500 sqft"
-            elif size_sqft < 800:
-                property_record["size_category"] = "500-800 sqft"
-            elif size_sqft < 1200:
-                property_record["size_category"] = "800-1200 sqft"
-            elif size_sqft < 1800:
-                property_record["size_category"] = "1200-1800 sqft"
-            else:
-                property_record["size_category"] = "Above 1800 sqft"
+            property_record["size_category"] = buckets["size_category"].lookup(size_sqft) if categorize else size_sqft
         
         # 👤 LISTING DATA
         if agent_name:
@@ -179,14 +156,9 @@ class PureDataSchema:
             property_record["image_count"] = image_count
             
             # Simple image categories
-            if image_count >= 15:
-                property_record["image_category"] = "15+ images"
-            elif image_count >= 8:
-                property_record["image_category"] = "8-14 images"
-            elif image_count >= 3:
-                property_record["image_category"] = "3-7 images"
-            else:
-                property_record["image_category"] = "1-2 images"
+            property_record["image_category"] = (
+                buckets["image_category"].lookup(image_count) if categorize else image_count
+            )
         
         if main_image:
             property_record["main_image_url"] = main_image
@@ -198,95 +170,84 @@ class PureDataSchema:
         return property_record
     
     @staticmethod
-    def _extract_district(name: str, mrt_station: str) -> str:
-        """Extract district code from property name or MRT station"""
-        # Common area to district mapping
-        area_districts = {
-            "commonwealth": "D03", "alexandra": "D03", "toa payoh": "D12",
-            "choa chu kang": "D23", "hougang": "D19", "punggol": "D19",
-            "sengkang": "D19", "bishan": "D20", "ang mo kio": "D20",
-            "orchard": "D09", "newton": "D11", "novena": "D11",
-            "marina": "D01", "raffles": "D01", "chinatown": "D02",
-            "tanjong pagar": "D02", "harbourfront": "D04", "telok blangah": "D04",
-            "buona vista": "D05", "west coast": "D05", "clementi": "D05",
-            "tanglin": "D10", "holland": "D10", "bukit timah": "D10",
-            "east coast": "D15", "marine parade": "D15", "bedok": "D16",
-            "tampines": "D18", "pasir ris": "D18", "woodlands": "D25",
-            "admiralty": "D25", "sembawang": "D27", "yishun": "D27",
-            "jurong": "D22", "boon lay": "D22", "tuas": "D22"
-        }
-        
-        text_to_search = f"{name} {mrt_station}".lower()
-        
-        for area, district in area_districts.items():
-            if area in text_to_search:
-                return district
-        
-        return None
+    def create_property_records(batch: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Convert a batch of technical records, labelling each category as one column
+
+        Returns one entry per input record (None where data was insufficient).
+        """
+        records = [PureDataSchema.create_property_record(tech, categorize=False) for tech in batch]
+        present = [record for record in records if record]
+
+        for name, table in get_bucket_tables().items():
+            rows = [record for record in present if name in record]
+            if rows:
+                for record, label in zip(rows, table.lookup_column([record[name] for record in rows])):
+                    record[name] = label
+
+        return records
+    
+    @staticmethod
+    def _normalize_district(value) -> Optional[str]:
+        """'D09', 'd9' or 9 -> 'D09'; None for anything that is not a D01-D28 code"""
+        match = PATTERNS['district_code'].fullmatch(str(value).strip()) if value is not None else None
+        if not match:
+            return None
+        number = int(match.group(1))
+        return f"D{number:02d}" if 1 <= number <= 28 else None
+
+    @staticmethod
+    def _extract_district(name: str, mrt_station: str, postal_code: str = None) -> str:
+        """Extract district code from property name, MRT station or postal code"""
+        return get_gazetteer().resolve(name, mrt_station, postal_code)
 
-def convert_to_pure_data_format(input_file: str, output_file: str = None):
-    """Convert technical data to pure data format"""
-    import json
+def convert_to_pure_data_format(input_file: str, output_file: str = None, workers: int = None,
+                                batch_size: int = None):
+    """Convert technical data to pure data format
+
+    Large files are sharded across worker processes; workers=1 converts in-process.
+    """
+    # Imported here because the batch converter itself imports this module
+    from schemas.batch_converter import BatchConverter, DEFAULT_BATCH_SIZE, print_conversion_stats
     
-    print("📊 CONVERTING TO PURE DATA FORMAT")
-    print("=" * 50)
-    print("🚫 No market analysis or segmentation")
-    print("📋 Pure data collection only")
+    logger.info("📊 CONVERTING TO PURE DATA FORMAT")
+    logger.info("=" * 50)
+    logger.info("🚫 No market analysis or segmentation")
+    logger.info("📋 Pure data collection only")
     
     try:
-        # Load technical data
-        with open(input_file, 'r', encoding='utf-8') as f:
-            technical_data = json.load(f)
-        
-        print(f"📂 Processing {len(technical_data)} properties...")
-        
-        # Convert each property
-        pure_properties = []
-        skipped = 0
-        
-        for i, tech_prop in enumerate(technical_data):
-            pure_prop = PureDataSchema.create_property_record(tech_prop)
-            
-            if pure_prop:
-                pure_properties.append(pure_prop)
-            else:
-                skipped += 1
-            
-            if (i + 1) % 10 == 0:
-                print(f"   Processed {i + 1}/{len(technical_data)}...")
-        
-        print(f"✅ Successfully converted {len(pure_properties)} properties")
-        print(f"⚠️ Skipped {skipped} properties (insufficient data)")
-        
         # Generate output filename
         if not output_file:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"data/pure_data_{timestamp}.json"
+            output_file = os.path.join(resolve_data_dir(), f"pure_data_{timestamp}.jsonl")
         
-        # Save pure data
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(pure_properties, f, indent=2, ensure_ascii=False)
+        logger.info("📂 Processing %s...", input_file)
         
-        print(f"💾 Pure data saved to: {output_file}")
+        converter = BatchConverter(workers=workers, batch_size=batch_size or DEFAULT_BATCH_SIZE)
+        stats = converter.convert_file(input_file, output_file)
+        print_conversion_stats(stats)
         
         # Show samples
-        print(f"\n📋 SAMPLE PURE DATA:")
-        print("=" * 40)
-        
-        for i, prop in enumerate(pure_properties[:3], 1):
-            print(f"\n{i}. {prop['property_name']}")
-            print(f"   💰 {prop['price_formatted']} ({prop.get('price_range', 'N/A')})")
-            print(f"   🏠 {prop.get('property_type', 'N/A')} • {prop['bedrooms']}BR • {prop.get('floor_area_sqft', 'N/A')} sqft")
-            print(f"   📍 {prop.get('district_code', 'N/A')} • {prop.get('mrt_station', 'N/A')} ({prop.get('mrt_distance_category', 'N/A')})")
-            print(f"   📅 {prop.get('listed_date', 'N/A')} • {prop.get('image_count', 0)} images")
+        logger.info("📋 SAMPLE PURE DATA:")
+        logger.info("=" * 40)
+        
+        for i, prop in enumerate(read_sample(output_file, 3), 1):
+            logger.info("%s. %s", i, prop['property_name'])
+            logger.info("   💰 %s (%s)", prop['price_formatted'], prop.get('price_range', 'N/A'))
+            logger.info("   🏠 %s • %sBR • %s sqft",
+                        prop.get('property_type', 'N/A'), prop['bedrooms'], prop.get('floor_area_sqft', 'N/A'))
+            logger.info("   📍 %s • %s (%s)",
+                        prop.get('district_code', 'N/A'), prop.get('mrt_station', 'N/A'),
+                        prop.get('mrt_distance_category', 'N/A'))
+            logger.info("   📅 %s • %s images", prop.get('listed_date', 'N/A'), prop.get('image_count', 0))
         
         return output_file
         
     except Exception as e:
-        print(f"❌ Conversion failed: {e}")
+        logger.error("❌ Conversion failed: %s", e)
         return None
 
 if __name__ == "__main__":
+    setup_logging()
     # Convert existing data to pure format
-    input_file = "data/samples/advanced_extraction_2025-07-13T17-44-24.json"
+    input_file = os.path.join(resolve_data_dir(), "samples", "advanced_extraction_2025-07-13T17-44-24.json")
     convert_to_pure_data_format(input_file)
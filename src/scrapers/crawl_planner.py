@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+🗺️ District-Sharded Crawl Planner
+Splits the all-districts search into one search per district and property type.
+Each shard is probed on its first page, sized from its "N Properties" heading and
+then crawled in page ranges of its own
+"""
+
+import logging
+import sys
+import os
+import math
+from typing import List, Dict, Any, Optional
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from scrapers.page_planner import DISTRICT_LABELS, SEARCH_BASE_URL, build_search_url
+from scrapers.worker_pool import PageRange, DEFAULT_CHUNK_SIZE, split_page_ranges
+from utils.config_loader import load_config, get_setting
+from utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+LISTINGS_PER_PAGE = 20
+
+
+class CrawlShard:
+    """One independent search: a district with an optional property type filter"""
+
+    def __init__(self, district: str, property_type: str, search_url: str):
+        self.district = district
+        self.property_type = property_type
+        self.search_url = search_url
+        self.result_count = None
+        self.estimated_pages = None
+        # Pages the result count called for when max_pages_per_shard cut the shard short
+        self.needed_pages = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.district} {self.property_type}".strip()
+
+    def __repr__(self):
+        return f"CrawlShard({self.label})"
+
+
+def estimate_pages(result_count: int, listings_per_page: int = LISTINGS_PER_PAGE) -> int:
+    return max(1, math.ceil(result_count / max(1, listings_per_page)))
+
+
+class CrawlPlanner:
+    """Builds shards from the "crawl_plan" config section and turns each one into page ranges.
+
+    Only page 1 of every shard is queued up front. Once a worker has read the
+    shard's result count, expand() queues the remaining pages, so shards of
+    very different sizes are scheduled independently and small districts do
+    not hold up large ones.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, base_url: str = SEARCH_BASE_URL):
+        if config is None:
+            config = load_config()
+        districts = get_setting(config, 'crawl_plan.districts', 'all')
+        self.districts = list(DISTRICT_LABELS) if districts in (None, 'all') else list(districts)
+        unknown = [code for code in self.districts if code not in DISTRICT_LABELS]
+        if unknown:
+            raise ValueError(f"Unknown district codes: {', '.join(unknown)}")
+
+        # name -> extra search parameters; {} crawls every property type in one shard,
+        # so splitting by type is opt-in and never leaves types out
+        self.property_types = get_setting(config, 'crawl_plan.property_types', None) or {"": {}}
+        self.listings_per_page = get_setting(config, 'crawl_plan.listings_per_page', LISTINGS_PER_PAGE)
+        self.max_pages_per_shard = get_setting(config, 'crawl_plan.max_pages_per_shard', 100)
+        self.chunk_size = get_setting(config, 'workers.chunk_size', DEFAULT_CHUNK_SIZE)
+        self.base_url = base_url
+        # Shards whose result count needed more than max_pages_per_shard pages
+        self.truncated_shards = []
+
+    def plan(self) -> List[CrawlShard]:
+        """One shard per configured district and property type"""
+        return [
+            CrawlShard(district, name, build_search_url([district], params, self.base_url))
+            for district in self.districts
+            for name, params in self.property_types.items()
+        ]
+
+    def initial_ranges(self, shards: List[CrawlShard]) -> List[PageRange]:
+        """The first page of every shard; the rest is queued once its size is known"""
+        ranges = []
+        for shard in shards:
+            ranges.append(PageRange(shard.search_url, 1, 1, f"{shard.label} page 1", shard=shard))
+        return ranges
+
+    def expand(self, page_range: PageRange, result_count: Optional[int]) -> List[PageRange]:
+        """Remaining page ranges of a probed shard.
+
+        Without a result count the shard is crawled up to max_pages_per_shard
+        and the pool's end-of-results detection stops it early.
+        """
+        shard = page_range.shard
+        if shard is None or page_range.first_page != 1:
+            return []
+
+        shard.result_count = result_count
+        if result_count is None:
+            last_page = self.max_pages_per_shard
+            logger.warning("⚠️ %s: no result count, crawling up to page %s", shard.label, last_page)
+        else:
+            last_page = estimate_pages(result_count, self.listings_per_page)
+            if last_page > self.max_pages_per_shard:
+                logger.warning("⚠️ %s: %s properties need %s pages, capped at %s - split it further by property type",
+                               shard.label, f"{result_count:,}", last_page, self.max_pages_per_shard)
+                shard.needed_pages = last_page
+                if shard not in self.truncated_shards:
+                    self.truncated_shards.append(shard)
+                    get_metrics().incr('crawl_plan.truncated_shards')
+                last_page = self.max_pages_per_shard
+            logger.info("📊 %s: %s properties, ~%s pages", shard.label, f"{result_count:,}", last_page)
+        shard.estimated_pages = last_page
+
+        return split_page_ranges(shard.search_url, page_range.last_page + 1, last_page,
+                                 self.chunk_size, shard.label)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+📡 Page Fetchers
+Interchangeable ways to load a results page. All return a PageSnapshot, so the
+parsers never know whether a page came from Chrome, a plain HTTP client or a
+recording on disk
+"""
+
+import logging
+import sys
+import os
+import hashlib
+from typing import Dict, Any, Optional
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from extractors.json_state_extractor import JsonStateExtractor
+from extractors.page_snapshot import PageSnapshot, capture_page_snapshot
+from extractors.patterns import PATTERNS, to_int
+from scrapers.page_planner import page_from_url
+from scrapers.rate_scheduler import RequestScheduler, title_looks_like_error
+from utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-SG,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+
+class PageFetcher:
+    """Loads search result pages as PageSnapshots.
+
+    fetch() returns None when the site sent us to a different page than the
+    one asked for (past the last page of a search), and raises when the page
+    could not be loaded or an error/challenge page came back.
+    """
+
+    def __init__(self, scheduler: Optional[RequestScheduler] = None):
+        self.scheduler = scheduler
+
+    def fetch(self, url: str, page_number: int) -> Optional[PageSnapshot]:
+        raise NotImplementedError
+
+    def page_html(self, snapshot: PageSnapshot) -> str:
+        """Full HTML of the page just fetched (for the snapshot archive)"""
+        return snapshot.html
+
+    def result_count(self, snapshot: PageSnapshot) -> Optional[int]:
+        """Listing total of the search ("52,147 Properties"), from the captured page"""
+        match = PATTERNS['result_count'].search(snapshot.page_text or snapshot.html)
+        return to_int(match.group(1)) if match else None
+
+    def close(self):
+        pass
+
+
+class SeleniumFetcher(PageFetcher):
+    """Full Chrome render through a SmartPropertyScraper (navigation, readiness waits, rate limit)"""
+
+    def __init__(self, scraper, state_extractor: Optional[JsonStateExtractor] = None):
+        self.scraper = scraper
+        self.state_extractor = state_extractor or JsonStateExtractor.from_config(scraper.config)
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        return self.scraper.scheduler
+
+    @scheduler.setter
+    def scheduler(self, scheduler: RequestScheduler):
+        self.scraper.scheduler = scheduler
+
+    def fetch(self, url: str, page_number: int) -> Optional[PageSnapshot]:
+        if not self.scraper.open_page(url, page_number):
+            return None
+        return capture_page_snapshot(self.scraper.driver, page_number, self.state_extractor)
+
+    def page_html(self, snapshot: PageSnapshot) -> str:
+        return snapshot.html or self.scraper.driver.page_source
+
+    def result_count(self, snapshot: PageSnapshot) -> Optional[int]:
+        # Bulk card snapshots carry no page text, so read the heading from the browser
+        return self.scraper.get_result_count(snapshot.page_text or snapshot.html or None)
+
+    def close(self):
+        self.scraper.close()
+
+
+class HttpFetcher(PageFetcher):
+    """Server-rendered HTML over a pooled keep-alive HTTP session (gzip), no JavaScript.
+
+    Much cheaper than a browser for pages whose listings are in the initial
+    HTML; pages that only render client-side come back without cards.
+    """
+
+    def __init__(self, scheduler: Optional[RequestScheduler] = None, pool_size: int = 4, timeout: float = 30,
+                 headers: Optional[Dict[str, str]] = None, session=None, recorder: Optional["ReplayFetcher"] = None):
+        """
+        Args:
+            scheduler: Shared RequestScheduler; defaults to the configured one
+            pool_size: Connections kept open per host
+            timeout: Seconds per request
+            headers: Request headers; defaults to a desktop Chrome profile
+            session: Ready requests.Session to use instead of building one
+            recorder: ReplayFetcher that keeps a copy of every fetched page
+        """
+        super().__init__(scheduler or RequestScheduler.from_config())
+        self.timeout = timeout
+        self.recorder = recorder
+        if session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(headers or DEFAULT_HEADERS)
+        self.session = session
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None, **kwargs) -> "HttpFetcher":
+        """Fetcher from the "fetch" config section"""
+        from utils.config_loader import load_config, get_setting
+
+        if config is None:
+            config = load_config()
+        record_dir = get_setting(config, 'fetch.record_dir', None)
+        kwargs.setdefault('pool_size', get_setting(config, 'fetch.pool_size', 4))
+        kwargs.setdefault('timeout', get_setting(config, 'fetch.timeout', 30))
+        kwargs.setdefault('recorder', ReplayFetcher(record_dir) if record_dir else None)
+        return cls(**kwargs)
+
+    def fetch(self, url: str, page_number: int) -> Optional[PageSnapshot]:
+        response = None
+
+        def get(request_url):
+            nonlocal response
+            response = self.session.get(request_url, timeout=self.timeout)
+
+        metrics = get_metrics()
+        with metrics.timer('page.load'):
+            self.scheduler.fetch(url, get, is_ok=lambda: self._served(response))
+        metrics.incr('http.bytes', len(response.content))
+        if not self._served(response):
+            # An error or challenge page must not look like an empty last page
+            raise RuntimeError(f"HTTP {response.status_code} error page for page {page_number}")
+
+        if page_number and page_from_url(response.url) != page_number:
+            logger.warning("⚠️ Redirected to %s instead of page %s", response.url[:100], page_number)
+            return None
+
+        snapshot = PageSnapshot(page_number, response.url, html=response.text)
+        if self.recorder is not None:
+            self.recorder.save(url, snapshot)
+        return snapshot
+
+    @staticmethod
+    def _served(response) -> bool:
+        """False for HTTP errors and error/challenge pages served with status 200"""
+        if response.status_code >= 400:
+            return False
+        match = PATTERNS['html_title'].search(response.text)
+        return not title_looks_like_error(match.group(1) if match else "")
+
+    def close(self):
+        self.session.close()
+
+
+def replay_key(url: str) -> str:
+    """File name stem for a recorded page"""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=10).hexdigest()
+
+
+class ReplayFetcher(PageFetcher):
+    """Serves pages recorded earlier (by HttpFetcher's recorder) from a directory of HTML files.
+
+    Lets the parsers be rerun, tuned or benchmarked against real pages
+    without touching the site. URLs that were never recorded return None.
+    """
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path_for(self, url: str) -> str:
+        return os.path.join(self.directory, f"{replay_key(url)}.html")
+
+    def save(self, url: str, snapshot: PageSnapshot):
+        """Record the HTML of a fetched page under the URL it was requested with"""
+        with open(self.path_for(url), 'w', encoding='utf-8') as f:
+            f.write(snapshot.html)
+
+    def fetch(self, url: str, page_number: int) -> Optional[PageSnapshot]:
+        path = self.path_for(url)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return PageSnapshot(page_number, url, html=f.read())
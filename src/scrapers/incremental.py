@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+🆕 Incremental Crawl
+Newest-first crawling that stops once whole pages consist of listings from earlier runs
+"""
+
+import sys
+import os
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from typing import Dict, Optional
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from storage.dedup_index import NEW
+
+# PropertyGuru search parameters for "newest listings first"
+NEWEST_FIRST_PARAMS = {"sort": "date", "order": "desc"}
+
+DEFAULT_KNOWN_PAGES_TO_STOP = 3
+
+
+def newest_first_url(url: str, sort_params: Optional[Dict[str, str]] = None) -> str:
+    """Same search with the sort parameters replaced (other filters and their order are kept)"""
+    sort_params = sort_params or NEWEST_FIRST_PARAMS
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+             if key not in sort_params]
+    query.extend(sort_params.items())
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+
+class KnownPageStop:
+    """Stop condition for incremental crawls.
+
+    Fed the dedup status counts of each page in crawl order; reports True once
+    known_pages_to_stop consecutive non-empty pages contained no new listing.
+    Empty pages neither extend nor break the streak.
+    """
+
+    def __init__(self, known_pages_to_stop: int = DEFAULT_KNOWN_PAGES_TO_STOP):
+        self.known_pages_to_stop = max(1, int(known_pages_to_stop or 1))
+        self.consecutive_known = 0
+
+    def observe(self, counts: Dict[str, int]) -> bool:
+        if sum(counts.values()):
+            self.consecutive_known = 0 if counts.get(NEW) else self.consecutive_known + 1
+        return self.consecutive_known >= self.known_pages_to_stop
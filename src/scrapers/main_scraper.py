@@ -4,9 +4,9 @@
 Handles Cloudflare and extracts property data intelligently
 """
 
+import logging
 import time
 import json
-import re
 import random
 import sys
 import os
@@ -22,12 +22,62 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from extractors.advanced_extractor import AdvancedPropertyExtractor
+from extractors.json_state_extractor import JsonStateExtractor
+from extractors.page_snapshot import capture_state_records
+from extractors.patterns import PATTERNS, to_int
+from extractors.selector_cache import DEFAULT_LAYOUT, NEXT_BUTTON, get_selector_cache, layout_key
+from storage.jsonl_sink import JsonlSink
+from storage.dedup_index import DedupIndex, NEW, DUPLICATE, KNOWN
+from scrapers.page_planner import ALL_DISTRICTS_URL, page_from_url, planner_for
+from scrapers.page_readiness import PageReadiness
+from scrapers.rate_scheduler import RequestScheduler, title_looks_like_error
+from utils.config_loader import load_config, get_setting, resolve_data_dir
+from utils.logging_setup import setup_logging
+from utils.metrics import counting_driver, get_metrics, timed
+
+logger = logging.getLogger(__name__)
+
+# PropertyGuru-specific selectors based on inspection
+NEXT_BUTTON_SELECTORS = [
+    # PropertyGuru specific - most likely to work
+    '.hui-pagination a.page-link',
+    '.pagination a.page-link',
+    'a.page-link',
+
+    # Generic fallbacks
+    'a[aria-label="Next"]',
+    'a[title="Next"]',
+    'button[aria-label="Next"]',
+    'button[title="Next"]',
+    '.next-page',
+    '.pagination-next',
+    '[data-testid="next-page"]',
+    '[data-testid="pagination-next"]'
+]
 
 class SmartPropertyScraper:
     def __init__(self):
         self.driver = None
         self.wait = None
-        # Enhanced timing patterns for human-like behavior
+        self.config = load_config()
+        self.data_dir = resolve_data_dir(self.config)
+        self.crawl_state = {}
+        # Persistent cross-run index when set by the caller, otherwise one per crawl
+        self.dedup_index = None
+        # Optional KnownPageStop for incremental crawls
+        self.stop_condition = None
+        self.skip_known_listings = get_setting(self.config, 'dedup.skip_known', False)
+        # Deepest results page the site serves; a page that stops advancing there is the end
+        self.last_site_page = get_setting(self.config, 'scraping.default_pages')
+        # Page loads wait on readiness signals; every request is paced by the rate scheduler
+        self.readiness_settings = get_setting(self.config, 'readiness', {}) or {}
+        self.scheduler = RequestScheduler.from_config(self.config)
+        self.state_extractor = JsonStateExtractor.from_config(self.config)
+        # Wrap new browsers so WebDriver round-trips per page show up in the run metrics
+        self.count_round_trips = get_setting(self.config, 'metrics.count_round_trips', True)
+        # Layout of the search being crawled, so cached selectors are tried first on its pages
+        self.layout = DEFAULT_LAYOUT
+        # Human-like waits while a Cloudflare challenge is showing (not used to pace requests)
         self.timing_patterns = {
             'page_load': (3, 8),      # 3-8 seconds for page loads
             'action_delay': (1, 3),   # 1-3 seconds between actions
@@ -39,9 +89,52 @@ class SmartPropertyScraper:
         """Add human-like delays based on timing patterns"""
         min_delay, max_delay = self.timing_patterns.get(delay_type, (1, 3))
         delay = random.uniform(min_delay, max_delay)
-        print(f"⏱️ Human-like delay: {delay:.1f}s ({delay_type})")
+        logger.debug("⏱️ Human-like delay: %.1fs (%s)", delay, delay_type)
         time.sleep(delay)
 
+    def wait_for_page(self, expected_page=None):
+        """Wait until the page is loaded and its listings have settled (no fixed sleep)"""
+        settings = self.readiness_settings
+        readiness = PageReadiness(
+            self.driver,
+            timeout=settings.get('timeout', 30),
+            poll_interval=settings.get('poll_interval', 0.25),
+            stable_polls=settings.get('stable_polls', 2),
+            empty_polls=settings.get('empty_polls', 8)
+        )
+        start = time.time()
+        ready = readiness.wait_until_ready(expected_page)
+        elapsed = time.time() - start
+        get_metrics().observe('page.readiness', elapsed)
+        if ready:
+            logger.debug("⏳ Page ready in %.1fs (%s polls)", elapsed, readiness.polls)
+        else:
+            logger.warning("⚠️ Page not ready after %.1fs - continuing anyway", elapsed)
+        return ready
+
+    def open_page(self, url, expected_page=None):
+        """Load a URL through the rate scheduler and wait until it is ready
+
+        Returns False only when the browser landed on a different results page
+        than expected (checked from the URL); a slow page is waited for up to
+        the readiness timeout and then used as it is.
+        """
+        self.layout = layout_key(url)
+        with get_metrics().timer('page.load'):
+            self.scheduler.fetch(url, self.driver.get, is_ok=self._page_served)
+
+        # The URL alone tells whether we landed on the requested page
+        if expected_page and page_from_url(self.driver.current_url) != expected_page:
+            logger.warning("⚠️ Landed on %s instead of page %s", self.driver.current_url[:100], expected_page)
+            return False
+
+        self.wait_for_page(expected_page)
+        return True
+
+    def _page_served(self):
+        """False when the browser shows an error or challenge page instead of the requested one"""
+        return not title_looks_like_error(getattr(self.driver, 'title', ''))
+
     def load_manual_connection(self):
         """Load manually selected Chrome connection info"""
         try:
@@ -51,7 +144,7 @@ class SmartPropertyScraper:
                 with open(connection_file, 'r') as f:
                     return json.load(f)
         except Exception as e:
-            print(f"⚠️ Could not load manual connection: {e}")
+            logger.warning("⚠️ Could not load manual connection: %s", e)
         return None
 
     def connect_and_navigate(self):
@@ -65,11 +158,11 @@ class SmartPropertyScraper:
                     chrome_options = Options()
                     chrome_options.add_experimental_option("debuggerAddress", f"127.0.0.1:{port}")
                     self.driver = webdriver.Chrome(options=chrome_options)
-                    print(f"✅ Connected to manually selected Chrome tab (port {port})")
-                    print(f"   Tab: {connection_info.get('tab_title', 'Unknown')}")
+                    logger.info("✅ Connected to manually selected Chrome tab (port %s)", port)
+                    logger.info("   Tab: %s", connection_info.get('tab_title', 'Unknown'))
                 except Exception as e:
-                    print(f"⚠️ Manual connection failed: {e}")
-                    print("🔄 Falling back to automatic detection...")
+                    logger.warning("⚠️ Manual connection failed: %s", e)
+                    logger.info("🔄 Falling back to automatic detection...")
                     connection_info = None
 
             # Fallback to automatic Chrome detection
@@ -78,37 +171,35 @@ class SmartPropertyScraper:
                     chrome_options = Options()
                     chrome_options.add_experimental_option("debuggerAddress", "127.0.0.1:9222")
                     self.driver = webdriver.Chrome(options=chrome_options)
-                    print("✅ Connected to existing Chrome browser (debug mode)")
+                    logger.info("✅ Connected to existing Chrome browser (debug mode)")
                 except:
                     # Final fallback to undetected Chrome
-                    print("🛡️ Starting undetected Chrome for enhanced stealth...")
+                    logger.info("🛡️ Starting undetected Chrome for enhanced stealth...")
                     self.driver = uc.Chrome(
                         headless=False,
                         use_subprocess=False,
                         version_main=None  # Auto-detect Chrome version
                     )
-                    print("✅ Started undetected Chrome browser")
+                    logger.info("✅ Started undetected Chrome browser")
 
+            self.driver = counting_driver(self.driver, self.count_round_trips)
             self.wait = WebDriverWait(self.driver, 20)  # Increased timeout
 
             # Navigate to PropertyGuru with comprehensive district coverage
-            url = "https://www.propertyguru.com.sg/property-for-sale?freetext=D01+Boat+Quay+%2F+Raffles+Place+%2F+Marina%2C+D02+Chinatown+%2F+Tanjong+Pagar%2C+D03+Alexandra+%2F+Commonwealth%2C+D04+Harbourfront+%2F+Telok+Blangah%2C+D05+Buona+Vista+%2F+West+Coast+%2F+Clementi+New+Town%2C+D06+City+Hall+%2F+Clarke+Quay%2C+D07+Beach+Road+%2F+Bugis+%2F+Rochor%2C+D08+Farrer+Park+%2F+Serangoon+Rd%2C+D09+Orchard+%2F+River+Valley%2C+D10+Tanglin+%2F+Holland+%2F+Bukit+Timah%2C+D11+Newton+%2F+Novena%2C+D21+Clementi+Park+%2F+Upper+Bukit+Timah%2C+D12+Balestier+%2F+Toa+Payoh%2C+D13+Macpherson+%2F+Potong+Pasir%2C+D14+Eunos+%2F+Geylang+%2F+Paya+Lebar%2C+D15+East+Coast+%2F+Marine+Parade%2C+D16+Bedok+%2F+Upper+East+Coast%2C+D17+Changi+Airport+%2F+Changi+Village%2C+D18+Pasir+Ris+%2F+Tampines%2C+D19+Hougang+%2F+Punggol+%2F+Sengkang%2C+D20+Ang+Mo+Kio+%2F+Bishan+%2F+Thomson%2C+D22+Boon+Lay+%2F+Jurong+%2F+Tuas%2C+D23+Dairy+Farm+%2F+Bukit+Panjang+%2F+Choa+Chu+Kang%2C+D24+Lim+Chu+Kang+%2F+Tengah%2C+D25+Admiralty+%2F+Woodlands%2C+D26+Mandai+%2F+Upper+Thomson%2C+D27+Sembawang+%2F+Yishun%2C+D28+Seletar+%2F+Yio+Chu+Kang&districtCode=D01&districtCode=D02&districtCode=D03&districtCode=D04&districtCode=D05&districtCode=D06&districtCode=D07&districtCode=D08&districtCode=D09&districtCode=D10&districtCode=D11&districtCode=D21&districtCode=D12&districtCode=D13&districtCode=D14&districtCode=D15&districtCode=D16&districtCode=D17&districtCode=D18&districtCode=D19&districtCode=D20&districtCode=D22&districtCode=D23&districtCode=D24&districtCode=D25&districtCode=D26&districtCode=D27&districtCode=D28&isCommercial=false"
-            print(f"🌐 Navigating to: PropertyGuru (All Singapore Districts D01-D28)")
-            print(f"🎯 Comprehensive coverage: All 28 districts included")
-            self.driver.get(url)
-
-            # Human-like delay after navigation
-            self.human_delay('page_load')
+            url = ALL_DISTRICTS_URL
+            logger.info("🌐 Navigating to: PropertyGuru (All Singapore Districts D01-D28)")
+            logger.info("🎯 Comprehensive coverage: All 28 districts included")
+            self.open_page(url)
 
             return True
 
         except Exception as e:
-            print(f"❌ Connection/Navigation failed: {e}")
+            logger.error("❌ Connection/Navigation failed: %s", e)
             return False
     
     def handle_cloudflare_and_wait(self):
         """Handle Cloudflare protection with enhanced timing patterns"""
-        print("🛡️ Checking for Cloudflare protection...")
+        logger.info("🛡️ Checking for Cloudflare protection...")
 
         max_wait_time = 90  # Increased wait time for better success
         start_time = time.time()
@@ -118,14 +209,14 @@ class SmartPropertyScraper:
                 current_title = self.driver.title
                 current_url = self.driver.current_url
 
-                print(f"⏳ Current page: {current_title}")
+                logger.info("⏳ Current page: %s", current_title)
 
                 # Check if we're past Cloudflare
                 if ("just a moment" not in current_title.lower() and
                     "propertyguru" in current_url and
                     "cloudflare" not in current_title.lower()):
 
-                    print("✅ Successfully bypassed Cloudflare!")
+                    logger.info("✅ Successfully bypassed Cloudflare!")
 
                     # Human-like delay after successful bypass
                     self.human_delay('page_load')
@@ -133,7 +224,7 @@ class SmartPropertyScraper:
 
                 # Check if we need to wait for Cloudflare
                 if "just a moment" in current_title.lower() or "cloudflare" in current_title.lower():
-                    print("🔄 Waiting for Cloudflare to pass...")
+                    logger.info("🔄 Waiting for Cloudflare to pass...")
                     # Use human-like delay for Cloudflare waiting
                     self.human_delay('cloudflare_wait')
                     continue
@@ -142,7 +233,7 @@ class SmartPropertyScraper:
                 try:
                     body_text = self.driver.find_element(By.TAG_NAME, "body").text
                     if "properties for sale" in body_text.lower() or "S$" in body_text:
-                        print("✅ PropertyGuru content detected!")
+                        logger.info("✅ PropertyGuru content detected!")
                         self.human_delay('action_delay')
                         return True
                 except:
@@ -152,95 +243,74 @@ class SmartPropertyScraper:
                 self.human_delay('action_delay')
 
             except Exception as e:
-                print(f"⚠️ Error checking page: {e}")
+                logger.warning("⚠️ Error checking page: %s", e)
                 self.human_delay('action_delay')
 
-        print("⚠️ Cloudflare wait timeout, proceeding anyway...")
+        logger.warning("⚠️ Cloudflare wait timeout, proceeding anyway...")
         return False
     
+    @timed('extract.smart')
     def extract_properties_smart(self):
         """Advanced property extraction using comprehensive extractor"""
-        print("🔍 Starting smart property extraction...")
+        logger.debug("🔍 Starting smart property extraction...")
+
+        # Listings embedded in the page state need no DOM reads at all
+        _, properties = capture_state_records(self.driver, self.state_extractor)
+        if properties:
+            logger.debug("✅ Page state held %s properties", len(properties))
+            return properties
 
         try:
             # Use the advanced extractor first
-            extractor = AdvancedPropertyExtractor(self.driver)
+            extractor = AdvancedPropertyExtractor(self.driver, layout=self.layout)
             properties = extractor.extract_properties_from_page()
 
             if properties:
-                print(f"✅ Advanced extractor found {len(properties)} properties")
+                logger.debug("✅ Advanced extractor found %s properties", len(properties))
                 return properties
             else:
-                print("⚠️ Advanced extractor found no properties, trying fallback strategies...")
+                logger.warning("⚠️ Advanced extractor found no properties, trying fallback strategies...")
                 return self._fallback_extraction_strategies()
 
         except Exception as e:
-            print(f"⚠️ Advanced extraction failed: {e}")
+            logger.warning("⚠️ Advanced extraction failed: %s", e)
             return self._fallback_extraction_strategies()
 
+    @timed('extract.fallback')
     def _fallback_extraction_strategies(self):
         """Fallback extraction strategies"""
         properties = []
 
         try:
             # Strategy 1: Look for property data in page source
-            print("📊 Strategy 1: Analyzing page source...")
+            logger.debug("📊 Strategy 1: Analyzing page source...")
             page_source = self.driver.page_source
 
-            # Look for JSON data in script tags (common in modern websites)
-            json_matches = re.findall(r'window\.__INITIAL_STATE__\s*=\s*({.*?});', page_source, re.DOTALL)
-            if not json_matches:
-                json_matches = re.findall(r'window\.__NEXT_DATA__\s*=\s*({.*?});', page_source, re.DOTALL)
-            if not json_matches:
-                json_matches = re.findall(r'"listings":\s*(\[.*?\])', page_source, re.DOTALL)
-
-            for json_str in json_matches:
-                try:
-                    data = json.loads(json_str)
-                    extracted = self._extract_from_json_data(data)
-                    if extracted:
-                        properties.extend(extracted)
-                        print(f"✅ Strategy 1 found {len(extracted)} properties in JSON data")
-                        break
-                except:
-                    continue
+            # Embedded page state (__NEXT_DATA__), located and decoded once
+            properties = self.state_extractor.extract(page_source)
+            if properties:
+                logger.debug("✅ Strategy 1 found %s properties in JSON data", len(properties))
 
             # Strategy 2: Extract from visible page text
             if not properties:
-                print("📊 Strategy 2: Extracting from page text...")
+                logger.debug("📊 Strategy 2: Extracting from page text...")
                 properties = self._extract_from_page_text()
 
             # Strategy 3: Look for property elements
             if not properties:
-                print("📊 Strategy 3: Looking for property elements...")
+                logger.debug("📊 Strategy 3: Looking for property elements...")
                 properties = self._extract_from_elements()
 
         except Exception as e:
-            print(f"❌ Extraction error: {e}")
+            logger.error("❌ Extraction error: %s", e)
 
         return properties
 
     def find_next_button(self):
         """Find and return the next page button"""
-        # PropertyGuru-specific selectors based on inspection
-        next_button_selectors = [
-            # PropertyGuru specific - most likely to work
-            '.hui-pagination a.page-link',
-            '.pagination a.page-link',
-            'a.page-link',
-
-            # Generic fallbacks
-            'a[aria-label="Next"]',
-            'a[title="Next"]',
-            'button[aria-label="Next"]',
-            'button[title="Next"]',
-            '.next-page',
-            '.pagination-next',
-            '[data-testid="next-page"]',
-            '[data-testid="pagination-next"]'
-        ]
-
-        for selector in next_button_selectors:
+        # The selector that found it on the previous page goes first
+        selector_cache = get_selector_cache()
+        for selector in selector_cache.ordered(NEXT_BUTTON, NEXT_BUTTON_SELECTORS, self.layout):
             try:
                 elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                 for element in elements:
@@ -248,88 +318,106 @@ class SmartPropertyScraper:
                         text = element.text.strip().lower()
                         # Check if this is actually the "Next" button
                         if 'next' in text:
-                            print(f"✅ Found Next button: {selector} with text '{element.text.strip()}'")
+                            logger.debug("✅ Found Next button: %s with text '%s'", selector, element.text.strip())
+                            selector_cache.record(NEXT_BUTTON, selector, self.layout)
                             return element
             except Exception as e:
                 continue
+        selector_cache.record(NEXT_BUTTON, None, self.layout)
 
         # Fallback: XPath search for "Next" text
         try:
             elements = self.driver.find_elements(By.XPATH, "//a[contains(text(), 'Next')] | //button[contains(text(), 'Next')]")
             for element in elements:
                 if element.is_enabled() and element.is_displayed():
-                    print(f"✅ Found Next button via XPath with text '{element.text.strip()}'")
+                    logger.debug("✅ Found Next button via XPath with text '%s'", element.text.strip())
                     return element
         except:
             pass
 
-        print("❌ Next button not found with any selector")
+        logger.error("❌ Next button not found with any selector")
         return None
 
-    def click_next_page(self):
-        """Navigate to next page using URL-based pagination (PropertyGuru uses URLs, not AJAX)"""
+    def get_next_page_url(self):
+        """Work out the next page URL from the current page (PropertyGuru uses URLs, not AJAX)"""
         try:
-            # Get current page number
-            current_page, _ = self.get_current_page_info()
-            next_page = current_page + 1
-
-            print(f"🔄 Navigating from page {current_page} to page {next_page}")
-
-            # Get current URL and modify it for next page
-            current_url = self.driver.current_url
-
             # PropertyGuru URL patterns:
             # Page 1: /property-for-sale?params
             # Page 2+: /property-for-sale/2?params
+            current_url = self.driver.current_url
+            planner = planner_for(current_url)
+            if planner:
+                next_page = page_from_url(current_url) + 1
+                logger.debug("🔄 Navigating to page %s", next_page)
+                return planner.url_for(next_page)
+
+            # Fallback: get URL from next button
+            next_button = self.find_next_button()
+            if not next_button:
+                logger.error("❌ Cannot determine next page URL")
+                return None
+
+            next_url = next_button.get_attribute('href')
+            if not next_url:
+                logger.error("❌ Next button has no href")
+                return None
+            return next_url
 
-            if '/property-for-sale/' in current_url and '?' in current_url:
-                # Already has page number - replace it
-                if f'/property-for-sale/{current_page}?' in current_url:
-                    next_url = current_url.replace(f'/property-for-sale/{current_page}?', f'/property-for-sale/{next_page}?')
-                else:
-                    # Fallback: get URL from next button
-                    next_button = self.find_next_button()
-                    if next_button:
-                        next_url = next_button.get_attribute('href')
-                        if not next_url:
-                            print("❌ Next button has no href")
-                            return False
-                    else:
-                        print("❌ Cannot find next button for URL")
-                        return False
-            elif '/property-for-sale?' in current_url and current_page == 1:
-                # Page 1 format - add page number for page 2+
-                next_url = current_url.replace('/property-for-sale?', f'/property-for-sale/{next_page}?')
-            else:
-                # Fallback: get URL from next button
-                next_button = self.find_next_button()
-                if next_button:
-                    next_url = next_button.get_attribute('href')
-                    if not next_url:
-                        print("❌ Next button has no href")
-                        return False
-                else:
-                    print("❌ Cannot determine next page URL")
-                    return False
+        except Exception as e:
+            logger.error("❌ Error finding next page URL: %s", e)
+            return None
 
-            print(f"🔗 Navigating to: {next_url[:100]}...")
+    def click_next_page(self, next_url=None):
+        """Navigate to next page using URL-based pagination (PropertyGuru uses URLs, not AJAX)"""
+        try:
+            if not next_url:
+                next_url = self.get_next_page_url()
+                if not next_url:
+                    return False
 
-            # Navigate to next page
-            self.driver.get(next_url)
+            logger.debug("🔗 Navigating to: %s...", next_url[:100])
 
-            # Wait for page to load
-            self.human_delay('page_load')
+            # Navigate to next page and wait until it has loaded
+            if not self.open_page(next_url, page_from_url(next_url)):
+                return False
 
-            print("✅ Successfully navigated to next page")
+            logger.debug("✅ Successfully navigated to next page")
             return True
 
         except Exception as e:
-            print(f"❌ Error navigating to next page: {e}")
+            logger.error("❌ Error navigating to next page: %s", e)
+            return False
+
+    def go_to_page(self, page):
+        """Jump straight to a results page of the current search"""
+        planner = planner_for(self.driver.current_url)
+        if planner is None:
+            logger.error("❌ Current page is not a search results page - cannot jump")
             return False
+        logger.info("🧭 Jumping to page %s", page)
+        return self.click_next_page(planner.url_for(page))
+
+    def get_result_count(self, text=None):
+        """Total listings of the current search, from headings like "52,147 Properties" (None if absent)
+
+        Pass already captured page text or HTML to avoid reading the body again.
+        """
+        if text is None:
+            try:
+                text = self.driver.find_element(By.TAG_NAME, "body").text
+            except Exception:
+                return None
+        match = PATTERNS['result_count'].search(text)
+        return to_int(match.group(1)) if match else None
 
     def get_current_page_info(self):
         """Get current page number and total pages"""
         try:
+            # Search result URLs carry the page number, so no DOM lookup is needed
+            url_page = page_from_url(self.driver.current_url)
+            if url_page:
+                return url_page, None
+
             # PropertyGuru specific: look for current page in pagination
             try:
                 # Look for the current page indicator in pagination
@@ -337,91 +425,35 @@ class SmartPropertyScraper:
                 if current_page_elements:
                     current_text = current_page_elements[0].text.strip()
                     # Extract number from text like "1\n(current)"
-                    page_match = re.search(r'(\d+)', current_text)
+                    page_match = PATTERNS['first_integer'].search(current_text)
                     if page_match:
                         current_page = int(page_match.group(1))
-                        print(f"📄 Current page from pagination: {current_page}")
+                        logger.debug("📄 Current page from pagination: %s", current_page)
                         return current_page, None
             except:
                 pass
 
             # Fallback: check URL for page parameter
             current_url = self.driver.current_url
-            page_match = re.search(r'[?&]page=(\d+)', current_url)
+            page_match = PATTERNS['page_param'].search(current_url)
             if page_match:
                 current_page = int(page_match.group(1))
-                print(f"📄 Current page from URL: {current_page}")
+                logger.debug("📄 Current page from URL: %s", current_page)
                 return current_page, None
 
             # Fallback: look for page info in page text
-            try:
-                body_text = self.driver.find_element(By.TAG_NAME, "body").text
-                # Look for patterns like "52,147 Properties" to detect content changes
-                property_count_match = re.search(r'([\d,]+)\s+Properties', body_text)
-                if property_count_match:
-                    count = property_count_match.group(1)
-                    print(f"📊 Found {count} properties on current page")
-            except:
-                pass
+            count = self.get_result_count()
+            if count is not None:
+                logger.debug("📊 Found %s properties on current page", count)
 
-            print("📄 Defaulting to page 1")
+            logger.debug("📄 Defaulting to page 1")
             return 1, None  # Default to page 1
 
         except Exception as e:
-            print(f"⚠️ Could not get page info: {e}")
+            logger.warning("⚠️ Could not get page info: %s", e)
             return 1, None
     
-    def _extract_from_json_data(self, data):
-        """Extract properties from JSON data"""
-        properties = []
-        
-        def find_properties_recursive(obj, path=""):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if key in ['listings', 'properties', 'results', 'data']:
-                        if isinstance(value, list):
-                            for item in value:
-                                if isinstance(item, dict) and 'price' in str(item).lower():
-                                    prop = self._parse_property_json(item)
-                                    if prop:
-                                        properties.append(prop)
-                    else:
-                        find_properties_recursive(value, f"{path}.{key}")
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    find_properties_recursive(item, f"{path}[{i}]")
-        
-        find_properties_recursive(data)
-        return properties
-    
-    def _parse_property_json(self, item):
-        """Parse a single property from JSON"""
-        try:
-            prop = {
-                'id': item.get('id', f'prop_{len(properties)}'),
-                'extraction_timestamp': datetime.now().isoformat(),
-                'source': 'PropertyGuru'
-            }
-            
-            # Extract common fields
-            if 'price' in item:
-                prop['price'] = item['price']
-            if 'bedrooms' in item:
-                prop['bedrooms'] = item['bedrooms']
-            if 'bathrooms' in item:
-                prop['bathrooms'] = item['bathrooms']
-            if 'area' in item:
-                prop['area'] = item['area']
-            if 'title' in item:
-                prop['name'] = item['title']
-            if 'address' in item:
-                prop['address'] = item['address']
-            
-            return prop if 'price' in prop else None
-            
-        except Exception as e:
-            return None
-    
+    @timed('extract.page_text')
     def _extract_from_page_text(self):
         """Extract properties from visible page text"""
         properties = []
@@ -439,7 +471,7 @@ class SmartPropertyScraper:
                 line = line.strip()
                 
                 # Look for price
-                price_match = re.search(r'S\$\s*([\d,]+)', line)
+                price_match = PATTERNS['price_integer'].search(line)
                 if price_match:
                     if current_property:
                         # Save previous property
@@ -455,18 +487,18 @@ class SmartPropertyScraper:
                     }
                 
                 # Look for bedrooms
-                bed_match = re.search(r'(\d+)\s+Beds?', line)
+                bed_match = PATTERNS['bedrooms_strict'].search(line)
                 if bed_match and current_property:
                     current_property['bedrooms'] = int(bed_match.group(1))
                 
                 # Look for area
-                area_match = re.search(r'(\d+,?\d*)\s+sqft', line)
+                area_match = PATTERNS['floor_area_strict'].search(line)
                 if area_match and current_property:
                     current_property['area'] = int(area_match.group(1).replace(',', ''))
                 
                 # Look for property name (usually appears before price)
                 if not price_match and current_property and 'name' not in current_property:
-                    name_match = re.search(r'^([A-Z][a-zA-Z\s&@]+(?:Residences?|Towers?|Hill|House|Nine|Waterfront|Handy|Paterson|Promont|Emerald|Shenton|Newton|Zion|Hijauan|Cairnhill|Attitude|Leonie|Wharf|Abode|Tribeca|Haus))$', line)
+                    name_match = PATTERNS['project_name'].search(line)
                     if name_match:
                         current_property['name'] = name_match.group(1)
             
@@ -474,13 +506,14 @@ class SmartPropertyScraper:
             if current_property and self._is_valid_property(current_property):
                 properties.append(current_property)
             
-            print(f"✅ Extracted {len(properties)} properties from page text")
+            logger.debug("✅ Extracted %s properties from page text", len(properties))
             
         except Exception as e:
-            print(f"❌ Text extraction error: {e}")
+            logger.error("❌ Text extraction error: %s", e)
         
         return properties
     
+    @timed('extract.elements')
     def _extract_from_elements(self):
         """Extract properties from DOM elements"""
         properties = []
@@ -500,7 +533,7 @@ class SmartPropertyScraper:
                 try:
                     elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                     if elements:
-                        print(f"   Found {len(elements)} elements with: {selector}")
+                        logger.debug("   Found %s elements with: %s", len(elements), selector)
                         
                         for i, element in enumerate(elements[:20]):
                             try:
@@ -518,7 +551,7 @@ class SmartPropertyScraper:
                     continue
             
         except Exception as e:
-            print(f"❌ Element extraction error: {e}")
+            logger.error("❌ Element extraction error: %s", e)
         
         return properties
     
@@ -532,17 +565,17 @@ class SmartPropertyScraper:
             }
             
             # Extract price
-            price_match = re.search(r'S\$\s*([\d,]+)', text)
+            price_match = PATTERNS['price_integer'].search(text)
             if price_match:
                 prop['price'] = int(price_match.group(1).replace(',', ''))
             
             # Extract bedrooms
-            bed_match = re.search(r'(\d+)\s+Beds?', text)
+            bed_match = PATTERNS['bedrooms_strict'].search(text)
             if bed_match:
                 prop['bedrooms'] = int(bed_match.group(1))
             
             # Extract area
-            area_match = re.search(r'(\d+,?\d*)\s+sqft', text)
+            area_match = PATTERNS['floor_area_strict'].search(text)
             if area_match:
                 prop['area'] = int(area_match.group(1).replace(',', ''))
             
@@ -555,94 +588,204 @@ class SmartPropertyScraper:
         """Check if property has minimum required data"""
         return 'price' in prop and 'bedrooms' in prop
     
+    def open_extraction_sink(self, filename=None):
+        """Open a streaming JSON Lines file for technical extraction records
+
+        Pass an existing filename to keep appending to it (used when resuming).
+        """
+        if not filename:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            filename = os.path.join(self.data_dir, f'extraction_{timestamp}.jsonl')
+        fsync_interval = get_setting(self.config, 'output.fsync_interval', 1)
+        return JsonlSink(filename, fsync_interval=fsync_interval)
+
     def save_properties(self, properties):
-        """Save properties to JSON file"""
+        """Save properties to a JSON Lines file"""
         if not properties:
-            print("❌ No properties to save")
+            logger.error("❌ No properties to save")
             return None
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-        # Save to data directory
-        import os
-        data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
-        os.makedirs(data_dir, exist_ok=True)
-        filename = os.path.join(data_dir, f'extraction_{timestamp}.json')
-
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(properties, f, indent=2, ensure_ascii=False)
-
-        print(f"💾 Saved {len(properties)} properties to {filename}")
-        return filename
-    
-    def scrape_multiple_pages(self, max_pages=10, start_page=1):
-        """Scrape multiple pages with pagination"""
+        with self.open_extraction_sink() as sink:
+            sink.write_page(properties)
+
+        logger.info("💾 Saved %s properties to %s", len(properties), sink.path)
+        return sink.path
+
+    def filter_new_properties(self, properties, dedup_index):
+        """Drop listings already collected this run (and, with dedup.skip_known, in earlier runs)
+
+        Returns the kept properties and a count per dedup status.
+        """
+        kept = []
+        counts = {NEW: 0, DUPLICATE: 0, KNOWN: 0}
+        for prop in properties or []:
+            status = dedup_index.check_and_add(prop)
+            counts[status] += 1
+            if status == NEW or (status == KNOWN and not self.skip_known_listings):
+                kept.append(prop)
+
+        if counts[DUPLICATE]:
+            logger.debug("🔁 Skipped %s listings seen on earlier pages", counts[DUPLICATE])
+        if counts[KNOWN]:
+            action = "skipped" if self.skip_known_listings else "kept"
+            logger.info("🧬 %s listings already known from earlier runs (%s)", counts[KNOWN], action)
+        return kept, counts
+
+    def reached_last_site_page(self, page_num):
+        """True when page_num is at or past the deepest results page the site serves"""
+        return bool(self.last_site_page and page_num and page_num >= self.last_site_page)
+
+    def caught_up(self, dedup_counts, state):
+        """Incremental crawls end once enough consecutive pages held only known listings"""
+        if self.stop_condition is None or not self.stop_condition.observe(dedup_counts):
+            return False
+        logger.info("🆕 Caught up: %s pages in a row had no new listings", self.stop_condition.consecutive_known)
+        state['status'] = 'complete'
+        state['caught_up'] = True
+        return True
+
+    def _save_checkpoint(self, checkpoint, state, dedup_index):
+        """Persist crawl progress together with the dedup state"""
+        if checkpoint is None:
+            return
+        state['seen_fingerprints'] = dedup_index.run_fingerprints()
+        if checkpoint.save(state):
+            logger.info("🔖 Checkpoint saved after page %s", state.get('last_completed_page'))
+
+    def scrape_multiple_pages(self, max_pages=10, start_page=1, sink=None, checkpoint=None, resume_state=None,
+                              dedup_index=None):
+        """Scrape multiple pages with pagination
+
+        When a sink is given each page is appended to it as soon as it is
+        extracted and nothing is kept in memory; the returned list is empty.
+        With a checkpoint manager, progress (next page URL, dedup keys and the
+        sink offset) is saved every checkpoint_interval pages and on interrupt;
+        pass the loaded state as resume_state to continue from it.
+        Listings are deduplicated across pages through the dedup index.
+        """
         all_properties = []
         current_page = start_page
-
-        print(f"🔄 Starting multi-page scraping (max {max_pages} pages)")
+        pages_completed = 0
+        if dedup_index is None:
+            dedup_index = self.dedup_index if self.dedup_index is not None else DedupIndex()
+
+        if resume_state:
+            current_page = resume_state.get('next_page', start_page)
+            pages_completed = resume_state.get('pages_completed', 0)
+            dedup_index.restore_run(resume_state.get('seen_fingerprints') or [])
+            logger.info("🔁 Resuming at page %s (%s pages already done)", current_page, pages_completed)
+
+        # Only ever reflects fully written pages, so it is safe to save at any time
+        state = dict(resume_state or {})
+        state.update({
+            'status': 'running',
+            'max_pages': max_pages,
+            'output_file': sink.path if sink is not None else None,
+        })
+        state.setdefault('records_written', 0)
+        self.crawl_state = state
+
+        logger.info("🔄 Starting multi-page scraping (max %s pages)", max_pages)
 
         try:
             while current_page <= max_pages:
-                print(f"\n📄 Scraping page {current_page}...")
+                logger.debug("📄 Scraping page %s...", current_page)
 
                 # Get current page info
                 page_num, total_pages = self.get_current_page_info()
                 if total_pages:
-                    print(f"📊 Page {page_num} of {total_pages}")
+                    logger.debug("📊 Page %s of %s", page_num, total_pages)
                     if page_num > max_pages:
-                        print(f"✅ Reached max pages limit ({max_pages})")
+                        logger.info("✅ Reached max pages limit (%s)", max_pages)
+                        state['status'] = 'complete'
                         break
 
                 # Extract properties from current page
                 properties = self.extract_properties_smart()
 
+                # Drop listings already collected on earlier pages
+                properties, dedup_counts = self.filter_new_properties(properties, dedup_index)
+
                 if properties:
-                    print(f"✅ Extracted {len(properties)} properties from page {current_page}")
-                    all_properties.extend(properties)
+                    logger.info("✅ Extracted %s properties from page %s", len(properties), current_page)
+                    if sink is not None:
+                        with get_metrics().timer('write.page'):
+                            sink.write_page(properties)
+                    else:
+                        all_properties.extend(properties)
                 else:
-                    print(f"⚠️ No properties found on page {current_page}")
+                    logger.warning("⚠️ No properties found on page %s", current_page)
+
+                get_metrics().page_done(len(properties), self.driver)
+                pages_completed += 1
+                state.update({
+                    'last_completed_page': current_page,
+                    'last_page_url': self.driver.current_url,
+                    'next_page': current_page + 1,
+                    'next_url': None,
+                    'pages_completed': pages_completed,
+                    'records_written': state['records_written'] + len(properties),
+                })
+                if sink is not None:
+                    sink.flush(fsync=checkpoint is not None and checkpoint.should_save(pages_completed))
+                    state['output_offset'] = sink.tell()
+
+                if self.caught_up(dedup_counts, state):
+                    break
 
                 # Check if we should continue
                 if current_page >= max_pages:
-                    print(f"✅ Reached maximum pages ({max_pages})")
+                    logger.info("✅ Reached maximum pages (%s)", max_pages)
+                    state['status'] = 'complete'
                     break
 
                 # Try to go to next page
-                print("🔄 Moving to next page...")
-                if not self.click_next_page():
-                    print("❌ Could not navigate to next page - stopping")
+                logger.debug("🔄 Moving to next page...")
+                next_url = self.get_next_page_url()
+                if not next_url:
+                    logger.error("❌ Could not navigate to next page - stopping")
+                    state['status'] = 'stopped'
                     break
+                state['next_url'] = next_url
 
-                # Wait for page to load and verify change
-                self.human_delay('page_load')
+                if checkpoint is not None and checkpoint.should_save(pages_completed):
+                    self._save_checkpoint(checkpoint, state, dedup_index)
+
+                if not self.click_next_page(next_url):
+                    logger.error("❌ Could not navigate to next page - stopping")
+                    state['status'] = 'stopped'
+                    break
 
                 # Verify page changed (PropertyGuru uses URL-based pagination)
-                print("⏳ Verifying page navigation...")
+                logger.debug("⏳ Verifying page navigation...")
                 new_page_num, _ = self.get_current_page_info()
 
                 if new_page_num > page_num:
-                    print(f"✅ Page changed successfully: {page_num} → {new_page_num}")
+                    logger.debug("✅ Page changed successfully: %s → %s", page_num, new_page_num)
                 else:
-                    print(f"⚠️ Page number didn't change as expected: {page_num} → {new_page_num}")
+                    logger.warning("⚠️ Page number didn't change as expected: %s → %s", page_num, new_page_num)
                     # Check if we hit the last page
-                    if page_num >= 2600:  # Close to max pages
-                        print("📄 Likely reached the last page")
+                    if self.reached_last_site_page(page_num):
+                        logger.info("📄 Likely reached the last page")
+                        state['status'] = 'complete'
                         break
                     else:
-                        print("❌ Unexpected pagination issue")
+                        logger.error("❌ Unexpected pagination issue")
+                        state['status'] = 'stopped'
                         break
 
                 current_page += 1
-
-                # Add extra delay between pages to be respectful
-                self.human_delay('action_delay')
+            else:
+                state['status'] = 'complete'
 
         except KeyboardInterrupt:
-            print("\n⚠️ Scraping interrupted by user")
+            logger.warning("⚠️ Scraping interrupted by user")
+            state['status'] = 'interrupted'
         except Exception as e:
-            print(f"❌ Pagination error: {e}")
+            logger.error("❌ Pagination error: %s", e)
+            state['status'] = 'error'
 
+        self._save_checkpoint(checkpoint, state, dedup_index)
         return all_properties
 
     def close(self):
@@ -651,6 +794,7 @@ class SmartPropertyScraper:
             self.driver.quit()
 
 def main():
+    setup_logging()
     scraper = SmartPropertyScraper()
 
     try:
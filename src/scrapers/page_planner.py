@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+🧭 Page URL Planner
+Builds the URL of any search results page from the search URL itself, so moving
+between pages needs no pagination DOM lookups
+"""
+
+import sys
+import os
+from urllib.parse import urlsplit, urlunsplit, urlencode
+from typing import Dict, List, Optional
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from extractors.patterns import PATTERNS
+
+SEARCH_BASE_URL = "https://www.propertyguru.com.sg/property-for-sale"
+
+# District filter labels in the order the site's district picker lists them
+DISTRICT_LABELS = {
+    "D01": "Boat Quay / Raffles Place / Marina",
+    "D02": "Chinatown / Tanjong Pagar",
+    "D03": "Alexandra / Commonwealth",
+    "D04": "Harbourfront / Telok Blangah",
+    "D05": "Buona Vista / West Coast / Clementi New Town",
+    "D06": "City Hall / Clarke Quay",
+    "D07": "Beach Road / Bugis / Rochor",
+    "D08": "Farrer Park / Serangoon Rd",
+    "D09": "Orchard / River Valley",
+    "D10": "Tanglin / Holland / Bukit Timah",
+    "D11": "Newton / Novena",
+    "D21": "Clementi Park / Upper Bukit Timah",
+    "D12": "Balestier / Toa Payoh",
+    "D13": "Macpherson / Potong Pasir",
+    "D14": "Eunos / Geylang / Paya Lebar",
+    "D15": "East Coast / Marine Parade",
+    "D16": "Bedok / Upper East Coast",
+    "D17": "Changi Airport / Changi Village",
+    "D18": "Pasir Ris / Tampines",
+    "D19": "Hougang / Punggol / Sengkang",
+    "D20": "Ang Mo Kio / Bishan / Thomson",
+    "D22": "Boon Lay / Jurong / Tuas",
+    "D23": "Dairy Farm / Bukit Panjang / Choa Chu Kang",
+    "D24": "Lim Chu Kang / Tengah",
+    "D25": "Admiralty / Woodlands",
+    "D26": "Mandai / Upper Thomson",
+    "D27": "Sembawang / Yishun",
+    "D28": "Seletar / Yio Chu Kang",
+}
+
+
+def build_search_url(districts: List[str], extra_params: Optional[Dict[str, str]] = None,
+                     base_url: str = SEARCH_BASE_URL) -> str:
+    """Residential search URL filtered to the given districts (plus e.g. property type parameters)"""
+    query = [("freetext", ", ".join(f"{code} {DISTRICT_LABELS[code]}" for code in districts))]
+    query.extend(("districtCode", code) for code in districts)
+    query.append(("isCommercial", "false"))
+    query.extend((extra_params or {}).items())
+    return f"{base_url}?{urlencode(query)}"
+
+
+# Every district D01-D28 in one search
+ALL_DISTRICTS_URL = build_search_url(list(DISTRICT_LABELS))
+
+
+def page_from_url(url: Optional[str]) -> Optional[int]:
+    """Page number of a search results URL (1 when the path has none); None for other URLs"""
+    if not url:
+        return None
+    match = PATTERNS['search_page_path'].search(urlsplit(url).path)
+    if not match:
+        return None
+    return int(match.group(2)) if match.group(2) else 1
+
+
+class PageUrlPlanner:
+    """URL template for one search: page 1 is /property-for-sale?query, page N is /property-for-sale/N?query"""
+
+    def __init__(self, search_url: str):
+        """
+        Args:
+            search_url: Any page of the search; filters and sort order are taken from its query string
+        """
+        parts = urlsplit(search_url)
+        match = PATTERNS['search_page_path'].search(parts.path)
+        if not match:
+            raise ValueError(f"Not a search results URL: {search_url}")
+
+        self.scheme = parts.scheme
+        self.netloc = parts.netloc
+        self.base_path = parts.path[:match.start()] + match.group(1)
+        self.query = parts.query
+
+    def url_for(self, page: int) -> str:
+        """URL of the given results page"""
+        page = int(page)
+        if page < 1:
+            raise ValueError(f"Page numbers start at 1, got {page}")
+        path = self.base_path if page == 1 else f"{self.base_path}/{page}"
+        return urlunsplit((self.scheme, self.netloc, path, self.query, ''))
+
+
+def planner_for(url: Optional[str]) -> Optional[PageUrlPlanner]:
+    """Planner for a search URL, or None when the URL is not a search results page"""
+    if not url:
+        return None
+    try:
+        return PageUrlPlanner(url)
+    except ValueError:
+        return None
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+⏳ Page Readiness
+Waits for concrete load signals (document state, a settled card count, the active
+pagination item) instead of fixed sleeps
+"""
+
+import sys
+import os
+import time
+from typing import Dict, Any, Optional
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from extractors.card_snapshot import CARD_SELECTORS, MIN_CARD_TEXT_LENGTH
+from extractors.patterns import PATTERNS
+
+ACTIVE_PAGE_SELECTOR = '.hui-pagination .page-item.active .page-link, .pagination .page-item.active .page-link'
+
+# One round-trip per poll: document state, number of substantial cards and the active page label
+READINESS_SCRIPT = """
+const selectors = arguments[0];
+const minLength = arguments[1];
+const activeSelector = arguments[2];
+
+let cards = 0;
+for (const selector of selectors) {
+    let elements;
+    try { elements = document.querySelectorAll(selector); } catch (e) { continue; }
+    if (!elements.length) { continue; }
+    for (const card of elements) {
+        if ((card.innerText || '').trim().length > minLength) { cards++; }
+    }
+    if (cards) { break; }
+}
+const active = document.querySelector(activeSelector);
+return {
+    ready_state: document.readyState,
+    cards: cards,
+    active_page: active ? (active.innerText || '').trim() : null
+};
+"""
+
+
+class PageReadiness:
+    """Polls the page until it is loaded, its listing cards have stopped changing
+    and the pagination (when present) shows the expected page.
+    """
+
+    def __init__(self, driver, timeout: float = 30, poll_interval: float = 0.25, stable_polls: int = 2,
+                 empty_polls: int = 8, clock=time.monotonic, sleep=time.sleep):
+        """
+        Args:
+            driver: Selenium WebDriver
+            timeout: Give up (and report not ready) after this many seconds
+            poll_interval: Seconds between polls
+            stable_polls: Consecutive polls with the same non-zero card count
+            empty_polls: Consecutive polls with no cards before an empty page counts as ready
+            clock, sleep: Injectable for tests
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.stable_polls = max(1, int(stable_polls))
+        self.empty_polls = max(self.stable_polls, int(empty_polls))
+        self.clock = clock
+        self.sleep = sleep
+        self.polls = 0
+
+    def probe(self) -> Dict[str, Any]:
+        """Current readiness signals, or an empty dict when the script could not run"""
+        self.polls += 1
+        try:
+            result = self.driver.execute_script(READINESS_SCRIPT, CARD_SELECTORS, MIN_CARD_TEXT_LENGTH,
+                                                ACTIVE_PAGE_SELECTOR)
+        except Exception:
+            return {}
+        return result if isinstance(result, dict) else {}
+
+    @staticmethod
+    def _active_page_matches(active_text: Optional[str], expected_page: Optional[int]) -> bool:
+        if expected_page is None or not active_text:
+            return True
+        match = PATTERNS['first_integer'].search(active_text)
+        return not match or int(match.group(1)) == expected_page
+
+    def wait_until_ready(self, expected_page: Optional[int] = None) -> bool:
+        """Block until the page is ready; False when the timeout passed first"""
+        deadline = self.clock() + self.timeout
+        last_count = None
+        same_count = 0
+
+        while True:
+            signals = self.probe()
+            count = signals.get('cards')
+            if signals.get('ready_state') == 'complete' and count is not None:
+                same_count = same_count + 1 if count == last_count else 1
+                last_count = count
+                settled = same_count >= (self.stable_polls if count else self.empty_polls)
+                if settled and self._active_page_matches(signals.get('active_page'), expected_page):
+                    return True
+            else:
+                last_count = None
+                same_count = 0
+
+            if self.clock() + self.poll_interval > deadline:
+                return False
+            self.sleep(self.poll_interval)
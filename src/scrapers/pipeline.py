@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+🏭 Staged Scraping Pipeline
+Browser, parser and converter stages joined by bounded queues so parsing and
+schema conversion overlap with page loads instead of adding to them
+"""
+
+import logging
+import sys
+import os
+import time
+import queue
+import threading
+from typing import List, Dict, Any, Optional
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from extractors.advanced_extractor import AdvancedPropertyExtractor
+from extractors.html_parser import HtmlPropertyParser
+from extractors.json_state_extractor import JsonStateExtractor
+from extractors.page_snapshot import PageSnapshot, capture_page_snapshot
+from schemas.pure_data_schema import PureDataSchema
+from scrapers.page_planner import page_from_url
+from storage.dedup_index import DedupIndex
+from utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+class ScrapePipeline:
+    """Runs a multi-page crawl as three stages:
+
+    1. browser (calling thread) - navigates and captures PageSnapshots only
+    2. parser pool (threads)    - turns snapshots into technical records
+    3. converter (one thread)   - restores page order, deduplicates, runs
+                                  create_property_record, writes both sinks
+                                  and saves checkpoints
+
+    Selenium is not thread-safe, so only the browser stage touches the driver.
+    """
+
+    def __init__(self, scraper, sink=None, pure_sink=None, checkpoint=None,
+                 parser_workers: int = 2, queue_size: int = 4, columnar_writer=None, archive=None):
+        """
+        Args:
+            scraper: Connected SmartPropertyScraper (used for navigation only)
+            sink: JsonlSink for technical records
+            pure_sink: JsonlSink for pure data records
+            checkpoint: Optional CheckpointManager
+            parser_workers: Number of parser threads
+            queue_size: Max pages waiting between stages (back-pressure on the browser)
+            columnar_writer: Optional ColumnarWriter fed the same pure records
+            archive: Optional SnapshotArchive keeping the full HTML of every page
+        """
+        self.scraper = scraper
+        self.sink = sink
+        self.pure_sink = pure_sink
+        self.checkpoint = checkpoint
+        self.columnar_writer = columnar_writer
+        self.archive = archive
+        self.parser_workers = max(1, int(parser_workers or 1))
+
+        self.snapshot_queue = queue.Queue(maxsize=max(1, int(queue_size or 1)))
+        self.result_queue = queue.Queue(maxsize=max(1, int(queue_size or 1)))
+
+        self.state = {}
+        self.dedup_index = scraper.dedup_index if scraper.dedup_index is not None else DedupIndex()
+        self.state_extractor = JsonStateExtractor.from_config(scraper.config)
+        self.stats = {
+            'pages_captured': 0,
+            'pages_parsed': 0,
+            'records_parsed': 0,
+            'records_converted': 0,
+            'records_skipped': 0,
+            'capture_seconds': 0.0,
+            'parse_seconds': 0.0,
+            'convert_seconds': 0.0
+        }
+        self.first_page = 1
+        self._lock = threading.Lock()
+        # Set by the converter when an incremental crawl has caught up
+        self.caught_up = threading.Event()
+        # First exception raised while writing a page; the browser stops and run() re-raises it
+        self.error = None
+
+    # ----- browser stage -----
+
+    def run(self, max_pages: int = 10, start_page: int = 1, resume_state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Crawl up to max_pages and return the final crawl state
+
+        Raises the converter's exception (after saving the checkpoint of the
+        pages written before it) when a page could not be written.
+        """
+        current_page = start_page
+        self.state = dict(resume_state or {})
+        if resume_state:
+            current_page = resume_state.get('next_page', start_page)
+            self.dedup_index.restore_run(resume_state.get('seen_fingerprints') or [])
+            logger.info("🔁 Resuming at page %s (%s pages already done)", current_page, resume_state.get('pages_completed', 0))
+
+        self.state.update({
+            'status': 'running',
+            'max_pages': max_pages,
+            'output_file': self.sink.path if self.sink is not None else None,
+            'pure_output_file': self.pure_sink.path if self.pure_sink is not None else None,
+        })
+        self.state.setdefault('records_written', 0)
+        self.state.setdefault('pure_records_written', 0)
+        self.state.setdefault('pages_completed', 0)
+        self.first_page = current_page
+
+        parsers = [threading.Thread(target=self._parse_worker, name=f"parser-{i}", daemon=True)
+                   for i in range(self.parser_workers)]
+        converter = threading.Thread(target=self._convert_worker, name="converter", daemon=True)
+        for thread in parsers + [converter]:
+            thread.start()
+
+        logger.info("🏭 Pipeline started: %s parser threads, queue size %s", self.parser_workers, self.snapshot_queue.maxsize)
+        started = time.time()
+        status = 'running'
+
+        try:
+            while current_page <= max_pages:
+                if self.error is not None:
+                    status = 'error'
+                    break
+                if self.caught_up.is_set():
+                    status = 'complete'
+                    break
+
+                logger.debug("📄 Capturing page %s...", current_page)
+
+                page_num = page_from_url(self.scraper.driver.current_url) or current_page
+
+                capture_start = time.time()
+                snapshot = capture_page_snapshot(self.scraper.driver, current_page, self.state_extractor)
+                if current_page < max_pages:
+                    snapshot.next_url = self.scraper.get_next_page_url()
+                if self.archive is not None:
+                    # The page source has to be read before the browser moves on
+                    self.archive.add_snapshot(snapshot, snapshot.html or self.scraper.driver.page_source)
+                self.stats['capture_seconds'] += time.time() - capture_start
+                self.stats['pages_captured'] += 1
+                get_metrics().record_round_trips(self.scraper.driver)
+
+                # Blocks when the parsers fall behind
+                self.snapshot_queue.put(snapshot)
+
+                if current_page >= max_pages:
+                    logger.info("✅ Reached maximum pages (%s)", max_pages)
+                    status = 'complete'
+                    break
+
+                if not snapshot.next_url:
+                    logger.error("❌ Could not navigate to next page - stopping")
+                    status = 'stopped'
+                    break
+
+                # Parsing of the captured page happens while this page loads
+                if not self.scraper.click_next_page(snapshot.next_url):
+                    logger.error("❌ Could not navigate to next page - stopping")
+                    status = 'stopped'
+                    break
+
+                new_page_num = page_from_url(self.scraper.driver.current_url)
+                if not new_page_num or new_page_num <= page_num:
+                    logger.warning("⚠️ Page number didn't change as expected: %s → %s", page_num, new_page_num)
+                    status = 'complete' if self.scraper.reached_last_site_page(page_num) else 'stopped'
+                    break
+
+                current_page += 1
+            else:
+                status = 'complete'
+
+        except KeyboardInterrupt:
+            logger.warning("⚠️ Scraping interrupted by user - finishing captured pages")
+            status = 'interrupted'
+        except Exception as e:
+            logger.error("❌ Pagination error: %s", e)
+            status = 'error'
+        finally:
+            for _ in parsers:
+                self.snapshot_queue.put(_DONE)
+            for thread in parsers:
+                thread.join()
+            self.result_queue.put(_DONE)
+            converter.join()
+
+        if self.error is not None:
+            status = 'error'
+        self.state['status'] = status
+        self._save_checkpoint()
+        self._print_stats(time.time() - started)
+        if self.error is not None:
+            raise self.error
+        return self.state
+
+    # ----- parser stage -----
+
+    def _parse_worker(self):
+        extractor = AdvancedPropertyExtractor(driver=None)
+        html_parser = HtmlPropertyParser(state_extractor=self.state_extractor)
+
+        while True:
+            snapshot = self.snapshot_queue.get()
+            if snapshot is _DONE:
+                break
+
+            start = time.time()
+            try:
+                properties = parse_page_snapshot(snapshot, extractor, html_parser)
+            except Exception as e:
+                logger.warning("⚠️ Parsing page %s failed: %s", snapshot.page_number, e)
+                properties = []
+
+            elapsed = time.time() - start
+            get_metrics().observe('parse.page', elapsed)
+            with self._lock:
+                self.stats['parse_seconds'] += elapsed
+                self.stats['pages_parsed'] += 1
+                self.stats['records_parsed'] += len(properties)
+
+            # Every page goes through, even empty ones, so the converter never waits on a gap
+            self.result_queue.put((snapshot, properties))
+
+    # ----- converter stage -----
+
+    def _convert_worker(self):
+        pending = {}
+        next_page = self.first_page
+
+        while True:
+            item = self.result_queue.get()
+            if item is _DONE:
+                break
+            snapshot, properties = item
+            pending[snapshot.page_number] = (snapshot, properties)
+
+            # Write pages strictly in crawl order so checkpoint offsets stay valid
+            while next_page in pending:
+                self._complete_page_safely(*pending.pop(next_page))
+                next_page += 1
+
+        for page_number in sorted(pending):
+            self._complete_page_safely(*pending[page_number])
+
+    def _complete_page_safely(self, snapshot: PageSnapshot, properties: List[Dict[str, Any]]):
+        """Complete a page unless an earlier one failed; a failure is kept for run() instead of killing the thread
+
+        The converter keeps draining the result queue after a failure so the
+        parsers and the browser never block on a full queue.
+        """
+        if self.error is not None:
+            return
+        try:
+            self._complete_page(snapshot, properties)
+        except Exception as e:
+            logger.error("❌ Writing page %s failed: %s", snapshot.page_number, e)
+            self.error = e
+
+    def _complete_page(self, snapshot: PageSnapshot, properties: List[Dict[str, Any]]):
+        start = time.time()
+        metrics = get_metrics()
+
+        new_properties, dedup_counts = self.scraper.filter_new_properties(properties, self.dedup_index)
+
+        pure_records = []
+        with metrics.timer('convert.page'):
+            for prop in new_properties:
+                pure_prop = PureDataSchema.create_property_record(prop)
+                if pure_prop:
+                    pure_records.append(pure_prop)
+                else:
+                    self.stats['records_skipped'] += 1
+
+        pages_completed = self.state['pages_completed'] + 1
+        fsync = self.checkpoint is not None and self.checkpoint.should_save(pages_completed)
+
+        with metrics.timer('write.page'):
+            if self.sink is not None:
+                self.sink.write_page(new_properties)
+                self.sink.flush(fsync=fsync)
+                self.state['output_offset'] = self.sink.tell()
+            if self.pure_sink is not None:
+                self.pure_sink.write_page(pure_records)
+                self.pure_sink.flush(fsync=fsync)
+                self.state['pure_output_offset'] = self.pure_sink.tell()
+            if self.columnar_writer is not None:
+                self.columnar_writer.write_batch(pure_records)
+
+        self.stats['records_converted'] += len(pure_records)
+        self.stats['convert_seconds'] += time.time() - start
+
+        self.state.update({
+            'last_completed_page': snapshot.page_number,
+            'last_page_url': snapshot.url,
+            'next_page': snapshot.page_number + 1,
+            'next_url': snapshot.next_url,
+            'pages_completed': pages_completed,
+            'records_written': self.state['records_written'] + len(new_properties),
+            'pure_records_written': self.state['pure_records_written'] + len(pure_records),
+        })
+
+        logger.info("✅ Page %s: %s properties, %s pure records", snapshot.page_number, len(new_properties), len(pure_records))
+        metrics.page_done(len(new_properties))
+
+        # Pages the browser captured ahead of this one are still written; no new ones are fetched
+        if not self.caught_up.is_set() and self.scraper.caught_up(dedup_counts, self.state):
+            self.caught_up.set()
+
+        if fsync and snapshot.next_url:
+            self._save_checkpoint()
+
+    def _save_checkpoint(self):
+        self.scraper._save_checkpoint(self.checkpoint, self.state, self.dedup_index)
+
+    def _print_stats(self, elapsed: float):
+        stats = self.stats
+        logger.info("🏭 PIPELINE SUMMARY")
+        logger.info("   📄 Pages captured/parsed: %s/%s", stats['pages_captured'], stats['pages_parsed'])
+        logger.info("   🏠 Records parsed: %s → converted: %s", stats['records_parsed'], stats['records_converted'])
+        logger.info("   ⏱️ Wall time: %.1fs (capture %.1fs, parse %.1fs, convert %.1fs overlapped)",
+                    elapsed, stats['capture_seconds'], stats['parse_seconds'], stats['convert_seconds'])
+
+
+def parse_page_snapshot(snapshot: PageSnapshot, extractor: AdvancedPropertyExtractor,
+                        html_parser: Optional[HtmlPropertyParser] = None) -> List[Dict[str, Any]]:
+    """Turn a captured page into technical records without touching the browser"""
+    if snapshot.state_records:
+        return snapshot.state_records
+    if snapshot.state_listings:
+        return (html_parser or HtmlPropertyParser()).state_extractor.records(snapshot.state_listings)
+    if snapshot.cards:
+        return extractor.extract_properties_from_snapshots(snapshot.cards, extraction_method="advanced_element")
+    if snapshot.page_text:
+        return extractor.extract_properties_from_text(snapshot.page_text)
+    if snapshot.html:
+        return (html_parser or HtmlPropertyParser()).parse(snapshot.html, snapshot.url or None)
+    return []
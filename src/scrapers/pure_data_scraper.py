@@ -4,17 +4,39 @@
 Raw data collection without any market analysis or segmentation
 """
 
+import logging
 import sys
 import os
 import json
 import time
 from datetime import datetime
+from typing import Optional
 
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from scrapers.main_scraper import SmartPropertyScraper
+from scrapers.pipeline import ScrapePipeline
 from schemas.pure_data_schema import PureDataSchema
+from schemas.batch_converter import BatchConverter, DEFAULT_BATCH_SIZE, print_conversion_stats
+from storage.jsonl_sink import JsonlSink, iter_records, read_sample
+from storage.checkpoint import CheckpointManager, truncate_output
+from storage.listing_store import ListingStore
+from storage.dedup_index import DedupIndex
+from storage.snapshot_archive import SnapshotArchive
+from scrapers.incremental import KnownPageStop, newest_first_url
+from scrapers.page_planner import ALL_DISTRICTS_URL, page_from_url, planner_for
+from scrapers.crawl_planner import CrawlPlanner
+from scrapers.worker_pool import (
+    WorkerPool, DEFAULT_CHUNK_SIZE, DEFAULT_PAGE_RETRIES, driver_factories_from_config, split_page_ranges
+)
+from storage.columnar_export import ColumnarWriter, columnar_available, columnar_path, export_jsonl
+from utils.config_loader import load_config, get_setting
+from utils.logging_setup import setup_logging
+from utils.metrics import counting_driver, get_metrics, reset_metrics
+from extractors.selector_cache import SelectorCache, get_selector_cache, set_selector_cache
+
+logger = logging.getLogger(__name__)
 
 class PureDataScraper:
     """Pure data collection scraper - no analysis, just clean categorized data"""
@@ -24,68 +46,427 @@ class PureDataScraper:
         self.start_time = None
         self.total_properties = 0
         self.successful_conversions = 0
+        self.config = load_config()
+        # Checkpoints, output files, indexes, metrics and caches all live in the scraper's data dir
+        self.data_dir = self.scraper.data_dir
+        self.fsync_interval = get_setting(self.config, 'output.fsync_interval', 1)
+        self.checkpoint = CheckpointManager(
+            os.path.join(self.data_dir, 'checkpoint.json'),
+            checkpoint_interval=get_setting(self.config, 'output.checkpoint_interval', 50),
+            backup_interval=get_setting(self.config, 'output.backup_interval', 100)
+        )
+        self.use_pipeline = get_setting(self.config, 'pipeline.enabled', True)
+        self.parser_workers = get_setting(self.config, 'pipeline.parser_workers', 2)
+        self.queue_size = get_setting(self.config, 'pipeline.queue_size', 4)
+        self.columnar_format = get_setting(self.config, 'output.columnar_format')
+        self.row_group_size = get_setting(self.config, 'output.row_group_size', 5000)
+        self.columnar_file = None
+        # Crawl plan shards the last sharded collection cut at max_pages_per_shard
+        self.truncated_shards = []
+        # (search URL, page) the last worker pool run gave up on after its retries
+        self.failed_pages = []
+        index_name = get_setting(self.config, 'dedup.index_file', 'dedup_index.bin')
+        self.dedup_index_path = os.path.join(self.data_dir, index_name) if index_name else None
+        self.incremental = get_setting(self.config, 'incremental.enabled', False)
+        self.known_pages_to_stop = get_setting(self.config, 'incremental.known_pages_to_stop', 3)
+        self.sort_params = get_setting(self.config, 'incremental.sort_params')
+        store_name = get_setting(self.config, 'output.listing_store', 'listings.db')
+        self.listing_store_path = os.path.join(self.data_dir, store_name) if store_name else None
+        self.write_metrics_json = get_setting(self.config, 'metrics.write_json', True)
+        self.status_line = get_setting(self.config, 'metrics.status_line', True)
+        self.metrics = get_metrics()
+        self.selector_cache = get_selector_cache()
         
-    def start_pure_data_collection(self, max_pages: int = 100, start_page: int = 1):
-        """Start pure data collection without any analysis"""
-
-        print("📊 PURE DATA COLLECTION")
-        print("=" * 60)
-        print("🚫 NO market analysis or segmentation")
-        print("📋 Raw data collection with simple categorization only")
-        print(f"📄 Target: {max_pages} pages (~{max_pages * 20} properties)")
-        print(f"🔢 Starting from page: {start_page}")
-
-        self.start_time = datetime.now()
+    def start_pure_data_collection(self, max_pages: int = 100, start_page: int = 1, resume: bool = True,
+                                   incremental: Optional[bool] = None):
+        """Start pure data collection without any analysis
+
+        If an earlier run left a checkpoint behind it is picked up automatically:
+        the technical output is cut back to the checkpointed offset and scraping
+        continues from the saved next page URL.
+
+        In incremental mode (config "incremental.enabled" unless overridden) the
+        search is sorted newest first and the crawl stops once
+        incremental.known_pages_to_stop consecutive pages hold only listings
+        already in the dedup index from earlier runs.
+        """
+        if incremental is None:
+            incremental = self.incremental
+
+        logger.info("📊 PURE DATA COLLECTION")
+        logger.info("=" * 60)
+        logger.info("🚫 NO market analysis or segmentation")
+        logger.info("📋 Raw data collection with simple categorization only")
+        logger.info("📄 Target: %s pages (~%s properties)", max_pages, max_pages * 20)
+        logger.info("🔢 Starting from page: %s", start_page)
+        if incremental:
+            logger.info("🆕 Incremental: newest first, stop after %s fully known pages", self.known_pages_to_stop)
+
+        self._start_run()
 
         # Fix SSL certificate issues
         self._fix_ssl_certificates()
 
         try:
             # Start scraping with main scraper
-            print(f"\n🚀 Starting data collection...")
+            logger.info("🚀 Starting data collection...")
+
+            resume_state = self._load_resume_state(max_pages) if resume else None
+            if resume_state and resume_state.get('next_page', 1) > max_pages:
+                return self._finish_checkpointed_crawl(resume_state)
 
             # Try to connect to existing Chrome session first
             if not self._connect_to_existing_chrome():
-                print("❌ Failed to connect to existing Chrome session")
+                logger.error("❌ Failed to connect to existing Chrome session")
                 return False
 
-            # Start multi-page scraping directly (skip navigation since Chrome is already on PropertyGuru)
-            properties = self.scraper.scrape_multiple_pages(max_pages=max_pages, start_page=start_page)
+            if resume_state and not self._navigate_to_resume_point(resume_state):
+                resume_state = None
 
-            if not properties:
-                print("❌ No properties extracted")
+            # Start multi-page scraping directly (skip navigation since Chrome is already on PropertyGuru)
+            # Each page is streamed to disk so a crash keeps everything extracted so far
+            self.scraper.dedup_index = DedupIndex(self.dedup_index_path)
+            self.scraper.stop_condition = KnownPageStop(self.known_pages_to_stop) if incremental else None
+            if incremental and not resume_state and not self._sort_newest_first():
                 return False
-
-            # Save the technical data first
-            filename = self.scraper.save_properties(properties)
-            print(f"📂 Technical data saved to: {filename}")
-
-            success = True
-
-            if not success:
-                print("❌ Data collection failed")
+            if not resume_state and start_page > 1 and not self._go_to_start_page(start_page):
                 return False
 
-            # Convert to pure data format using the saved file
-            pure_data_file = self._convert_to_pure_data(filename)
-
-            if pure_data_file:
-                self._show_collection_summary(pure_data_file)
-                return True
+            output_file = resume_state.get('output_file') if resume_state else None
+            pure_data_file = None
+            with self.scraper.open_extraction_sink(output_file) as sink:
+                if self.use_pipeline:
+                    pure_data_file = self._run_pipeline(sink, max_pages, start_page, resume_state)
+                else:
+                    self.scraper.scrape_multiple_pages(
+                        max_pages=max_pages, start_page=start_page, sink=sink,
+                        checkpoint=self.checkpoint, resume_state=resume_state
+                    )
+
+            crawl_state = self.scraper.crawl_state
+            self._save_dedup_index(crawl_state)
+            if crawl_state.get('status') == 'complete':
+                self.checkpoint.clear()
             else:
-                print("❌ Pure data conversion failed")
+                logger.info("🔖 Crawl %s - run again to resume from page %s", crawl_state.get('status'), crawl_state.get('next_page'))
+
+            if not crawl_state.get('records_written'):
+                logger.error("❌ No properties extracted")
                 return False
 
+            return self._finish_output(sink.path, pure_data_file)
+
         except KeyboardInterrupt:
-            print("\n⏹️ Data collection interrupted by user")
+            logger.info("⏹️ Data collection interrupted by user")
             return False
         except Exception as e:
-            print(f"\n❌ Error during data collection: {e}")
+            logger.error("❌ Error during data collection: %s", e)
             return False
         finally:
             # Close browser connection
             if hasattr(self.scraper, 'close'):
                 self.scraper.close()
+            self._end_run()
+
+    def _save_dedup_index(self, crawl_state) -> bool:
+        """Remember this run's listings for later crawls, once the crawl is complete
+
+        An unfinished crawl keeps its fingerprints in the checkpoint only: saving
+        them here would mark pages written after the last checkpoint as known
+        when the resumed crawl fetches them again.
+        """
+        dedup_stats = self.scraper.dedup_index.stats
+        logger.info("🧬 Dedup: %s new, %s known, %s duplicate listings",
+                    dedup_stats['new'], dedup_stats['known'], dedup_stats['duplicate'])
+        if not self.dedup_index_path or crawl_state.get('status') != 'complete':
+            return False
+        return self.scraper.dedup_index.save()
+
+    def start_pool_collection(self, search_url: str, max_pages: int = 100, start_page: int = 1,
+                              workers: Optional[int] = None, driver_factories=None):
+        """Collect pages start_page..max_pages of a search with several browsers at once
+
+        Each worker drives its own Chrome (config "workers": debug ports from
+        base_port, or separate profiles); the page range is cut into chunks of
+        workers.chunk_size pages that idle workers pick up. All workers share
+        the rate limit, the dedup index and the output file. Pool runs are not
+        checkpointed - rerunning skips nothing, but the dedup index keeps the
+        output free of repeats.
+        """
+        logger.info("👥 PURE DATA COLLECTION - WORKER POOL")
+        logger.info("=" * 60)
+        self._start_run()
+        self._fix_ssl_certificates()
+
+        ranges = split_page_ranges(search_url, start_page, max_pages,
+                                   get_setting(self.config, 'workers.chunk_size', DEFAULT_CHUNK_SIZE))
+        try:
+            return self._run_pool(ranges, workers, driver_factories)
+        finally:
+            self._end_run()
+
+    def start_sharded_collection(self, workers: Optional[int] = None, driver_factories=None):
+        """Collect every district (and property type) of the "crawl_plan" config as separate searches
+
+        Each shard's first page is read to size it from its result count, then
+        its remaining pages are queued for the worker pool. Shards finish
+        independently, and a shard whose count needs more pages than
+        crawl_plan.max_pages_per_shard is kept in truncated_shards (and counted
+        in the run metrics) so it can be split further.
+        """
+        logger.info("🗺️ PURE DATA COLLECTION - DISTRICT SHARDS")
+        logger.info("=" * 60)
+        self._start_run()
+        self._fix_ssl_certificates()
+
+        planner = CrawlPlanner(self.config)
+        shards = planner.plan()
+        self.truncated_shards = planner.truncated_shards
+        logger.info("🗺️ %s shards: %s districts x %s property types", len(shards), len(planner.districts), len(planner.property_types))
+        ranges = planner.initial_ranges(shards)
+        try:
+            if not self._run_pool(ranges, workers, driver_factories, on_result_count=planner.expand):
+                return False
+        finally:
+            self._end_run()
+
+        counted = [shard for shard in shards if shard.result_count is not None]
+        logger.info("📊 Shards sized from result counts: %s/%s (%s properties)",
+                    len(counted), len(shards), f"{sum(shard.result_count for shard in counted):,}")
+        for shard in self.truncated_shards:
+            logger.warning("⚠️ %s was cut at %s of %s pages - split it further in crawl_plan.property_types",
+                           shard.label, shard.estimated_pages, shard.needed_pages)
+        return True
+
+    def _run_pool(self, ranges, workers: Optional[int] = None, driver_factories=None,
+                  on_result_count=None) -> bool:
+        """Run the worker pool over the ranges and finish the output file"""
+        if driver_factories is None:
+            driver_factories = driver_factories_from_config(self.config, workers)
+
+        dedup_index = DedupIndex(self.dedup_index_path)
+        archive = SnapshotArchive.from_config(self.config, self.data_dir)
+        try:
+            with self.scraper.open_extraction_sink() as sink:
+                pool = WorkerPool(driver_factories, sink=sink, scheduler=self.scraper.scheduler,
+                                  dedup_index=dedup_index, on_result_count=on_result_count, archive=archive,
+                                  page_retries=get_setting(self.config, 'workers.page_retries', DEFAULT_PAGE_RETRIES))
+                stats = pool.run(ranges)
+                self.failed_pages = pool.failed_pages
+        except KeyboardInterrupt:
+            logger.info("⏹️ Data collection interrupted by user")
+            return False
+        finally:
+            if archive is not None:
+                archive.close()
+                archive.print_stats()
+
+        if self.dedup_index_path:
+            dedup_index.save()
+        if not stats['records_written']:
+            logger.error("❌ No properties extracted")
+            return False
+        return self._finish_output(sink.path)
+
+    def _start_run(self):
+        """Reset the clock and the run metrics, and load the selector cache, at the start of a collection"""
+        self.start_time = datetime.now()
+        self.metrics = reset_metrics(status_line=self.status_line)
+        self.selector_cache = set_selector_cache(SelectorCache.from_config(self.config, self.data_dir))
+
+    def _end_run(self):
+        """Keep the selector hit rates for the next run and report the run's metrics"""
+        if self.selector_cache.save():
+            self.selector_cache.print_stats()
+        self._write_metrics()
+
+    def _write_metrics(self) -> Optional[str]:
+        """Print the stage timings and save the run's metrics JSON in the data directory"""
+        if not self.metrics.counters and not self.metrics.histograms:
+            # Nothing was fetched (e.g. the browser never connected)
+            return None
+        self.metrics.print_summary()
+        if not self.write_metrics_json:
+            return None
+        path = os.path.join(self.data_dir, f"metrics_{self.start_time.strftime('%Y%m%d_%H%M%S')}.json")
+        try:
+            self.metrics.write_json(path)
+        except OSError as e:
+            logger.warning("⚠️ Could not save run metrics: %s", e)
+            return None
+        logger.info("📈 Run metrics saved to: %s", path)
+        return path
+
+    def _finish_output(self, filename: str, pure_data_file: Optional[str] = None) -> bool:
+        """Convert, export and store a finished technical data file"""
+        logger.info("📂 Technical data saved to: %s", filename)
+
+        # Convert to pure data format using the saved file (the pipeline already did it page by page)
+        if not pure_data_file:
+            pure_data_file = self._convert_to_pure_data(filename)
+
+        if pure_data_file and self.columnar_format and not self.columnar_file:
+            self._export_columnar(pure_data_file)
+
+        if pure_data_file:
+            self._update_listing_store(filename, pure_data_file)
+
+        if pure_data_file:
+            self._show_collection_summary(pure_data_file)
+            return True
+        else:
+            logger.error("❌ Pure data conversion failed")
+            return False
+
+    def _run_pipeline(self, sink, max_pages: int, start_page: int, resume_state):
+        """Crawl with the staged pipeline; returns the pure data file it wrote"""
+        if not resume_state:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            pure_file = os.path.join(self.data_dir, f"pure_data_{timestamp}.jsonl")
+        else:
+            # A checkpoint from a sequential run has no pure output; convert the whole file afterwards
+            pure_file = resume_state.get('pure_output_file')
+
+        pure_sink = JsonlSink(pure_file, fsync_interval=self.fsync_interval) if pure_file else None
+
+        # Columnar files cannot be appended to, so only a fresh crawl streams row groups directly
+        columnar_writer = None
+        if pure_sink is not None and not resume_state and self.columnar_format and columnar_available():
+            columnar_writer = ColumnarWriter(columnar_path(pure_file, self.columnar_format),
+                                             file_format=self.columnar_format, row_group_size=self.row_group_size)
+
+        archive = SnapshotArchive.from_config(self.config, self.data_dir)
+        try:
+            pipeline = ScrapePipeline(self.scraper, sink=sink, pure_sink=pure_sink, checkpoint=self.checkpoint,
+                                      parser_workers=self.parser_workers, queue_size=self.queue_size,
+                                      columnar_writer=columnar_writer, archive=archive)
+            self.scraper.crawl_state = pipeline.run(max_pages, start_page, resume_state)
+        finally:
+            if archive is not None:
+                archive.close()
+                archive.print_stats()
+            if pure_sink is not None:
+                pure_sink.close()
+            if columnar_writer is not None:
+                columnar_writer.close()
+                self.columnar_file = columnar_writer.path
+
+        if pure_sink is None:
+            return None
+
+        self.total_properties = self.scraper.crawl_state.get('pure_records_written', 0)
+        self.successful_conversions = self.total_properties
+        logger.info("💾 Pure data saved to: %s", pure_file)
+        return pure_file
+
+    def _update_listing_store(self, extraction_file: str, pure_data_file: str):
+        """Upsert the run's pure data into the persistent listing store"""
+        if not self.listing_store_path:
+            return
+        try:
+            with ListingStore(self.listing_store_path) as store:
+                run_id = store.start_run(extraction_file, started_at=self.start_time)
+                upserted = store.ingest_file(pure_data_file)
+                store.finish_run(run_id, extraction_file, pure_data_file, upserted)
+                logger.info("🗄️ Listing store updated: %s upserted, %s listings total", upserted, store.count())
+        except Exception as e:
+            logger.warning("⚠️ Could not update listing store: %s", e)
+
+    def _export_columnar(self, pure_data_file: str):
+        """Write the pure data JSONL out again as Parquet/Arrow"""
+        if not columnar_available():
+            logger.warning("⚠️ Columnar export skipped - install pyarrow to enable it")
+            return None
+        try:
+            output_file = columnar_path(pure_data_file, self.columnar_format)
+            export_jsonl(pure_data_file, output_file, row_group_size=self.row_group_size)
+            self.columnar_file = output_file
+            return output_file
+        except Exception as e:
+            logger.error("❌ Columnar export failed: %s", e)
+            return None
+
+    def _load_resume_state(self, max_pages: int):
+        """Return a usable checkpoint from an earlier run, or None to start fresh"""
+        state = self.checkpoint.load()
+        if not state:
+            return None
+
+        output_file = state.get('output_file')
+        if not output_file or not os.path.exists(output_file):
+            logger.warning("⚠️ Checkpoint output file is missing - starting fresh")
+            self.checkpoint.clear()
+            return None
+
+        # Drop records from pages after the checkpoint; they are scraped again
+        truncate_output(output_file, state.get('output_offset', 0))
+        if state.get('pure_output_file'):
+            truncate_output(state['pure_output_file'], state.get('pure_output_offset', 0))
+
+        logger.info("🔖 Found checkpoint from %s", state.get('updated_at'))
+        logger.info("   Last completed page: %s", state.get('last_completed_page'))
+        logger.info("   Records so far: %s", state.get('records_written', 0))
+        logger.info("   Output file: %s", output_file)
+        return state
+
+    def _finish_checkpointed_crawl(self, state) -> bool:
+        """Finish the output of a checkpointed crawl that already reached max_pages, without fetching"""
+        logger.info("✅ Checkpointed crawl already covers the requested pages - finishing its output")
+        if self.dedup_index_path:
+            dedup_index = DedupIndex(self.dedup_index_path)
+            dedup_index.restore_run(state.get('seen_fingerprints') or [])
+            dedup_index.save()
+
+        pure_data_file = state.get('pure_output_file')
+        if pure_data_file and not os.path.exists(pure_data_file):
+            pure_data_file = None
+        if not self._finish_output(state['output_file'], pure_data_file):
+            return False
+        self.checkpoint.clear()
+        return True
+
+    def _sort_newest_first(self) -> bool:
+        """Reload the current search sorted by listing date, newest first"""
+        try:
+            url = newest_first_url(self.scraper.driver.current_url, self.sort_params)
+            logger.info("🆕 Sorting newest first: %s...", url[:100])
+            return self.scraper.open_page(url, page_from_url(url))
+        except Exception as e:
+            logger.error("❌ Could not sort results newest first: %s", e)
+            return False
+
+    def _go_to_start_page(self, start_page: int) -> bool:
+        """Jump straight to the first page to collect"""
+        if page_from_url(self.scraper.driver.current_url) == start_page:
+            return True
+        if self.scraper.go_to_page(start_page):
+            return True
+        logger.error("❌ Could not open start page %s", start_page)
+        return False
+
+    def _navigate_to_resume_point(self, state) -> bool:
+        """Open the page after the last checkpointed one"""
+        try:
+            if state.get('next_url'):
+                logger.info("🔗 Resuming at: %s...", state['next_url'][:100])
+                return self.scraper.click_next_page(state['next_url'])
+
+            planner = planner_for(state.get('last_page_url'))
+            if planner and state.get('next_page'):
+                logger.info("🧭 Resuming at page %s", state['next_page'])
+                return self.scraper.click_next_page(planner.url_for(state['next_page']))
+
+            if state.get('last_page_url'):
+                self.scraper.open_page(state['last_page_url'])
+                return self.scraper.click_next_page()
+
+        except Exception as e:
+            logger.error("❌ Could not navigate to resume point: %s", e)
+            return False
+
+        logger.warning("⚠️ Checkpoint has no resume URL - starting fresh")
+        self.checkpoint.clear()
+        return False
 
     def _fix_ssl_certificates(self):
         """Fix SSL certificate issues on macOS"""
@@ -93,7 +474,7 @@ class PureDataScraper:
         import ssl
         import certifi
 
-        print("🔒 Fixing SSL certificate issues...")
+        logger.info("🔒 Fixing SSL certificate issues...")
 
         # Tell Python to use certifi's certificates
         os.environ['SSL_CERT_FILE'] = certifi.where()
@@ -101,7 +482,7 @@ class PureDataScraper:
         # Create default SSL context with certificate verification disabled
         ssl._create_default_https_context = ssl._create_unverified_context
 
-        print("✅ SSL certificate verification disabled")
+        logger.info("✅ SSL certificate verification disabled")
 
     def _connect_to_existing_chrome(self):
         """Connect to existing Chrome session or start new undetected Chrome"""
@@ -114,73 +495,79 @@ class PureDataScraper:
             try:
                 chrome_options = Options()
                 chrome_options.add_experimental_option("debuggerAddress", "127.0.0.1:9222")
-                self.scraper.driver = webdriver.Chrome(options=chrome_options)
+                self.scraper.driver = counting_driver(webdriver.Chrome(options=chrome_options),
+                                                      self.scraper.count_round_trips)
                 self.scraper.wait = WebDriverWait(self.scraper.driver, 20)
 
-                print("✅ Connected to existing Chrome session")
-                print(f"   Current URL: {self.scraper.driver.current_url}")
+                logger.info("✅ Connected to existing Chrome session")
+                logger.info("   Current URL: %s", self.scraper.driver.current_url)
 
                 # Check if we're on PropertyGuru
                 if "propertyguru.com.sg" in self.scraper.driver.current_url:
-                    print("✅ Already on PropertyGuru - ready to scrape!")
+                    logger.info("✅ Already on PropertyGuru - ready to scrape!")
                     return True
                 else:
-                    print("⚠️ Not on PropertyGuru - navigating now...")
+                    logger.warning("⚠️ Not on PropertyGuru - navigating now...")
                     return self._navigate_to_propertyguru()
 
             except Exception as e:
-                print(f"⚠️ Existing Chrome connection failed: {e}")
-                print("🛡️ Starting new undetected Chrome session...")
+                logger.warning("⚠️ Existing Chrome connection failed: %s", e)
+                logger.info("🛡️ Starting new undetected Chrome session...")
 
                 # Fallback to undetected Chrome
                 import undetected_chromedriver as uc
                 import time
 
-                self.scraper.driver = uc.Chrome(
+                self.scraper.driver = counting_driver(uc.Chrome(
                     headless=False,
                     use_subprocess=False,
                     version_main=None
-                )
+                ), self.scraper.count_round_trips)
                 self.scraper.wait = WebDriverWait(self.scraper.driver, 20)
 
-                print("✅ Started new undetected Chrome session")
+                logger.info("✅ Started new undetected Chrome session")
                 return self._navigate_to_propertyguru()
 
         except Exception as e:
-            print(f"❌ Failed to connect to Chrome: {e}")
+            logger.error("❌ Failed to connect to Chrome: %s", e)
             return False
 
     def _navigate_to_propertyguru(self):
         """Navigate to PropertyGuru with comprehensive district coverage"""
         try:
-            import time
+            url = ALL_DISTRICTS_URL
 
-            url = "https://www.propertyguru.com.sg/property-for-sale?freetext=D01+Boat+Quay+%2F+Raffles+Place+%2F+Marina%2C+D02+Chinatown+%2F+Tanjong+Pagar%2C+D03+Alexandra+%2F+Commonwealth%2C+D04+Harbourfront+%2F+Telok+Blangah%2C+D05+Buona+Vista+%2F+West+Coast+%2F+Clementi+New+Town%2C+D06+City+Hall+%2F+Clarke+Quay%2C+D07+Beach+Road+%2F+Bugis+%2F+Rochor%2C+D08+Farrer+Park+%2F+Serangoon+Rd%2C+D09+Orchard+%2F+River+Valley%2C+D10+Tanglin+%2F+Holland+%2F+Bukit+Timah%2C+D11+Newton+%2F+Novena%2C+D21+Clementi+Park+%2F+Upper+Bukit+Timah%2C+D12+Balestier+%2F+Toa+Payoh%2C+D13+Macpherson+%2F+Potong+Pasir%2C+D14+Eunos+%2F+Geylang+%2F+Paya+Lebar%2C+D15+East+Coast+%2F+Marine+Parade%2C+D16+Bedok+%2F+Upper+East+Coast%2C+D17+Changi+Airport+%2F+Changi+Village%2C+D18+Pasir+Ris+%2F+Tampines%2C+D19+Hougang+%2F+Punggol+%2F+Sengkang%2C+D20+Ang+Mo+Kio+%2F+Bishan+%2F+Thomson%2C+D22+Boon+Lay+%2F+Jurong+%2F+Tuas%2C+D23+Dairy+Farm+%2F+Bukit+Panjang+%2F+Choa+Chu+Kang%2C+D24+Lim+Chu+Kang+%2F+Tengah%2C+D25+Admiralty+%2F+Woodlands%2C+D26+Mandai+%2F+Upper+Thomson%2C+D27+Sembawang+%2F+Yishun%2C+D28+Seletar+%2F+Yio+Chu+Kang&districtCode=D01&districtCode=D02&districtCode=D03&districtCode=D04&districtCode=D05&districtCode=D06&districtCode=D07&districtCode=D08&districtCode=D09&districtCode=D10&districtCode=D11&districtCode=D21&districtCode=D12&districtCode=D13&districtCode=D14&districtCode=D15&districtCode=D16&districtCode=D17&districtCode=D18&districtCode=D19&districtCode=D20&districtCode=D22&districtCode=D23&districtCode=D24&districtCode=D25&districtCode=D26&districtCode=D27&districtCode=D28&isCommercial=false"
+            logger.info("🌐 Navigating to PropertyGuru (All Singapore Districts D01-D28)")
+            self.scraper.open_page(url)
 
-            print("🌐 Navigating to PropertyGuru (All Singapore Districts D01-D28)")
-            self.scraper.driver.get(url)
-
-            # Wait for page load
-            time.sleep(5)
-
-            print("✅ Successfully navigated to PropertyGuru")
+            logger.info("✅ Successfully navigated to PropertyGuru")
             return True
 
         except Exception as e:
-            print(f"❌ Navigation failed: {e}")
+            logger.error("❌ Navigation failed: %s", e)
             return False
     
     def _get_latest_extraction_file(self):
         """Get the most recent extraction file"""
         
-        data_dir = "data"
+        # The listing store records every finished run
+        if self.listing_store_path and os.path.exists(self.listing_store_path):
+            try:
+                with ListingStore(self.listing_store_path) as store:
+                    run = store.latest_run()
+                if run and run.get('extraction_file') and os.path.exists(run['extraction_file']):
+                    return run['extraction_file']
+            except Exception as e:
+                logger.warning("⚠️ Could not read listing store: %s", e)
+        
+        data_dir = self.data_dir
         if not os.path.exists(data_dir):
             return None
         
         # Look for extraction files
         extraction_files = []
         for file in os.listdir(data_dir):
-            if file.startswith("extraction_") and file.endswith(".json"):
+            if file.startswith("extraction_") and file.endswith((".json", ".jsonl")):
                 file_path = os.path.join(data_dir, file)
                 extraction_files.append((file_path, os.path.getmtime(file_path)))
         
@@ -194,54 +581,31 @@ class PureDataScraper:
     def _convert_to_pure_data(self, extraction_file: str):
         """Convert technical extraction to pure data format"""
         
-        print(f"\n📊 CONVERTING TO PURE DATA FORMAT")
-        print("=" * 50)
+        logger.info("📊 CONVERTING TO PURE DATA FORMAT")
+        logger.info("=" * 50)
         
         try:
-            # Load technical data
-            with open(extraction_file, 'r', encoding='utf-8') as f:
-                technical_data = json.load(f)
-            
-            print(f"📂 Processing {len(technical_data)} properties...")
-            
-            # Convert each property
-            pure_properties = []
-            skipped = 0
-            
-            for i, tech_prop in enumerate(technical_data):
-                pure_prop = PureDataSchema.create_property_record(tech_prop)
-                
-                if pure_prop:
-                    pure_properties.append(pure_prop)
-                    self.successful_conversions += 1
-                else:
-                    skipped += 1
-                
-                if (i + 1) % 20 == 0:
-                    print(f"   📊 Processed {i + 1}/{len(technical_data)} properties...")
-            
-            self.total_properties = len(pure_properties)
-            
-            print(f"✅ Successfully converted {len(pure_properties)} properties")
-            print(f"⚠️ Skipped {skipped} properties (insufficient data)")
-            
             # Generate output filename
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"data/pure_data_{timestamp}.json"
-
-            # Ensure directory exists
-            os.makedirs("data", exist_ok=True)
+            output_file = os.path.join(self.data_dir, f"pure_data_{timestamp}.jsonl")
             
-            # Save pure data
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(pure_properties, f, indent=2, ensure_ascii=False)
+            # Shard the technical records across worker processes, output stays in input order
+            converter = BatchConverter(
+                workers=get_setting(self.config, 'conversion.workers', 0),
+                batch_size=get_setting(self.config, 'conversion.batch_size', DEFAULT_BATCH_SIZE),
+                fsync_interval=self.fsync_interval
+            )
+            stats = converter.convert_file(extraction_file, output_file)
             
-            print(f"💾 Pure data saved to: {output_file}")
+            self.successful_conversions += stats['converted']
+            self.total_properties = stats['converted']
+            
+            print_conversion_stats(stats)
             
             return output_file
             
         except Exception as e:
-            print(f"❌ Conversion failed: {e}")
+            logger.error("❌ Conversion failed: %s", e)
             return None
     
     def _show_collection_summary(self, pure_data_file: str):
@@ -250,73 +614,70 @@ class PureDataScraper:
         end_time = datetime.now()
         duration = end_time - self.start_time
         
-        print(f"\n🎉 PURE DATA COLLECTION COMPLETE!")
-        print("=" * 60)
-        print(f"⏱️ Duration: {duration}")
-        print(f"📊 Total properties: {self.total_properties}")
-        print(f"✅ Successful conversions: {self.successful_conversions}")
-        print(f"💾 Output file: {pure_data_file}")
+        logger.info("🎉 PURE DATA COLLECTION COMPLETE!")
+        logger.info("=" * 60)
+        logger.info("⏱️ Duration: %s", duration)
+        logger.info("📊 Total properties: %s", self.total_properties)
+        logger.info("✅ Successful conversions: %s", self.successful_conversions)
+        logger.info("💾 Output file: %s", pure_data_file)
+        if self.columnar_file:
+            logger.info("🧱 Columnar file: %s", self.columnar_file)
         
-        # Load and analyze the pure data
+        # Stream through the pure data once to tally categories
         try:
-            with open(pure_data_file, 'r', encoding='utf-8') as f:
-                pure_data = json.load(f)
-            
-            print(f"\n📋 DATA CATEGORIES (NO ANALYSIS):")
-            print("=" * 40)
-            
-            # Price range distribution
             price_ranges = {}
-            for prop in pure_data:
+            property_types = {}
+            mrt_categories = {}
+            for prop in iter_records(pure_data_file):
                 price_range = prop.get('price_range', 'Unknown')
                 price_ranges[price_range] = price_ranges.get(price_range, 0) + 1
+                prop_type = prop.get('property_type', 'Unknown')
+                property_types[prop_type] = property_types.get(prop_type, 0) + 1
+                mrt_cat = prop.get('mrt_distance_category', 'Unknown')
+                mrt_categories[mrt_cat] = mrt_categories.get(mrt_cat, 0) + 1
+            
+            logger.info("📋 DATA CATEGORIES (NO ANALYSIS):")
+            logger.info("=" * 40)
             
-            print("💰 Price Ranges:")
+            # Price range distribution
+            logger.info("💰 Price Ranges:")
             for price_range, count in sorted(price_ranges.items()):
-                print(f"   {price_range}: {count} properties")
+                logger.info("   %s: %s properties", price_range, count)
             
             # Property type distribution
-            property_types = {}
-            for prop in pure_data:
-                prop_type = prop.get('property_type', 'Unknown')
-                property_types[prop_type] = property_types.get(prop_type, 0) + 1
-            
-            print("\n🏠 Property Types:")
+            logger.info("🏠 Property Types:")
             for prop_type, count in sorted(property_types.items()):
-                print(f"   {prop_type}: {count} properties")
+                logger.info("   %s: %s properties", prop_type, count)
             
             # MRT distance categories
-            mrt_categories = {}
-            for prop in pure_data:
-                mrt_cat = prop.get('mrt_distance_category', 'Unknown')
-                mrt_categories[mrt_cat] = mrt_categories.get(mrt_cat, 0) + 1
             
-            print("\n🚇 MRT Distance Categories:")
+            logger.info("🚇 MRT Distance Categories:")
             for mrt_cat, count in sorted(mrt_categories.items()):
-                print(f"   {mrt_cat}: {count} properties")
+                logger.info("   %s: %s properties", mrt_cat, count)
             
             # Show sample properties
-            print(f"\n📋 SAMPLE PURE DATA:")
-            print("=" * 40)
+            logger.info("📋 SAMPLE PURE DATA:")
+            logger.info("=" * 40)
             
-            for i, prop in enumerate(pure_data[:3], 1):
-                print(f"\n{i}. {prop['property_name']}")
-                print(f"   💰 {prop['price_formatted']} ({prop.get('price_range', 'N/A')})")
-                print(f"   🏠 {prop.get('property_type', 'N/A')} • {prop['bedrooms']}BR • {prop.get('floor_area_sqft', 'N/A')} sqft")
-                print(f"   📍 {prop.get('district_code', 'N/A')} • {prop.get('mrt_station', 'N/A')} ({prop.get('mrt_distance_category', 'N/A')})")
-                print(f"   📅 {prop.get('listed_date', 'N/A')} • {prop.get('image_count', 0)} images")
+            for i, prop in enumerate(read_sample(pure_data_file, 3), 1):
+                logger.info("%s. %s", i, prop['property_name'])
+                logger.info("   💰 %s (%s)", prop['price_formatted'], prop.get('price_range', 'N/A'))
+                logger.info("   🏠 %s • %sBR • %s sqft", prop.get('property_type', 'N/A'), prop['bedrooms'], prop.get('floor_area_sqft', 'N/A'))
+                logger.info("   📍 %s • %s (%s)", prop.get('district_code', 'N/A'), prop.get('mrt_station', 'N/A'), prop.get('mrt_distance_category', 'N/A'))
+                logger.info("   📅 %s • %s images", prop.get('listed_date', 'N/A'), prop.get('image_count', 0))
                 if prop.get('property_url'):
-                    print(f"   🔗 {prop['property_url']}")
+                    logger.info("   🔗 %s", prop['property_url'])
             
-            print(f"\n🎯 PURE DATA READY FOR USE!")
-            print("📊 No market analysis or segmentation included")
-            print("📋 Raw categorized data only")
+            logger.info("🎯 PURE DATA READY FOR USE!")
+            logger.info("📊 No market analysis or segmentation included")
+            logger.info("📋 Raw categorized data only")
             
         except Exception as e:
-            print(f"⚠️ Could not analyze data: {e}")
+            logger.warning("⚠️ Could not analyze data: %s", e)
 
 def main():
     """Main execution function for pure data collection"""
+    setup_logging()
     
     print("📊 PROPERTYGURU PURE DATA COLLECTOR")
     print("=" * 60)
@@ -328,10 +689,12 @@ def main():
         print("\n⚙️ COLLECTION CONFIGURATION:")
         max_pages = int(input("📄 How many pages to collect? (default 100): ") or "100")
         start_page = int(input("🔢 Start from which page? (default 1): ") or "1")
+        incremental = input("🆕 Only collect new listings (incremental)? (y/N): ").lower() == 'y'
         
         print(f"\n🎯 Configuration:")
         print(f"   Pages to collect: {max_pages}")
         print(f"   Starting page: {start_page}")
+        print(f"   Mode: {'Incremental (newest first)' if incremental else 'Full crawl'}")
         print(f"   Expected properties: ~{max_pages * 20}")
         print(f"   Format: Pure data (no analysis)")
         
@@ -342,7 +705,7 @@ def main():
         
         # Start collection
         scraper = PureDataScraper()
-        success = scraper.start_pure_data_collection(max_pages, start_page)
+        success = scraper.start_pure_data_collection(max_pages, start_page, incremental=incremental)
         
         if success:
             print("\n🎉 Pure data collection completed successfully!")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+🚦 Request Rate Scheduler
+Per-host token buckets with a configured request budget, backing off when the
+site answers slowly or with errors and recovering once it is healthy again
+"""
+
+import logging
+import sys
+import os
+import time
+import threading
+from urllib.parse import urlsplit
+from typing import Dict, Any, Optional, Callable
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from utils.config_loader import load_config, get_setting
+
+logger = logging.getLogger(__name__)
+
+# Page titles that mean the request was refused or failed rather than served
+ERROR_TITLE_MARKERS = (
+    "just a moment", "attention required", "access denied", "too many requests",
+    "429", "500 internal", "502 bad gateway", "503 service", "504 gateway"
+)
+
+
+def title_looks_like_error(title: Optional[str]) -> bool:
+    title = (title or "").lower()
+    return any(marker in title for marker in ERROR_TITLE_MARKERS)
+
+
+class TokenBucket:
+    """Tokens refill at rate_per_minute up to capacity; each request takes one.
+
+    reserve() never blocks: it takes the token immediately (letting the balance
+    go negative) and returns how long the caller must wait before using it, so
+    concurrent callers queue up in reservation order.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float = 1, clock=time.monotonic):
+        self.clock = clock
+        self.capacity = max(1.0, float(capacity))
+        self.tokens = self.capacity
+        self.updated = clock()
+        self._apply_rate(rate_per_minute)
+
+    def set_rate(self, rate_per_minute: float):
+        """Change the refill rate; tokens accrued so far are kept"""
+        self._refill()
+        self._apply_rate(rate_per_minute)
+
+    def _apply_rate(self, rate_per_minute: float):
+        # reserve() divides by the rate, so a bucket that never refills is rejected outright
+        if not rate_per_minute > 0:
+            raise ValueError(f"Token bucket rate must be positive, got {rate_per_minute}")
+        self.rate_per_minute = float(rate_per_minute)
+        self.rate_per_second = self.rate_per_minute / 60.0
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate_per_second)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """Take a token; returns the seconds to wait before it may be used"""
+        self._refill()
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate_per_second
+
+
+class RequestScheduler:
+    """Paces every page request through a token bucket per host.
+
+    The rate starts at target_requests_per_minute and never exceeds
+    max_requests_per_minute. A failed or slow response multiplies the host's
+    rate by backoff_factor (down to min_requests_per_minute); each healthy
+    response adds recovery_per_success requests/minute back until the target
+    is reached again.
+    """
+
+    def __init__(self, max_requests_per_minute: float = 30, target_requests_per_minute: float = 20,
+                 min_requests_per_minute: float = 2, burst: int = 1, slow_response_seconds: float = 15,
+                 backoff_factor: float = 0.5, recovery_per_success: float = 1.0,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.max_rate = float(max_requests_per_minute)
+        self.target_rate = min(float(target_requests_per_minute), self.max_rate)
+        self.min_rate = min(float(min_requests_per_minute), self.target_rate)
+        if not self.min_rate > 0:
+            raise ValueError("rate_limit requests_per_minute settings must be positive, "
+                             f"got a minimum of {self.min_rate}")
+        self.burst = max(1, int(burst or 1))
+        self.slow_response_seconds = slow_response_seconds
+        self.backoff_factor = backoff_factor
+        self.recovery_per_success = recovery_per_success
+        self.clock = clock
+        self.sleep = sleep
+
+        self.buckets = {}
+        self.stats = {'requests': 0, 'failures': 0, 'slow': 0, 'backoffs': 0, 'waited_seconds': 0.0}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None, **kwargs) -> "RequestScheduler":
+        """Scheduler configured from the "rate_limit" section"""
+        if config is None:
+            config = load_config()
+        settings = get_setting(config, 'rate_limit', {}) or {}
+        return cls(
+            max_requests_per_minute=settings.get('max_requests_per_minute', 30),
+            target_requests_per_minute=settings.get('target_requests_per_minute', 20),
+            min_requests_per_minute=settings.get('min_requests_per_minute', 2),
+            burst=settings.get('burst', 1),
+            slow_response_seconds=settings.get('slow_response_seconds', 15),
+            backoff_factor=settings.get('backoff_factor', 0.5),
+            recovery_per_success=settings.get('recovery_per_success', 1.0),
+            **kwargs
+        )
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            bucket = self.buckets[host] = TokenBucket(self.target_rate, self.burst, clock=self.clock)
+        return bucket
+
+    def current_rate(self, url: str) -> float:
+        """Requests per minute currently allowed for the URL's host"""
+        with self._lock:
+            return self._bucket(self.host_of(url)).rate_per_minute
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to the URL's host is allowed; returns the seconds waited"""
+        with self._lock:
+            wait = self._bucket(self.host_of(url)).reserve()
+            self.stats['requests'] += 1
+            self.stats['waited_seconds'] += wait
+        if wait:
+            self.sleep(wait)
+        return wait
+
+    def record(self, url: str, elapsed: float, ok: bool = True):
+        """Feed back how a request went: back off on failures and slow responses, recover otherwise"""
+        slow = self.slow_response_seconds and elapsed > self.slow_response_seconds
+        host = self.host_of(url)
+        with self._lock:
+            bucket = self._bucket(host)
+            rate = bucket.rate_per_minute
+            if not ok or slow:
+                self.stats['failures' if not ok else 'slow'] += 1
+                new_rate = max(self.min_rate, rate * self.backoff_factor)
+                if new_rate < rate:
+                    self.stats['backoffs'] += 1
+                    reason = "error response" if not ok else f"slow response ({elapsed:.1f}s)"
+                    logger.info("🚦 Backing off %s: %.1f → %.1f requests/min after %s", host, rate, new_rate, reason)
+            else:
+                new_rate = min(self.target_rate, rate + self.recovery_per_success)
+            if new_rate != rate:
+                bucket.set_rate(new_rate)
+
+    def fetch(self, url: str, fetch_fn: Callable[[str], Any], is_ok: Optional[Callable[[], bool]] = None):
+        """Run fetch_fn(url) inside the rate limit and record the outcome.
+
+        is_ok is called after a successful fetch_fn to inspect the result
+        (for a browser, whether the page is an error or challenge page).
+        Exceptions from fetch_fn count as failures and are re-raised.
+        """
+        self.acquire(url)
+        start = self.clock()
+        try:
+            result = fetch_fn(url)
+        except Exception:
+            self.record(url, self.clock() - start, ok=False)
+            raise
+        elapsed = self.clock() - start
+        ok = True
+        if is_ok is not None:
+            try:
+                ok = bool(is_ok())
+            except Exception:
+                ok = False
+        self.record(url, elapsed, ok=ok)
+        return result
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+👥 Browser Worker Pool
+Several browser sessions crawl disjoint page ranges handed out by a coordinator,
+sharing one request-rate limit, one dedup index and one output sink
+"""
+
+import logging
+import sys
+import os
+import time
+import queue
+import threading
+from typing import List, Dict, Any, Optional, Callable
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from extractors.advanced_extractor import AdvancedPropertyExtractor
+from extractors.html_parser import HtmlPropertyParser
+from extractors.json_state_extractor import JsonStateExtractor
+from scrapers.fetchers import PageFetcher, SeleniumFetcher, HttpFetcher
+from scrapers.main_scraper import SmartPropertyScraper
+from scrapers.page_planner import PageUrlPlanner
+from scrapers.pipeline import parse_page_snapshot
+from scrapers.rate_scheduler import RequestScheduler
+from storage.dedup_index import DedupIndex
+from storage.snapshot_archive import SnapshotArchive
+from utils.config_loader import load_config, get_setting
+from utils.metrics import counting_driver, get_metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 10
+# Times a failed page is queued again before it is given up on
+DEFAULT_PAGE_RETRIES = 2
+
+
+class PageRange:
+    """One unit of work: pages first_page..last_page (inclusive) of a search"""
+
+    def __init__(self, search_url: str, first_page: int, last_page: int, label: str = "", shard=None,
+                 attempt: int = 0):
+        self.search_url = search_url
+        self.first_page = first_page
+        self.last_page = last_page
+        self.label = label or f"pages {first_page}-{last_page}"
+        # Set for the probe page of a crawl plan shard (see crawl_planner.py)
+        self.shard = shard
+        # How many times this range's page failed before (retries are single-page ranges)
+        self.attempt = attempt
+
+    def urls(self):
+        planner = PageUrlPlanner(self.search_url)
+        for page in range(self.first_page, self.last_page + 1):
+            yield page, planner.url_for(page)
+
+    def __repr__(self):
+        return f"PageRange({self.label})"
+
+
+def split_page_ranges(search_url: str, start_page: int, end_page: int,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE, label: str = "") -> List[PageRange]:
+    """Cut start_page..end_page into consecutive chunks; workers pull them one at a time"""
+    chunk_size = max(1, int(chunk_size or 1))
+    ranges = []
+    for first in range(start_page, end_page + 1, chunk_size):
+        last = min(end_page, first + chunk_size - 1)
+        ranges.append(PageRange(search_url, first, last, f"{label} pages {first}-{last}".strip()))
+    return ranges
+
+
+def debug_port_driver(port: int):
+    """Attach to a Chrome already running with --remote-debugging-port=<port>"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    chrome_options.add_experimental_option("debuggerAddress", f"127.0.0.1:{port}")
+    return webdriver.Chrome(options=chrome_options)
+
+
+def profile_driver(user_data_dir: str, headless: bool = False):
+    """Start an undetected Chrome with its own profile directory"""
+    import undetected_chromedriver as uc
+
+    return uc.Chrome(headless=headless, use_subprocess=False, version_main=None, user_data_dir=user_data_dir)
+
+
+def driver_factories_from_config(config: Optional[Dict[str, Any]] = None,
+                                 workers: Optional[int] = None) -> List[Callable[[], Any]]:
+    """One driver factory per worker from the "workers" section.
+
+    mode "debug_port" attaches worker i to the Chrome on base_port + i (as
+    scripts/chrome_selector.py scans 9222-9225); mode "profile" starts a Chrome
+    per worker with user_data_dir + "_<i>". With fetch.backend "http" the
+    workers get plain HTTP fetchers instead of browsers.
+    """
+    if config is None:
+        config = load_config()
+    count = max(1, int(workers or get_setting(config, 'workers.count', 1)))
+    mode = get_setting(config, 'workers.mode', 'debug_port')
+    backend = get_setting(config, 'fetch.backend', 'selenium')
+
+    factories = []
+    for i in range(count):
+        if backend == 'http':
+            factories.append(lambda: HttpFetcher.from_config(config))
+        elif mode == 'profile':
+            user_data_dir = f"{get_setting(config, 'workers.user_data_dir', 'chrome_data')}_{i}"
+            headless = get_setting(config, 'workers.headless', False)
+            factories.append(lambda d=user_data_dir, h=headless: profile_driver(d, h))
+        else:
+            port = get_setting(config, 'workers.base_port', 9222) + i
+            factories.append(lambda p=port: debug_port_driver(p))
+    return factories
+
+
+class WorkerPool:
+    """Coordinator: a queue of PageRanges drained by one thread per browser session.
+
+    Only the worker that owns a driver ever touches it. The scheduler (one
+    token bucket per host) paces the requests of all workers together, and
+    page writes, dedup and stats are serialized by a single lock. Pages are
+    written as workers finish them, so the output is not in page order.
+
+    Ranges may add more work: after page 1 of a range carrying a shard,
+    on_result_count(range, count) returns further ranges to queue. Workers
+    keep waiting until every queued range, including those, is done.
+
+    A page that fails is queued again as a range of its own, up to
+    page_retries times; pages still failing after that are listed in
+    failed_pages.
+    """
+
+    def __init__(self, driver_factories: List[Callable[[], Any]], sink=None,
+                 scheduler: Optional[RequestScheduler] = None, dedup_index: Optional[DedupIndex] = None,
+                 scraper_factory: Callable[[], SmartPropertyScraper] = SmartPropertyScraper,
+                 on_result_count: Optional[Callable[[PageRange, Optional[int]], List[PageRange]]] = None,
+                 archive: Optional[SnapshotArchive] = None, page_retries: int = DEFAULT_PAGE_RETRIES):
+        """
+        Args:
+            driver_factories: One callable per worker returning a connected WebDriver or a PageFetcher
+            sink: Shared JsonlSink for technical records
+            scheduler: Shared RequestScheduler; defaults to the configured one
+            dedup_index: Shared DedupIndex; defaults to an in-memory one
+            scraper_factory: Builds the per-worker scraper (navigation and dedup helpers)
+            on_result_count: Turns a probed shard's result count into its remaining ranges
+            archive: Shared SnapshotArchive keeping every fetched page
+            page_retries: Times a failed page is queued again before it is given up on
+        """
+        self.driver_factories = list(driver_factories)
+        self.sink = sink
+        self.scheduler = scheduler or RequestScheduler.from_config()
+        self.dedup_index = dedup_index if dedup_index is not None else DedupIndex()
+        self.scraper_factory = scraper_factory
+        self.on_result_count = on_result_count
+        self.archive = archive
+        self.page_retries = max(0, int(page_retries))
+
+        self.tasks = queue.Queue()
+        self._lock = threading.Lock()
+        self.stats = {
+            'pages': 0,
+            'empty_pages': 0,
+            'failed_pages': 0,
+            'retried_pages': 0,
+            'records_written': 0,
+            'ranges_done': 0,
+            'ranges_added': 0,
+        }
+        self.worker_stats = {}
+        # search URL -> first page found to be past the end of its results
+        self.end_pages = {}
+        # (search URL, page) of every page given up on after its retries
+        self.failed_pages = []
+
+    def run(self, ranges: List[PageRange]) -> Dict[str, Any]:
+        """Crawl every range and return the combined stats"""
+        for page_range in ranges:
+            self.tasks.put(page_range)
+
+        logger.info("👥 Worker pool: %s browsers, %s page ranges", len(self.driver_factories), len(ranges))
+        started = time.time()
+        threads = [threading.Thread(target=self._worker, args=(i, factory), name=f"browser-{i}", daemon=True)
+                   for i, factory in enumerate(self.driver_factories)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.stats['elapsed_seconds'] = time.time() - started
+        self._print_stats()
+        return self.stats
+
+    def _worker(self, worker_id: int, driver_factory: Callable[[], Any]):
+        stats = self.worker_stats[worker_id] = {'pages': 0, 'records': 0}
+        try:
+            scraper = self.scraper_factory()
+            resource = driver_factory()
+        except Exception as e:
+            logger.error("❌ Worker %s could not start its browser: %s", worker_id, e)
+            return
+        if isinstance(resource, PageFetcher):
+            fetcher = resource
+        else:
+            scraper.driver = counting_driver(resource, getattr(scraper, 'count_round_trips', True))
+            fetcher = SeleniumFetcher(scraper)
+        fetcher.scheduler = self.scheduler
+        extractor = AdvancedPropertyExtractor(driver=None)
+        html_parser = HtmlPropertyParser(state_extractor=JsonStateExtractor.from_config(scraper.config))
+
+        try:
+            while True:
+                try:
+                    page_range = self.tasks.get(timeout=0.2)
+                except queue.Empty:
+                    # Ranges still being crawled may queue more work
+                    if self.tasks.unfinished_tasks == 0:
+                        break
+                    continue
+                try:
+                    if page_range.first_page < self.end_pages.get(page_range.search_url, page_range.first_page + 1):
+                        logger.info("👷 Worker %s: %s", worker_id, page_range.label)
+                        self._crawl_range(worker_id, scraper, fetcher, page_range, extractor, html_parser, stats)
+                finally:
+                    self.tasks.task_done()
+        finally:
+            try:
+                fetcher.close()
+            except Exception:
+                pass
+
+    def _mark_end(self, search_url: str, page: int):
+        """Remember that the search has no results from this page on"""
+        with self._lock:
+            self.end_pages[search_url] = min(page, self.end_pages.get(search_url, page))
+
+    def _crawl_range(self, worker_id, scraper, fetcher, page_range, extractor, html_parser, stats):
+        metrics = get_metrics()
+        for page, url in page_range.urls():
+            if page >= self.end_pages.get(page_range.search_url, page + 1):
+                break
+            try:
+                with metrics.timer('page.fetch'):
+                    snapshot = fetcher.fetch(url, page)
+                if snapshot is None:
+                    # Redirected away from the page: past the last page of the search
+                    self._mark_end(page_range.search_url, page)
+                    break
+                if self.archive is not None:
+                    self.archive.add_snapshot(snapshot, fetcher.page_html(snapshot))
+                with metrics.timer('parse.page'):
+                    properties = parse_page_snapshot(snapshot, extractor, html_parser)
+            except Exception as e:
+                logger.warning("⚠️ Worker %s failed on page %s: %s", worker_id, page, e)
+                self._page_failed(page_range, page)
+                continue
+
+            if page == 1:
+                self._queue_shard_ranges(page_range, fetcher.result_count(snapshot))
+
+            with self._lock:
+                self.stats['pages'] += 1
+                stats['pages'] += 1
+                if not properties:
+                    self.stats['empty_pages'] += 1
+                kept, _ = scraper.filter_new_properties(properties, self.dedup_index)
+                if self.sink is not None and kept:
+                    with metrics.timer('write.page'):
+                        self.sink.write_page(kept)
+                self.stats['records_written'] += len(kept)
+                stats['records'] += len(kept)
+
+            logger.info("✅ Worker %s page %s: %s properties", worker_id, page, len(kept))
+            metrics.page_done(len(kept), scraper.driver)
+            if not properties:
+                # An empty results page means the search has no more pages
+                self._mark_end(page_range.search_url, page)
+                break
+
+        with self._lock:
+            self.stats['ranges_done'] += 1
+
+    def _page_failed(self, page_range: PageRange, page: int):
+        """Queue a failed page again, or give up on it once its retries are used"""
+        attempt = page_range.attempt
+        metrics = get_metrics()
+        if attempt < self.page_retries:
+            # A retried probe page still carries its shard, so the shard is sized when it succeeds
+            shard = page_range.shard if page == 1 else None
+            label = f"page {page} retry {attempt + 1}"
+            with self._lock:
+                self.stats['retried_pages'] += 1
+            metrics.incr('pages.retried')
+            self.tasks.put(PageRange(page_range.search_url, page, page, label, shard=shard, attempt=attempt + 1))
+            return
+
+        logger.warning("⚠️ Giving up on page %s of %s after %s attempts", page, page_range.search_url, attempt + 1)
+        with self._lock:
+            self.stats['failed_pages'] += 1
+            self.failed_pages.append((page_range.search_url, page))
+        metrics.incr('pages.failed')
+        if page == 1:
+            self._queue_shard_ranges(page_range, None)
+
+    def _queue_shard_ranges(self, page_range: PageRange, result_count: Optional[int]):
+        """Queue the rest of a shard once its first page has been read"""
+        if page_range.shard is None or self.on_result_count is None:
+            return
+        try:
+            ranges = self.on_result_count(page_range, result_count)
+        except Exception as e:
+            logger.warning("⚠️ Could not plan %s: %s", page_range.label, e)
+            return
+        for new_range in ranges:
+            self.tasks.put(new_range)
+        with self._lock:
+            self.stats['ranges_added'] += len(ranges)
+
+    def _print_stats(self):
+        stats = self.stats
+        logger.info("👥 WORKER POOL SUMMARY")
+        logger.info("   📄 Pages: %s (%s empty, %s retried, %s failed)", stats['pages'], stats['empty_pages'],
+                    stats['retried_pages'], stats['failed_pages'])
+        logger.info("   🏠 Records written: %s", stats['records_written'])
+        for worker_id, worker in sorted(self.worker_stats.items()):
+            logger.info("   👷 Worker %s: %s pages, %s records", worker_id, worker['pages'], worker['records'])
+        logger.info("   🚦 Requests: %s (waited %.1fs, %s backoffs)", self.scheduler.stats['requests'],
+                    self.scheduler.stats['waited_seconds'], self.scheduler.stats['backoffs'])
+        logger.info("   ⏱️ Wall time: %.1fs", stats['elapsed_seconds'])
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+🔖 Crawl Checkpoints
+Saves crawl progress atomically so an interrupted collection resumes where it stopped
+"""
+
+import logging
+import os
+import json
+import shutil
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 2
+
+
+class CheckpointManager:
+    """Atomic JSON checkpoint with a rolling backup copy"""
+
+    def __init__(self, path: str, checkpoint_interval: int = 50, backup_interval: int = 100):
+        """
+        Args:
+            path: Checkpoint file; the backup is written next to it as <path>.bak
+            checkpoint_interval: Save after every N completed pages
+            backup_interval: Copy the checkpoint to the backup every N completed pages
+        """
+        self.path = path
+        self.backup_path = path + '.bak'
+        self.checkpoint_interval = max(1, int(checkpoint_interval or 1))
+        self.backup_interval = max(0, int(backup_interval or 0))
+        self.saves = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def should_save(self, pages_completed: int) -> bool:
+        """True when a checkpoint is due after this many completed pages"""
+        return pages_completed > 0 and pages_completed % self.checkpoint_interval == 0
+
+    def save(self, state: Dict[str, Any]) -> bool:
+        """Write the state to a temp file, fsync it and swap it into place"""
+        state = dict(state)
+        state['version'] = CHECKPOINT_VERSION
+        state['updated_at'] = datetime.now().isoformat()
+
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning("⚠️ Could not save checkpoint %s: %s", self.path, e)
+            return False
+
+        self.saves += 1
+        pages_completed = state.get('pages_completed', 0)
+        if self.backup_interval and pages_completed and pages_completed % self.backup_interval == 0:
+            try:
+                shutil.copyfile(self.path, self.backup_path)
+            except Exception as e:
+                logger.warning("⚠️ Could not back up checkpoint: %s", e)
+        return True
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return the saved state, falling back to the backup if the main file is unreadable"""
+        for path in (self.path, self.backup_path):
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                if isinstance(state, dict) and state.get('version') == CHECKPOINT_VERSION:
+                    return state
+            except Exception as e:
+                logger.warning("⚠️ Could not read checkpoint %s: %s", path, e)
+        return None
+
+    def clear(self):
+        """Remove the checkpoint once the crawl has finished"""
+        for path in (self.path, self.backup_path, self.path + '.tmp'):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def truncate_output(path: str, offset: int) -> bool:
+    """Cut an output file back to the offset recorded with the last checkpoint.
+
+    Records written after the checkpoint belong to pages that will be scraped
+    again, so dropping them keeps the resumed output free of duplicates.
+    """
+    if not os.path.exists(path):
+        return False
+    with open(path, 'r+b') as f:
+        f.truncate(max(0, int(offset or 0)))
+    return True
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+🧱 Columnar Pure Data Export
+Writes pure data records to typed Parquet or Arrow IPC files in streamed row groups
+"""
+
+import logging
+import sys
+import os
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterable
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from storage.jsonl_sink import iter_records
+from utils.config_loader import load_config, get_setting
+
+logger = logging.getLogger(__name__)
+
+# pyarrow is optional - JSON Lines output works without it
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+DEFAULT_ROW_GROUP_SIZE = 5000
+
+COLUMN_TYPES = ("string", "int64", "float64", "bool", "timestamp")
+
+
+class ColumnSpec:
+    """One typed output column"""
+
+    def __init__(self, name: str, type: str = "string", dictionary: bool = False, nullable: bool = True):
+        if type not in COLUMN_TYPES:
+            raise ValueError(f"Unsupported column type '{type}' for {name}")
+        self.name = name
+        self.type = type
+        self.dictionary = dictionary and type == "string"
+        self.nullable = nullable
+
+    def coerce(self, value):
+        """Convert a JSON value to this column's Python type (None when it doesn't fit)"""
+        if value is None or value == "":
+            return None
+        try:
+            if self.type == "string":
+                return value if isinstance(value, str) else str(value)
+            if self.type == "int64":
+                return int(float(str(value).replace(',', '')))
+            if self.type == "float64":
+                return float(str(value).replace(',', ''))
+            if self.type == "bool":
+                return bool(value)
+            if self.type == "timestamp":
+                return value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+        except (TypeError, ValueError):
+            return None
+        return value
+
+
+def load_columns(config: Optional[Dict[str, Any]] = None) -> List[ColumnSpec]:
+    """Column specs from the config "schema" section, the only place the layout is defined.
+
+    Fields listed in schema.required_fields are written as non-nullable, so
+    only list fields PureDataSchema always fills (name, price, bedrooms).
+    """
+    if config is None:
+        config = load_config()
+    columns = get_setting(config, 'schema.columns')
+    if not columns:
+        raise ValueError("Config \"schema\" section has no columns")
+    required = set(get_setting(config, 'schema.required_fields') or [])
+    return [
+        ColumnSpec(column["name"], column.get("type", "string"), bool(column.get("dictionary", False)),
+                   nullable=column["name"] not in required)
+        for column in columns
+    ]
+
+
+def columnar_available() -> bool:
+    return pa is not None
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Columnar export needs pyarrow (pip install pyarrow)")
+
+
+def arrow_schema(columns: List[ColumnSpec], schema_version: str = ""):
+    """pyarrow schema for the given columns, dictionary-encoding low-cardinality strings"""
+    _require_pyarrow()
+    types = {
+        "string": pa.string(),
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("us"),
+    }
+    fields = []
+    for column in columns:
+        arrow_type = pa.dictionary(pa.int32(), pa.string()) if column.dictionary else types[column.type]
+        fields.append(pa.field(column.name, arrow_type, nullable=column.nullable))
+    return pa.schema(fields, metadata={"schema_version": schema_version})
+
+
+class ColumnarWriter:
+    """Buffers pure data records and writes one row group per row_group_size records"""
+
+    def __init__(self, path: str, columns: Optional[List[ColumnSpec]] = None, file_format: Optional[str] = None,
+                 row_group_size: int = DEFAULT_ROW_GROUP_SIZE, compression: str = "zstd"):
+        """
+        Args:
+            path: Output file (.parquet, or .arrow/.feather for Arrow IPC)
+            columns: Column specs; defaults to the config schema
+            file_format: "parquet" or "arrow"; inferred from the extension when omitted
+            row_group_size: Records per row group (Parquet) or record batch (Arrow)
+            compression: Parquet/IPC compression codec
+        """
+        _require_pyarrow()
+        config = load_config()
+        self.path = path
+        self.columns = columns or load_columns(config)
+        self.file_format = file_format or ("parquet" if path.endswith(".parquet") else "arrow")
+        self.row_group_size = max(1, int(row_group_size or DEFAULT_ROW_GROUP_SIZE))
+        self.schema = arrow_schema(self.columns, str(get_setting(config, 'schema.version', '')))
+        self.records_written = 0
+        self.records_dropped = 0
+        self.row_groups_written = 0
+        self._buffer = []
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if self.file_format == "parquet":
+            self._writer = pq.ParquetWriter(
+                path, self.schema, compression=compression,
+                use_dictionary=[column.name for column in self.columns if column.dictionary]
+            )
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=compression if compression in ("zstd", "lz4") else None)
+            self._writer = pa.ipc.new_file(path, self.schema, options=options)
+
+    def write(self, record: Dict[str, Any]):
+        self._buffer.append(record)
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+
+    def write_batch(self, records: Iterable[Dict[str, Any]]) -> int:
+        count = 0
+        for record in records:
+            self.write(record)
+            count += 1
+        return count
+
+    def flush(self):
+        """Write buffered records as one row group"""
+        if not self._buffer:
+            return
+        records = self._complete_records(self._buffer)
+        self._buffer = []
+        if not records:
+            return
+        arrays = []
+        for column, field in zip(self.columns, self.schema):
+            values = [column.coerce(record.get(column.name)) for record in records]
+            if column.dictionary:
+                arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+            else:
+                arrays.append(pa.array(values, type=field.type))
+        batch = pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+        if self.file_format == "parquet":
+            self._writer.write_batch(batch, row_group_size=len(records))
+        else:
+            self._writer.write_batch(batch)
+
+        self.records_written += len(records)
+        self.row_groups_written += 1
+
+    def _complete_records(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop (and count) records missing a non-nullable column - pyarrow would reject the whole batch"""
+        required = [column for column in self.columns if not column.nullable]
+        complete = [record for record in records
+                    if all(column.coerce(record.get(column.name)) is not None for column in required)]
+        dropped = len(records) - len(complete)
+        if dropped:
+            self.records_dropped += dropped
+            logger.warning("⚠️ Skipped %s records missing a required column (%s)",
+                           dropped, ', '.join(column.name for column in required))
+        return complete
+
+    def close(self):
+        if self._writer is not None:
+            self.flush()
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def columnar_path(jsonl_path: str, file_format: str) -> str:
+    """data/pure_data_x.jsonl -> data/pure_data_x.parquet (or .arrow)"""
+    extension = ".parquet" if file_format == "parquet" else ".arrow"
+    return os.path.splitext(jsonl_path)[0] + extension
+
+
+def export_jsonl(input_file: str, output_file: str, row_group_size: int = DEFAULT_ROW_GROUP_SIZE) -> int:
+    """Stream an existing pure data JSONL file into a columnar file"""
+    with ColumnarWriter(output_file, row_group_size=row_group_size) as writer:
+        writer.write_batch(iter_records(input_file))
+    logger.info("🧱 Exported %s records in %s row groups to %s",
+                f"{writer.records_written:,}", writer.row_groups_written, output_file)
+    return writer.records_written
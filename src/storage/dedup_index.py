@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+🧬 Listing Dedup Index
+64-bit listing fingerprints in a compact sorted array with a Bloom filter in front,
+persisted between runs so duplicates are caught across pages and crawls
+"""
+
+import logging
+import sys
+import os
+import struct
+import hashlib
+import heapq
+from array import array
+from bisect import bisect_left
+from typing import Dict, Any, Iterable, List, Optional
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from extractors.patterns import listing_id_from_url
+
+logger = logging.getLogger(__name__)
+
+NEW = 'new'              # never seen before
+DUPLICATE = 'duplicate'  # already seen earlier in this run
+KNOWN = 'known'          # seen in an earlier run
+
+MAGIC = b'PGDX'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sIQQI')  # magic, version, fingerprint count, bloom bits, bloom hashes
+
+BLOOM_BITS_PER_KEY = 10
+BLOOM_HASHES = 7
+MIN_BLOOM_BITS = 1 << 16
+
+
+def fingerprint_key(record: Dict[str, Any]) -> str:
+    """Normalized identity: listing id first (from the URL, else the record's listing_id),
+    then the URL, then the listing's content. The listing store keys its rows by it too."""
+    url = record.get('listing_url') or record.get('property_url')
+    listing_id = listing_id_from_url(url) or record.get('listing_id')
+    if listing_id:
+        return f"id:{listing_id}"
+    if url:
+        return f"url:{url.split('?')[0].rstrip('/').lower()}"
+
+    # Page-text fallback records (main_scraper) carry name/area instead of property_name/floor_area_sqft
+    price = record.get('price', record.get('price_numeric'))
+    name = ' '.join(str(record.get('property_name') or record.get('name') or '').lower().split())
+    area = record.get('floor_area_sqft', record.get('area'))
+    return f"content:{name}|{price}|{record.get('bedrooms')}|{area}"
+
+
+def fingerprint(record: Dict[str, Any]) -> int:
+    """64-bit blake2b fingerprint of fingerprint_key(record)"""
+    digest = hashlib.blake2b(fingerprint_key(record).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 64-bit fingerprints (double hashing, no extra digests)"""
+
+    def __init__(self, bits: int, hashes: int = BLOOM_HASHES, data: Optional[bytes] = None):
+        self.bits = max(8, int(bits))
+        self.hashes = hashes
+        self.data = bytearray(data) if data is not None else bytearray((self.bits + 7) // 8)
+
+    def _positions(self, fp: int):
+        h1 = fp & 0xFFFFFFFF
+        h2 = (fp >> 32) | 1
+        bits = self.bits
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % bits
+
+    def add(self, fp: int):
+        data = self.data
+        for position in self._positions(fp):
+            data[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, fp: int) -> bool:
+        data = self.data
+        for position in self._positions(fp):
+            if not data[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+class DedupIndex:
+    """Run-level set plus a persisted history of fingerprints.
+
+    Lookups are O(1) for new listings (the Bloom filter rejects them) and fall
+    back to a binary search of the 8-byte-per-listing history array only when
+    the filter says a fingerprint may have been seen before.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: Index file; None keeps the index in memory for this run only
+        """
+        self.path = path
+        self.history = array('Q')
+        self.run = set()
+        self.bloom = BloomFilter(MIN_BLOOM_BITS)
+        self.stats = {NEW: 0, DUPLICATE: 0, KNOWN: 0}
+
+        if path and os.path.exists(path):
+            self._load(path)
+
+    def _load(self, path: str):
+        try:
+            with open(path, 'rb') as f:
+                magic, version, count, bloom_bits, bloom_hashes = HEADER.unpack(f.read(HEADER.size))
+                if magic != MAGIC or version != FORMAT_VERSION:
+                    raise ValueError("unrecognised dedup index file")
+                self.history.frombytes(f.read(count * 8))
+                self.bloom = BloomFilter(bloom_bits, bloom_hashes, f.read((bloom_bits + 7) // 8))
+            logger.info("🧬 Dedup index loaded: %s known listings", f"{len(self.history):,}")
+        except Exception as e:
+            logger.warning("⚠️ Could not load dedup index %s: %s", path, e)
+            self.history = array('Q')
+            self.bloom = BloomFilter(MIN_BLOOM_BITS)
+
+    def _in_history(self, fp: int) -> bool:
+        if fp not in self.bloom:
+            return False
+        history = self.history
+        index = bisect_left(history, fp)
+        return index < len(history) and history[index] == fp
+
+    def check_and_add(self, record: Dict[str, Any]) -> str:
+        """Classify a record as NEW, DUPLICATE or KNOWN and remember it for this run"""
+        fp = fingerprint(record)
+        if fp in self.run:
+            status = DUPLICATE
+        else:
+            self.run.add(fp)
+            status = KNOWN if self._in_history(fp) else NEW
+        self.stats[status] += 1
+        return status
+
+    def __contains__(self, record: Dict[str, Any]) -> bool:
+        fp = fingerprint(record)
+        return fp in self.run or self._in_history(fp)
+
+    def run_fingerprints(self) -> List[int]:
+        """This run's fingerprints, for checkpoints"""
+        return sorted(self.run)
+
+    def restore_run(self, fingerprints: Iterable[int]):
+        """Reload a resumed run's fingerprints"""
+        self.run.update(int(fp) for fp in fingerprints)
+
+    def save(self, path: Optional[str] = None) -> bool:
+        """Merge this run into the history and write the index atomically"""
+        path = path or self.path
+        if not path:
+            return False
+
+        new = sorted(fp for fp in self.run if not self._in_history(fp))
+        if new:
+            self.history = array('Q', heapq.merge(self.history, new))
+
+        # Resize the filter as the history grows so the false-positive rate stays low
+        bits = max(MIN_BLOOM_BITS, len(self.history) * BLOOM_BITS_PER_KEY)
+        if bits > self.bloom.bits:
+            self.bloom = BloomFilter(bits * 2)
+            for fp in self.history:
+                self.bloom.add(fp)
+        else:
+            for fp in new:
+                self.bloom.add(fp)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(self.history), self.bloom.bits, self.bloom.hashes))
+                self.history.tofile(f)
+                f.write(self.bloom.data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("⚠️ Could not save dedup index %s: %s", path, e)
+            return False
+        return True
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+💾 Streaming JSON Lines Sink
+Appends records page by page so long crawls keep constant memory and survive crashes
+"""
+
+import os
+import json
+import logging
+from typing import Dict, Any, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class CorruptRecordError(ValueError):
+    """A line in the middle of a JSON Lines file is not valid JSON"""
+
+
+class JsonlSink:
+    """Append-only JSON Lines writer with periodic fsync"""
+
+    def __init__(self, path: str, fsync_interval: int = 1):
+        """
+        Args:
+            path: Output file, created (with its directory) if missing
+            fsync_interval: fsync after this many pages; 0 leaves it to the OS
+        """
+        self.path = path
+        self.fsync_interval = max(0, int(fsync_interval or 0))
+        self.records_written = 0
+        self.pages_written = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def write(self, record: Dict[str, Any]):
+        """Append a single record"""
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+        self._file.write('\n')
+        self.records_written += 1
+
+    def write_lines(self, lines: Iterable[str]) -> int:
+        """Append records that were already serialized (one JSON document per string)"""
+        count = 0
+        for line in lines:
+            self._file.write(line)
+            self._file.write('\n')
+            count += 1
+        self.records_written += count
+        return count
+
+    def write_page(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Append one page of records and flush it to disk"""
+        count = 0
+        for record in records:
+            self.write(record)
+            count += 1
+
+        self.pages_written += 1
+        fsync = self.fsync_interval and self.pages_written % self.fsync_interval == 0
+        self.flush(fsync=bool(fsync))
+        return count
+
+    def flush(self, fsync: bool = False):
+        self._file.flush()
+        if fsync:
+            os.fsync(self._file.fileno())
+
+    def tell(self) -> int:
+        """Byte offset of the end of the data written so far"""
+        self._file.flush()
+        return self._file.tell()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush(fsync=True)
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def iter_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream records from a .jsonl file (or a legacy .json array) one at a time.
+
+    A truncated last line - left behind by a crash mid-write - is skipped with a
+    warning. An invalid line followed by more records is corruption and raises
+    CorruptRecordError with its line number.
+    """
+    if path.endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            for record in json.load(f):
+                yield record
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        bad_line = None
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            if bad_line is not None:
+                raise CorruptRecordError(f"{path}: line {bad_line} is not valid JSON")
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                bad_line = number
+                continue
+            yield record
+
+    if bad_line is not None:
+        logger.warning("⚠️ Skipped truncated last line %s of %s", bad_line, path)
+
+
+def iter_raw_records(path: str) -> Iterator[Any]:
+    """Like iter_records, but yields undecoded lines for .jsonl files.
+
+    Lets a worker pool do the JSON decoding; legacy .json arrays still yield dicts.
+    """
+    if path.endswith('.json'):
+        yield from iter_records(path)
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def count_records(path: str) -> int:
+    """Count records without keeping them in memory"""
+    return sum(1 for _ in iter_records(path))
+
+
+def read_sample(path: str, limit: int = 3) -> list:
+    """Return the first few records of a file"""
+    sample = []
+    for record in iter_records(path):
+        sample.append(record)
+        if len(sample) >= limit:
+            break
+    return sample
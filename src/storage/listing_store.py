@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+🗄️ Listing Store
+Persistent SQLite (WAL) store of listings with batched upserts and indexed queries
+"""
+
+import sys
+import os
+import json
+import sqlite3
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from extractors.patterns import listing_id_from_url
+from storage.dedup_index import fingerprint_key
+from storage.jsonl_sink import iter_records
+
+DEFAULT_BATCH_SIZE = 1000
+# PRAGMA user_version of the current layout; 1 keys listings by dedup_index.fingerprint_key
+STORE_VERSION = 1
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS listings (
+    listing_key TEXT PRIMARY KEY,
+    listing_id TEXT,
+    property_url TEXT,
+    property_name TEXT,
+    price_numeric INTEGER,
+    bedrooms INTEGER,
+    bathrooms INTEGER,
+    floor_area_sqft INTEGER,
+    property_type TEXT,
+    district_code TEXT,
+    mrt_station TEXT,
+    listed_date TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_listings_district ON listings (district_code);
+CREATE INDEX IF NOT EXISTS idx_listings_price ON listings (price_numeric);
+CREATE INDEX IF NOT EXISTS idx_listings_bedrooms ON listings (bedrooms);
+CREATE INDEX IF NOT EXISTS idx_listings_listed_date ON listings (listed_date);
+CREATE INDEX IF NOT EXISTS idx_listings_url ON listings (property_url);
+
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    extraction_file TEXT,
+    pure_data_file TEXT,
+    records INTEGER DEFAULT 0
+);
+"""
+
+UPSERT_SQL = """
+INSERT INTO listings (
+    listing_key, listing_id, property_url, property_name, price_numeric, bedrooms, bathrooms,
+    floor_area_sqft, property_type, district_code, mrt_station, listed_date, first_seen, last_seen, record
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(listing_key) DO UPDATE SET
+    listing_id = excluded.listing_id,
+    property_url = excluded.property_url,
+    property_name = excluded.property_name,
+    price_numeric = excluded.price_numeric,
+    bedrooms = excluded.bedrooms,
+    bathrooms = excluded.bathrooms,
+    floor_area_sqft = excluded.floor_area_sqft,
+    property_type = excluded.property_type,
+    district_code = excluded.district_code,
+    mrt_station = excluded.mrt_station,
+    listed_date = excluded.listed_date,
+    last_seen = excluded.last_seen,
+    record = excluded.record
+"""
+
+# Columns query() can sort by
+ORDER_COLUMNS = {"price_numeric", "bedrooms", "listed_date", "last_seen", "first_seen", "floor_area_sqft"}
+
+
+def normalize_listed_date(value: Optional[str]) -> Optional[str]:
+    """'Jul 12, 2025' -> '2025-07-12' so the index sorts by date; unknown formats pass through"""
+    if not value:
+        return None
+    value = value.strip()
+    for fmt in ('%b %d, %Y', '%d %b %Y', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(value, fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    return value
+
+
+class ListingStore:
+    """SQLite listing table keyed by listing id, upserted in batches"""
+
+    def __init__(self, path: str, wal: bool = True):
+        """
+        Args:
+            path: Database file (":memory:" for a throwaway store)
+            wal: Use write-ahead logging so readers never block the crawl
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory and path != ':memory:':
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        if wal and path != ':memory:':
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA_SQL)
+        self._migrate()
+        self.conn.commit()
+
+    def _migrate(self):
+        """Re-key rows written before the store shared the dedup index's listing identity"""
+        if self.conn.execute('PRAGMA user_version').fetchone()[0] >= STORE_VERSION:
+            return
+        rows = self.conn.execute('SELECT listing_key, record FROM listings').fetchall()
+        with self.conn:
+            for row in rows:
+                key = fingerprint_key(json.loads(row['record']))
+                if key != row['listing_key']:
+                    self.conn.execute('UPDATE OR REPLACE listings SET listing_key = ? WHERE listing_key = ?',
+                                      (key, row['listing_key']))
+            self.conn.execute(f'PRAGMA user_version = {STORE_VERSION}')
+
+    def _row(self, record: Dict[str, Any], seen_at: str) -> tuple:
+        url = record.get('property_url') or record.get('listing_url')
+        return (
+            fingerprint_key(record),
+            listing_id_from_url(url),
+            url,
+            record.get('property_name'),
+            record.get('price_numeric', record.get('price')),
+            record.get('bedrooms'),
+            record.get('bathrooms'),
+            record.get('floor_area_sqft'),
+            record.get('property_type'),
+            record.get('district_code', record.get('district')),
+            record.get('mrt_station'),
+            normalize_listed_date(record.get('listed_date')),
+            seen_at,
+            seen_at,
+            json.dumps(record, ensure_ascii=False, separators=(',', ':')),
+        )
+
+    def upsert_many(self, records: Iterable[Dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """Insert or update records (pure data or technical shape), one transaction per batch"""
+        seen_at = datetime.now().isoformat()
+        total = 0
+        batch = []
+        for record in records:
+            batch.append(self._row(record, seen_at))
+            if len(batch) >= batch_size:
+                total += self._write_batch(batch)
+                batch = []
+        if batch:
+            total += self._write_batch(batch)
+        return total
+
+    def _write_batch(self, rows: List[tuple]) -> int:
+        with self.conn:
+            self.conn.executemany(UPSERT_SQL, rows)
+        return len(rows)
+
+    def ingest_file(self, path: str, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """Stream a .jsonl (or legacy .json) file into the store"""
+        return self.upsert_many(iter_records(path), batch_size)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up one listing by id or URL"""
+        listing_id = listing_id_from_url(key) or (key if '/' not in key else None)
+        lookup_key = fingerprint_key({'listing_id': listing_id} if listing_id else {'listing_url': key})
+        row = self.conn.execute(
+            'SELECT record FROM listings WHERE listing_key = ? OR property_url = ? LIMIT 1', (lookup_key, key)
+        ).fetchone()
+        return json.loads(row['record']) if row else None
+
+    def _where(self, district_code=None, min_price=None, max_price=None, bedrooms=None,
+               listed_since=None, property_type=None):
+        clauses = []
+        params = []
+        if district_code:
+            clauses.append('district_code = ?')
+            params.append(district_code)
+        if min_price is not None:
+            clauses.append('price_numeric >= ?')
+            params.append(min_price)
+        if max_price is not None:
+            clauses.append('price_numeric <= ?')
+            params.append(max_price)
+        if bedrooms is not None:
+            clauses.append('bedrooms = ?')
+            params.append(bedrooms)
+        if listed_since:
+            clauses.append('listed_date >= ?')
+            params.append(normalize_listed_date(listed_since))
+        if property_type:
+            clauses.append('property_type = ?')
+            params.append(property_type)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def query(self, district_code: Optional[str] = None, min_price: Optional[float] = None,
+              max_price: Optional[float] = None, bedrooms: Optional[int] = None,
+              listed_since: Optional[str] = None, property_type: Optional[str] = None,
+              order_by: str = 'price_numeric', descending: bool = False,
+              limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Stream matching listings; every filter uses an indexed column"""
+        if order_by not in ORDER_COLUMNS:
+            raise ValueError(f"Cannot order by '{order_by}'")
+        where, params = self._where(district_code, min_price, max_price, bedrooms, listed_since, property_type)
+        sql = f'SELECT record FROM listings{where} ORDER BY {order_by} {"DESC" if descending else "ASC"}'
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(int(limit))
+        for row in self.conn.execute(sql, params):
+            yield json.loads(row['record'])
+
+    def count(self, **filters) -> int:
+        where, params = self._where(**filters)
+        return self.conn.execute(f'SELECT COUNT(*) FROM listings{where}', params).fetchone()[0]
+
+    def district_counts(self) -> Dict[str, int]:
+        rows = self.conn.execute(
+            'SELECT district_code, COUNT(*) AS n FROM listings GROUP BY district_code ORDER BY district_code'
+        )
+        return {row['district_code'] or 'Unknown': row['n'] for row in rows}
+
+    def start_run(self, extraction_file: Optional[str] = None, started_at: Optional[datetime] = None) -> int:
+        """Record a run; pass started_at when the crawl began before the store was opened"""
+        with self.conn:
+            cursor = self.conn.execute(
+                'INSERT INTO runs (started_at, extraction_file) VALUES (?, ?)',
+                ((started_at or datetime.now()).isoformat(), extraction_file)
+            )
+        return cursor.lastrowid
+
+    def finish_run(self, run_id: int, extraction_file: Optional[str] = None,
+                   pure_data_file: Optional[str] = None, records: int = 0):
+        with self.conn:
+            self.conn.execute(
+                'UPDATE runs SET finished_at = ?, extraction_file = COALESCE(?, extraction_file), '
+                'pure_data_file = ?, records = ? WHERE run_id = ?',
+                (datetime.now().isoformat(), extraction_file, pure_data_file, records, run_id)
+            )
+
+    def latest_run(self) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute(
+            'SELECT * FROM runs WHERE finished_at IS NOT NULL ORDER BY run_id DESC LIMIT 1'
+        ).fetchone()
+        return dict(row) if row else None
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+🗄️ Page Snapshot Archive
+Keeps the full HTML (and optionally the embedded JSON state) of every fetched page,
+compressed and content-addressed in packed segment files, so extraction changes can
+be replayed over old crawls without re-crawling
+"""
+
+import logging
+import sys
+import os
+import json
+import time
+import zlib
+import hashlib
+import threading
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from extractors.json_state_extractor import find_state_json
+
+logger = logging.getLogger(__name__)
+
+# zstandard is optional - zlib is used when it is missing
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+INDEX_FILE = "index.jsonl"
+SEGMENT_TEMPLATE = "segment_{:05d}.pgs"
+DEFAULT_MAX_SEGMENT_BYTES = 256 * 1024 * 1024
+DEFAULT_LEVELS = {"zstd": 9, "zlib": 6}
+
+
+def default_codec() -> str:
+    return "zstd" if zstandard is not None else "zlib"
+
+
+def content_hash(data: bytes) -> str:
+    """Address of a blob: 128-bit blake2b of its uncompressed bytes"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def compress(data: bytes, codec: str, level: Optional[int] = None) -> bytes:
+    level = DEFAULT_LEVELS[codec] if level is None else level
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd archive codec needs the zstandard package")
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    if codec == "zlib":
+        return zlib.compress(data, level)
+    raise ValueError(f"Unknown archive codec: {codec}")
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Archive blob is zstd-compressed - install zstandard to read it")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == "zlib":
+        return zlib.decompress(data)
+    raise ValueError(f"Unknown archive codec: {codec}")
+
+
+def read_blob_at(directory: str, location: Dict[str, Any]) -> str:
+    """Read one blob from its index location; module-level so worker processes can use it"""
+    with open(os.path.join(directory, location['segment']), 'rb') as f:
+        f.seek(location['offset'])
+        data = f.read(location['length'])
+    return decompress(data, location['codec']).decode('utf-8')
+
+
+class SnapshotArchive:
+    """Append-only page archive: blobs packed into segment files, described by a JSON Lines index.
+
+    The index holds two kinds of lines. "blob" lines give the segment, offset,
+    length and codec of each distinct content hash; "page" lines tie a
+    fetched URL to the hashes of its HTML and state. A page identical to one
+    already archived only adds a page line. Blobs are written before their
+    index line, so a crash can leave unreferenced bytes but never a dangling
+    index entry. Safe to share between threads.
+    """
+
+    def __init__(self, directory: str, codec: Optional[str] = None, level: Optional[int] = None,
+                 max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES, include_state: bool = False):
+        """
+        Args:
+            directory: Archive directory, created if missing
+            codec: "zstd" or "zlib"; defaults to zstd when zstandard is installed
+            level: Compression level; defaults per codec
+            max_segment_bytes: Start a new segment file past this size
+            include_state: Also store the page's __NEXT_DATA__ state as its own blob
+        """
+        self.directory = directory
+        self.codec = codec or default_codec()
+        self.level = level
+        self.max_segment_bytes = max_segment_bytes
+        self.include_state = include_state
+        os.makedirs(directory, exist_ok=True)
+
+        self.blobs = {}
+        self.page_count = 0
+        self.stats = {'pages': 0, 'blobs_written': 0, 'duplicate_blobs': 0, 'raw_bytes': 0, 'stored_bytes': 0}
+        self._lock = threading.Lock()
+        self._load_index()
+
+        self._segment_number = self._last_segment_number()
+        self._segment = None
+        self._index = open(os.path.join(directory, INDEX_FILE), 'a', encoding='utf-8')
+        if self._index.tell() and not self._index_ends_with_newline():
+            # Terminate a line cut off by a crash so the next entry starts cleanly
+            self._index.write('\n')
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None,
+                    base_dir: str = "") -> Optional["SnapshotArchive"]:
+        """Archive from the "archive" config section (relative to base_dir), None when archiving is off"""
+        from utils.config_loader import load_config, get_setting
+
+        if config is None:
+            config = load_config()
+        if not get_setting(config, 'archive.enabled', False):
+            return None
+        return cls(os.path.join(base_dir, get_setting(config, 'archive.directory', 'archive')),
+                   codec=get_setting(config, 'archive.codec', None),
+                   level=get_setting(config, 'archive.level', None),
+                   include_state=get_setting(config, 'archive.include_state', True))
+
+    # ----- writing -----
+
+    def add_page(self, url: str, page_number: Optional[int], html: str,
+                 state: Optional[str] = None) -> Dict[str, Any]:
+        """Archive one fetched page and return its index entry"""
+        if state is None and self.include_state:
+            state = find_state_json(html)
+
+        with self._lock:
+            entry = {
+                'type': 'page',
+                'url': url,
+                'page_number': page_number,
+                'captured_at': time.time(),
+                'html': self._add_blob(html),
+                'state': self._add_blob(state) if state else None,
+            }
+            self._write_index(entry)
+            self.page_count += 1
+            self.stats['pages'] += 1
+        return entry
+
+    def add_snapshot(self, snapshot, html: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Archive a PageSnapshot; html overrides the snapshot's own (e.g. page_source of a card snapshot)"""
+        html = html or snapshot.html
+        if not html:
+            return None
+        return self.add_page(snapshot.url, snapshot.page_number, html)
+
+    def _add_blob(self, text: str) -> str:
+        data = text.encode('utf-8')
+        digest = content_hash(data)
+        if digest in self.blobs:
+            self.stats['duplicate_blobs'] += 1
+            return digest
+
+        packed = compress(data, self.codec, self.level)
+        segment = self._segment_for(len(packed))
+        offset = segment.tell()
+        segment.write(packed)
+        segment.flush()
+
+        location = {'type': 'blob', 'hash': digest, 'segment': os.path.basename(segment.name),
+                    'offset': offset, 'length': len(packed), 'size': len(data), 'codec': self.codec}
+        self._write_index(location)
+        self.blobs[digest] = location
+        self.stats['blobs_written'] += 1
+        self.stats['raw_bytes'] += len(data)
+        self.stats['stored_bytes'] += len(packed)
+        return digest
+
+    def _segment_for(self, size: int):
+        if self._segment is not None and self._segment.tell() + size > self.max_segment_bytes:
+            self._segment.close()
+            self._segment = None
+            self._segment_number += 1
+        if self._segment is None:
+            path = os.path.join(self.directory, SEGMENT_TEMPLATE.format(self._segment_number))
+            self._segment = open(path, 'ab')
+        return self._segment
+
+    def _write_index(self, entry: Dict[str, Any]):
+        self._index.write(json.dumps(entry, separators=(',', ':')))
+        self._index.write('\n')
+        self._index.flush()
+
+    # ----- reading -----
+
+    def _load_index(self):
+        path = os.path.join(self.directory, INDEX_FILE)
+        if not os.path.exists(path):
+            return
+        for entry in self._index_entries(path):
+            if entry.get('type') == 'blob':
+                self.blobs[entry['hash']] = entry
+            elif entry.get('type') == 'page':
+                self.page_count += 1
+
+    @staticmethod
+    def _index_entries(path: str) -> Iterator[Dict[str, Any]]:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # A line cut off by a crash
+                    continue
+
+    def _index_ends_with_newline(self) -> bool:
+        with open(os.path.join(self.directory, INDEX_FILE), 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def _last_segment_number(self) -> int:
+        numbers = [int(name[8:13]) for name in os.listdir(self.directory)
+                   if name.startswith('segment_') and name.endswith('.pgs')]
+        return max(numbers, default=1)
+
+    def pages(self) -> Iterator[Dict[str, Any]]:
+        """Page entries in archive order"""
+        self._index.flush()
+        for entry in self._index_entries(os.path.join(self.directory, INDEX_FILE)):
+            if entry.get('type') == 'page':
+                yield entry
+
+    def read(self, digest: str) -> str:
+        """Decompressed text of a blob"""
+        with self._lock:
+            if self._segment is not None:
+                self._segment.flush()
+        return read_blob_at(self.directory, self.blobs[digest])
+
+    def iter_pages(self) -> Iterator[Tuple[Dict[str, Any], str, Optional[str]]]:
+        """(entry, html, state) for every archived page"""
+        for entry in self.pages():
+            state = self.read(entry['state']) if entry.get('state') else None
+            yield entry, self.read(entry['html']), state
+
+    def close(self):
+        with self._lock:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+            self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def print_stats(self):
+        stats = self.stats
+        ratio = stats['raw_bytes'] / stats['stored_bytes'] if stats['stored_bytes'] else 0
+        logger.info("🗄️ Archived %s pages: %s new blobs (%s duplicates), %s KB stored, %.1fx %s compression",
+                    stats['pages'], stats['blobs_written'], stats['duplicate_blobs'],
+                    f"{stats['stored_bytes'] / 1024:,.0f}", ratio, self.codec)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+⚙️ Scraper Configuration Loader
+Reads config/scraper_config.json and fills in defaults for missing settings
+"""
+
+import logging
+import os
+import copy
+import json
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+CONFIG_PATH = os.path.join(PROJECT_ROOT, 'config', 'scraper_config.json')
+
+# config/scraper_config.json is the single source of settings; each module passes its
+# own fallback to get_setting, so only what must exist without a config file is here
+DEFAULT_CONFIG = {
+    "output": {
+        "data_dir": "data"
+    }
+}
+
+
+def _merge(defaults: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    merged = copy.deepcopy(defaults)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_config(path: Optional[str] = None) -> Dict[str, Any]:
+    """Load the scraper config, falling back to defaults for anything missing"""
+    config_path = path or CONFIG_PATH
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return _merge(DEFAULT_CONFIG, json.load(f))
+    except FileNotFoundError:
+        return copy.deepcopy(DEFAULT_CONFIG)
+    except Exception as e:
+        logger.warning("⚠️ Could not load config %s: %s", config_path, e)
+        return copy.deepcopy(DEFAULT_CONFIG)
+
+
+def resolve_data_dir(config: Optional[Dict[str, Any]] = None) -> str:
+    """The directory every run artifact goes to: output.data_dir, a relative path taken from the project root"""
+    if config is None:
+        config = load_config()
+    data_dir = get_setting(config, 'output.data_dir', 'data')
+    return data_dir if os.path.isabs(data_dir) else os.path.normpath(os.path.join(PROJECT_ROOT, data_dir))
+
+
+def get_setting(config: Dict[str, Any], dotted_key: str, default: Any = None) -> Any:
+    """Read a nested setting such as 'output.checkpoint_interval'"""
+    value = config
+    for part in dotted_key.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return default
+        value = value[part]
+    return value
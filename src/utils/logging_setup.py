@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+📝 Logging Setup
+Leveled logging for the scraper: console lines in the usual emoji style, an
+optional JSON Lines log file, and a queue in between so a background thread does
+all the terminal and disk I/O instead of the crawl
+"""
+
+import os
+import sys
+import json
+import queue
+import atexit
+import logging
+import logging.handlers
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
+
+# Top-level packages of this project; their loggers follow the configured level,
+# everything else (selenium, urllib3, ...) stays at WARNING
+PACKAGE_LOGGERS = ("scrapers", "extractors", "schemas", "storage", "utils", "__main__")
+
+# Attributes every LogRecord has; anything else was passed through extra={...}
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_listener = None
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Just the message - the leading emoji already tells the level"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if record.exc_info:
+            message = f"{message}\n{self.formatException(record.exc_info)}"
+        return message
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, thread, message and any extra fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage().strip(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def _level(value: Union[str, int]) -> int:
+    if isinstance(value, int):
+        return value
+    level = logging.getLevelName(str(value).upper())
+    if not isinstance(level, int):
+        raise ValueError(f"Unknown log level: {value}")
+    return level
+
+
+def setup_logging(config: Optional[Dict[str, Any]] = None, level: Optional[Union[str, int]] = None,
+                  json_file: Optional[str] = None, console: Optional[bool] = None
+                  ) -> logging.handlers.QueueListener:
+    """Send all project logging through a queue to the console and an optional JSON Lines file.
+
+    Settings come from the "logging" config section unless given here.
+    Calling it again replaces the previous handlers.
+    """
+    from utils.config_loader import load_config, get_setting
+
+    if config is None:
+        config = load_config()
+    console_level = _level(level or get_setting(config, 'logging.level', 'INFO'))
+    if json_file is None:
+        json_file = get_setting(config, 'logging.json_file', None)
+    if console is None:
+        console = get_setting(config, 'logging.console', True)
+
+    handlers = []
+    if console:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setLevel(console_level)
+        handler.setFormatter(ConsoleFormatter())
+        handlers.append(handler)
+    if json_file:
+        directory = os.path.dirname(json_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        handler = logging.FileHandler(json_file, encoding='utf-8')
+        handler.setLevel(_level(get_setting(config, 'logging.json_level', 'DEBUG')))
+        handler.setFormatter(JsonLinesFormatter())
+        handlers.append(handler)
+
+    stop_logging()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root.removeHandler(handler)
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.WARNING)
+    # Records below every handler's level are dropped at the call site, before any formatting
+    package_level = min((handler.level for handler in handlers), default=console_level)
+    for name in PACKAGE_LOGGERS:
+        logging.getLogger(name).setLevel(package_level)
+
+    global _listener
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging():
+    """Write out everything still queued and stop the background thread"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(stop_logging)
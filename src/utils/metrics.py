@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+📈 Run Metrics
+Counters and latency histograms for every stage of a crawl - page loads,
+readiness waits, extraction, conversion and writes - plus WebDriver round-trips
+per page, a one-line live status and a per-run metrics JSON file
+"""
+
+import logging
+import os
+import json
+import math
+import time
+import threading
+import functools
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Histogram buckets grow by this factor from MIN_BUCKET_VALUE (about 19% wide)
+BUCKET_GROWTH = 2 ** 0.25
+MIN_BUCKET_VALUE = 1e-4
+
+# Driver attributes that are plain properties but still cost a WebDriver round-trip
+REMOTE_PROPERTIES = {'page_source', 'title', 'current_url', 'window_handles', 'current_window_handle',
+                     'text', 'tag_name', 'size', 'location', 'rect'}
+
+# Stages shown in the status line: histogram name -> label
+STATUS_STAGES = {
+    'page.load': 'load',
+    'page.readiness': 'ready',
+    'page.fetch': 'fetch',
+    'extract.smart': 'extract',
+    'parse.page': 'parse',
+    'convert.page': 'convert',
+    'write.page': 'write',
+}
+
+
+class Histogram:
+    """Streaming histogram with log-spaced buckets: constant memory, percentiles within one bucket width"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = {}
+
+    def observe(self, value: float):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        bucket = self._bucket(value)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    @staticmethod
+    def _bucket(value: float) -> int:
+        if value <= MIN_BUCKET_VALUE:
+            return 0
+        return int(math.ceil(math.log(value / MIN_BUCKET_VALUE, BUCKET_GROWTH)))
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of observations, clamped to min/max"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                value = MIN_BUCKET_VALUE * BUCKET_GROWTH ** bucket
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.total / self.count if self.count else 0.0,
+            'min': self.min or 0.0,
+            'max': self.max or 0.0,
+            'p50': self.percentile(0.50),
+            'p90': self.percentile(0.90),
+            'p99': self.percentile(0.99),
+        }
+
+
+class RunMetrics:
+    """Counters and histograms for one run; safe to share between threads"""
+
+    def __init__(self, status_line: bool = False):
+        """
+        Args:
+            status_line: Print a one-line status after every completed page
+        """
+        self.status_line = status_line
+        self.started = time.time()
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # id(driver) -> round-trip count at that driver's previous page
+        self._round_trip_marks = {}
+
+    def incr(self, name: str, amount: int = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name: str, value: float):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str):
+        """Observe the seconds spent in the block under name (also when it raises)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def record_round_trips(self, driver):
+        """Observe the WebDriver round-trips a CountingDriver made since its previous page"""
+        count = getattr(driver, 'round_trips', None)
+        if count is None:
+            return
+        with self._lock:
+            previous = self._round_trip_marks.get(id(driver), 0)
+            self._round_trip_marks[id(driver)] = count
+        self.observe('webdriver.round_trips_per_page', count - previous)
+
+    def page_done(self, cards: int = 0, driver=None):
+        """Count a finished page and its cards; the page time is measured per thread since its previous page"""
+        now = time.perf_counter()
+        last = getattr(self._local, 'last_page', None)
+        self._local.last_page = now
+        if last is not None:
+            self.observe('page.seconds', now - last)
+        self.incr('pages')
+        self.incr('cards', cards)
+        if driver is not None:
+            self.record_round_trips(driver)
+        if self.status_line:
+            logger.info(self.format_status())
+
+    def format_status(self) -> str:
+        """One line: pages, cards, rate, page time, round-trips and the p50 of each stage"""
+        with self._lock:
+            pages = self.counters.get('pages', 0)
+            cards = self.counters.get('cards', 0)
+            summaries = {name: histogram.to_dict() for name, histogram in self.histograms.items()}
+        elapsed = max(time.time() - self.started, 1e-9)
+
+        parts = [f"📈 {pages} pages", f"{cards} cards", f"{pages * 60 / elapsed:.1f} pages/min"]
+        if 'page.seconds' in summaries:
+            parts.append(f"p50 {summaries['page.seconds']['p50']:.1f}s/page")
+        if 'webdriver.round_trips_per_page' in summaries:
+            parts.append(f"{summaries['webdriver.round_trips_per_page']['mean']:.0f} round-trips/page")
+        stages = [f"{label} {summaries[name]['p50']:.2f}s" for name, label in STATUS_STAGES.items()
+                  if name in summaries]
+        if stages:
+            parts.append(" ".join(stages))
+        return " | ".join(parts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        finished = time.time()
+        with self._lock:
+            return {
+                'started_at': datetime.fromtimestamp(self.started).isoformat(),
+                'finished_at': datetime.fromtimestamp(finished).isoformat(),
+                'elapsed_seconds': finished - self.started,
+                'counters': dict(sorted(self.counters.items())),
+                'histograms': {name: histogram.to_dict() for name, histogram in sorted(self.histograms.items())},
+            }
+
+    def write_json(self, path: str) -> str:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def print_summary(self):
+        """Total and p50/p99 seconds per stage, largest total first"""
+        summaries = self.to_dict()['histograms']
+        if not summaries:
+            return
+        logger.info("📈 STAGE TIMINGS")
+        for name, summary in sorted(summaries.items(), key=lambda item: -item[1]['total']):
+            logger.info("   %-32s n=%-6s total %8.1f  p50 %.3f  p99 %.3f",
+                        name, summary['count'], summary['total'], summary['p50'], summary['p99'])
+
+
+# The current run's metrics; instrumented code looks it up on every call
+_metrics = RunMetrics()
+
+
+def get_metrics() -> RunMetrics:
+    return _metrics
+
+
+def reset_metrics(status_line: bool = False) -> RunMetrics:
+    """Start a new run's metrics and make them current"""
+    global _metrics
+    _metrics = RunMetrics(status_line=status_line)
+    return _metrics
+
+
+def timed(name: str):
+    """Decorator: observe each call's seconds under name and count calls that raise"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics = _metrics
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                metrics.incr(f"{name}.errors")
+                raise
+            finally:
+                metrics.observe(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+class _CountingProxy:
+    """Forwards everything to the wrapped object and counts the calls that reach the browser"""
+
+    def __init__(self, target, driver: "CountingDriver"):
+        object.__setattr__(self, '_target', target)
+        object.__setattr__(self, '_owner', driver)
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        owner = self._owner
+        if name in REMOTE_PROPERTIES:
+            owner.count_round_trip()
+            return value
+        if not callable(value) or name.startswith('_'):
+            return value
+
+        @functools.wraps(value)
+        def call(*args, **kwargs):
+            owner.count_round_trip()
+            return owner.wrap_result(value(*args, **kwargs))
+        return call
+
+    def __setattr__(self, name, value):
+        setattr(self._target, name, value)
+
+
+class CountingDriver(_CountingProxy):
+    """WebDriver wrapper that counts round-trips, including those made through the elements it returns"""
+
+    def __init__(self, driver, metrics: Optional[RunMetrics] = None):
+        super().__init__(driver, self)
+        object.__setattr__(self, 'round_trips', 0)
+        object.__setattr__(self, '_fixed_metrics', metrics)
+        object.__setattr__(self, '_count_lock', threading.Lock())
+
+    @property
+    def wrapped_driver(self):
+        return self._target
+
+    def count_round_trip(self):
+        with self._count_lock:
+            object.__setattr__(self, 'round_trips', self.round_trips + 1)
+        (self._fixed_metrics or _metrics).incr('webdriver.round_trips')
+
+    def wrap_result(self, result):
+        if isinstance(result, list):
+            return [self._wrap_element(item) for item in result]
+        return self._wrap_element(result)
+
+    def _wrap_element(self, item):
+        # WebElements are recognised by their remote id rather than by class
+        if hasattr(item, 'id') and hasattr(item, 'find_elements') and not isinstance(item, _CountingProxy):
+            return _CountingProxy(item, self)
+        return item
+
+
+def counting_driver(driver, enabled: bool = True):
+    """Wrap a driver in a CountingDriver unless counting is off or it is already wrapped"""
+    if driver is None or not enabled or isinstance(driver, CountingDriver):
+        return driver
+    return CountingDriver(driver)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+🧪 Legacy Field Patterns
+The per-field re.search extraction the single-pass card tokenizer replaced,
+and a synthetic card corpus; the reference both the tests and
+scripts/benchmark_patterns.py compare scan_card_text against
+"""
+
+import re
+import random
+
+CARD_TEMPLATE = (
+    "{name}\n{address}\nS$ {price:,}\nS$ {psf:,} psf\n{beds} Beds\n{baths} Baths\n{sqft:,} sqft\n"
+    "{land}{ptype} · {tenure} · Built: {built}\n{walk} min ({dist} m) from {code} {station} MRT Station\n"
+    "Listed on Jul {day}, 2025 ({ago} hours ago)\nListed by {agent}\n"
+)
+NAMES = ["The Sail @ Marina Bay", "212 Jurong East Street 21", "Seletar Hills Estate", "Parc Esta", "Treasure At Tampines"]
+STATIONS = [("NE11", "Woodleigh"), ("EW23", "Clementi"), ("DT17", "Downtown"), ("CC15", "Bishan"), ("NS16", "Ang Mo Kio")]
+
+
+def build_corpus(size: int, seed: int = 7):
+    """Generate realistic card texts"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        code, station = rng.choice(STATIONS)
+        sqft = rng.randint(400, 4000)
+        corpus.append(CARD_TEMPLATE.format(
+            name=rng.choice(NAMES),
+            address=f"{rng.randint(1, 999)} Sample Road {rng.randint(100000, 829999)}",
+            price=rng.randint(300_000, 9_000_000),
+            psf=rng.randint(400, 3500),
+            beds=rng.randint(1, 6),
+            baths=rng.randint(1, 5),
+            sqft=sqft,
+            land=f"{sqft + rng.randint(100, 900):,} sqft (land)\n" if rng.random() < 0.2 else "",
+            ptype=rng.choice(["Condominium", "HDB Flat", "Terraced House"]),
+            tenure=rng.choice(["Freehold", "99-year Leasehold"]),
+            built=rng.randint(1975, 2024),
+            walk=rng.randint(1, 20),
+            dist=rng.randint(80, 1600),
+            code=code,
+            station=station,
+            day=rng.randint(1, 28),
+            ago=rng.randint(1, 23),
+            agent=rng.choice(["Jane Tan", "Marcus Lim", "Aisha Rahman"]),
+        ))
+    return corpus
+
+
+def legacy_scan(text: str):
+    """The previous approach: one inline re.search per field"""
+    tokens = {}
+    m = re.search(r'S\$\s*([\d,]+(?:\.\d+)?)', text)
+    if m:
+        tokens['price'] = m.group(1)
+    m = re.search(r'S\$\s*([\d,]+(?:\.\d+)?)\s*psf', text, re.IGNORECASE)
+    if m:
+        tokens['psf'] = m.group(1)
+    m = re.search(r'(\d+)\s*Bed', text, re.IGNORECASE)
+    if m:
+        tokens['bedrooms'] = m.group(1)
+    m = re.search(r'(\d+)\s*Bath', text, re.IGNORECASE)
+    if m:
+        tokens['bathrooms'] = m.group(1)
+    m = re.search(r'([\d,]+)\s*sqft', text, re.IGNORECASE)
+    if m:
+        tokens['floor_area'] = m.group(1)
+    m = re.search(r'([\d,]+)\s*sqft\s*\(land\)', text, re.IGNORECASE)
+    if m:
+        tokens['land_area'] = m.group(1)
+    m = re.search(r'Built:\s*(\d{4})', text)
+    if m:
+        tokens['built_year'] = m.group(1)
+    m = re.search(r'New Project:\s*(\d{4})', text)
+    if m:
+        tokens['completion_year'] = m.group(1)
+    m = re.search(r'Listed on\s*([^(]+)\s*\(([^)]+)\)', text)
+    if m:
+        tokens['listed'] = m.groups()
+    m = re.search(r'(\d+)\s*min\s*\(([^)]+)\)\s*from\s*([A-Z0-9]+)\s*([^MRT\n]*)\s*MRT Station', text, re.IGNORECASE)
+    if m:
+        tokens['mrt'] = m.groups()
+    return tokens
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+🧪 Batch Converter Tests
+Checks the process-pool converter keeps order and matches the single-record path
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from schemas.batch_converter import BatchConverter
+from schemas.pure_data_schema import PureDataSchema
+from storage.jsonl_sink import CorruptRecordError, JsonlSink, iter_records
+
+
+def technical_record(i):
+    return {
+        "property_name": f"Listing {i}",
+        "price": 300000 + i * 997,
+        "price_per_sqft": 400 + i % 1800,
+        "bedrooms": 1 + i % 5,
+        "floor_area_sqft": 400 + i % 2500,
+        "property_type": "Condominium",
+        "built_year": 1980 + i % 44,
+        "mrt_station": "Clementi",
+        "mrt_distance": f"{1 + i % 20} min (300 m)",
+        "mrt_line": "EW23",
+        "image_count": i % 20,
+        "listing_url": f"https://www.propertyguru.com.sg/listing/{i}",
+    }
+
+
+def without_timestamp(record):
+    record = dict(record)
+    record.pop("extraction_timestamp", None)
+    return record
+
+
+class TestBatchConverter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.tmp.name, 'extraction.jsonl')
+        self.records = [technical_record(i) for i in range(1200)]
+        self.records[7] = {"property_name": "No price"}
+        with JsonlSink(self.input) as sink:
+            sink.write_page(self.records)
+        with open(self.input, 'a', encoding='utf-8') as f:
+            f.write('{"property_name": "trunc')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_parallel_output_matches_serial_schema(self):
+        output = os.path.join(self.tmp.name, 'pure.jsonl')
+        stats = BatchConverter(workers=2, batch_size=100).convert_file(self.input, output)
+
+        self.assertEqual(stats['processed'], 1201)
+        self.assertEqual(stats['converted'], 1199)
+        self.assertEqual(stats['skipped'], 1)
+        self.assertEqual(stats['invalid'], 1)
+        self.assertGreater(stats['records_per_sec'], 0)
+
+        expected = [PureDataSchema.create_property_record(r) for r in self.records]
+        expected = [without_timestamp(r) for r in expected if r]
+        self.assertEqual([without_timestamp(r) for r in iter_records(output)], expected)
+
+    def test_in_process_mode(self):
+        output = os.path.join(self.tmp.name, 'pure_serial.jsonl')
+        stats = BatchConverter(workers=1, batch_size=500).convert_file(self.input, output)
+        self.assertEqual(stats['converted'], 1199)
+        self.assertEqual(next(iter_records(output))['property_name'], "Listing 0")
+
+    def test_corrupt_middle_line_raises(self):
+        """Like iter_records, only a truncated last line is tolerated"""
+        with open(self.input, 'a', encoding='utf-8') as f:
+            f.write('\n{"property_name": "after the bad line"}\n')
+        for workers, batch_size in ((2, 100), (1, 5000)):
+            with self.subTest(workers=workers):
+                with self.assertRaises(CorruptRecordError):
+                    BatchConverter(workers=workers, batch_size=batch_size).convert_file(
+                        self.input, os.path.join(self.tmp.name, f'pure_{workers}.jsonl'))
+        with self.assertRaises(CorruptRecordError):
+            list(iter_records(self.input))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+🧪 Extraction Benchmark Tests
+Checks the replay corpus, the per-path report and baseline regression detection
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from benchmark_extraction import (
+    EXTRACTION_PATHS, build_corpus, find_regressions, percentile, run_benchmark, save_report
+)
+from storage.snapshot_archive import SnapshotArchive
+
+FIXTURE_PAGE = os.path.join(os.path.dirname(__file__), 'fixtures', 'search_results_page.html')
+
+
+class TestBenchmarkExtraction(unittest.TestCase):
+
+    def test_corpus_copies_get_distinct_listings(self):
+        corpus = build_corpus(copies=2)
+        self.assertEqual(len(corpus), 2)
+        # Four cards on the page, one a duplicate listing
+        self.assertEqual(len(corpus[0]['cards']), 4)
+        self.assertNotEqual(corpus[0]['html'], corpus[1]['html'])
+        self.assertIn("S$", corpus[0]['body_text'])
+
+    def test_corpus_from_archive(self):
+        with open(FIXTURE_PAGE, 'r', encoding='utf-8') as f:
+            html = f.read()
+        with tempfile.TemporaryDirectory() as tmp:
+            with SnapshotArchive(tmp) as archive:
+                archive.add_page("https://www.propertyguru.com.sg/property-for-sale/2", 2, html)
+            corpus = build_corpus(archive_dirs=[tmp])
+        self.assertEqual([page['url'] for page in corpus], ["https://www.propertyguru.com.sg/property-for-sale/2"])
+
+    def test_report_covers_every_path(self):
+        report = run_benchmark(build_corpus(copies=2), rounds=1)
+        self.assertEqual(set(report['paths']), set(EXTRACTION_PATHS))
+        for name, result in report['paths'].items():
+            self.assertEqual(result['pages'], 2)
+            self.assertGreater(result['cards'], 0, name)
+            self.assertGreater(result['cards_per_sec'], 0, name)
+            self.assertLessEqual(result['p50_ms'], result['p99_ms'])
+            self.assertGreater(result['peak_kb'], 0, name)
+
+    def test_regressions_past_threshold(self):
+        baseline = {'paths': {'page_text': {'cards_per_sec': 1000.0, 'p99_ms': 2.0, 'peak_kb': 100.0}}}
+        report = {'paths': {'page_text': {'cards_per_sec': 850.0, 'p99_ms': 2.1, 'peak_kb': 100.0}}}
+        self.assertEqual(find_regressions(report, baseline, threshold=0.2), [])
+
+        report['paths']['page_text'].update(cards_per_sec=700.0, p99_ms=3.0)
+        regressions = find_regressions(report, baseline, threshold=0.2)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("page_text cards_per_sec"))
+
+    def test_baseline_round_trip(self):
+        report = run_benchmark(build_corpus(), paths=['page_text'], rounds=1)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'baselines', 'extraction.json')
+            save_report(report, path)
+            with open(path, 'r', encoding='utf-8') as f:
+                self.assertEqual(find_regressions(report, json.load(f)), [])
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([], 0.99), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+🧪 Bucket Table Tests
+Checks the bisect-based categories against the original if/elif ranges
+"""
+
+import os
+import sys
+import unittest
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from schemas.buckets import BucketTable, load_bucket_tables
+from schemas.pure_data_schema import PureDataSchema
+from utils.config_loader import load_config
+
+
+def legacy_price_range(price):
+    if price < 500000:
+        return "Under 500K"
+    elif price < 800000:
+        return "500K-800K"
+    elif price < 1200000:
+        return "800K-1.2M"
+    elif price < 2000000:
+        return "1.2M-2M"
+    elif price < 3000000:
+        return "2M-3M"
+    elif price < 5000000:
+        return "3M-5M"
+    return "Above 5M"
+
+
+def legacy_mrt_category(minutes):
+    if minutes <= 5:
+        return "0-5 min"
+    elif minutes <= 10:
+        return "6-10 min"
+    elif minutes <= 15:
+        return "11-15 min"
+    return "Above 15 min"
+
+
+def legacy_image_category(count):
+    if count >= 15:
+        return "15+ images"
+    elif count >= 8:
+        return "8-14 images"
+    elif count >= 3:
+        return "3-7 images"
+    return "1-2 images"
+
+
+class TestBucketTables(unittest.TestCase):
+
+    def setUp(self):
+        self.tables = load_bucket_tables(load_config())
+
+    def test_matches_legacy_ranges_at_boundaries(self):
+        for price in [0, 499999, 500000, 799999.5, 800000, 1200000, 2000000, 2999999, 3000000, 5000000, 9e9]:
+            self.assertEqual(self.tables["price_range"].lookup(price), legacy_price_range(price))
+        for minutes in range(0, 25):
+            self.assertEqual(self.tables["mrt_distance_category"].lookup(minutes), legacy_mrt_category(minutes))
+        for count in range(1, 30):
+            self.assertEqual(self.tables["image_category"].lookup(count), legacy_image_category(count))
+
+    def test_column_mode(self):
+        values = [450000, None, 800000, 6000000]
+        self.assertEqual(self.tables["price_range"].lookup_column(values),
+                         ["Under 500K", None, "800K-1.2M", "Above 5M"])
+
+    def test_config_override(self):
+        config = load_config()
+        config["buckets"]["psf_range"] = {"boundaries": [1000], "labels": ["Low", "High"]}
+        tables = load_bucket_tables(config)
+        self.assertEqual(tables["psf_range"].lookup(999), "Low")
+        self.assertEqual(tables["price_range"].lookup(1), "Under 500K")
+
+    def test_missing_table_is_rejected(self):
+        config = load_config()
+        del config["buckets"]["age_category"]
+        with self.assertRaises(ValueError):
+            load_bucket_tables(config)
+
+    def test_invalid_table(self):
+        with self.assertRaises(ValueError):
+            BucketTable("broken", [10, 5], ["a", "b", "c"])
+        with self.assertRaises(ValueError):
+            BucketTable("broken", [5], ["a"])
+
+    def test_batch_records_match_single_records(self):
+        batch = [
+            {"property_name": "A", "price": 718888, "price_per_sqft": 557, "bedrooms": 3, "floor_area_sqft": 1291,
+             "built_year": 2010, "mrt_station": "Clementi", "mrt_distance": "5 min (410 m)", "mrt_line": "EW23",
+             "image_count": 8},
+            {"property_name": "No price", "bedrooms": 2},
+            {"property_name": "B", "price": 5200000, "bedrooms": 4},
+        ]
+        single = [PureDataSchema.create_property_record(r) for r in batch]
+        batched = PureDataSchema.create_property_records(batch)
+
+        self.assertIsNone(batched[1])
+        for expected, actual in zip(single, batched):
+            if expected is None:
+                continue
+            expected.pop("extraction_timestamp")
+            actual.pop("extraction_timestamp")
+            self.assertEqual(list(actual.items()), list(expected.items()))
+        self.assertEqual(batched[0]["mrt_line_name"], "East West Line")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+🧪 Checkpoint / Resume Tests
+Interrupts a fake crawl and checks it picks up where it stopped
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scrapers.main_scraper import SmartPropertyScraper
+from scrapers.pure_data_scraper import PureDataScraper
+from storage.checkpoint import CheckpointManager, truncate_output
+from storage.dedup_index import DedupIndex
+from storage.jsonl_sink import JsonlSink, iter_records
+from utils.config_loader import PROJECT_ROOT, resolve_data_dir
+
+
+class FakeDriver:
+    current_url = "https://www.propertyguru.com.sg/property-for-sale?market=residential"
+
+
+class FakePagedScraper(SmartPropertyScraper):
+    """Serves canned pages instead of driving a browser"""
+
+    def __init__(self, pages, interrupt_on=None):
+        super().__init__()
+        self.driver = FakeDriver()
+        self.pages = pages
+        self.page = 1
+        self.interrupt_on = interrupt_on
+        self.extracted_pages = []
+
+    def human_delay(self, delay_type='action_delay'):
+        pass
+
+    def get_current_page_info(self):
+        return self.page, len(self.pages)
+
+    def extract_properties_smart(self):
+        if self.page == self.interrupt_on:
+            raise KeyboardInterrupt
+        self.extracted_pages.append(self.page)
+        return self.pages[self.page - 1]
+
+    def get_next_page_url(self):
+        return f"https://www.propertyguru.com.sg/property-for-sale/{self.page + 1}?market=residential"
+
+    def click_next_page(self, next_url=None):
+        self.page += 1
+        self.driver.current_url = next_url
+        return True
+
+
+def listing(listing_id):
+    return {"property_name": f"Listing {listing_id}", "price": 1000000, "bedrooms": 3,
+            "listing_url": f"https://www.propertyguru.com.sg/listing/{listing_id}"}
+
+
+PAGES = [
+    [listing(1), listing(2)],
+    [listing(3), listing(2)],   # listing 2 re-appears on the next page
+    [listing(4)],
+    [listing(5)],
+]
+
+
+class PeriodicCheckpoint(CheckpointManager):
+    """Keeps only the periodic saves, as if the process died before its final checkpoint"""
+
+    def save(self, state):
+        if state.get('status') != 'running':
+            return False
+        return super().save(state)
+
+
+class TestCheckpointResume(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.tmp.name, 'extraction.jsonl')
+        self.checkpoint = CheckpointManager(os.path.join(self.tmp.name, 'checkpoint.json'),
+                                            checkpoint_interval=1, backup_interval=2)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_interrupt_then_resume(self):
+        """Pages done before the interrupt are neither fetched nor written twice"""
+        scraper = FakePagedScraper(PAGES, interrupt_on=3)
+        with JsonlSink(self.output) as sink:
+            scraper.scrape_multiple_pages(max_pages=4, sink=sink, checkpoint=self.checkpoint)
+
+        state = self.checkpoint.load()
+        self.assertEqual(state['status'], 'interrupted')
+        self.assertEqual(state['last_completed_page'], 2)
+        self.assertEqual(state['next_page'], 3)
+        self.assertTrue(state['next_url'].endswith('/property-for-sale/3?market=residential'))
+        self.assertTrue(os.path.exists(self.checkpoint.backup_path))
+
+        # Simulate a half-written page after the checkpoint
+        with open(self.output, 'a', encoding='utf-8') as f:
+            f.write('{"property_name": "partial"}\n')
+        truncate_output(self.output, state['output_offset'])
+
+        resumed = FakePagedScraper(PAGES)
+        resumed.page = state['next_page']
+        with JsonlSink(state['output_file']) as sink:
+            resumed.scrape_multiple_pages(max_pages=4, sink=sink, checkpoint=self.checkpoint,
+                                          resume_state=state)
+
+        self.assertEqual(resumed.extracted_pages, [3, 4])
+        self.assertEqual(resumed.crawl_state['status'], 'complete')
+        names = [r['property_name'] for r in iter_records(self.output)]
+        self.assertEqual(names, [f"Listing {i}" for i in range(1, 6)])
+
+    def test_pages_after_checkpoint_stay_new_on_resume(self):
+        """An unfinished run does not add its uncheckpointed pages to the dedup history"""
+        pure = PureDataScraper()
+        pure.dedup_index_path = os.path.join(self.tmp.name, 'dedup_index.bin')
+        checkpoint = PeriodicCheckpoint(os.path.join(self.tmp.name, 'periodic.json'), checkpoint_interval=2)
+
+        scraper = pure.scraper = FakePagedScraper(PAGES, interrupt_on=4)
+        scraper.skip_known_listings = True
+        scraper.dedup_index = DedupIndex(pure.dedup_index_path)
+        with JsonlSink(self.output) as sink:
+            scraper.scrape_multiple_pages(max_pages=4, sink=sink, checkpoint=checkpoint)
+        self.assertFalse(pure._save_dedup_index(scraper.crawl_state))
+
+        # Page 3 was written after the last checkpoint and is crawled again
+        state = checkpoint.load()
+        self.assertEqual(state['next_page'], 3)
+        truncate_output(self.output, state['output_offset'])
+        resumed = pure.scraper = FakePagedScraper(PAGES)
+        resumed.page = state['next_page']
+        resumed.skip_known_listings = True
+        resumed.dedup_index = DedupIndex(pure.dedup_index_path)
+        with JsonlSink(state['output_file']) as sink:
+            resumed.scrape_multiple_pages(max_pages=4, sink=sink, checkpoint=checkpoint, resume_state=state)
+        self.assertTrue(pure._save_dedup_index(resumed.crawl_state))
+
+        names = [r['property_name'] for r in iter_records(self.output)]
+        self.assertEqual(names, [f"Listing {i}" for i in range(1, 6)])
+        self.assertIn(listing(4), DedupIndex(pure.dedup_index_path))
+
+    def test_checkpoint_covering_max_pages_skips_the_crawl(self):
+        """A resume that has nothing left to fetch finishes the existing output without a browser"""
+        with JsonlSink(self.output) as sink:
+            sink.write_page([listing(1), listing(2)])
+            offset = sink.tell()
+        pure = PureDataScraper()
+        pure.checkpoint = self.checkpoint
+        pure.dedup_index_path = os.path.join(self.tmp.name, 'dedup_index.bin')
+        self.checkpoint.save({'status': 'interrupted', 'output_file': self.output, 'output_offset': offset,
+                              'next_page': 3, 'last_completed_page': 2, 'records_written': 2,
+                              'seen_fingerprints': DedupIndex().run_fingerprints()})
+        finished = []
+        pure._connect_to_existing_chrome = lambda: self.fail("connected to Chrome")
+        pure._finish_output = lambda filename, pure_data_file=None: finished.append(filename) or True
+
+        self.assertTrue(pure.start_pure_data_collection(max_pages=2))
+        self.assertEqual(finished, [self.output])
+        self.assertIsNone(self.checkpoint.load())
+
+    def test_checkpoint_interval(self):
+        manager = CheckpointManager(os.path.join(self.tmp.name, 'cp.json'), checkpoint_interval=50)
+        self.assertFalse(manager.should_save(49))
+        self.assertTrue(manager.should_save(50))
+
+    def test_corrupt_checkpoint_falls_back_to_backup(self):
+        self.checkpoint.save({'pages_completed': 2, 'next_page': 3})
+        with open(self.checkpoint.path, 'w', encoding='utf-8') as f:
+            f.write('{"pages_comp')
+        self.assertEqual(self.checkpoint.load()['next_page'], 3)
+
+        self.checkpoint.clear()
+        self.assertIsNone(self.checkpoint.load())
+
+
+class TestDataDir(unittest.TestCase):
+
+    def test_relative_data_dir_is_under_project_root(self):
+        self.assertEqual(resolve_data_dir({'output': {'data_dir': 'data'}}),
+                         os.path.normpath(os.path.join(PROJECT_ROOT, 'data')))
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(resolve_data_dir({'output': {'data_dir': tmp}}), tmp)
+
+    def test_checkpoint_and_outputs_share_one_directory(self):
+        scraper = PureDataScraper()
+        self.assertEqual(scraper.data_dir, scraper.scraper.data_dir)
+        self.assertEqual(os.path.dirname(scraper.checkpoint.path), scraper.data_dir)
+        if scraper.dedup_index_path:
+            self.assertEqual(os.path.dirname(scraper.dedup_index_path), scraper.data_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+🧪 Columnar Export Tests
+Checks the config-derived column schema and, when pyarrow is installed, the files written
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from schemas.pure_data_schema import PureDataSchema
+from storage.columnar_export import ColumnSpec, ColumnarWriter, columnar_available, load_columns
+from utils.config_loader import load_config
+
+TECHNICAL_RECORD = {
+    "property_name": "212 Jurong East Street 21",
+    "price": 718888,
+    "price_per_sqft": 557.0,
+    "bedrooms": 3,
+    "bathrooms": 2,
+    "floor_area_sqft": 1291,
+    "property_type": "HDB Flat",
+    "tenure": "99-year Leasehold",
+    "built_year": 2010,
+    "mrt_station": "Clementi",
+    "mrt_distance": "5 min (410 m)",
+    "mrt_line": "EW23",
+    "agent_name": "Marcus Lim",
+    "listed_date": "Jul 12, 2025",
+    "image_count": 12,
+    "main_image_url": "https://sg1-cdn.pgimgs.com/listing/60013717/UPHO.1.jpg",
+    "listing_url": "https://www.propertyguru.com.sg/listing/hdb-for-sale-212-jurong-east-street-21-60013717",
+}
+
+
+class TestColumnSchema(unittest.TestCase):
+
+    def test_config_columns_cover_pure_record(self):
+        """Every field a full pure data record can carry has a column"""
+        columns = {column.name for column in load_columns(load_config())}
+        record = PureDataSchema.create_property_record(TECHNICAL_RECORD)
+        self.assertEqual(set(record) - columns, set())
+
+    def test_required_fields_not_nullable(self):
+        columns = {column.name: column for column in load_columns(load_config())}
+        self.assertFalse(columns["price_numeric"].nullable)
+        self.assertTrue(columns["district_code"].nullable)
+        # The schema stores "" when no type was detected, which is written as null
+        self.assertTrue(columns["property_type"].nullable)
+        self.assertTrue(columns["price_range"].dictionary)
+        self.assertTrue(columns["mrt_line_name"].dictionary)
+
+    def test_config_without_columns_is_rejected(self):
+        with self.assertRaises(ValueError):
+            load_columns({"schema": {"version": "pure_data_v1.0"}})
+
+    def test_coerce(self):
+        self.assertEqual(ColumnSpec("a", "int64").coerce("1,291"), 1291)
+        self.assertIsNone(ColumnSpec("a", "int64").coerce("n/a"))
+        self.assertEqual(ColumnSpec("a", "float64").coerce(557), 557.0)
+        self.assertEqual(ColumnSpec("a", "timestamp").coerce("2025-07-15T17:34:42").hour, 17)
+        with self.assertRaises(ValueError):
+            ColumnSpec("a", "decimal")
+
+
+@unittest.skipUnless(columnar_available(), "pyarrow not installed")
+class TestColumnarWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        record = PureDataSchema.create_property_record(TECHNICAL_RECORD)
+        self.records = [dict(record, price_numeric=record["price_numeric"] + i) for i in range(25)]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_parquet_row_groups(self):
+        import pyarrow.parquet as pq
+        path = os.path.join(self.tmp.name, 'pure.parquet')
+        with ColumnarWriter(path, row_group_size=10) as writer:
+            writer.write_batch(self.records)
+
+        parquet = pq.ParquetFile(path)
+        self.assertEqual(parquet.metadata.num_row_groups, 3)
+        table = parquet.read()
+        self.assertEqual(table.num_rows, 25)
+        self.assertEqual(str(table.schema.field("price_range").type), "dictionary<values=string, indices=int32, ordered=0>")
+        self.assertEqual(table.column("price_numeric").to_pylist()[-1], 718888 + 24)
+
+    def test_arrow_ipc(self):
+        import pyarrow as pa
+        path = os.path.join(self.tmp.name, 'pure.arrow')
+        with ColumnarWriter(path, row_group_size=10) as writer:
+            writer.write_batch(self.records)
+        with pa.memory_map(path) as source:
+            table = pa.ipc.open_file(source).read_all()
+        self.assertEqual(table.num_rows, 25)
+        self.assertEqual(table.column("district_code").to_pylist()[0], "D22")
+
+    def test_record_without_property_type(self):
+        import pyarrow.parquet as pq
+        untyped = PureDataSchema.create_property_record(dict(TECHNICAL_RECORD, property_type=""))
+        self.assertEqual(untyped["property_type"], "")
+        nameless = dict(untyped, property_name="")
+        path = os.path.join(self.tmp.name, 'pure.parquet')
+        with ColumnarWriter(path) as writer:
+            writer.write_batch([untyped, nameless] + self.records)
+
+        table = pq.read_table(path)
+        self.assertEqual(table.num_rows, 26)
+        self.assertIsNone(table.column("property_type").to_pylist()[0])
+        self.assertEqual(writer.records_dropped, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+🧪 Crawl Planner Tests
+Checks district search URLs, shard sizing and a sharded worker pool run against a local server
+"""
+
+import os
+import re
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scrapers.crawl_planner import CrawlPlanner, estimate_pages
+from scrapers.page_planner import ALL_DISTRICTS_URL, DISTRICT_LABELS, build_search_url, page_from_url
+from scrapers.rate_scheduler import RequestScheduler
+from scrapers.worker_pool import WorkerPool
+from storage.dedup_index import DedupIndex
+from storage.jsonl_sink import JsonlSink, iter_records
+from utils.metrics import reset_metrics
+from test_worker_pool import FIXTURE_PAGE, HttpPageDriver
+
+# The all-districts search the scrapers used to hardcode
+LEGACY_ALL_DISTRICTS_URL = (
+    "https://www.propertyguru.com.sg/property-for-sale?freetext=D01+Boat+Quay+%2F+Raffles+Place+%2F+Marina%2C+"
+    "D02+Chinatown+%2F+Tanjong+Pagar%2C+D03+Alexandra+%2F+Commonwealth%2C+D04+Harbourfront+%2F+Telok+Blangah%2C+"
+    "D05+Buona+Vista+%2F+West+Coast+%2F+Clementi+New+Town%2C+D06+City+Hall+%2F+Clarke+Quay%2C+"
+    "D07+Beach+Road+%2F+Bugis+%2F+Rochor%2C+D08+Farrer+Park+%2F+Serangoon+Rd%2C+D09+Orchard+%2F+River+Valley%2C+"
+    "D10+Tanglin+%2F+Holland+%2F+Bukit+Timah%2C+D11+Newton+%2F+Novena%2C+D21+Clementi+Park+%2F+Upper+Bukit+Timah%2C+"
+    "D12+Balestier+%2F+Toa+Payoh%2C+D13+Macpherson+%2F+Potong+Pasir%2C+D14+Eunos+%2F+Geylang+%2F+Paya+Lebar%2C+"
+    "D15+East+Coast+%2F+Marine+Parade%2C+D16+Bedok+%2F+Upper+East+Coast%2C+D17+Changi+Airport+%2F+Changi+Village%2C+"
+    "D18+Pasir+Ris+%2F+Tampines%2C+D19+Hougang+%2F+Punggol+%2F+Sengkang%2C+D20+Ang+Mo+Kio+%2F+Bishan+%2F+Thomson%2C+"
+    "D22+Boon+Lay+%2F+Jurong+%2F+Tuas%2C+D23+Dairy+Farm+%2F+Bukit+Panjang+%2F+Choa+Chu+Kang%2C+"
+    "D24+Lim+Chu+Kang+%2F+Tengah%2C+D25+Admiralty+%2F+Woodlands%2C+D26+Mandai+%2F+Upper+Thomson%2C+"
+    "D27+Sembawang+%2F+Yishun%2C+D28+Seletar+%2F+Yio+Chu+Kang&districtCode=D01&districtCode=D02&districtCode=D03&"
+    "districtCode=D04&districtCode=D05&districtCode=D06&districtCode=D07&districtCode=D08&districtCode=D09&"
+    "districtCode=D10&districtCode=D11&districtCode=D21&districtCode=D12&districtCode=D13&districtCode=D14&"
+    "districtCode=D15&districtCode=D16&districtCode=D17&districtCode=D18&districtCode=D19&districtCode=D20&"
+    "districtCode=D22&districtCode=D23&districtCode=D24&districtCode=D25&districtCode=D26&districtCode=D27&"
+    "districtCode=D28&isCommercial=false"
+)
+
+# Result counts the local server reports per district; 20 listings per page
+DISTRICT_RESULTS = {"D01": 45, "D02": 12, "D03": 0}
+
+
+class DistrictPagesHandler(BaseHTTPRequestHandler):
+    """Serves the recorded page for a district search, with its own "N Properties" heading"""
+
+    recorded_page = ""
+    requests = []
+
+    def do_GET(self):
+        district = parse_qs(urlsplit(self.path).query).get('districtCode', [''])[0]
+        page = page_from_url(self.path)
+        type(self).requests.append((district, page))
+        results = DISTRICT_RESULTS.get(district, 0)
+        if page is None or page > estimate_pages(results) or not results:
+            body = "<html><head><title>No results</title></head><body><h1>0 Properties for Sale</h1></body></html>"
+        else:
+            body = self.recorded_page.replace("52,147 Properties", f"{results} Properties")
+            body = re.sub(r'-(\d{8})"', lambda m: f'-{district[1:]}{page:02d}{m.group(1)}"', body)
+        data = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestSearchUrls(unittest.TestCase):
+
+    def test_all_districts_url_matches_legacy_search(self):
+        self.assertEqual(ALL_DISTRICTS_URL, LEGACY_ALL_DISTRICTS_URL)
+        self.assertEqual(len(DISTRICT_LABELS), 28)
+
+    def test_single_district_with_property_type(self):
+        url = build_search_url(["D09"], {"propertyTypeGroup": "N"})
+        query = parse_qs(urlsplit(url).query)
+        self.assertEqual(query['districtCode'], ["D09"])
+        self.assertEqual(query['freetext'], ["D09 Orchard / River Valley"])
+        self.assertEqual(query['propertyTypeGroup'], ["N"])
+        self.assertEqual(query['isCommercial'], ["false"])
+
+
+class TestCrawlPlanner(unittest.TestCase):
+
+    def test_plans_district_by_property_type(self):
+        planner = CrawlPlanner({"crawl_plan": {"districts": ["D01", "D19"],
+                                               "property_types": {"hdb": {"propertyTypeGroup": "H"},
+                                                                  "condo": {"propertyTypeGroup": "N"}}}})
+        shards = planner.plan()
+        self.assertEqual([shard.label for shard in shards], ["D01 hdb", "D01 condo", "D19 hdb", "D19 condo"])
+        self.assertEqual(len({shard.search_url for shard in shards}), 4)
+        self.assertEqual(len(CrawlPlanner({"crawl_plan": {"property_types": {}}}).plan()), 28)
+
+    def test_unknown_district_is_rejected(self):
+        with self.assertRaises(ValueError):
+            CrawlPlanner({"crawl_plan": {"districts": ["D29"]}})
+
+    def test_expand_from_result_count(self):
+        planner = CrawlPlanner({"crawl_plan": {"districts": ["D10"], "property_types": {},
+                                               "max_pages_per_shard": 50},
+                                "workers": {"chunk_size": 4}})
+        probe = planner.initial_ranges(planner.plan())[0]
+        self.assertEqual((probe.first_page, probe.last_page), (1, 1))
+
+        ranges = planner.expand(probe, 201)
+        self.assertEqual(probe.shard.estimated_pages, 11)
+        self.assertEqual([(r.first_page, r.last_page) for r in ranges], [(2, 5), (6, 9), (10, 11)])
+        self.assertEqual(planner.expand(probe, 15), [])
+        self.assertEqual(planner.truncated_shards, [])
+        self.assertEqual(planner.expand(probe, 52147)[-1].last_page, 50)
+        self.assertEqual(planner.expand(probe, None)[-1].last_page, 50)
+
+    def test_capped_shard_is_recorded(self):
+        metrics = reset_metrics()
+        planner = CrawlPlanner({"crawl_plan": {"districts": ["D10"], "max_pages_per_shard": 50}})
+        probe = planner.initial_ranges(planner.plan())[0]
+        planner.expand(probe, 52147)
+        planner.expand(probe, 52147)
+
+        self.assertEqual(planner.truncated_shards, [probe.shard])
+        self.assertEqual((probe.shard.estimated_pages, probe.shard.needed_pages), (50, 2608))
+        self.assertEqual(metrics.counters['crawl_plan.truncated_shards'], 1)
+
+    def test_default_plan_covers_every_property_type(self):
+        shards = CrawlPlanner().plan()
+        self.assertEqual(len(shards), 28)
+        self.assertNotIn('propertyTypeGroup', parse_qs(urlsplit(shards[0].search_url).query))
+
+
+class TestShardedPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(FIXTURE_PAGE, 'r', encoding='utf-8') as f:
+            DistrictPagesHandler.recorded_page = f.read().replace(
+                'href="/listing/', 'href="https://www.propertyguru.com.sg/listing/')
+        cls.server = HTTPServer(('127.0.0.1', 0), DistrictPagesHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_shards_are_sized_and_crawled_independently(self):
+        DistrictPagesHandler.requests = []
+        planner = CrawlPlanner({"crawl_plan": {"districts": list(DISTRICT_RESULTS), "property_types": {}},
+                                "workers": {"chunk_size": 1}},
+                               base_url=f"http://127.0.0.1:{self.server.server_port}/property-for-sale")
+        shards = planner.plan()
+        scheduler = RequestScheduler(max_requests_per_minute=60000, target_requests_per_minute=60000)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'extraction.jsonl')
+            with JsonlSink(path) as sink:
+                pool = WorkerPool([HttpPageDriver, HttpPageDriver], sink=sink, scheduler=scheduler,
+                                  dedup_index=DedupIndex(), on_result_count=planner.expand)
+                stats = pool.run(planner.initial_ranges(shards))
+            records = list(iter_records(path))
+
+        self.assertEqual({shard.district: shard.result_count for shard in shards}, DISTRICT_RESULTS)
+        self.assertEqual({shard.district: shard.estimated_pages for shard in shards}, {"D01": 3, "D02": 1, "D03": 1})
+        # Only the pages each count calls for are requested
+        self.assertEqual(sorted(DistrictPagesHandler.requests),
+                         [("D01", 1), ("D01", 2), ("D01", 3), ("D02", 1), ("D03", 1)])
+        self.assertEqual(stats['ranges_added'], 2)
+        # 3 unique listings per recorded page
+        self.assertEqual(len(records), 4 * 3)
+        self.assertEqual(len({r['listing_url'] for r in records}), 4 * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+🧪 Dedup Index Tests
+Checks fingerprinting, in-run duplicates and listings remembered across runs
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from storage.dedup_index import (
+    DedupIndex, BloomFilter, fingerprint, fingerprint_key, NEW, DUPLICATE, KNOWN, MIN_BLOOM_BITS
+)
+
+
+def listing(listing_id, price=500000):
+    return {
+        "property_name": f"Listing {listing_id}",
+        "price": f"S$ {price:,}",
+        "bedrooms": "3",
+        "listing_url": f"https://www.propertyguru.com.sg/listing/hdb-for-sale-block-{listing_id}",
+    }
+
+
+class TestFingerprint(unittest.TestCase):
+
+    def test_listing_id_ignores_slug_and_query(self):
+        a = {"listing_url": "https://www.propertyguru.com.sg/listing/hdb-for-sale-block-123-25123456"}
+        b = {"listing_url": "https://www.propertyguru.com.sg/listing/25123456?utm_source=feed"}
+        self.assertEqual(fingerprint_key(a), "id:25123456")
+        self.assertEqual(fingerprint(a), fingerprint(b))
+
+    def test_content_fallback_normalizes_whitespace(self):
+        a = {"property_name": "The  Sail @ Marina", "price": "S$ 1,200,000", "bedrooms": "2"}
+        b = {"property_name": "the sail @ marina ", "price": "S$ 1,200,000", "bedrooms": "2"}
+        self.assertTrue(fingerprint_key(a).startswith("content:"))
+        self.assertEqual(fingerprint(a), fingerprint(b))
+        self.assertNotEqual(fingerprint(a), fingerprint(dict(b, bedrooms="3")))
+
+    def test_text_fallback_records_keep_name_and_area(self):
+        """Records from the page-text fallback use name/area; same price and bedrooms is not a duplicate"""
+        a = {"name": "Marina One Residences", "price": 1500000, "bedrooms": 2, "area": 818}
+        b = {"name": "Martin Modern", "price": 1500000, "bedrooms": 2, "area": 775}
+        self.assertEqual(fingerprint_key(a), "content:marina one residences|1500000|2|818")
+        index = DedupIndex()
+        self.assertEqual([index.check_and_add(a), index.check_and_add(b)], [NEW, NEW])
+        self.assertEqual(index.check_and_add(dict(a)), DUPLICATE)
+
+    def test_pure_records_use_property_url(self):
+        record = {"property_url": "https://www.propertyguru.com.sg/listing/for-sale-25123456"}
+        self.assertEqual(fingerprint_key(record), "id:25123456")
+
+
+class TestDedupIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'dedup_index.bin')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_duplicates_within_run(self):
+        index = DedupIndex()
+        self.assertEqual(index.check_and_add(listing(25000001)), NEW)
+        self.assertEqual(index.check_and_add(listing(25000001)), DUPLICATE)
+        self.assertEqual(index.stats, {NEW: 1, DUPLICATE: 1, KNOWN: 0})
+        self.assertFalse(index.save())
+
+    def test_known_across_runs(self):
+        first = DedupIndex(self.path)
+        for i in range(100):
+            first.check_and_add(listing(25000000 + i))
+        self.assertTrue(first.save())
+
+        second = DedupIndex(self.path)
+        self.assertEqual(len(second.history), 100)
+        self.assertEqual(second.check_and_add(listing(25000005)), KNOWN)
+        self.assertEqual(second.check_and_add(listing(25000005)), DUPLICATE)
+        self.assertEqual(second.check_and_add(listing(25999999)), NEW)
+        self.assertIn(listing(25000050), second)
+        self.assertNotIn(listing(26000000), second)
+
+        second.save()
+        third = DedupIndex(self.path)
+        self.assertEqual(len(third.history), 101)
+        self.assertEqual(list(third.history), sorted(third.history))
+
+    def test_restore_run_from_checkpoint(self):
+        index = DedupIndex()
+        index.check_and_add(listing(25000001))
+        saved = index.run_fingerprints()
+
+        resumed = DedupIndex()
+        resumed.restore_run(saved)
+        self.assertEqual(resumed.check_and_add(listing(25000001)), DUPLICATE)
+
+    def test_bloom_grows_with_history(self):
+        index = DedupIndex(self.path)
+        count = MIN_BLOOM_BITS // 10 + 1000
+        index.restore_run(range(1, count + 1))
+        index.save()
+        self.assertGreater(index.bloom.bits, MIN_BLOOM_BITS)
+
+        reloaded = DedupIndex(self.path)
+        self.assertEqual(reloaded.bloom.bits, index.bloom.bits)
+        self.assertTrue(all(fp in reloaded.bloom for fp in range(1, count + 1, 97)))
+
+    def test_corrupt_file_starts_empty(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not an index')
+        index = DedupIndex(self.path)
+        self.assertEqual(len(index.history), 0)
+        self.assertEqual(index.check_and_add(listing(25000001)), NEW)
+
+
+class TestBloomFilter(unittest.TestCase):
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(1 << 12)
+        values = [fingerprint(listing(25000000 + i)) for i in range(200)]
+        for value in values:
+            bloom.add(value)
+        self.assertTrue(all(value in bloom for value in values))
+
+
+if __name__ == '__main__':
+    unittest.main()
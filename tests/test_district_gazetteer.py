@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+🧪 District Gazetteer Tests
+Checks area, MRT station and postal sector resolution
+"""
+
+import os
+import sys
+import unittest
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from schemas.district_gazetteer import get_gazetteer, DISTRICT_AREAS, POSTAL_SECTOR_DISTRICTS
+from schemas.pure_data_schema import PureDataSchema
+from scrapers.page_planner import DISTRICT_LABELS
+
+
+class TestDistrictGazetteer(unittest.TestCase):
+
+    def setUp(self):
+        self.gazetteer = get_gazetteer()
+
+    def test_all_districts_covered(self):
+        self.assertEqual(sorted(DISTRICT_AREAS), [f"D{i:02d}" for i in range(1, 29)])
+        self.assertEqual(sorted(set(POSTAL_SECTOR_DISTRICTS.values())), [f"D{i:02d}" for i in range(1, 29)])
+
+    def test_filter_labels_resolve_to_their_district(self):
+        """Every name in the site's district filter labels is an area of that district"""
+        for code, label in DISTRICT_LABELS.items():
+            for name in label.split(" / "):
+                self.assertIn(name, DISTRICT_AREAS[code])
+
+    def test_area_names(self):
+        self.assertEqual(self.gazetteer.resolve("The Sail @ Marina Bay"), "D01")
+        self.assertEqual(self.gazetteer.resolve("212 Jurong East Street 21"), "D22")
+        self.assertEqual(self.gazetteer.resolve("Seletar Hills Estate"), "D28")
+
+    def test_longest_phrase_wins(self):
+        """Longer area names beat the shorter names they contain"""
+        self.assertEqual(self.gazetteer.resolve("Upper Bukit Timah View"), "D21")
+        self.assertEqual(self.gazetteer.resolve("Bukit Timah Plaza"), "D10")
+        self.assertEqual(self.gazetteer.resolve("Clementi Park"), "D21")
+        self.assertEqual(self.gazetteer.resolve("Upper Thomson Road"), "D26")
+
+    def test_whole_words_only(self):
+        self.assertIsNone(self.gazetteer.resolve("Tuasview Residences"))
+        self.assertIsNone(self.gazetteer.resolve("Dovertown"))
+
+    def test_mrt_station_and_postal_fallbacks(self):
+        self.assertEqual(self.gazetteer.resolve("Parc Esta", "Eunos "), "D14")
+        self.assertEqual(self.gazetteer.resolve("Sunshine Residences", "Botanic Gardens"), "D10")
+        self.assertEqual(self.gazetteer.resolve("Sunshine Residences", "", "238888"), "D09")
+        self.assertIsNone(self.gazetteer.resolve("Sunshine Residences", "", "2388"))
+
+    def test_schema_uses_gazetteer(self):
+        self.assertEqual(PureDataSchema._extract_district("Treasure At Tampines", "Clementi"), "D18")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+🧪 Page Fetcher Tests
+Fetches recorded result pages from a local keep-alive/gzip server with each backend
+"""
+
+import gzip
+import os
+import re
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from extractors.advanced_extractor import AdvancedPropertyExtractor
+from extractors.html_parser import HtmlPropertyParser
+from extractors.page_snapshot import PageSnapshot
+from scrapers.fetchers import HttpFetcher, ReplayFetcher, SeleniumFetcher
+from scrapers.main_scraper import SmartPropertyScraper
+from scrapers.page_planner import PageUrlPlanner, page_from_url
+from scrapers.pipeline import parse_page_snapshot
+from scrapers.rate_scheduler import RequestScheduler
+from scrapers.worker_pool import WorkerPool, split_page_ranges
+from test_worker_pool import FIXTURE_PAGE, HttpPageDriver
+
+LAST_PAGE = 3
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 server for recorded pages: gzip when asked, redirect past the last page, /blocked is a challenge"""
+
+    protocol_version = "HTTP/1.1"
+    recorded_page = ""
+    connections = set()
+    encodings = []
+
+    def do_GET(self):
+        type(self).connections.add(self.client_address)
+        if self.path.startswith("/blocked"):
+            self._send(200, "<html><head><title>Just a moment...</title></head><body></body></html>")
+            return
+        page = page_from_url(self.path)
+        if page is None:
+            self._send(404, "<html><head><title>Not found</title></head></html>")
+            return
+        if page > LAST_PAGE:
+            self.send_response(302)
+            self.send_header("Location", "/property-for-sale?isCommercial=false")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._send(200, re.sub(r'-(\d{8})"', lambda m: f'-{page:03d}{m.group(1)}"', self.recorded_page))
+
+    def _send(self, status, body):
+        data = body.encode('utf-8')
+        gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+        type(self).encodings.append('gzip' if gzipped else 'identity')
+        if gzipped:
+            data = gzip.compress(data)
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def fast_scheduler():
+    return RequestScheduler(max_requests_per_minute=60000, target_requests_per_minute=60000)
+
+
+class TestFetchers(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(FIXTURE_PAGE, 'r', encoding='utf-8') as f:
+            KeepAliveHandler.recorded_page = f.read().replace(
+                'href="/listing/', 'href="https://www.propertyguru.com.sg/listing/')
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+        cls.planner = PageUrlPlanner(f"{cls.base}/property-for-sale?isCommercial=false")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        KeepAliveHandler.connections = set()
+        KeepAliveHandler.encodings = []
+        self.extractor = AdvancedPropertyExtractor(driver=None)
+        self.html_parser = HtmlPropertyParser()
+
+    def parse(self, snapshot):
+        return parse_page_snapshot(snapshot, self.extractor, self.html_parser)
+
+    def test_http_fetcher_reuses_connection_with_gzip(self):
+        fetcher = HttpFetcher(scheduler=fast_scheduler())
+        try:
+            snapshots = [fetcher.fetch(self.planner.url_for(page), page) for page in (1, 2, 3)]
+        finally:
+            fetcher.close()
+
+        self.assertTrue(all(isinstance(snapshot, PageSnapshot) for snapshot in snapshots))
+        self.assertEqual([snapshot.page_number for snapshot in snapshots], [1, 2, 3])
+        self.assertEqual(len(self.parse(snapshots[1])), 3)
+        self.assertEqual(fetcher.result_count(snapshots[0]), 52147)
+        self.assertEqual(KeepAliveHandler.encodings, ['gzip'] * 3)
+        self.assertEqual(len(KeepAliveHandler.connections), 1)
+
+    def test_redirect_past_last_page_returns_none(self):
+        fetcher = HttpFetcher(scheduler=fast_scheduler())
+        self.assertIsNone(fetcher.fetch(self.planner.url_for(LAST_PAGE + 1), LAST_PAGE + 1))
+
+    def test_error_pages_raise_and_back_off(self):
+        scheduler = fast_scheduler()
+        fetcher = HttpFetcher(scheduler=scheduler)
+        with self.assertRaises(RuntimeError):
+            fetcher.fetch(f"{self.base}/blocked", 1)
+        with self.assertRaises(RuntimeError):
+            fetcher.fetch(f"{self.base}/missing", 1)
+        self.assertEqual(scheduler.stats['failures'], 2)
+
+    def test_same_snapshots_as_selenium_backend(self):
+        scraper = SmartPropertyScraper()
+        scraper.driver = HttpPageDriver()
+        scraper.scheduler = fast_scheduler()
+        browser = SeleniumFetcher(scraper)
+        http = HttpFetcher(scheduler=fast_scheduler())
+
+        url = self.planner.url_for(2)
+        from_browser = browser.fetch(url, 2)
+        from_http = http.fetch(url, 2)
+        self.assertIs(type(from_browser), type(from_http))
+        self.assertEqual(self.parse(from_browser), self.parse(from_http))
+        self.assertIsNone(browser.fetch(self.planner.url_for(LAST_PAGE + 1), LAST_PAGE + 1))
+
+    def test_record_and_replay(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            recorder = ReplayFetcher(tmp)
+            fetcher = HttpFetcher(scheduler=fast_scheduler(), recorder=recorder)
+            url = self.planner.url_for(2)
+            live = fetcher.fetch(url, 2)
+
+            replayed = ReplayFetcher(tmp).fetch(url, 2)
+            self.assertEqual(replayed.html, live.html)
+            self.assertEqual(self.parse(replayed), self.parse(live))
+            self.assertIsNone(recorder.fetch(self.planner.url_for(3), 3))
+
+    def test_pool_with_http_fetchers(self):
+        scheduler = fast_scheduler()
+        pool = WorkerPool([lambda: HttpFetcher(scheduler=scheduler)] * 2, scheduler=scheduler)
+        stats = pool.run(split_page_ranges(self.planner.url_for(1), 1, 6, chunk_size=2))
+        self.assertEqual(stats['records_written'], LAST_PAGE * 3)
+        self.assertEqual(pool.end_pages[self.planner.url_for(1)], LAST_PAGE + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
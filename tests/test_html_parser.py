@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+🧪 Offline HTML Parser Tests
+Parses a recorded result page without Chrome and checks the extracted fields
+"""
+
+import os
+import sys
+import unittest
+from urllib.parse import urljoin
+
+import lxml.html
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from extractors.advanced_extractor import AdvancedPropertyExtractor
+from extractors.card_snapshot import CardSnapshot, MIN_CARD_TEXT_LENGTH
+from extractors.html_parser import CARD_XPATHS, SUB_ELEMENT_XPATHS, HtmlPropertyParser, element_text
+from extractors.json_state_extractor import BASE_URL
+from extractors.selector_cache import SelectorCache, get_selector_cache, set_selector_cache
+
+FIXTURE_PAGE = os.path.join(os.path.dirname(__file__), 'fixtures', 'search_results_page.html')
+
+
+class FakeSnapshotDriver:
+    """Driver stand-in that answers the bulk snapshot script"""
+
+    def __init__(self, cards):
+        self.cards = cards
+        self.calls = 0
+
+    def execute_script(self, script, *args):
+        self.calls += 1
+        return {"selector": args[0][0], "cards": self.cards}
+
+
+class DomElement:
+    """WebElement stand-in over an lxml element; hrefs and srcs come back absolute like a browser's"""
+
+    def __init__(self, node):
+        self.node = node
+
+    @property
+    def text(self):
+        return element_text(self.node)
+
+    def find_elements(self, by, value):
+        return [DomElement(node) for node in self.node.iter(value)]
+
+    def find_element(self, by, value):
+        matches = self.node.xpath(SUB_ELEMENT_XPATHS[value])
+        if not matches:
+            raise Exception(f"no such element: {value}")
+        return DomElement(matches[0])
+
+    def get_attribute(self, name):
+        value = self.node.get(name)
+        return urljoin(BASE_URL, value) if value and name in ('href', 'src') else value
+
+
+class DomDriver:
+    """Driver over a parsed page answering both the bulk snapshot script and element lookups"""
+
+    def __init__(self, html):
+        self.document = lxml.html.fromstring(html)
+
+    def find_elements(self, by, value):
+        return [DomElement(node) for node in self.document.xpath(CARD_XPATHS[value])]
+
+    def execute_script(self, script, selectors, title_selectors, price_selectors, min_length):
+        """What CARD_SNAPSHOT_SCRIPT returns in the browser, built from the same elements"""
+        for selector in selectors:
+            cards = []
+            for element in self.find_elements(None, selector):
+                if len(element.text.strip()) <= min_length:
+                    continue
+                cards.append({
+                    "text": element.text,
+                    "links": [a.get_attribute('href') or "" for a in element.find_elements(None, 'a')],
+                    "image_srcs": [img.get_attribute('src') or "" for img in element.find_elements(None, 'img')],
+                    "outer_html": lxml.html.tostring(element.node, encoding='unicode', with_tail=False),
+                    "title_text": self._first_text(element, title_selectors),
+                    "price_text": self._first_text(element, price_selectors),
+                })
+            if cards:
+                return {"selector": selector, "cards": cards}
+        return {"selector": None, "cards": []}
+
+    @staticmethod
+    def _first_text(element, selectors):
+        for selector in selectors:
+            try:
+                text = element.find_element(None, selector).text.strip()
+            except Exception:
+                continue
+            if text:
+                return text
+        return ""
+
+
+class TestHtmlPropertyParser(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = HtmlPropertyParser()
+        self.properties = self.parser.parse_file(FIXTURE_PAGE)
+
+    def test_cards_extracted_and_deduplicated(self):
+        """Duplicate and tiny cards are dropped"""
+        names = [p["property_name"] for p in self.properties]
+        self.assertEqual(names, ["The Sail @ Marina Bay", "212 Jurong East Street 21", "Seletar Hills Estate"])
+
+    def test_core_fields(self):
+        """Price, rooms, area and type come through as numbers"""
+        hdb = self.properties[1]
+        self.assertEqual(hdb["price"], 718888)
+        self.assertEqual(hdb["price_per_sqft"], 557.0)
+        self.assertEqual(hdb["bedrooms"], 3)
+        self.assertEqual(hdb["bathrooms"], 2)
+        self.assertEqual(hdb["floor_area_sqft"], 1291)
+        self.assertEqual(hdb["property_type"], "HDB Flat")
+        self.assertEqual(hdb["built_year"], 2010)
+        self.assertEqual(hdb["mrt_line"], "EW23")
+        self.assertEqual(hdb["listed_date"], "Jul 12, 2025")
+        self.assertEqual(hdb["agent_name"], "Marcus Lim")
+
+    def test_links_and_images_resolved(self):
+        """Relative hrefs are resolved against the PropertyGuru host"""
+        sail = self.properties[0]
+        self.assertEqual(sail["listing_url"],
+                         "https://www.propertyguru.com.sg/listing/for-sale-the-sail-marina-bay-24001234")
+        self.assertEqual(sail["image_count"], 2)
+        self.assertTrue(sail["main_image_url"].startswith("https://cdn.pgimgs.com/"))
+
+    def test_land_area(self):
+        """Landed properties keep their land area"""
+        landed = self.properties[2]
+        self.assertEqual(landed["land_area_sqft"], 2400)
+        self.assertEqual(landed["tenure"], "Freehold")
+
+    def test_text_fallback_without_cards(self):
+        """Pages without card markup fall back to text splitting"""
+        html = ("<html><body><div>Orchard Residences</div><div>S$ 3,100,000</div>"
+                "<div>Orchard Residences 3 Beds 1,500 sqft near Orchard MRT with great views</div></body></html>")
+        properties = self.parser.parse(html)
+        self.assertEqual(len(properties), 1)
+        self.assertEqual(properties[0]["extraction_method"], "text_fallback")
+        self.assertEqual(properties[0]["bedrooms"], 3)
+
+    def test_element_text_skips_scripts(self):
+        """innerText approximation ignores script content and breaks on blocks"""
+        import lxml.html
+        node = lxml.html.fromstring("<div><p>One</p><script>var x = 1;</script><span>Two</span> three</div>")
+        self.assertEqual(element_text(node), "One\nTwo three")
+
+
+class TestSnapshotMode(unittest.TestCase):
+
+    def test_single_bulk_call_per_page(self):
+        """Snapshot mode parses every card from one driver call"""
+        cards = [card.to_dict() for card in HtmlPropertyParser().card_snapshots(open(FIXTURE_PAGE, encoding='utf-8').read())]
+        driver = FakeSnapshotDriver(cards)
+
+        properties = AdvancedPropertyExtractor(driver).extract_properties_from_page()
+
+        self.assertEqual(driver.calls, 1)
+        self.assertEqual(len(properties), 3)
+        self.assertEqual(properties[0]["extraction_method"], "advanced_element")
+
+    def test_snapshot_path_matches_element_path(self):
+        """One bulk snapshot call yields the same records as reading each card element"""
+        with open(FIXTURE_PAGE, 'r', encoding='utf-8') as f:
+            html = f.read()
+        previous = get_selector_cache()
+        try:
+            set_selector_cache(SelectorCache())
+            from_snapshots = AdvancedPropertyExtractor(DomDriver(html)).extract_properties_from_page()
+            set_selector_cache(SelectorCache())
+            from_elements = AdvancedPropertyExtractor(DomDriver(html), snapshot_mode=False).extract_properties_from_page()
+        finally:
+            set_selector_cache(previous)
+
+        self.assertEqual(len(from_snapshots), 3)
+        self.assertEqual(from_snapshots, from_elements)
+        self.assertTrue(all(p["extraction_method"] == "advanced_element" for p in from_snapshots))
+        self.assertEqual(from_snapshots[0]["listing_url"],
+                         "https://www.propertyguru.com.sg/listing/for-sale-the-sail-marina-bay-24001234")
+
+    def test_snapshot_round_trip(self):
+        """Snapshots survive conversion to and from plain dicts"""
+        card = CardSnapshot(text="x" * 120, links=["https://a"], image_srcs=["https://b"], title_text="T")
+        self.assertEqual(CardSnapshot.from_dict(card.to_dict()).to_dict(), card.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
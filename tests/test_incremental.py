@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+🧪 Incremental Crawl Tests
+Checks the newest-first search URL and the known-page stop condition
+"""
+
+import os
+import sys
+import unittest
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scrapers.incremental import KnownPageStop, newest_first_url
+from storage.dedup_index import NEW, DUPLICATE, KNOWN
+
+
+def counts(new=0, duplicate=0, known=0):
+    return {NEW: new, DUPLICATE: duplicate, KNOWN: known}
+
+
+class TestNewestFirstUrl(unittest.TestCase):
+
+    def test_adds_sort_and_keeps_filters(self):
+        url = newest_first_url("https://www.propertyguru.com.sg/property-for-sale?districtCode=D01&districtCode=D02")
+        self.assertEqual(url, "https://www.propertyguru.com.sg/property-for-sale"
+                              "?districtCode=D01&districtCode=D02&sort=date&order=desc")
+
+    def test_replaces_existing_sort(self):
+        url = newest_first_url("https://www.propertyguru.com.sg/property-for-sale/4?sort=price&order=asc&isCommercial=false")
+        self.assertEqual(url, "https://www.propertyguru.com.sg/property-for-sale/4?isCommercial=false&sort=date&order=desc")
+
+    def test_custom_sort_params(self):
+        url = newest_first_url("https://www.propertyguru.com.sg/property-for-sale", {"sort": "newest"})
+        self.assertTrue(url.endswith("?sort=newest"))
+
+
+class TestKnownPageStop(unittest.TestCase):
+
+    def test_stops_after_consecutive_known_pages(self):
+        stop = KnownPageStop(2)
+        self.assertFalse(stop.observe(counts(new=20)))
+        self.assertFalse(stop.observe(counts(known=19, duplicate=1)))
+        self.assertTrue(stop.observe(counts(known=20)))
+
+    def test_new_listing_resets_streak(self):
+        stop = KnownPageStop(2)
+        stop.observe(counts(known=20))
+        self.assertFalse(stop.observe(counts(new=1, known=19)))
+        self.assertFalse(stop.observe(counts(known=20)))
+        self.assertTrue(stop.observe(counts(known=20)))
+
+    def test_empty_pages_do_not_count(self):
+        stop = KnownPageStop(2)
+        stop.observe(counts(known=20))
+        self.assertFalse(stop.observe(counts()))
+        self.assertTrue(stop.observe(counts(known=20)))
+
+
+if __name__ == '__main__':
+    unittest.main()
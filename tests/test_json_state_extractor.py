@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+🧪 JSON State Extractor Tests
+Checks locating, decoding and mapping the embedded __NEXT_DATA__ listings
+"""
+
+import json
+import os
+import sys
+import unittest
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from extractors.advanced_extractor import AdvancedPropertyExtractor
+from extractors.html_parser import HtmlPropertyParser
+from extractors.json_state_extractor import (
+    STATE_SCRIPT, JsonStateExtractor, decode_state, find_state_json, get_path
+)
+from extractors.page_snapshot import PageSnapshot, capture_page_snapshot
+from schemas.pure_data_schema import PureDataSchema
+from scrapers.pipeline import parse_page_snapshot
+
+FIXTURE_PAGE = os.path.join(os.path.dirname(__file__), 'fixtures', 'search_results_page.html')
+
+
+def listing(listing_id, title, price, **extra):
+    data = {
+        "id": listing_id,
+        "url": f"/listing/for-sale-{listing_id}",
+        "localizedTitle": title,
+        "price": {"value": price, "pretty": f"S$ {price:,}" if price else "Price on ask"},
+        "bedrooms": 3,
+        "bathrooms": "2",
+        "floorArea": "1,119",
+        "media": {"cover": {"url": f"https://cdn.example.com/{listing_id}.jpg"}},
+    }
+    data.update(extra)
+    return {"listingData": data}
+
+
+STATE = {
+    "props": {"pageProps": {"pageData": {"data": {"listingsData": [
+        listing(60013717, "The Sail @ Marina Bay", 1850000, fullAddress="2 Marina Boulevard", tenure="99-year Leasehold"),
+        listing(60020001, "212 Jurong East Street 21", 520000, propertyType="HDB Flat"),
+        listing(60020001, "212 Jurong East Street 21", 520000),
+        listing(60020002, "Price on ask", None),
+        {"advert": True},
+    ]}}}},
+    "page": "/property-for-sale",
+}
+
+
+def state_page(state=STATE, body=""):
+    return (f'<html><head><title>Property for Sale</title></head><body>{body}'
+            f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(state)}</script></body></html>')
+
+
+class StateDriver:
+    """Serves the state blob to the state script; any other script call is recorded"""
+
+    def __init__(self, state_text):
+        self.state_text = state_text
+        self.current_url = "https://www.propertyguru.com.sg/property-for-sale/2"
+        self.other_scripts = 0
+
+    def execute_script(self, script, *args):
+        if script == STATE_SCRIPT:
+            return self.state_text
+        self.other_scripts += 1
+        return []
+
+
+class TestLocateAndDecode(unittest.TestCase):
+
+    def test_script_tag(self):
+        self.assertEqual(decode_state(find_state_json(state_page())), STATE)
+
+    def test_window_assignment(self):
+        html = f"<script>window.__NEXT_DATA__ = {json.dumps(STATE)};window.other = {{}};</script>"
+        self.assertEqual(decode_state(find_state_json(html)), STATE)
+
+    def test_missing_or_broken_state(self):
+        self.assertIsNone(find_state_json("<html><body>No state</body></html>"))
+        self.assertIsNone(decode_state('{"props": '))
+        self.assertIsNone(decode_state(None))
+
+    def test_get_path(self):
+        self.assertEqual(get_path({"a": [{"b": 1}]}, "a.0.b"), 1)
+        self.assertIsNone(get_path({"a": [{"b": 1}]}, "a.3.b"))
+        self.assertIsNone(get_path({"a": 1}, "a.b"))
+
+
+class TestJsonStateExtractor(unittest.TestCase):
+
+    def setUp(self):
+        self.extractor = JsonStateExtractor()
+
+    def test_maps_listing_fields(self):
+        records = self.extractor.extract(state_page())
+        self.assertEqual(len(records), 2)
+        sail, hdb = records
+        self.assertEqual(sail["property_name"], "The Sail @ Marina Bay")
+        self.assertEqual(sail["price"], 1850000)
+        self.assertEqual(sail["price_formatted"], "S$ 1,850,000")
+        self.assertEqual(sail["bathrooms"], 2)
+        self.assertEqual(sail["floor_area_sqft"], 1119)
+        self.assertEqual(sail["full_address"], "2 Marina Boulevard")
+        self.assertEqual(sail["tenure"], "99-year Leasehold")
+        self.assertEqual(sail["listing_url"], "https://www.propertyguru.com.sg/listing/for-sale-60013717")
+        self.assertEqual(sail["listing_id"], "60013717")
+        self.assertEqual(sail["image_urls"], ["https://cdn.example.com/60013717.jpg"])
+        self.assertEqual(sail["extraction_method"], "json_state")
+        self.assertEqual(hdb["full_address"], "212 Jurong East Street 21")
+        self.assertEqual(hdb["property_type"], "HDB Flat")
+
+    def test_state_record_through_pure_schema(self):
+        """MRT and district from the state survive conversion to a pure data record"""
+        state_listing = listing(60030003, "Downtown Suites", 1200000, districtCode="D01",
+                                mrt={"nearbyText": "5 min (400 m) from DT17 Downtown MRT Station"})
+        record = JsonStateExtractor().records([state_listing["listingData"]])[0]
+        self.assertEqual(record["mrt_station"], "Downtown")
+        self.assertEqual(record["mrt_line"], "DT17")
+        self.assertEqual(record["mrt_distance"], "5 min (400 m)")
+
+        pure = PureDataSchema.create_property_record(record)
+        self.assertEqual(pure["mrt_station"], "Downtown")
+        self.assertEqual(pure["mrt_walk_minutes"], 5)
+        self.assertEqual(pure["mrt_line_name"], "Downtown Line")
+        self.assertEqual(pure["district_code"], "D01")
+
+    def test_configured_paths(self):
+        state = {"results": [{"name": "Seletar Park Residence", "cost": "1,200,000"}]}
+        extractor = JsonStateExtractor.from_config({"json_state": {
+            "listings_path": "results", "item_path": "",
+            "fields": {"property_name": "name", "price": "cost"}}})
+        records = extractor.records(extractor.listings(state))
+        self.assertEqual(records[0]["property_name"], "Seletar Park Residence")
+        self.assertEqual(records[0]["price"], 1200000)
+
+    def test_page_without_state_falls_back_to_cards(self):
+        with open(FIXTURE_PAGE, 'r', encoding='utf-8') as f:
+            page = f.read()
+        parser = HtmlPropertyParser()
+        self.assertEqual(parser.state_extractor.extract(page), [])
+        self.assertTrue(all(p["extraction_method"] == "html_snapshot" for p in parser.parse(page)))
+
+        with_state = page.replace("</body>", state_page().split("<body>")[1].split("</body>")[0] + "</body>")
+        self.assertTrue(all(p["extraction_method"] == "json_state" for p in parser.parse(with_state)))
+
+
+class TestStateSnapshots(unittest.TestCase):
+
+    def test_capture_skips_dom_when_state_is_usable(self):
+        driver = StateDriver(json.dumps(STATE))
+        snapshot = capture_page_snapshot(driver, 2, JsonStateExtractor())
+        self.assertEqual(driver.other_scripts, 0)
+        # The advert has no listing object
+        self.assertEqual(len(snapshot.state_listings), 4)
+        # Mapped once at capture time and reused by the parser stage
+        self.assertEqual([r["property_name"] for r in snapshot.state_records],
+                         ["The Sail @ Marina Bay", "212 Jurong East Street 21"])
+
+        restored = PageSnapshot.from_dict(json.loads(json.dumps(snapshot.to_dict())))
+        records = parse_page_snapshot(restored, AdvancedPropertyExtractor(driver=None), HtmlPropertyParser())
+        self.assertEqual([r["property_name"] for r in records],
+                         ["The Sail @ Marina Bay", "212 Jurong East Street 21"])
+
+    def test_capture_reads_cards_without_state(self):
+        driver = StateDriver(None)
+        snapshot = capture_page_snapshot(driver, 2, JsonStateExtractor())
+        self.assertEqual(snapshot.state_listings, [])
+        self.assertGreater(driver.other_scripts, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
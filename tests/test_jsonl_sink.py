@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+🧪 Streaming Output Tests
+Checks the JSON Lines sink, its reader and streaming pure data conversion
+"""
+
+import os
+import sys
+import json
+import tempfile
+import unittest
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from storage.jsonl_sink import CorruptRecordError, JsonlSink, iter_records, count_records, read_sample
+from schemas.pure_data_schema import convert_to_pure_data_format
+
+TECHNICAL_RECORD = {
+    "property_name": "212 Jurong East Street 21",
+    "price": 718888,
+    "price_formatted": "S$ 718,888",
+    "bedrooms": 3,
+    "bathrooms": 2,
+    "floor_area_sqft": 1291,
+    "property_type": "HDB Flat",
+    "listing_url": "https://www.propertyguru.com.sg/listing/hdb-for-sale-212-jurong-east-street-21-60013717",
+}
+
+
+class TestJsonlSink(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'out', 'extraction_test.jsonl')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_pages_are_appended(self):
+        """Each page lands on disk as one line per record"""
+        with JsonlSink(self.path, fsync_interval=2) as sink:
+            sink.write_page([{"id": 1}, {"id": 2}])
+            sink.write_page([{"id": 3}])
+            self.assertEqual(count_records(self.path), 3)
+
+        self.assertEqual(sink.records_written, 3)
+        self.assertEqual(sink.pages_written, 2)
+        self.assertEqual([r["id"] for r in iter_records(self.path)], [1, 2, 3])
+
+    def test_reopen_appends(self):
+        """A second sink on the same file keeps the earlier output"""
+        with JsonlSink(self.path) as sink:
+            sink.write_page([{"id": 1}])
+        with JsonlSink(self.path) as sink:
+            sink.write_page([{"id": 2}])
+        self.assertEqual(count_records(self.path), 2)
+
+    def test_truncated_last_line_is_skipped(self):
+        """A crash mid-write leaves a partial line that the reader ignores"""
+        with JsonlSink(self.path) as sink:
+            sink.write_page([{"id": 1}, {"id": 2}])
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('{"id": 3, "prop')
+        self.assertEqual([r["id"] for r in iter_records(self.path)], [1, 2])
+
+    def test_corrupt_middle_line_raises(self):
+        """Only the last line may be broken; a bad line between records is reported with its number"""
+        with JsonlSink(self.path) as sink:
+            sink.write_page([{"id": 1}])
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('{"id": 2, "prop\n{"id": 3}\n')
+        records = iter_records(self.path)
+        self.assertEqual(next(records), {"id": 1})
+        with self.assertRaisesRegex(CorruptRecordError, "line 2"):
+            list(records)
+
+    def test_legacy_json_array(self):
+        """Old indented JSON arrays still read"""
+        legacy = os.path.join(self.tmp.name, 'extraction_old.json')
+        with open(legacy, 'w', encoding='utf-8') as f:
+            json.dump([{"id": 1}, {"id": 2}], f, indent=2)
+        self.assertEqual(read_sample(legacy, 1), [{"id": 1}])
+
+    def test_streaming_conversion(self):
+        """Technical records convert straight into a pure data JSONL file"""
+        with JsonlSink(self.path) as sink:
+            sink.write_page([TECHNICAL_RECORD, {"property_name": "No price"}])
+
+        output = os.path.join(self.tmp.name, 'pure.jsonl')
+        self.assertEqual(convert_to_pure_data_format(self.path, output), output)
+
+        records = list(iter_records(output))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["price_range"], "500K-800K")
+        self.assertEqual(records[0]["property_url"], TECHNICAL_RECORD["listing_url"])
+
+
+if __name__ == "__main__":
+    unittest.main()
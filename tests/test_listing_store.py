@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+🧪 Listing Store Tests
+Checks batched upserts, indexed queries and run bookkeeping in the SQLite store
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from extractors.patterns import listing_id_from_url
+from storage.dedup_index import DedupIndex, NEW, fingerprint_key
+from storage.jsonl_sink import JsonlSink
+from scrapers.pure_data_scraper import PureDataScraper
+from storage.listing_store import ListingStore, normalize_listed_date
+
+
+def pure_record(listing_id, price, district="D22", bedrooms=3, listed="Jul 12, 2025"):
+    return {
+        "property_name": f"Listing {listing_id}",
+        "price_numeric": price,
+        "bedrooms": bedrooms,
+        "property_type": "HDB Flat",
+        "district_code": district,
+        "listed_date": listed,
+        "property_url": f"https://www.propertyguru.com.sg/listing/hdb-for-sale-block-{listing_id}",
+    }
+
+
+class TestListingStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ListingStore(os.path.join(self.tmp.name, 'listings.db'))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_listing_id_from_url(self):
+        url = "https://www.propertyguru.com.sg/listing/hdb-for-sale-212-jurong-east-street-21-60013717"
+        self.assertEqual(listing_id_from_url(url), "60013717")
+        self.assertEqual(listing_id_from_url(url + "?ref=search"), "60013717")
+        self.assertIsNone(listing_id_from_url("https://www.propertyguru.com.sg/property-for-sale/2"))
+
+    def test_store_and_dedup_index_share_identity(self):
+        """A record the dedup index counts as new gets its own row, never another listing's"""
+        records = [
+            {"property_name": "A", "price": 1, "bedrooms": 2, "floor_area_sqft": 800},
+            {"property_name": "A", "price": 1, "bedrooms": 2, "floor_area_sqft": 1200},
+            pure_record(60000001, 700000),
+        ]
+        index = DedupIndex()
+        self.assertEqual([index.check_and_add(r) for r in records], [NEW, NEW, NEW])
+        self.store.upsert_many(records)
+        self.assertEqual(self.store.count(), 3)
+        keys = {row[0] for row in self.store.conn.execute("SELECT listing_key FROM listings")}
+        self.assertEqual(keys, {fingerprint_key(r) for r in records})
+
+    def test_old_keys_are_migrated(self):
+        self.store.upsert_many([pure_record(60000001, 700000)])
+        self.store.conn.execute("UPDATE listings SET listing_key = '60000001'")
+        self.store.conn.execute("PRAGMA user_version = 0")
+        self.store.conn.commit()
+        self.store.close()
+
+        self.store = ListingStore(os.path.join(self.tmp.name, 'listings.db'))
+        self.store.upsert_many([pure_record(60000001, 650000)])
+        self.assertEqual(self.store.count(), 1)
+        self.assertEqual(self.store.get("60000001")["price_numeric"], 650000)
+
+    def test_upsert_updates_in_place(self):
+        self.store.upsert_many([pure_record(60000001, 700000), pure_record(60000002, 900000)], batch_size=1)
+        self.store.upsert_many([pure_record(60000001, 650000)])
+
+        self.assertEqual(self.store.count(), 2)
+        self.assertEqual(self.store.get("60000001")["price_numeric"], 650000)
+        url = pure_record(60000002, 0)["property_url"]
+        self.assertEqual(self.store.get(url)["price_numeric"], 900000)
+
+    def test_indexed_queries(self):
+        self.store.upsert_many([
+            pure_record(60000001, 700000, "D22", 3, "Jul 12, 2025"),
+            pure_record(60000002, 1500000, "D22", 4, "Jun 1, 2025"),
+            pure_record(60000003, 2500000, "D09", 3, "Jul 14, 2025"),
+        ])
+        names = [r["property_name"] for r in self.store.query(district_code="D22", order_by="price_numeric", descending=True)]
+        self.assertEqual(names, ["Listing 60000002", "Listing 60000001"])
+        self.assertEqual(self.store.count(min_price=1000000, bedrooms=3), 1)
+        self.assertEqual(self.store.count(listed_since="Jul 1, 2025"), 2)
+        self.assertEqual(self.store.district_counts(), {"D09": 1, "D22": 2})
+
+        plan = " ".join(str(tuple(row)) for row in self.store.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT record FROM listings WHERE district_code = 'D22'"))
+        self.assertIn("idx_listings_district", plan)
+
+        # Lookups by id or URL use the primary key and the URL index, not a table scan
+        plan = " ".join(str(tuple(row)) for row in self.store.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT record FROM listings WHERE listing_key = ? OR property_url = ? LIMIT 1",
+            ("60000001", "https://example")))
+        self.assertIn("idx_listings_url", plan)
+        self.assertNotIn("SCAN listings", plan)
+
+        with self.assertRaises(ValueError):
+            list(self.store.query(order_by="record; DROP TABLE listings"))
+
+    def test_ingest_file_and_runs(self):
+        path = os.path.join(self.tmp.name, 'pure.jsonl')
+        with JsonlSink(path) as sink:
+            sink.write_page([pure_record(60000001 + i, 500000 + i) for i in range(5)])
+
+        run_id = self.store.start_run("extraction.jsonl")
+        self.assertEqual(self.store.ingest_file(path, batch_size=2), 5)
+        self.store.finish_run(run_id, pure_data_file=path, records=5)
+
+        run = self.store.latest_run()
+        self.assertEqual(run["extraction_file"], "extraction.jsonl")
+        self.assertEqual(run["records"], 5)
+        self.assertEqual(self.store.conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+    def test_run_keeps_the_crawl_start_time(self):
+        path = os.path.join(self.tmp.name, 'pure.jsonl')
+        with JsonlSink(path) as sink:
+            sink.write_page([pure_record(60000001, 500000)])
+        scraper = PureDataScraper()
+        scraper.listing_store_path = os.path.join(self.tmp.name, 'runs.db')
+        scraper.start_time = datetime(2025, 7, 15, 8, 0)
+        scraper._update_listing_store("extraction.jsonl", path)
+
+        with ListingStore(scraper.listing_store_path) as store:
+            run = store.latest_run()
+        self.assertEqual(run["started_at"], "2025-07-15T08:00:00")
+        self.assertGreater(run["finished_at"], run["started_at"])
+
+    def test_normalize_listed_date(self):
+        self.assertEqual(normalize_listed_date("Jul 12, 2025"), "2025-07-12")
+        self.assertEqual(normalize_listed_date("yesterday"), "yesterday")
+        self.assertIsNone(normalize_listed_date(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
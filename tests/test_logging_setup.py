@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+🧪 Logging Setup Tests
+Checks the queue-backed handlers, JSON Lines output and that hot-path messages stay at debug
+"""
+
+import io
+import json
+import logging
+import logging.handlers
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from extractors.advanced_extractor import AdvancedPropertyExtractor
+from extractors.html_parser import HtmlPropertyParser
+from utils.logging_setup import PACKAGE_LOGGERS, JsonLinesFormatter, setup_logging, stop_logging
+from test_html_parser import FIXTURE_PAGE, FakeSnapshotDriver
+
+
+class TestLoggingSetup(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        stop_logging()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                root.removeHandler(handler)
+        for name in PACKAGE_LOGGERS:
+            logging.getLogger(name).setLevel(logging.NOTSET)
+        self.tmp.cleanup()
+
+    def read_json_log(self, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    def test_json_lines_file_gets_debug_and_extra_fields(self):
+        path = os.path.join(self.tmp.name, 'logs', 'run.jsonl')
+        setup_logging({}, json_file=path, console=False)
+
+        logger = logging.getLogger('scrapers.example')
+        logger.debug("📄 Page %s captured", 3, extra={'page': 3})
+        logger.warning("⚠️ Slow page")
+        logging.getLogger('urllib3.connectionpool').info("third-party chatter")
+        stop_logging()
+
+        entries = self.read_json_log(path)
+        self.assertEqual([entry['level'] for entry in entries], ['DEBUG', 'WARNING'])
+        self.assertEqual(entries[0]['message'], "📄 Page 3 captured")
+        self.assertEqual(entries[0]['page'], 3)
+        self.assertEqual(entries[0]['logger'], 'scrapers.example')
+
+    def test_console_level_filters_debug(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            setup_logging({}, level='INFO')
+            logger = logging.getLogger('extractors.example')
+            logger.debug("hidden")
+            logger.info("✅ shown")
+            stop_logging()
+        self.assertEqual(output.getvalue(), "✅ shown\n")
+        self.assertFalse(logger.isEnabledFor(logging.DEBUG))
+
+    def test_card_extraction_is_quiet_at_info(self):
+        with open(FIXTURE_PAGE, 'r', encoding='utf-8') as f:
+            cards = [card.to_dict() for card in HtmlPropertyParser().card_snapshots(f.read())]
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            setup_logging({}, level='INFO')
+            properties = AdvancedPropertyExtractor(FakeSnapshotDriver(cards)).extract_properties_from_page()
+            stop_logging()
+        self.assertEqual(len(properties), 3)
+        self.assertEqual(output.getvalue(), "")
+
+    def test_formatter_keeps_exceptions(self):
+        try:
+            raise ValueError("broken card")
+        except ValueError:
+            record = logging.getLogger('extractors.example').makeRecord(
+                'extractors.example', logging.ERROR, __file__, 1, "❌ Failed", (), sys.exc_info())
+        entry = json.loads(JsonLinesFormatter().format(record))
+        self.assertIn("ValueError: broken card", entry['exception'])
+
+    def test_unknown_level(self):
+        with self.assertRaises(ValueError):
+            setup_logging({}, level='LOUD', console=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+🧪 Run Metrics Tests
+Checks histograms, stage timers, WebDriver round-trip counting and the metrics report
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import HTTPServer
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scrapers.rate_scheduler import RequestScheduler
+from scrapers.worker_pool import WorkerPool, split_page_ranges
+from storage.dedup_index import DedupIndex
+from utils.metrics import CountingDriver, Histogram, RunMetrics, counting_driver, get_metrics, reset_metrics, timed
+from test_worker_pool import FIXTURE_PAGE, HttpPageDriver, RecordedPagesHandler, LAST_PAGE
+
+
+class FakeElement:
+    def __init__(self, text):
+        self.id = text
+        self.text = text
+
+    def find_elements(self, by, value):
+        return []
+
+    def get_attribute(self, name):
+        return None
+
+
+class FakeDriver:
+    def __init__(self):
+        self.page_source = "<html></html>"
+        self.session_id = "local"
+
+    def get(self, url):
+        pass
+
+    def find_elements(self, by, value):
+        return [FakeElement("card one"), FakeElement("card two")]
+
+
+class TestHistogram(unittest.TestCase):
+
+    def test_percentiles_within_a_bucket(self):
+        histogram = Histogram()
+        for value in range(1, 1001):
+            histogram.observe(value / 1000)
+        summary = histogram.to_dict()
+        self.assertEqual(summary['count'], 1000)
+        self.assertAlmostEqual(summary['mean'], 0.5005)
+        self.assertAlmostEqual(summary['p50'], 0.5, delta=0.5 * 0.2)
+        self.assertAlmostEqual(summary['p99'], 0.99, delta=0.99 * 0.2)
+        self.assertEqual(summary['max'], 1.0)
+
+    def test_empty_and_single_value(self):
+        self.assertEqual(Histogram().percentile(0.5), 0.0)
+        histogram = Histogram()
+        histogram.observe(2.5)
+        self.assertEqual(histogram.percentile(0.99), 2.5)
+
+
+class TestRunMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = reset_metrics()
+
+    def test_timers_and_decorator(self):
+        @timed('stage.work')
+        def work(fail=False):
+            if fail:
+                raise ValueError("boom")
+            return 1
+
+        work()
+        with self.assertRaises(ValueError):
+            work(fail=True)
+        with self.metrics.timer('stage.block'):
+            pass
+
+        report = self.metrics.to_dict()
+        self.assertEqual(report['histograms']['stage.work']['count'], 2)
+        self.assertEqual(report['counters']['stage.work.errors'], 1)
+        self.assertEqual(report['histograms']['stage.block']['count'], 1)
+
+    def test_counting_driver(self):
+        driver = counting_driver(FakeDriver())
+        self.assertIsInstance(driver, CountingDriver)
+        self.assertIs(counting_driver(driver), driver)
+        self.assertIsNone(counting_driver(None))
+
+        driver.get("https://example.com")
+        elements = driver.find_elements("css selector", ".card")
+        texts = [element.text for element in elements]
+        driver.page_source
+        driver.session_id
+
+        self.assertEqual(texts, ["card one", "card two"])
+        # get + find_elements + two element .text reads + page_source
+        self.assertEqual(driver.round_trips, 5)
+        self.assertEqual(get_metrics().counters['webdriver.round_trips'], 5)
+
+    def test_round_trips_per_page(self):
+        driver = counting_driver(FakeDriver())
+        driver.get("https://example.com/1")
+        self.metrics.page_done(20, driver)
+        driver.get("https://example.com/2")
+        driver.page_source
+        driver.page_source
+        self.metrics.page_done(18, driver)
+
+        report = self.metrics.to_dict()
+        per_page = report['histograms']['webdriver.round_trips_per_page']
+        self.assertEqual((per_page['min'], per_page['max']), (1, 3))
+        self.assertEqual(report['counters']['pages'], 2)
+        self.assertEqual(report['counters']['cards'], 38)
+        self.assertEqual(report['histograms']['page.seconds']['count'], 1)
+
+        status = self.metrics.format_status()
+        self.assertIn("2 pages", status)
+        self.assertIn("38 cards", status)
+        self.assertIn("round-trips/page", status)
+
+    def test_write_json(self):
+        metrics = RunMetrics()
+        metrics.incr('pages', 3)
+        metrics.observe('page.load', 1.5)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = metrics.write_json(os.path.join(tmp, 'run', 'metrics.json'))
+            with open(path, 'r', encoding='utf-8') as f:
+                report = json.load(f)
+        self.assertEqual(report['counters'], {'pages': 3})
+        self.assertEqual(report['histograms']['page.load']['p50'], 1.5)
+
+
+class TestPoolMetrics(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(FIXTURE_PAGE, 'r', encoding='utf-8') as f:
+            RecordedPagesHandler.recorded_page = f.read().replace(
+                'href="/listing/', 'href="https://www.propertyguru.com.sg/listing/')
+        cls.server = HTTPServer(('127.0.0.1', 0), RecordedPagesHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.search_url = f"http://127.0.0.1:{cls.server.server_port}/property-for-sale?isCommercial=false"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_pool_records_stages_and_round_trips(self):
+        metrics = reset_metrics()
+        scheduler = RequestScheduler(max_requests_per_minute=60000, target_requests_per_minute=60000)
+        pool = WorkerPool([HttpPageDriver], scheduler=scheduler, dedup_index=DedupIndex())
+        pool.run(split_page_ranges(self.search_url, 1, LAST_PAGE, chunk_size=LAST_PAGE))
+
+        report = metrics.to_dict()
+        self.assertEqual(report['counters']['pages'], LAST_PAGE)
+        self.assertEqual(report['counters']['cards'], LAST_PAGE * 3)
+        for stage in ('page.fetch', 'page.load', 'page.readiness', 'capture.page', 'parse.page'):
+            self.assertEqual(report['histograms'][stage]['count'], LAST_PAGE, stage)
+        round_trips = report['histograms']['webdriver.round_trips_per_page']
+        self.assertEqual(round_trips['count'], LAST_PAGE)
+        self.assertGreater(round_trips['min'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
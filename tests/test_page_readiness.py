@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+🧪 Page Readiness Tests
+Checks the readiness signals with a fake clock
+"""
+
+import os
+import sys
+import unittest
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scrapers.page_readiness import PageReadiness
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class ScriptedDriver:
+    """Returns one readiness probe result per call, repeating the last one"""
+
+    def __init__(self, results):
+        self.results = list(results)
+
+    def execute_script(self, script, *args):
+        if len(self.results) > 1:
+            return self.results.pop(0)
+        return self.results[0]
+
+
+def signals(ready_state="complete", cards=20, active_page=None):
+    return {"ready_state": ready_state, "cards": cards, "active_page": active_page}
+
+
+class TestPageReadiness(unittest.TestCase):
+
+    def readiness(self, results, **kwargs):
+        clock = FakeClock()
+        return PageReadiness(ScriptedDriver(results), clock=clock, sleep=clock.sleep, **kwargs), clock
+
+    def test_waits_for_stable_card_count(self):
+        readiness, clock = self.readiness([
+            signals(ready_state="loading", cards=0),
+            signals(cards=5),
+            signals(cards=18),
+            signals(cards=20),
+            signals(cards=20),
+        ])
+        self.assertTrue(readiness.wait_until_ready())
+        self.assertEqual(readiness.polls, 5)
+        self.assertAlmostEqual(clock.now, 1.0)
+
+    def test_waits_for_expected_active_page(self):
+        readiness, _ = self.readiness([
+            signals(active_page="4\n(current)"),
+            signals(active_page="4\n(current)"),
+            signals(active_page="5\n(current)"),
+        ])
+        self.assertTrue(readiness.wait_until_ready(expected_page=5))
+        self.assertEqual(readiness.polls, 3)
+
+    def test_missing_pagination_is_accepted(self):
+        readiness, _ = self.readiness([signals()])
+        self.assertTrue(readiness.wait_until_ready(expected_page=7))
+        self.assertEqual(readiness.polls, 2)
+
+    def test_empty_page_needs_more_polls(self):
+        readiness, _ = self.readiness([signals(cards=0)], empty_polls=6)
+        self.assertTrue(readiness.wait_until_ready())
+        self.assertEqual(readiness.polls, 6)
+
+    def test_times_out(self):
+        readiness, clock = self.readiness([signals(ready_state="interactive")], timeout=2)
+        self.assertFalse(readiness.wait_until_ready())
+        self.assertLessEqual(clock.now, 2)
+
+    def test_script_errors_are_not_ready(self):
+        class BrokenDriver:
+            def execute_script(self, script, *args):
+                raise RuntimeError("no such window")
+        clock = FakeClock()
+        readiness = PageReadiness(BrokenDriver(), timeout=1, clock=clock, sleep=clock.sleep)
+        self.assertFalse(readiness.wait_until_ready())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+🧪 Field Pattern Tests
+Checks the single-pass card tokenizer against the per-field searches it replaces
+"""
+
+import os
+import sys
+import unittest
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from extractors.patterns import scan_card_text, to_int
+from legacy_patterns import build_corpus, legacy_scan
+
+
+class TestCardTokenizer(unittest.TestCase):
+
+    def test_matches_per_field_searches(self):
+        """Tokenizer output equals the old one-search-per-field results"""
+        for text in build_corpus(500):
+            with self.subTest(text=text[:40]):
+                self.assertEqual(scan_card_text(text), legacy_scan(text))
+
+    def test_first_occurrence_semantics(self):
+        """psf-only prices and land-first areas behave like plain searches"""
+        text = "S$ 1,200 psf\n2,400 sqft (land)\n1,800 sqft\n3 Beds"
+        self.assertEqual(scan_card_text(text), legacy_scan(text))
+        self.assertEqual(scan_card_text(text)["price"], "1,200")
+        self.assertEqual(scan_card_text(text)["floor_area"], "2,400")
+
+    def test_mrt_tokens(self):
+        """Standard MRT line is split into minutes, distance, code and name"""
+        tokens = scan_card_text("5 min (410 m) from NE11 Woodleigh MRT Station")
+        self.assertEqual(tokens["mrt"], ("5", "410 m", "NE11", "Woodleigh "))
+
+    def test_empty_text(self):
+        self.assertEqual(scan_card_text(""), {})
+
+    def test_to_int(self):
+        self.assertEqual(to_int("1,291"), 1291)
+        self.assertIsNone(to_int(None))
+        self.assertIsNone(to_int(","))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+🧪 Staged Pipeline Tests
+Runs the browser/parser/converter pipeline against canned pages
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from extractors.advanced_extractor import AdvancedPropertyExtractor
+from extractors.html_parser import HtmlPropertyParser
+from scrapers.main_scraper import SmartPropertyScraper
+from scrapers.pipeline import ScrapePipeline
+from scrapers.incremental import KnownPageStop
+from storage.checkpoint import CheckpointManager
+from storage.dedup_index import DedupIndex
+from storage.jsonl_sink import JsonlSink, iter_records
+
+FIXTURE_PAGE = os.path.join(os.path.dirname(__file__), 'fixtures', 'search_results_page.html')
+
+
+class FakePageDriver:
+    """Answers the bulk snapshot script with the cards of the current page"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.page = 1
+        self.current_url = "https://www.propertyguru.com.sg/property-for-sale?market=residential"
+
+    def execute_script(self, script, *args):
+        return {"selector": args[0][0], "cards": self.pages[self.page - 1]}
+
+
+class FailingWriter:
+    """Columnar writer stand-in that fails on its second page"""
+
+    def __init__(self):
+        self.pages = 0
+
+    def write_batch(self, records):
+        self.pages += 1
+        if self.pages == 2:
+            raise OSError("disk full")
+        return len(records)
+
+
+class FakePipelineScraper(SmartPropertyScraper):
+
+    def __init__(self, pages, interrupt_on=None, stuck_on=None):
+        super().__init__()
+        self.driver = FakePageDriver(pages)
+        self.interrupt_on = interrupt_on
+        self.stuck_on = stuck_on
+
+    def human_delay(self, delay_type='action_delay'):
+        pass
+
+    def get_next_page_url(self):
+        return f"https://www.propertyguru.com.sg/property-for-sale/{self.driver.page + 1}?market=residential"
+
+    def click_next_page(self, next_url=None):
+        if self.driver.page == self.interrupt_on:
+            raise KeyboardInterrupt
+        if self.driver.page == self.stuck_on:
+            # The site keeps serving the same page
+            return True
+        self.driver.page += 1
+        self.driver.current_url = next_url
+        return True
+
+
+class TestScrapePipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        with open(FIXTURE_PAGE, 'r', encoding='utf-8') as f:
+            sail, hdb, seletar = [card.to_dict() for card in HtmlPropertyParser().card_snapshots(f.read())][:3]
+        self.pages = [[sail, hdb], [hdb, seletar], [sail]]
+        self.checkpoint = CheckpointManager(os.path.join(self.tmp.name, 'checkpoint.json'), checkpoint_interval=1)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_pipeline(self, scraper, **kwargs):
+        tech_path = os.path.join(self.tmp.name, 'extraction.jsonl')
+        pure_path = os.path.join(self.tmp.name, 'pure.jsonl')
+        with JsonlSink(tech_path) as sink, JsonlSink(pure_path) as pure_sink:
+            pipeline = ScrapePipeline(scraper, sink=sink, pure_sink=pure_sink, checkpoint=self.checkpoint,
+                                      parser_workers=3, queue_size=1)
+            state = pipeline.run(**kwargs)
+        return state, list(iter_records(tech_path)), list(iter_records(pure_path))
+
+    def test_pages_written_in_order_and_deduplicated(self):
+        state, technical, pure = self.run_pipeline(FakePipelineScraper(self.pages), max_pages=3)
+
+        self.assertEqual(state['status'], 'complete')
+        self.assertEqual(state['pages_completed'], 3)
+        self.assertEqual([r['property_name'] for r in technical],
+                         ["The Sail @ Marina Bay", "212 Jurong East Street 21", "Seletar Hills Estate"])
+        self.assertEqual([r['property_name'] for r in pure], [r['property_name'] for r in technical])
+        self.assertEqual(pure[1]['price_range'], "500K-800K")
+
+    def test_interrupt_keeps_captured_pages(self):
+        """Pages captured before the interrupt are still parsed, written and checkpointed"""
+        state, technical, _ = self.run_pipeline(FakePipelineScraper(self.pages, interrupt_on=2), max_pages=3)
+
+        self.assertEqual(state['status'], 'interrupted')
+        saved = self.checkpoint.load()
+        self.assertEqual(saved['last_completed_page'], 2)
+        self.assertEqual(saved['next_page'], 3)
+        self.assertTrue(saved['next_url'].endswith('/property-for-sale/3?market=residential'))
+        self.assertEqual(len(technical), 3)
+        self.assertIn('pure_output_offset', saved)
+
+    def test_page_that_stops_advancing(self):
+        """A page that does not advance ends the crawl as complete only at the site's last page"""
+        state, technical, _ = self.run_pipeline(FakePipelineScraper(self.pages, stuck_on=2), max_pages=3)
+        self.assertEqual(state['status'], 'stopped')
+        self.assertEqual(state['pages_completed'], 2)
+
+        scraper = FakePipelineScraper(self.pages, stuck_on=2)
+        scraper.last_site_page = 2
+        state, _, _ = self.run_pipeline(scraper, max_pages=3)
+        self.assertEqual(state['status'], 'complete')
+
+    def test_incremental_stops_after_known_pages(self):
+        """The browser stops fetching once the converter reports enough fully known pages"""
+        with open(FIXTURE_PAGE, 'r', encoding='utf-8') as f:
+            cards = HtmlPropertyParser().card_snapshots(f.read())[:3]
+        sail, hdb, seletar = [card.to_dict() for card in cards]
+
+        # A previous run already collected one of the listings
+        index_path = os.path.join(self.tmp.name, 'dedup_index.bin')
+        previous_run = DedupIndex(index_path)
+        for prop in AdvancedPropertyExtractor(driver=None).extract_properties_from_snapshots(cards[2:]):
+            previous_run.check_and_add(prop)
+        previous_run.save()
+
+        max_pages = 30
+        pages = [[sail, hdb], [hdb, seletar]] + [[seletar]] * (max_pages - 2)
+        scraper = FakePipelineScraper(pages)
+        scraper.dedup_index = DedupIndex(index_path)
+        scraper.stop_condition = KnownPageStop(2)
+        state, technical, _ = self.run_pipeline(scraper, max_pages=max_pages)
+
+        self.assertEqual(state['status'], 'complete')
+        self.assertTrue(state['caught_up'])
+        # Only pages already in flight when the stop was reported are written after page 3
+        self.assertGreaterEqual(state['pages_completed'], 3)
+        self.assertLess(state['pages_completed'], 12)
+        self.assertEqual(scraper.dedup_index.stats['new'], 2)
+        self.assertEqual(technical[0]['property_name'], "The Sail @ Marina Bay")
+
+    def test_writer_error_stops_the_crawl(self):
+        """A failing writer ends run() with its exception instead of leaving the queues full"""
+        pages = [self.pages[0]] * 30
+        tech_path = os.path.join(self.tmp.name, 'extraction.jsonl')
+        outcome = {}
+
+        def run():
+            with JsonlSink(tech_path) as sink:
+                pipeline = ScrapePipeline(FakePipelineScraper(pages), sink=sink, checkpoint=self.checkpoint,
+                                          parser_workers=2, queue_size=1, columnar_writer=FailingWriter())
+                try:
+                    pipeline.run(max_pages=30)
+                except OSError as e:
+                    outcome['error'] = e
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(timeout=10)
+
+        self.assertFalse(thread.is_alive(), "pipeline hung after the writer failed")
+        self.assertEqual(str(outcome.get('error')), "disk full")
+        saved = self.checkpoint.load()
+        self.assertEqual(saved['status'], 'error')
+        self.assertEqual(saved['last_completed_page'], 1)
+        self.assertLess(saved.get('pages_completed', 0), 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,7 @@ from collections import Counter, defaultdict
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from scrapers.pure_data_scraper import PureDataScraper
+from storage.jsonl_sink import iter_records
 
 def analyze_pure_data_quality(properties):
     """Analyze pure data quality and categories"""
@@ -120,7 +121,7 @@ def test_pure_data_scraping():
         data_files = []
         if os.path.exists('data'):
             for file in os.listdir('data'):
-                if file.startswith('pure_data_') and file.endswith('.json'):
+                if file.startswith('pure_data_') and file.endswith(('.json', '.jsonl')):
                     file_path = os.path.join('data', file)
                     data_files.append((file_path, os.path.getmtime(file_path)))
         
@@ -133,8 +134,7 @@ def test_pure_data_scraping():
         print(f"\n📂 Analyzing: {latest_file}")
         
         # Load and analyze data
-        with open(latest_file, 'r', encoding='utf-8') as f:
-            properties = json.load(f)
+        properties = list(iter_records(latest_file))
         
         # Analyze data quality
         analyze_pure_data_quality(properties)
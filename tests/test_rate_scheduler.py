@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+🧪 Rate Scheduler Tests
+Checks token bucket pacing, per-host limits and backoff/recovery with a fake clock
+"""
+
+import os
+import sys
+import unittest
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scrapers.rate_scheduler import RequestScheduler, TokenBucket, title_looks_like_error
+
+PAGE = "https://www.propertyguru.com.sg/property-for-sale/2?market=residential"
+OTHER_HOST = "https://www.example.com/"
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def scheduler(**kwargs):
+    clock = FakeClock()
+    return RequestScheduler(clock=clock, sleep=clock.sleep, **kwargs), clock
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_then_steady_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(60, capacity=2, clock=clock)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+        # A second reservation queues behind the first
+        self.assertAlmostEqual(bucket.reserve(), 2.0)
+
+    def test_refill_is_capped(self):
+        clock = FakeClock()
+        bucket = TokenBucket(60, capacity=1, clock=clock)
+        bucket.reserve()
+        clock.now += 100
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+
+    def test_rate_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(0)
+        bucket = TokenBucket(60, clock=FakeClock())
+        with self.assertRaises(ValueError):
+            bucket.set_rate(-1)
+        self.assertEqual(bucket.rate_per_minute, 60)
+
+
+class TestRequestScheduler(unittest.TestCase):
+
+    def test_paces_at_target_rate(self):
+        limiter, clock = scheduler(target_requests_per_minute=20)
+        for _ in range(4):
+            limiter.fetch(PAGE, lambda url: None)
+        self.assertAlmostEqual(clock.now, 9.0)
+        self.assertEqual(limiter.stats['requests'], 4)
+
+    def test_target_capped_by_max(self):
+        limiter, _ = scheduler(max_requests_per_minute=10, target_requests_per_minute=50)
+        self.assertEqual(limiter.current_rate(PAGE), 10)
+
+    def test_hosts_are_independent(self):
+        limiter, clock = scheduler(target_requests_per_minute=6)
+        limiter.acquire(PAGE)
+        self.assertEqual(limiter.acquire(OTHER_HOST), 0.0)
+        self.assertAlmostEqual(limiter.acquire(PAGE), 10.0)
+
+    def test_backs_off_on_errors_and_recovers(self):
+        limiter, _ = scheduler(target_requests_per_minute=20, min_requests_per_minute=4,
+                               backoff_factor=0.5, recovery_per_success=2)
+        limiter.fetch(PAGE, lambda url: None, is_ok=lambda: False)
+        self.assertEqual(limiter.current_rate(PAGE), 10)
+        for _ in range(3):
+            limiter.fetch(PAGE, lambda url: None, is_ok=lambda: False)
+        self.assertEqual(limiter.current_rate(PAGE), 4)
+        self.assertEqual(limiter.stats['failures'], 4)
+        self.assertEqual(limiter.stats['backoffs'], 3)
+
+        for _ in range(20):
+            limiter.fetch(PAGE, lambda url: None)
+        self.assertEqual(limiter.current_rate(PAGE), 20)
+
+    def test_slow_responses_back_off(self):
+        limiter, clock = scheduler(target_requests_per_minute=20, slow_response_seconds=5)
+
+        def slow_get(url):
+            clock.now += 8
+
+        limiter.fetch(PAGE, slow_get)
+        self.assertEqual(limiter.current_rate(PAGE), 10)
+        self.assertEqual(limiter.stats['slow'], 1)
+
+    def test_exceptions_count_as_failures(self):
+        limiter, _ = scheduler(target_requests_per_minute=20)
+
+        def broken_get(url):
+            raise TimeoutError("page load timeout")
+
+        with self.assertRaises(TimeoutError):
+            limiter.fetch(PAGE, broken_get)
+        self.assertEqual(limiter.current_rate(PAGE), 10)
+
+    def test_from_config(self):
+        limiter = RequestScheduler.from_config({"rate_limit": {"max_requests_per_minute": 12,
+                                                               "target_requests_per_minute": 8}})
+        self.assertEqual(limiter.current_rate(PAGE), 8)
+        self.assertEqual(limiter.max_rate, 12)
+
+    def test_zero_minimum_rate_is_rejected(self):
+        with self.assertRaises(ValueError):
+            RequestScheduler.from_config({"rate_limit": {"min_requests_per_minute": 0}})
+        with self.assertRaises(ValueError):
+            scheduler(max_requests_per_minute=0)
+
+
+class TestErrorTitles(unittest.TestCase):
+
+    def test_titles(self):
+        self.assertTrue(title_looks_like_error("Just a moment..."))
+        self.assertTrue(title_looks_like_error("429 Too Many Requests"))
+        self.assertFalse(title_looks_like_error("Property for Sale in Singapore | PropertyGuru"))
+        self.assertFalse(title_looks_like_error(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+🧪 Selector Cache Tests
+Checks that the last winning selector is tried first, misses fall back to the full list and hit rates persist
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from extractors.advanced_extractor import AdvancedPropertyExtractor
+from extractors.card_snapshot import CARD_SELECTORS, capture_card_snapshots
+from extractors.html_parser import HtmlPropertyParser
+from extractors.selector_cache import (
+    CARDS, DEFAULT_LAYOUT, NEXT_BUTTON, SelectorCache, get_selector_cache, layout_key, set_selector_cache
+)
+from scrapers.main_scraper import NEXT_BUTTON_SELECTORS, SmartPropertyScraper
+from utils.metrics import reset_metrics
+from test_html_parser import FIXTURE_PAGE
+
+LAYOUT = "www.propertyguru.com.sg/property-for-sale"
+
+
+class SelectorDriver:
+    """Driver stand-in where only one selector matches; logs every selector it is asked for"""
+
+    def __init__(self, matching_selector, element_text="Card " * 60):
+        self.matching_selector = matching_selector
+        self.element_text = element_text
+        self.queries = []
+
+    def execute_script(self, script, selectors, *args):
+        self.queries.append(list(selectors))
+        for selector in selectors:
+            if selector == self.matching_selector:
+                return {"selector": selector, "cards": [{"text": self.element_text}]}
+        return {"selector": None, "cards": []}
+
+    def find_elements(self, by, value):
+        self.queries.append(value)
+        if value == self.matching_selector:
+            return [FakeElement(self.element_text)]
+        return []
+
+
+class FakeElement:
+    def __init__(self, text):
+        self.text = text
+
+    def find_elements(self, by, value):
+        return []
+
+    def find_element(self, by, value):
+        raise Exception("no such element")
+
+    def get_attribute(self, name):
+        return None
+
+    def is_enabled(self):
+        return True
+
+    def is_displayed(self):
+        return True
+
+
+class TestSelectorCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.previous = get_selector_cache()
+        self.cache = set_selector_cache(SelectorCache())
+        self.metrics = reset_metrics()
+
+    def tearDown(self):
+        set_selector_cache(self.previous)
+        self.tmp.cleanup()
+
+    def test_layout_key_ignores_page_number_and_query(self):
+        self.assertEqual(layout_key("https://www.propertyguru.com.sg/property-for-sale?isCommercial=false"), LAYOUT)
+        self.assertEqual(layout_key("https://www.propertyguru.com.sg/property-for-sale/7?district_code=D09"), LAYOUT)
+        self.assertEqual(layout_key(None), DEFAULT_LAYOUT)
+        self.assertEqual(layout_key(""), DEFAULT_LAYOUT)
+
+    def test_winner_first_then_listed_order(self):
+        selectors = ['.a', '.b', '.c']
+        self.assertEqual(self.cache.ordered(CARDS, selectors, LAYOUT), selectors)
+
+        self.cache.record(CARDS, '.c', LAYOUT)
+        self.assertEqual(self.cache.ordered(CARDS, selectors, LAYOUT), ['.c', '.a', '.b'])
+        # Other layouts and strategies keep their own winners
+        self.assertEqual(self.cache.ordered(CARDS, selectors, DEFAULT_LAYOUT), selectors)
+        self.assertEqual(self.cache.ordered(NEXT_BUTTON, selectors, LAYOUT), selectors)
+        # A winner that is no longer in the list is ignored
+        self.assertEqual(self.cache.ordered(CARDS, ['.a', '.b'], LAYOUT), ['.a', '.b'])
+
+    def test_hits_misses_and_new_winner(self):
+        self.cache.record(CARDS, '.a', LAYOUT)
+        self.cache.record(CARDS, '.a', LAYOUT)
+        self.cache.record(CARDS, '.b', LAYOUT)
+        self.cache.record(CARDS, None, LAYOUT)
+
+        entry = self.cache.entries[f"{CARDS}|{LAYOUT}"]
+        self.assertEqual(entry['winner'], '.b')
+        self.assertEqual(entry['selectors']['.a'], {'hits': 2, 'misses': 1})
+        self.assertEqual(entry['selectors']['.b'], {'hits': 1, 'misses': 1})
+        self.assertEqual(self.cache.hit_rate(CARDS, LAYOUT), 0.25)
+        self.assertEqual(self.metrics.counters['selectors.cards.cache_hits'], 1)
+        self.assertEqual(self.metrics.counters['selectors.cards.cache_misses'], 3)
+
+    def test_persists_across_runs(self):
+        path = os.path.join(self.tmp.name, 'data', 'selector_cache.json')
+        cache = SelectorCache(path)
+        self.assertFalse(cache.save())
+        self.assertFalse(os.path.exists(path))
+
+        cache.record(NEXT_BUTTON, 'a.page-link', LAYOUT)
+        cache.record(NEXT_BUTTON, 'a.page-link', LAYOUT)
+        self.assertTrue(cache.save())
+
+        reloaded = SelectorCache(path)
+        self.assertEqual(reloaded.ordered(NEXT_BUTTON, NEXT_BUTTON_SELECTORS, LAYOUT)[0], 'a.page-link')
+        self.assertEqual(reloaded.hit_rate(NEXT_BUTTON, LAYOUT), 0.5)
+
+    def test_unreadable_file_starts_empty(self):
+        path = os.path.join(self.tmp.name, 'selector_cache.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 99}, f)
+        self.assertEqual(SelectorCache(path).entries, {})
+
+    def test_disabled_keeps_listed_order(self):
+        path = os.path.join(self.tmp.name, 'selector_cache.json')
+        cache = SelectorCache.from_config({'selector_cache': {'enabled': False}}, self.tmp.name)
+        self.assertEqual(cache.path, path)
+        cache.record(CARDS, '.b', LAYOUT)
+        self.assertEqual(cache.ordered(CARDS, ['.a', '.b'], LAYOUT), ['.a', '.b'])
+        self.assertFalse(cache.save())
+
+
+class TestCachedLookups(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = get_selector_cache()
+        self.cache = set_selector_cache(SelectorCache())
+
+    def tearDown(self):
+        set_selector_cache(self.previous)
+
+    def test_snapshot_script_gets_winner_first(self):
+        driver = SelectorDriver('.property-card')
+        capture_card_snapshots(driver, LAYOUT)
+        capture_card_snapshots(driver, LAYOUT)
+
+        self.assertEqual(driver.queries[0], CARD_SELECTORS)
+        self.assertEqual(driver.queries[1][0], '.property-card')
+        self.assertEqual(sorted(driver.queries[1]), sorted(CARD_SELECTORS))
+        self.assertEqual(self.cache.hit_rate(CARDS, LAYOUT), 0.5)
+
+    def test_element_path_skips_earlier_selectors(self):
+        driver = SelectorDriver('.search-result-item')
+        extractor = AdvancedPropertyExtractor(driver, snapshot_mode=False, layout=LAYOUT)
+        extractor.extract_properties_from_page()
+        first_page = len(driver.queries)
+        driver.queries = []
+        extractor.extract_properties_from_page()
+
+        self.assertEqual(first_page, CARD_SELECTORS.index('.search-result-item') + 1)
+        self.assertEqual(driver.queries, ['.search-result-item'])
+
+    def test_html_parser_records_winner(self):
+        with open(FIXTURE_PAGE, 'r', encoding='utf-8') as f:
+            html = f.read()
+        parser = HtmlPropertyParser()
+        first = parser.card_snapshots(html)
+        second = parser.card_snapshots(html)
+
+        layout = layout_key(parser.base_url)
+        self.assertEqual(len(first), len(second))
+        self.assertEqual(self.cache.hit_rate(CARDS, layout), 0.5)
+
+    def test_next_button_winner_first(self):
+        scraper = SmartPropertyScraper()
+        scraper.driver = SelectorDriver('button[aria-label="Next"]', element_text="Next")
+        scraper.layout = LAYOUT
+
+        self.assertIsNotNone(scraper.find_next_button())
+        first_page = len(scraper.driver.queries)
+        scraper.driver.queries = []
+        self.assertIsNotNone(scraper.find_next_button())
+
+        self.assertEqual(first_page, NEXT_BUTTON_SELECTORS.index('button[aria-label="Next"]') + 1)
+        self.assertEqual(scraper.driver.queries, ['button[aria-label="Next"]'])
+
+
+if __name__ == '__main__':
+    unittest.main()
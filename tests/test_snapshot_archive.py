@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+🧪 Snapshot Archive Tests
+Checks content-addressed storage, reopening, segment rotation and archive reparsing
+"""
+
+import json
+import os
+import re
+import sys
+import tempfile
+import unittest
+
+# Add src and scripts directories to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from extractors.page_snapshot import PageSnapshot
+from reparse_archive import reparse_archive
+from storage.jsonl_sink import iter_records
+from storage.snapshot_archive import INDEX_FILE, SnapshotArchive, zstandard
+
+FIXTURE_PAGE = os.path.join(os.path.dirname(__file__), 'fixtures', 'search_results_page.html')
+PAGE_URL = "https://www.propertyguru.com.sg/property-for-sale/{}?isCommercial=false"
+
+
+def fixture_page(page):
+    """The recorded page with page-specific listing ids"""
+    with open(FIXTURE_PAGE, 'r', encoding='utf-8') as f:
+        html = f.read().replace('href="/listing/', 'href="https://www.propertyguru.com.sg/listing/')
+    return re.sub(r'-(\d{8})"', lambda m: f'-{page:03d}{m.group(1)}"', html)
+
+
+class TestSnapshotArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, 'archive')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_and_duplicates_stored_once(self):
+        with SnapshotArchive(self.directory, codec="zlib") as archive:
+            first = archive.add_page(PAGE_URL.format(1), 1, fixture_page(1))
+            archive.add_page(PAGE_URL.format(2), 2, fixture_page(2))
+            again = archive.add_page(PAGE_URL.format(1), 1, fixture_page(1))
+
+            self.assertEqual(first['html'], again['html'])
+            self.assertEqual(archive.stats['pages'], 3)
+            self.assertEqual(archive.stats['blobs_written'], 2)
+            self.assertEqual(archive.stats['duplicate_blobs'], 1)
+            self.assertLess(archive.stats['stored_bytes'], archive.stats['raw_bytes'] / 3)
+            pages = list(archive.iter_pages())
+
+        self.assertEqual([entry['page_number'] for entry, _, _ in pages], [1, 2, 1])
+        self.assertEqual(pages[1][1], fixture_page(2))
+
+    def test_reopen_keeps_addresses(self):
+        with SnapshotArchive(self.directory, codec="zlib") as archive:
+            archive.add_page(PAGE_URL.format(1), 1, fixture_page(1))
+        with open(os.path.join(self.directory, INDEX_FILE), 'a', encoding='utf-8') as f:
+            f.write('{"type": "page", "url"')  # line cut off by a crash
+
+        with SnapshotArchive(self.directory, codec="zlib") as archive:
+            self.assertEqual(archive.page_count, 1)
+            archive.add_page(PAGE_URL.format(1), 1, fixture_page(1))
+            self.assertEqual(archive.stats['blobs_written'], 0)
+            archive.add_page(PAGE_URL.format(3), 3, fixture_page(3))
+            self.assertEqual(len(list(archive.pages())), 3)
+
+    def test_segments_rotate(self):
+        with SnapshotArchive(self.directory, codec="zlib", max_segment_bytes=2048) as archive:
+            for page in range(1, 5):
+                archive.add_page(PAGE_URL.format(page), page, fixture_page(page))
+            segments = {location['segment'] for location in archive.blobs.values()}
+            self.assertEqual(len(segments), 4)
+            self.assertEqual([html for _, html, _ in archive.iter_pages()],
+                             [fixture_page(page) for page in range(1, 5)])
+
+    def test_state_blob_and_snapshots(self):
+        state = {"props": {"pageProps": {}}}
+        html = f'<html><body><script id="__NEXT_DATA__" type="application/json">{json.dumps(state)}</script></body></html>'
+        with SnapshotArchive(self.directory, codec="zlib", include_state=True) as archive:
+            archive.add_snapshot(PageSnapshot(4, PAGE_URL.format(4), html=html))
+            # Card snapshots carry no HTML of their own
+            self.assertIsNone(archive.add_snapshot(PageSnapshot(5, PAGE_URL.format(5))))
+            archive.add_snapshot(PageSnapshot(5, PAGE_URL.format(5)), html=fixture_page(5))
+
+            (entry, stored_html, stored_state), (second, _, no_state) = list(archive.iter_pages())
+        self.assertEqual(stored_html, html)
+        self.assertEqual(json.loads(stored_state), state)
+        self.assertEqual(entry['url'], PAGE_URL.format(4))
+        self.assertIsNone(no_state)
+
+    @unittest.skipUnless(zstandard, "zstandard not installed")
+    def test_zstd_codec(self):
+        with SnapshotArchive(self.directory, codec="zstd") as archive:
+            archive.add_page(PAGE_URL.format(1), 1, fixture_page(1))
+            self.assertEqual(next(archive.iter_pages())[1], fixture_page(1))
+
+    def test_reparse_archive(self):
+        with SnapshotArchive(self.directory, codec="zlib") as archive:
+            for page in (1, 2, 3, 2):
+                archive.add_page(PAGE_URL.format(page), page, fixture_page(page))
+
+        output = os.path.join(self.tmp.name, 'reparsed.jsonl')
+        stats = reparse_archive(self.directory, output, workers=2)
+        records = list(iter_records(output))
+
+        # 3 unique listings per page; the repeated page 2 only adds duplicates
+        self.assertEqual(stats['pages'], 4)
+        self.assertEqual(stats['records'], 9)
+        self.assertEqual(stats['duplicates'], 3)
+        self.assertEqual(len({r['listing_url'] for r in records}), 9)
+        self.assertEqual(reparse_archive(self.directory, output + '.serial', workers=1)['records'], 9)
+
+    def test_reparse_missing_archive(self):
+        with self.assertRaises(FileNotFoundError):
+            reparse_archive(self.directory, os.path.join(self.tmp.name, 'out.jsonl'))
+
+
+if __name__ == '__main__':
+    unittest.main()
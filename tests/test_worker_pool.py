@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+🧪 Worker Pool Tests
+Runs several workers against a local HTTP server serving recorded result pages
+"""
+
+import os
+import re
+import sys
+import tempfile
+import threading
+import unittest
+import urllib.request
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scrapers.page_planner import page_from_url
+from scrapers.page_readiness import READINESS_SCRIPT
+from scrapers.rate_scheduler import RequestScheduler
+from scrapers.worker_pool import WorkerPool, PageRange, split_page_ranges
+from storage.dedup_index import DedupIndex
+from storage.jsonl_sink import JsonlSink, iter_records
+
+FIXTURE_PAGE = os.path.join(os.path.dirname(__file__), 'fixtures', 'search_results_page.html')
+LAST_PAGE = 7
+
+
+class RecordedPagesHandler(BaseHTTPRequestHandler):
+    """Serves the recorded results page with page-specific listing ids up to LAST_PAGE"""
+
+    recorded_page = ""
+    requests = []
+
+    def do_GET(self):
+        page = page_from_url(self.path)
+        type(self).requests.append(page)
+        if page is None:
+            self.send_error(404)
+            return
+        if page > LAST_PAGE:
+            body = "<html><head><title>No results</title></head><body></body></html>"
+        else:
+            body = re.sub(r'-(\d{8})"', lambda m: f'-{page:03d}{m.group(1)}"', self.recorded_page)
+        data = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HttpPageDriver:
+    """Minimal WebDriver stand-in: plain HTTP loads, no JavaScript beyond the readiness probe"""
+
+    def __init__(self):
+        self.current_url = None
+        self.page_source = ""
+        self.title = ""
+        self.closed = False
+
+    def get(self, url):
+        with urllib.request.urlopen(url, timeout=10) as response:
+            self.page_source = response.read().decode('utf-8')
+            self.current_url = response.geturl()
+        match = re.search(r'<title>(.*?)</title>', self.page_source)
+        self.title = match.group(1) if match else ""
+
+    def execute_script(self, script, *args):
+        if script == READINESS_SCRIPT:
+            return {"ready_state": "complete", "cards": self.page_source.count('data-testid="listing-card"'),
+                    "active_page": None}
+        # Card snapshot script cannot run without a browser; the worker falls back to page_source
+        raise RuntimeError("javascript not available")
+
+    def quit(self):
+        self.closed = True
+
+
+class FlakyPageDriver(HttpPageDriver):
+    """Fails the first `failures` loads of each page in fail_pages"""
+
+    def __init__(self, fail_pages, failures):
+        super().__init__()
+        self.fail_pages = fail_pages
+        self.failures = failures
+        self.attempts = {}
+
+    def get(self, url):
+        page = page_from_url(url)
+        if page in self.fail_pages:
+            self.attempts[page] = self.attempts.get(page, 0) + 1
+            if self.attempts[page] <= self.failures:
+                raise RuntimeError(f"page {page} timed out")
+        super().get(url)
+
+
+class TestWorkerPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Recorded pages link listings with absolute site URLs
+        with open(FIXTURE_PAGE, 'r', encoding='utf-8') as f:
+            RecordedPagesHandler.recorded_page = f.read().replace(
+                'href="/listing/', 'href="https://www.propertyguru.com.sg/listing/')
+        cls.server = HTTPServer(('127.0.0.1', 0), RecordedPagesHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.search_url = f"http://127.0.0.1:{cls.server.server_port}/property-for-sale?isCommercial=false"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        RecordedPagesHandler.requests = []
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_pool(self, workers, ranges):
+        drivers = [HttpPageDriver() for _ in range(workers)]
+        scheduler = RequestScheduler(max_requests_per_minute=60000, target_requests_per_minute=60000)
+        path = os.path.join(self.tmp.name, 'extraction.jsonl')
+        with JsonlSink(path) as sink:
+            pool = WorkerPool([lambda d=d: d for d in drivers], sink=sink, scheduler=scheduler,
+                              dedup_index=DedupIndex())
+            stats = pool.run(ranges)
+        return pool, stats, drivers, list(iter_records(path))
+
+    def test_workers_share_ranges_and_sink(self):
+        ranges = split_page_ranges(self.search_url, 1, 10, chunk_size=2)
+        pool, stats, drivers, records = self.run_pool(3, ranges)
+
+        # 3 unique listings per recorded page, pages 8+ are past the end
+        self.assertEqual(stats['records_written'], LAST_PAGE * 3)
+        self.assertEqual(len(records), LAST_PAGE * 3)
+        self.assertEqual(len({r['listing_url'] for r in records}), LAST_PAGE * 3)
+        self.assertEqual(sorted(p for p in RecordedPagesHandler.requests if p <= LAST_PAGE),
+                         list(range(1, LAST_PAGE + 1)))
+        self.assertEqual(pool.end_pages[self.search_url], LAST_PAGE + 1)
+        self.assertEqual(pool.scheduler.stats['requests'], len(RecordedPagesHandler.requests))
+        self.assertTrue(all(driver.closed for driver in drivers))
+        self.assertEqual(sum(worker['pages'] for worker in pool.worker_stats.values()), stats['pages'])
+
+    def test_split_page_ranges(self):
+        ranges = split_page_ranges(self.search_url, 3, 12, chunk_size=4)
+        self.assertEqual([(r.first_page, r.last_page) for r in ranges], [(3, 6), (7, 10), (11, 12)])
+        urls = [url for _, url in PageRange(self.search_url, 1, 2).urls()]
+        self.assertEqual(page_from_url(urls[0]), 1)
+        self.assertEqual(page_from_url(urls[1]), 2)
+
+    def test_failed_browser_does_not_stop_pool(self):
+        def broken():
+            raise RuntimeError("no Chrome on port 9223")
+
+        scheduler = RequestScheduler(max_requests_per_minute=60000, target_requests_per_minute=60000)
+        pool = WorkerPool([HttpPageDriver, broken], scheduler=scheduler)
+        stats = pool.run(split_page_ranges(self.search_url, 1, 3, chunk_size=1))
+        self.assertEqual(stats['pages'], 3)
+        self.assertEqual(stats['records_written'], 9)
+
+    def test_failed_page_is_retried(self):
+        driver = FlakyPageDriver({2}, failures=1)
+        scheduler = RequestScheduler(max_requests_per_minute=60000, target_requests_per_minute=60000)
+        pool = WorkerPool([lambda: driver], scheduler=scheduler, page_retries=2)
+        stats = pool.run(split_page_ranges(self.search_url, 1, 3, chunk_size=3))
+
+        self.assertEqual(driver.attempts[2], 2)
+        self.assertEqual((stats['pages'], stats['retried_pages'], stats['failed_pages']), (3, 1, 0))
+        self.assertEqual(stats['records_written'], 9)
+        self.assertEqual(pool.failed_pages, [])
+
+    def test_page_failing_every_retry_is_reported(self):
+        driver = FlakyPageDriver({2}, failures=10)
+        scheduler = RequestScheduler(max_requests_per_minute=60000, target_requests_per_minute=60000)
+        pool = WorkerPool([lambda: driver], scheduler=scheduler, page_retries=2)
+        stats = pool.run(split_page_ranges(self.search_url, 1, 3, chunk_size=3))
+
+        self.assertEqual(driver.attempts[2], 3)
+        self.assertEqual((stats['pages'], stats['retried_pages'], stats['failed_pages']), (2, 2, 1))
+        self.assertEqual(pool.failed_pages, [(self.search_url, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
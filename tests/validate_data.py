@@ -9,6 +9,11 @@ import os
 import unittest
 from datetime import datetime
 import statistics
+import sys
+
+# Add src directory to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from storage.jsonl_sink import iter_records
 
 class TestPropertyScraper(unittest.TestCase):
     
@@ -21,7 +26,7 @@ class TestPropertyScraper(unittest.TestCase):
 
         # Try to find the most recent extraction file
         if os.path.exists(data_dir):
-            json_files = [f for f in os.listdir(data_dir) if f.endswith('.json')]
+            json_files = [f for f in os.listdir(data_dir) if f.endswith(('.json', '.jsonl'))]
 
             if json_files:
                 # Use the sample file or most recent
@@ -39,8 +44,7 @@ class TestPropertyScraper(unittest.TestCase):
     def load_test_data(self):
         """Load test data from JSON file"""
         if self.test_data_file and os.path.exists(self.test_data_file):
-            with open(self.test_data_file, 'r') as f:
-                return json.load(f)
+            return list(iter_records(self.test_data_file))
         return []
     
     def test_data_file_exists(self):